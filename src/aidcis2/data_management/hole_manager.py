@@ -11,6 +11,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
+import sys
+
+# 测量文件与实时图表、历史数据查看器共用同一读取器
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from modules.measurement_csv import read_measurement_csv
 
 
 class HoleDataManager:
@@ -273,13 +278,11 @@ class HoleDataManager:
             csv_file_path: CSV文件路径
 
         Returns:
-            Optional[List[Dict]]: 测量数据列表，如果失败返回None
+            Optional[List[Dict]]: 测量数据列表（数值列为float），如果失败返回None
         """
         try:
             if Path(csv_file_path).exists():
-                with open(csv_file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    return list(reader)
+                return read_measurement_csv(csv_file_path).records()
             return None
 
         except Exception as e:
@@ -0,0 +1,13 @@
+"""
+AIDCIS2 检测调度包
+"""
+
+from .probe_scheduler import ProbeScheduler, ProbeState, DEFAULT_MIN_SEPARATION
+from .detection_engine import (DetectionEngine, HoleStatusEvent,
+                               DETECTION_CYCLE_INTERVAL, SIMULATION_CYCLE_INTERVAL)
+from .eta_predictor import EtaPredictor, ProbeTimingModel, PredictionSample
+
+__all__ = ['ProbeScheduler', 'ProbeState', 'DEFAULT_MIN_SEPARATION',
+           'DetectionEngine', 'HoleStatusEvent',
+           'DETECTION_CYCLE_INTERVAL', 'SIMULATION_CYCLE_INTERVAL',
+           'EtaPredictor', 'ProbeTimingModel', 'PredictionSample']
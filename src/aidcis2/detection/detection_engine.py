@@ -0,0 +1,260 @@
+"""
+检测引擎
+在工作线程中推进检测流程，将孔位状态变化事件写入队列，由界面按帧批量取出
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from aidcis2.models.hole_data import HoleData, HoleStatus
+from .probe_scheduler import ProbeScheduler
+
+
+# 实际检测节拍：每个探头每秒检测一个孔位
+DETECTION_CYCLE_INTERVAL = 1.0
+
+# 模拟节拍：每个探头每秒5000个孔位
+SIMULATION_CYCLE_INTERVAL = 0.0002
+
+# 落后超过该时长时放弃追赶，避免暂停/卡顿后突发大量处理
+MAX_CATCH_UP_SECONDS = 0.5
+
+# 等待时的最长单次休眠，保证停止/暂停请求能及时响应
+MAX_SLEEP_SECONDS = 0.05
+
+
+@dataclass
+class HoleStatusEvent:
+    """孔位状态变化事件"""
+    hole_id: str            # 孔位ID
+    status: HoleStatus      # 新状态
+    probe_id: int           # 探头编号
+    timestamp: float        # 单调时钟时间戳
+
+
+class DetectionEngine:
+    """后台检测引擎"""
+
+    def __init__(self, scheduler: ProbeScheduler,
+                 result_provider: Callable[[HoleData], HoleStatus],
+                 cycle_interval: float = DETECTION_CYCLE_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        初始化检测引擎
+
+        Args:
+            scheduler: 多探头调度器
+            result_provider: 返回孔位检测结果的函数（在工作线程中调用）
+            cycle_interval: 每个检测周期的时长（秒），0表示不限速
+            clock: 单调时钟函数
+        """
+        self.logger = logging.getLogger(__name__)
+        self.scheduler = scheduler
+        self.result_provider = result_provider
+        self.cycle_interval = max(0.0, float(cycle_interval))
+        self._clock = clock
+
+        self.events: "queue.SimpleQueue[HoleStatusEvent]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+        self._cycle_active = False
+        self._error: Optional[BaseException] = None
+
+    # ------------------------------------------------------------------
+    # 控制
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """启动工作线程"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="DetectionEngine", daemon=True)
+        self._thread.start()
+
+    def pause(self) -> None:
+        """暂停检测"""
+        self._resume_event.clear()
+
+    def resume(self) -> None:
+        """恢复检测"""
+        self._resume_event.set()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        停止检测并等待工作线程退出
+
+        Args:
+            timeout: 等待线程退出的最长时间（秒）
+        """
+        self._stop_event.set()
+        self._resume_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def is_paused(self) -> bool:
+        """是否处于暂停状态"""
+        return not self._resume_event.is_set()
+
+    def is_running(self) -> bool:
+        """工作线程是否仍在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_idle(self) -> bool:
+        """
+        当前是否没有进行中的检测周期
+
+        暂停只在周期之间生效，已开始的周期会在节拍结束后正常完成；
+        界面可据此判断暂停前的最终状态事件是否已全部产生。
+        """
+        return not self._cycle_active
+
+    def is_finished(self) -> bool:
+        """所有孔位是否已检测完成（事件可能尚未取完）"""
+        return self._finished
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """工作线程中发生的异常"""
+        return self._error
+
+    # ------------------------------------------------------------------
+    # 事件
+    # ------------------------------------------------------------------
+    def drain(self, max_events: Optional[int] = None) -> List[HoleStatusEvent]:
+        """
+        非阻塞地取出已产生的事件
+
+        Args:
+            max_events: 本次最多取出的事件数量，None表示全部取出
+
+        Returns:
+            List[HoleStatusEvent]: 按产生顺序排列的事件
+        """
+        drained = []
+        while max_events is None or len(drained) < max_events:
+            try:
+                drained.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return drained
+
+    @staticmethod
+    def coalesce(events: List[HoleStatusEvent]) -> Dict[str, HoleStatus]:
+        """将事件合并为每个孔位的最终状态"""
+        return {event.hole_id: event.status for event in events}
+
+    # ------------------------------------------------------------------
+    # 统计（线程安全）
+    # ------------------------------------------------------------------
+    def get_probe_statistics(self) -> List[Dict]:
+        """获取各探头统计信息"""
+        with self._lock:
+            return self.scheduler.get_probe_statistics()
+
+    def estimate_remaining_seconds(self) -> Optional[float]:
+        """估算剩余检测时间"""
+        with self._lock:
+            return self.scheduler.estimate_remaining_seconds()
+
+    # ------------------------------------------------------------------
+    # 工作线程
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        """工作线程主循环：按节拍推进检测周期"""
+        try:
+            next_cycle = self._clock()
+            while not self._stop_event.is_set():
+                # 先标记周期开始再检查暂停，保证暂停后 is_idle() 为True时不会再开始新周期
+                self._cycle_active = True
+                if not self._resume_event.is_set():
+                    self._cycle_active = False
+                    self._resume_event.wait(MAX_SLEEP_SECONDS)
+                    next_cycle = self._clock()
+                    continue
+
+                assignments = self._begin_cycle()
+                if not assignments:
+                    self._cycle_active = False
+                    with self._lock:
+                        finished = self.scheduler.is_finished()
+                    if finished:
+                        self._finished = True
+                        break
+                    # 所有探头均被间距约束阻塞，稍后重试
+                    time.sleep(MAX_SLEEP_SECONDS / 10)
+                    continue
+
+                next_cycle += self.cycle_interval
+                if not self._wait_until(next_cycle):
+                    break
+
+                self._finish_cycle(assignments)
+                self._cycle_active = False
+
+                # 严重落后时重置节拍基准
+                now = self._clock()
+                if now - next_cycle > MAX_CATCH_UP_SECONDS:
+                    next_cycle = now
+        except Exception as e:
+            self._error = e
+            self.logger.error(f"检测引擎异常: {e}", exc_info=True)
+        finally:
+            self._release_active()
+            self._cycle_active = False
+
+    def _begin_cycle(self) -> List[tuple]:
+        """所有探头同时领取孔位，并发出检测中事件"""
+        assignments = []
+        with self._lock:
+            for probe_id in self.scheduler.probes:
+                hole = self.scheduler.next_hole(probe_id)
+                if hole is not None:
+                    assignments.append((probe_id, hole))
+
+        now = self._clock()
+        for probe_id, hole in assignments:
+            self.events.put(HoleStatusEvent(hole.hole_id, HoleStatus.PROCESSING, probe_id, now))
+        return assignments
+
+    def _finish_cycle(self, assignments: List[tuple]) -> None:
+        """计算检测结果并发出最终状态事件"""
+        results = [(probe_id, hole, self.result_provider(hole)) for probe_id, hole in assignments]
+
+        with self._lock:
+            for probe_id, hole, _ in results:
+                self.scheduler.complete(probe_id, hole)
+
+        now = self._clock()
+        for probe_id, hole, status in results:
+            self.events.put(HoleStatusEvent(hole.hole_id, status, probe_id, now))
+
+    def _wait_until(self, deadline: float) -> bool:
+        """等待到指定时刻，期间响应停止请求；返回False表示已请求停止"""
+        while True:
+            if self._stop_event.is_set():
+                return False
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, MAX_SLEEP_SECONDS))
+
+    def _release_active(self) -> None:
+        """停止时将正在检测的孔位放回队列，并恢复为待检状态"""
+        with self._lock:
+            released = []
+            for probe_id, probe in self.scheduler.probes.items():
+                if probe.current_hole is not None:
+                    released.append((probe_id, probe.current_hole))
+                    self.scheduler.release(probe_id)
+
+        now = self._clock()
+        for probe_id, hole in released:
+            self.events.put(HoleStatusEvent(hole.hole_id, HoleStatus.PENDING, probe_id, now))
@@ -0,0 +1,336 @@
+"""
+检测剩余时间预测器
+按探头维护指数加权的单孔耗时模型（固定检测时间 + 移动距离），按区域维护修正系数，
+每个完成事件增量更新，并记录预测误差随时间的变化
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from aidcis2.models.hole_data import HoleData
+from .probe_scheduler import ProbeScheduler
+
+
+# 指数加权系数：新样本的权重
+DEFAULT_ALPHA = 0.1
+
+# 预测历史的采样间隔（秒）与最大记录数
+HISTORY_INTERVAL = 1.0
+HISTORY_LIMIT = 100000
+
+# 移动距离的方差低于该值时不拟合距离项（例如等间距排列）
+MIN_DISTANCE_VARIANCE = 1e-6
+
+
+@dataclass
+class ProbeTimingModel:
+    """
+    单个探头的耗时模型：interval ≈ base + per_mm * distance
+
+    使用指数遗忘的加权最小二乘在线拟合，每个样本O(1)更新。
+    """
+    alpha: float = DEFAULT_ALPHA
+    mean_d: float = 0.0
+    mean_t: float = 0.0
+    var_d: float = 0.0
+    cov_dt: float = 0.0
+    samples: int = 0
+
+    def update(self, distance: float, interval: float) -> None:
+        """加入一个 (移动距离, 耗时) 样本"""
+        self.samples += 1
+        a = 1.0 if self.samples == 1 else self.alpha
+        # 指数加权均值与协方差（Welford形式）
+        delta_d = distance - self.mean_d
+        delta_t = interval - self.mean_t
+        self.mean_d += a * delta_d
+        self.mean_t += a * delta_t
+        self.var_d = (1 - a) * (self.var_d + a * delta_d * delta_d)
+        self.cov_dt = (1 - a) * (self.cov_dt + a * delta_d * delta_t)
+
+    @property
+    def per_mm(self) -> float:
+        """每毫米移动耗时（秒），不可辨识时为0"""
+        if self.var_d < MIN_DISTANCE_VARIANCE:
+            return 0.0
+        return max(0.0, self.cov_dt / self.var_d)
+
+    @property
+    def base(self) -> float:
+        """固定检测耗时（秒）"""
+        return max(0.0, self.mean_t - self.per_mm * self.mean_d)
+
+    def predict(self, distance: float) -> float:
+        """预测移动指定距离后完成一个孔位的耗时"""
+        return self.base + self.per_mm * distance
+
+    @property
+    def throughput(self) -> float:
+        """指数加权吞吐量（孔/秒）"""
+        return 1.0 / self.mean_t if self.mean_t > 0 else 0.0
+
+
+@dataclass
+class RegionProgress:
+    """区域剩余工作量"""
+    owner_probe: int                # 区域初始所属探头
+    remaining_count: int = 0        # 剩余孔位数
+    remaining_travel: float = 0.0   # 剩余计划移动距离
+    correction: float = 1.0         # 实际/预测耗时的指数加权修正系数
+
+
+@dataclass
+class PredictionSample:
+    """一次剩余时间预测"""
+    elapsed: float                  # 检测开始后的时间（秒）
+    predicted_remaining: float      # 预测剩余时间（秒）
+    completed: int                  # 当时已完成数量
+
+    @property
+    def predicted_total(self) -> float:
+        """预测的总检测时长"""
+        return self.elapsed + self.predicted_remaining
+
+
+class EtaPredictor:
+    """检测剩余时间预测器"""
+
+    def __init__(self, probe_count: int, start_time: float, alpha: float = DEFAULT_ALPHA):
+        """
+        初始化预测器
+
+        Args:
+            probe_count: 探头数量
+            start_time: 检测开始时刻（单调时钟）
+            alpha: 指数加权系数
+        """
+        self.probe_count = probe_count
+        self.start_time = start_time
+        self.alpha = alpha
+
+        self.probe_models: Dict[int, ProbeTimingModel] = {
+            probe_id: ProbeTimingModel(alpha=alpha) for probe_id in range(1, probe_count + 1)
+        }
+        self.regions: Dict[int, RegionProgress] = {}
+        self.hole_region: Dict[str, int] = {}
+        self.planned_leg: Dict[str, float] = {}
+        self.hole_position: Dict[str, Tuple[float, float]] = {}
+
+        self._last_completion: Dict[int, Tuple[float, Tuple[float, float]]] = {}
+        self.completed_count = 0
+        self.interval_abs_error = 0.0   # 单孔耗时预测的指数加权相对误差
+        self.history: Deque[PredictionSample] = deque(maxlen=HISTORY_LIMIT)
+        self._last_history_time = -math.inf
+        self.finish_elapsed: Optional[float] = None
+
+    @classmethod
+    def from_scheduler(cls, scheduler: ProbeScheduler, alpha: float = DEFAULT_ALPHA) -> 'EtaPredictor':
+        """
+        根据调度器的初始分配创建预测器（需在检测引擎启动前调用）
+
+        Args:
+            scheduler: 多探头调度器
+            alpha: 指数加权系数
+
+        Returns:
+            EtaPredictor: 预测器实例
+        """
+        predictor = cls(scheduler.probe_count, scheduler.start_time, alpha)
+        for probe_id, probe in scheduler.probes.items():
+            predictor.add_region(probe_id, probe_id, list(probe.queue))
+        return predictor
+
+    def add_region(self, region_id: int, owner_probe: int, planned_holes: List[HoleData]) -> None:
+        """
+        登记一个区域及其计划检测顺序
+
+        Args:
+            region_id: 区域编号
+            owner_probe: 区域所属探头
+            planned_holes: 按计划顺序排列的孔位
+        """
+        region = RegionProgress(owner_probe=owner_probe)
+        previous = None
+        for hole in planned_holes:
+            leg = hole.distance_to(previous) if previous is not None else 0.0
+            self.hole_region[hole.hole_id] = region_id
+            self.planned_leg[hole.hole_id] = leg
+            self.hole_position[hole.hole_id] = (hole.center_x, hole.center_y)
+            region.remaining_count += 1
+            region.remaining_travel += leg
+            previous = hole
+        self.regions[region_id] = region
+
+    # ------------------------------------------------------------------
+    # 增量更新
+    # ------------------------------------------------------------------
+    def mark_idle(self, timestamp: float) -> None:
+        """
+        标记所有探头从指定时刻重新开始计时（如暂停恢复后）
+
+        暂停期间不属于检测耗时，下一个孔位的耗时从该时刻开始计算；
+        探头位置保留，移动距离照常计入。
+
+        Args:
+            timestamp: 恢复检测的时刻（单调时钟）
+        """
+        for probe_id in self.probe_models:
+            _, position = self._last_completion.get(probe_id, (timestamp, None))
+            self._last_completion[probe_id] = (timestamp, position)
+
+    def record_completion(self, probe_id: int, hole_id: str, timestamp: float) -> None:
+        """
+        处理一个孔位完成事件，O(1)更新模型
+
+        Args:
+            probe_id: 完成该孔位的探头
+            hole_id: 孔位ID
+            timestamp: 完成时刻（单调时钟）
+        """
+        region_id = self.hole_region.get(hole_id)
+        position = self.hole_position.get(hole_id)
+        if region_id is None or position is None:
+            return
+
+        region = self.regions[region_id]
+        region.remaining_count = max(0, region.remaining_count - 1)
+        region.remaining_travel = max(0.0, region.remaining_travel - self.planned_leg[hole_id])
+        self.completed_count += 1
+        if self.remaining_count == 0:
+            self.finish_elapsed = timestamp - self.start_time
+
+        previous_time, previous_position = self._last_completion.get(probe_id, (self.start_time, None))
+        interval = timestamp - previous_time
+        if interval <= 0:
+            # 暂停前完成、恢复后才取出的事件：只更新位置，保留恢复时刻
+            self._last_completion[probe_id] = (previous_time, position)
+            return
+        self._last_completion[probe_id] = (timestamp, position)
+
+        distance = 0.0
+        if previous_position is not None:
+            distance = math.hypot(position[0] - previous_position[0], position[1] - previous_position[1])
+
+        model = self.probe_models.setdefault(probe_id, ProbeTimingModel(alpha=self.alpha))
+        if model.samples > 0:
+            # 先用旧模型预测，再更新，得到一步预测误差
+            predicted = model.predict(distance)
+            if predicted > 0:
+                ratio = interval / predicted
+                region.correction += self.alpha * (ratio - region.correction)
+                relative_error = abs(interval - predicted) / interval
+                self.interval_abs_error += self.alpha * (relative_error - self.interval_abs_error)
+        model.update(distance, interval)
+        self._record_history(timestamp)
+
+    def _record_history(self, timestamp: float) -> None:
+        """按采样间隔记录当前预测"""
+        if timestamp - self._last_history_time < HISTORY_INTERVAL and self.remaining_count > 0:
+            return
+        remaining = self.predict_remaining_seconds()
+        if remaining is None:
+            return
+        self._last_history_time = timestamp
+        self.history.append(PredictionSample(timestamp - self.start_time, remaining, self.completed_count))
+
+    # ------------------------------------------------------------------
+    # 预测
+    # ------------------------------------------------------------------
+    @property
+    def remaining_count(self) -> int:
+        """剩余孔位总数"""
+        return sum(region.remaining_count for region in self.regions.values())
+
+    def probe_throughput(self, probe_id: int) -> float:
+        """探头的指数加权吞吐量（孔/秒）"""
+        model = self.probe_models.get(probe_id)
+        return model.throughput if model else 0.0
+
+    def region_remaining_seconds(self, region_id: int) -> Optional[float]:
+        """预测单个区域由其所属探头完成所需时间"""
+        region = self.regions[region_id]
+        if region.remaining_count == 0:
+            return 0.0
+
+        model = self.probe_models.get(region.owner_probe)
+        if model is None or model.samples == 0:
+            # 所属探头尚无样本时使用已有样本的探头均值
+            trained = [m for m in self.probe_models.values() if m.samples > 0]
+            if not trained:
+                return None
+            base = sum(m.base for m in trained) / len(trained)
+            per_mm = sum(m.per_mm for m in trained) / len(trained)
+        else:
+            base, per_mm = model.base, model.per_mm
+
+        work = region.remaining_count * base + region.remaining_travel * per_mm
+        return work * region.correction
+
+    def predict_remaining_seconds(self) -> Optional[float]:
+        """
+        预测剩余检测时间
+
+        工作窃取会使各探头的工作量趋于均衡，因此按总工作量除以探头数量估算。
+
+        Returns:
+            Optional[float]: 剩余秒数，尚无样本时返回None
+        """
+        if self.remaining_count == 0:
+            return 0.0
+
+        total_work = 0.0
+        for region_id in self.regions:
+            work = self.region_remaining_seconds(region_id)
+            if work is None:
+                return None
+            total_work += work
+        return total_work / max(1, self.probe_count)
+
+    # ------------------------------------------------------------------
+    # 预测误差
+    # ------------------------------------------------------------------
+    def prediction_errors(self, actual_total: Optional[float] = None) -> List[Tuple[float, float]]:
+        """
+        获取预测误差随时间的变化
+
+        Args:
+            actual_total: 实际总时长，None时使用记录的完成时间；
+                          检测尚未完成时以最新预测作为参照
+
+        Returns:
+            List[Tuple[float, float]]: (已用时间, 预测总时长 - 参照总时长)
+        """
+        if not self.history:
+            return []
+        reference = actual_total if actual_total is not None else self.finish_elapsed
+        if reference is None:
+            reference = self.history[-1].predicted_total
+        return [(sample.elapsed, sample.predicted_total - reference) for sample in self.history]
+
+    def get_statistics(self) -> Dict:
+        """获取预测器统计信息"""
+        return {
+            'completed': self.completed_count,
+            'remaining': self.remaining_count,
+            'predicted_remaining': self.predict_remaining_seconds(),
+            'interval_error': self.interval_abs_error,
+            'probes': {
+                probe_id: {
+                    'throughput': model.throughput,
+                    'base_seconds': model.base,
+                    'seconds_per_mm': model.per_mm,
+                    'samples': model.samples,
+                }
+                for probe_id, model in self.probe_models.items()
+            },
+            'regions': {
+                region_id: {
+                    'remaining': region.remaining_count,
+                    'remaining_travel': region.remaining_travel,
+                    'correction': region.correction,
+                }
+                for region_id, region in self.regions.items()
+            },
+        }
@@ -0,0 +1,298 @@
+"""
+多探头检测调度器
+将孔位按空间区域均衡分配给多个探头，支持最小间距约束和工作窃取
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+
+from aidcis2.models.hole_data import HoleData
+
+
+# 同时工作的探头之间的默认最小间距（与DXF坐标单位一致，mm）
+DEFAULT_MIN_SEPARATION = 100.0
+
+# 在自身队列中寻找满足间距约束的孔位时的最大前瞻数量
+LOOKAHEAD_LIMIT = 32
+
+# 计算吞吐量时使用的最近完成记录数量
+THROUGHPUT_WINDOW = 50
+
+
+@dataclass
+class ProbeState:
+    """单个探头的调度状态"""
+    probe_id: int                                   # 探头编号（从1开始）
+    region_bounds: tuple = (0.0, 0.0, 0.0, 0.0)     # 分配区域边界 (min_x, min_y, max_x, max_y)
+    queue: Deque[HoleData] = field(default_factory=deque)  # 待检工作队列
+    current_hole: Optional[HoleData] = None         # 当前正在检测的孔位
+    assigned_count: int = 0                         # 初始分配的孔位数量
+    completed_count: int = 0                        # 已完成数量
+    stolen_count: int = 0                           # 从其他探头窃取的数量
+    completion_times: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=THROUGHPUT_WINDOW))  # 最近完成时刻
+
+    @property
+    def remaining(self) -> int:
+        """剩余待检数量（包含正在检测的孔位）"""
+        return len(self.queue) + (1 if self.current_hole is not None else 0)
+
+    @property
+    def is_idle(self) -> bool:
+        """探头是否空闲且无剩余工作"""
+        return self.current_hole is None and not self.queue
+
+
+class ProbeScheduler:
+    """多探头并行检测调度器"""
+
+    def __init__(self, holes: List[HoleData], probe_count: int = 1,
+                 min_separation: float = DEFAULT_MIN_SEPARATION,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        初始化调度器
+
+        Args:
+            holes: 待检测孔位列表
+            probe_count: 探头数量
+            min_separation: 同时工作探头之间的最小间距
+            clock: 单调时钟函数，便于测试时注入
+        """
+        if probe_count < 1:
+            raise ValueError(f"探头数量必须大于0: {probe_count}")
+
+        self.probe_count = probe_count
+        self.min_separation = max(0.0, float(min_separation))
+        self._clock = clock
+        self.start_time = clock()
+        self.total_count = len(holes)
+
+        self.probes: Dict[int, ProbeState] = {
+            probe_id: ProbeState(probe_id=probe_id)
+            for probe_id in range(1, probe_count + 1)
+        }
+        self._partition(holes)
+
+    # ------------------------------------------------------------------
+    # 区域划分
+    # ------------------------------------------------------------------
+    def _partition(self, holes: List[HoleData]) -> None:
+        """按X坐标将孔位划分为数量均衡的条带区域，区域内按蛇形路径排序"""
+        ordered = sorted(holes, key=lambda h: (h.center_x, h.center_y, h.hole_id))
+        total = len(ordered)
+
+        start = 0
+        for index, probe in enumerate(self.probes.values()):
+            end = (total * (index + 1)) // self.probe_count
+            region_holes = ordered[start:end]
+            start = end
+
+            probe.queue = deque(self._serpentine_order(region_holes))
+            probe.assigned_count = len(region_holes)
+            if region_holes:
+                xs = [h.center_x for h in region_holes]
+                ys = [h.center_y for h in region_holes]
+                probe.region_bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    @staticmethod
+    def _serpentine_order(holes: List[HoleData]) -> List[HoleData]:
+        """
+        区域内蛇形排序：逐行推进，相邻行方向相反
+
+        所有探头都沿Y方向同步推进，使并行工作的探头保持条带宽度的间距。
+        """
+        rows: Dict[float, List[HoleData]] = {}
+        for hole in holes:
+            rows.setdefault(round(hole.center_y, 3), []).append(hole)
+
+        ordered = []
+        for row_index, row_y in enumerate(sorted(rows)):
+            row = sorted(rows[row_y], key=lambda h: h.center_x)
+            if row_index % 2 == 1:
+                row.reverse()
+            ordered.extend(row)
+        return ordered
+
+    # ------------------------------------------------------------------
+    # 调度
+    # ------------------------------------------------------------------
+    def next_hole(self, probe_id: int) -> Optional[HoleData]:
+        """
+        为指定探头分配下一个孔位
+
+        优先从自身队列中取出满足间距约束的孔位；自身队列为空时从剩余
+        工作最多的探头队列尾部窃取。
+
+        Args:
+            probe_id: 探头编号
+
+        Returns:
+            Optional[HoleData]: 分配的孔位，暂无可用孔位时返回None
+        """
+        probe = self.probes[probe_id]
+        if probe.current_hole is not None:
+            return probe.current_hole
+
+        hole = self._take_from_queue(probe, probe.queue, from_tail=False)
+        if hole is None and not probe.queue:
+            hole = self._steal_for(probe)
+
+        probe.current_hole = hole
+        return hole
+
+    def complete(self, probe_id: int, hole: Optional[HoleData] = None) -> None:
+        """
+        标记探头当前孔位检测完成
+
+        Args:
+            probe_id: 探头编号
+            hole: 完成的孔位（用于校验，可选）
+        """
+        probe = self.probes[probe_id]
+        if probe.current_hole is None:
+            return
+        if hole is not None and hole.hole_id != probe.current_hole.hole_id:
+            raise ValueError(f"探头 {probe_id} 当前孔位为 {probe.current_hole.hole_id}，"
+                             f"不能完成 {hole.hole_id}")
+
+        probe.current_hole = None
+        probe.completed_count += 1
+        probe.completion_times.append(self._clock())
+
+    def release(self, probe_id: int) -> None:
+        """取消探头当前孔位并放回队列头部（如停止检测时）"""
+        probe = self.probes[probe_id]
+        if probe.current_hole is not None:
+            probe.queue.appendleft(probe.current_hole)
+            probe.current_hole = None
+
+    def _take_from_queue(self, probe: ProbeState, queue: Deque[HoleData],
+                         from_tail: bool) -> Optional[HoleData]:
+        """在队列前瞻范围内取出第一个满足间距约束的孔位"""
+        if not queue:
+            return None
+
+        limit = min(len(queue), LOOKAHEAD_LIMIT)
+        for offset in range(limit):
+            index = len(queue) - 1 - offset if from_tail else offset
+            candidate = queue[index]
+            if self._is_separated(probe.probe_id, candidate):
+                del queue[index]
+                return candidate
+        return None
+
+    def _steal_for(self, thief: ProbeState) -> Optional[HoleData]:
+        """从剩余工作最多的探头队列尾部窃取孔位"""
+        victims = sorted(
+            (p for p in self.probes.values() if p is not thief and p.queue),
+            key=lambda p: len(p.queue), reverse=True)
+
+        for victim in victims:
+            hole = self._take_from_queue(thief, victim.queue, from_tail=True)
+            if hole is not None:
+                thief.stolen_count += 1
+                return hole
+        return None
+
+    def _is_separated(self, probe_id: int, candidate: HoleData) -> bool:
+        """检查候选孔位与其他正在工作的探头是否满足最小间距"""
+        if self.min_separation <= 0:
+            return True
+        for other in self.probes.values():
+            if other.probe_id == probe_id or other.current_hole is None:
+                continue
+            if candidate.distance_to(other.current_hole) < self.min_separation:
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # 统计
+    # ------------------------------------------------------------------
+    @property
+    def remaining_count(self) -> int:
+        """所有探头剩余待检数量"""
+        return sum(p.remaining for p in self.probes.values())
+
+    @property
+    def completed_count(self) -> int:
+        """所有探头已完成数量"""
+        return sum(p.completed_count for p in self.probes.values())
+
+    def is_finished(self) -> bool:
+        """是否所有孔位都已完成"""
+        return all(p.is_idle for p in self.probes.values())
+
+    def get_probe_throughput(self, probe_id: int) -> float:
+        """
+        获取探头吞吐量（孔/秒），基于最近完成记录的滑动窗口
+
+        Args:
+            probe_id: 探头编号
+
+        Returns:
+            float: 吞吐量，尚无完成记录时返回0
+        """
+        probe = self.probes[probe_id]
+        times = probe.completion_times
+        if not times:
+            return 0.0
+
+        if len(times) >= 2 and times[-1] > times[0]:
+            return (len(times) - 1) / (times[-1] - times[0])
+
+        elapsed = self._clock() - self.start_time
+        return probe.completed_count / elapsed if elapsed > 0 else 0.0
+
+    def get_total_throughput(self) -> float:
+        """获取所有探头的总吞吐量（孔/秒）"""
+        return sum(self.get_probe_throughput(pid) for pid in self.probes)
+
+    def estimate_remaining_seconds(self) -> Optional[float]:
+        """
+        估算剩余检测时间
+
+        工作窃取使各探头的结束时间趋于一致，因此按总吞吐量估算。
+
+        Returns:
+            Optional[float]: 剩余秒数，吞吐量未知时返回None
+        """
+        remaining = self.remaining_count
+        if remaining == 0:
+            return 0.0
+
+        throughput = self.get_total_throughput()
+        if throughput <= 0:
+            return None
+        return remaining / throughput
+
+    def get_probe_statistics(self) -> List[Dict]:
+        """
+        获取各探头统计信息
+
+        Returns:
+            List[Dict]: 每个探头的编号、分配数、完成数、剩余数、窃取数和吞吐量
+        """
+        stats = []
+        for probe_id, probe in self.probes.items():
+            stats.append({
+                'probe_id': probe_id,
+                'assigned': probe.assigned_count,
+                'completed': probe.completed_count,
+                'remaining': probe.remaining,
+                'stolen': probe.stolen_count,
+                'throughput': self.get_probe_throughput(probe_id),
+                'current_hole': probe.current_hole.hole_id if probe.current_hole else None,
+            })
+        return stats
+
+    def min_active_distance(self) -> float:
+        """当前同时工作的探头之间的最小距离，少于两个工作探头时返回inf"""
+        active = [p.current_hole for p in self.probes.values() if p.current_hole is not None]
+        best = math.inf
+        for i in range(len(active)):
+            for j in range(i + 1, len(active)):
+                best = min(best, active[i].distance_to(active[j]))
+        return best
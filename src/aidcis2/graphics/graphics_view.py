@@ -287,9 +287,13 @@ class OptimizedGraphicsView(InteractionMixin, NavigationMixin, QGraphicsView):
 
 
     def batch_update_status(self, status_updates: dict):
-        """批量更新孔状态"""
+        """批量更新孔状态，所有图形项更新完成后只刷新一次视口"""
         for hole_id, new_status in status_updates.items():
-            self.update_hole_status(hole_id, new_status)
+            hole_item = self.hole_items.get(hole_id)
+            if hole_item is not None:
+                hole_item.update_status(new_status)
+        if status_updates:
+            self.viewport().update()
     
     def get_performance_info(self) -> Dict:
         """获取性能信息"""
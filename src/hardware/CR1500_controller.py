@@ -2,8 +2,15 @@ import ctypes
 import time
 import csv
 import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
+from .sample_writer import SampleTail, StreamingSampleWriter
+
 # 精确匹配SDK的C语言类型定义
 TSCMCAPI_InstanceHandle = ctypes.c_uint64  # SDK中对应uint64_t，64位无符号整数
 uint8_t = ctypes.c_ubyte
@@ -57,6 +64,25 @@ CONTROLLERS = [
 # 采集参数
 RECORD_DURATION = 30  # 数据记录时长（秒）
 
+# 组成一帧 measure_list 的三个通道（顺序即 measure_list 顺序）
+MEASURE_CHANNELS = [("控制器1", 1), ("控制器1", 2), ("控制器2", 1)]
+
+# 并发采集参数
+READER_QUEUE_SIZE = 4096  # 每个控制器的样本队列容量（满时丢弃最早的样本）
+READER_IDLE_WAIT = 0.001  # 连续读取模式下无数据时的等待时间（秒）
+ALIGN_INTERVAL = 0.005  # 对齐器轮询间隔（秒）
+MAX_FRAME_SKEW = 0.05  # 同一帧内各控制器样本允许的最大时间差（秒）
+MAX_ALIGN_WAIT = 0.2  # 等待其他控制器更近样本的最长时间（秒）
+DATA_TAIL_SIZE = 10000  # 内存中保留的最近数据点数（完整数据由流式写入器写入文件）
+TIMESTAMP_FIELD = "时间戳(s)"  # 流式存储中的时间字段（Unix时间，秒）
+SAMPLE_OUTPUT_DIR = os.path.join("Data", "acquisition")  # 命令行采集时流式存储的输出目录
+
+
+def sample_fields(controllers=CONTROLLERS):
+    """流式存储和内存数据的字段名：时间戳 + 每个控制器通道的距离"""
+    return [TIMESTAMP_FIELD] + [f"{config['name']}通道{channel}距离(mm)"
+                                for config in controllers for channel in config["channels"]]
+
 
 def load_dll():
     """加载动态链接库并配置函数接口"""
@@ -283,6 +309,264 @@ def read_channel_data(protocol, instance, controller_name, channel):
     return None
 
 
+def read_data_nodes(protocol, instance, channels):
+    """
+    一次SDK调用读取控制器所有通道的距离数据
+
+    Returns:
+        dict: {通道号: 距离}，读取失败或没有所需通道时为None
+    """
+    data_nodes = (DataNode * 10)()
+    nread = int32_t(0)
+    err = protocol.TSCMCAPI_GetSingleDataNode(
+        instance, 0, data_nodes, ctypes.byref(nread), 10)
+    if err != TS_ERRCODE_OK or nread.value <= 0:
+        return None
+
+    values = {}
+    for i in range(nread.value):
+        channel = data_nodes[i].cfg.channel
+        if channel in channels:
+            values[channel] = data_nodes[i].data
+    return values or None
+
+
+class ControllerReader(threading.Thread):
+    """
+    单个控制器的读取线程
+
+    按固定周期（poll_interval为0时连续）读取控制器，用单调时钟为样本打时间戳
+    （取SDK调用前后时间的中点），写入本控制器的样本队列。队列为有界deque，
+    append/popleft在CPython中是原子操作，读取线程与对齐器之间无需加锁。
+    """
+
+    def __init__(self, protocol, name, instance, channels, poll_interval=0.0,
+                 queue_size=READER_QUEUE_SIZE):
+        super().__init__(name=f"CR1500Reader-{name}", daemon=True)
+        self.protocol = protocol
+        self.controller_name = name
+        self.instance = instance
+        self.channels = tuple(channels)
+        self.poll_interval = poll_interval
+        self.queue = deque(maxlen=queue_size)  # (时间戳, {通道: 距离})
+
+        # 统计
+        self.samples = 0
+        self.read_errors = 0
+        self.queue_drops = 0
+        self.started_at = None
+        self.stopped_at = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        self.started_at = time.monotonic()
+        next_poll = self.started_at
+        while not self._stop_event.is_set():
+            t0 = time.monotonic()
+            try:
+                values = read_data_nodes(self.protocol, self.instance, self.channels)
+            except Exception as e:
+                print(f"[{self.controller_name}] 读取异常: {str(e)}")
+                values = None
+            timestamp = (t0 + time.monotonic()) / 2
+
+            if values:
+                if len(self.queue) == self.queue.maxlen:
+                    self.queue_drops += 1
+                self.queue.append((timestamp, values))
+                self.samples += 1
+            else:
+                self.read_errors += 1
+
+            if self.poll_interval > 0:
+                # 按截止时间调度，读取耗时不累加到采样周期；落后时不补读
+                next_poll += self.poll_interval
+                delay = next_poll - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                else:
+                    next_poll = time.monotonic()
+            elif not values:
+                self._stop_event.wait(READER_IDLE_WAIT)
+        self.stopped_at = time.monotonic()
+
+    def stop(self, timeout=1.0):
+        """停止读取并等待线程退出"""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    @property
+    def sample_rate(self):
+        """实际采样率（Hz）"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.stopped_at or time.monotonic()) - self.started_at
+        return self.samples / elapsed if elapsed > 0 else 0.0
+
+    def get_stats(self):
+        """读取统计"""
+        return {
+            'samples': self.samples,
+            'rate_hz': self.sample_rate,
+            'read_errors': self.read_errors,
+            'queue_drops': self.queue_drops,
+            'queued': len(self.queue)
+        }
+
+
+@dataclass
+class AlignedFrame:
+    """按时间戳对齐的一帧多控制器数据"""
+    timestamp: float  # 参考控制器样本的单调时钟时间戳
+    values: dict = field(default_factory=dict)  # {(控制器名, 通道): 距离}
+    skew: float = 0.0  # 帧内样本时间戳与参考时间戳的最大差（秒）
+
+    @property
+    def measure_list(self):
+        """三通道测量值，缺少任一通道时为None"""
+        measure_list = [self.values.get(key) for key in MEASURE_CHANNELS]
+        if any(value is None for value in measure_list):
+            return None
+        return measure_list
+
+
+class FrameAligner:
+    """
+    多控制器样本对齐器
+
+    以参考控制器（order 中第一个已登记的控制器）的每个样本为一帧，从其他控制器的队列中选取
+    时间戳最接近的样本。其他控制器的最新样本仍早于参考时间戳时，可能还有更近
+    的样本在路上，暂缓出帧，最长等待 max_wait；时间差超过 max_skew 的样本
+    不计入该帧。比参考控制器快的控制器多出的样本计为未匹配样本。
+    控制器顺序固定，断线重连后重新登记的控制器回到原来的位置。
+    """
+
+    def __init__(self, queues, max_skew=MAX_FRAME_SKEW, max_wait=MAX_ALIGN_WAIT, order=None):
+        """
+        初始化
+
+        Args:
+            queues: {控制器名: 样本队列}
+            max_skew: 帧内允许的最大时间差（秒）
+            max_wait: 等待更近样本的最长时间（秒）
+            order: 控制器固定顺序，第一个已登记的为参考控制器；默认为 queues 的顺序
+        """
+        self.order = list(order) if order is not None else list(queues)
+        self.queues = {}
+        self.max_skew = max_skew
+        self.max_wait = max_wait
+        self.pending = {}
+        self._last_picks = {}  # 各控制器最近一次入帧的样本，丢弃时不计为未匹配
+
+        # 统计
+        self.frames = 0
+        self.incomplete_frames = 0
+        self.unmatched = {}
+        for name, queue in queues.items():
+            self.set_queue(name, queue)
+        self.skew_total = 0.0
+        self.skew_max = 0.0
+        self.first_frame_at = None
+        self.last_frame_at = None
+
+    def set_queue(self, name, queue):
+        """添加或替换控制器的样本队列（重连后调用），queue为None时移除"""
+        if queue is None:
+            self.queues.pop(name, None)
+            self.pending.pop(name, None)
+            self._last_picks.pop(name, None)
+            return
+        if name not in self.order:
+            self.order.append(name)
+        self.queues[name] = queue
+        self.queues = {key: self.queues[key] for key in self.order if key in self.queues}
+        self.pending[name] = deque()
+        self._last_picks.pop(name, None)
+        self.unmatched.setdefault(name, 0)
+
+    def _drain(self):
+        for name, queue in self.queues.items():
+            pending = self.pending[name]
+            while queue:
+                pending.append(queue.popleft())
+
+    def align(self, now=None):
+        """
+        取出当前可以确定的所有帧
+
+        Args:
+            now: 当前单调时钟时间，用于判断等待超时
+
+        Returns:
+            list: AlignedFrame 列表
+        """
+        if not self.queues:
+            return []
+        now = time.monotonic() if now is None else now
+        self._drain()
+
+        names = list(self.queues)
+        reference, others = names[0], names[1:]
+        reference_pending = self.pending[reference]
+        frames = []
+
+        while reference_pending:
+            t_ref, ref_values = reference_pending[0]
+            timed_out = now - t_ref >= self.max_wait
+            picks = {}
+            ready = True
+            for name in others:
+                pending = self.pending[name]
+                # 丢弃比后一个样本离参考时间更远的样本
+                while len(pending) >= 2 and abs(pending[1][0] - t_ref) <= abs(pending[0][0] - t_ref):
+                    if pending.popleft() is not self._last_picks.get(name):
+                        self.unmatched[name] += 1
+                if (not pending or pending[-1][0] < t_ref) and not timed_out:
+                    ready = False
+                    break
+                if pending and abs(pending[0][0] - t_ref) <= self.max_skew:
+                    picks[name] = pending[0]
+            if not ready:
+                break
+
+            reference_pending.popleft()
+            frame = AlignedFrame(t_ref)
+            for channel, value in ref_values.items():
+                frame.values[(reference, channel)] = value
+            for name, sample in picks.items():
+                timestamp, values = sample
+                self._last_picks[name] = sample
+                frame.skew = max(frame.skew, abs(timestamp - t_ref))
+                for channel, value in values.items():
+                    frame.values[(name, channel)] = value
+            if len(picks) < len(others):
+                self.incomplete_frames += 1
+            self._record(frame)
+            frames.append(frame)
+        return frames
+
+    def _record(self, frame):
+        self.frames += 1
+        self.skew_total += frame.skew
+        self.skew_max = max(self.skew_max, frame.skew)
+        if self.first_frame_at is None:
+            self.first_frame_at = frame.timestamp
+        self.last_frame_at = frame.timestamp
+
+    def get_stats(self):
+        """对齐统计"""
+        span = (self.last_frame_at - self.first_frame_at) if self.frames > 1 else 0.0
+        return {
+            'frames': self.frames,
+            'frame_rate_hz': (self.frames - 1) / span if span > 0 else 0.0,
+            'incomplete_frames': self.incomplete_frames,
+            'unmatched': dict(self.unmatched),
+            'skew_mean_ms': self.skew_total / self.frames * 1000 if self.frames else 0.0,
+            'skew_max_ms': self.skew_max * 1000
+        }
+
+
 def save_data_to_csv(data_list, filename):
     """将多控制器多通道数据保存到CSV文件"""
     if not data_list:
@@ -311,13 +595,32 @@ def simple_callback(data_str, distance, controller_name, channel):
 
 
 class Acquisition:
-    def __init__(self, protocol, callback, sampling_interval=0.5):
+    def __init__(self, protocol, callback, sampling_interval=0.5, frame_callback=None, writer=None,
+                 output_dir=None):
         self.protocol = protocol
         self.callback = callback
+        self.frame_callback = frame_callback  # 收到完整三通道帧时以 measure_list 调用
         self.controller_instances = {}
         self.running = False
-        self.data_list = []
-        self.sampling_interval = sampling_interval  # 存储采样间隔
+
+        # 数据：内存中只保留最近 DATA_TAIL_SIZE 个数据点，完整数据由 writer 流式写入文件
+        self.fields = sample_fields()
+        channel_keys = [(config["name"], channel) for config in CONTROLLERS for channel in config["channels"]]
+        self._field_index = {key: index for index, key in enumerate(channel_keys, start=1)}
+        self._row = np.full(len(self.fields), np.nan)
+        self.data_tail = SampleTail(DATA_TAIL_SIZE, len(self.fields))
+        # StreamingSampleWriter，字段须为 self.fields；只给出 output_dir 时在该目录新建写入器
+        if writer is None and output_dir is not None:
+            writer = StreamingSampleWriter(output_dir, self.fields)
+        self.writer = writer
+        self.sampling_interval = sampling_interval  # 每个控制器的读取周期（0为连续读取）
+        self.record_duration = RECORD_DURATION  # 数据记录时长（秒）
+
+        # 并发采集：每个控制器一个读取线程，由对齐器按时间戳组帧
+        self.readers = {}
+        self.aligner = None
+        self.max_frame_skew = MAX_FRAME_SKEW
+        self._wall_offset = time.time() - time.monotonic()
 
         # 连接监控参数
         self.connection_check_interval = 10  # 每10秒检查一次连接状态
@@ -326,6 +629,9 @@ class Acquisition:
         self.max_reconnect_attempts = 3  # 最大重连尝试次数
         self.reconnect_delay = 5  # 重连延迟（秒）
         self.failed_controllers = set()  # 记录连接失败的控制器
+        # 重连在后台线程中进行，不阻塞对齐循环；成功的连接经 _reconnected 交回采集线程登记
+        self._reconnect_threads = []
+        self._reconnected = deque()  # (控制器名, 新实例, 配置)
 
     def start(self):
         if self.running:
@@ -349,7 +655,7 @@ class Acquisition:
             return
 
         # 配置所有控制器的数据输出
-        for name, controller in self.controller_instances.items():
+        for name, controller in list(self.controller_instances.items()):
             if not configure_data_output(self.protocol, controller["instance"], controller["config"]):
                 print(f"[{name}] 数据输出配置失败，将跳过该控制器")
                 del self.controller_instances[name]
@@ -360,45 +666,27 @@ class Acquisition:
             self.running = False
             return
 
+        # 每个控制器启动独立的读取线程，慢控制器不再拖慢其他控制器
+        self.readers = {}
+        self.aligner = FrameAligner({}, max_skew=self.max_frame_skew,
+                                    order=[config["name"] for config in CONTROLLERS])
+        for name in [config["name"] for config in CONTROLLERS if config["name"] in self.controller_instances]:
+            self._start_reader(name)
+
         try:
-            end_time = time.time() + RECORD_DURATION
+            end_time = time.monotonic() + self.record_duration
 
             print("[开始] 多控制器多通道数据采集...")
-            while self.running and time.time() < end_time:
-                # 初始化当前时间点的数据
-                current_data = {'时间': datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
-                measure_list = []
-
-                # 遍历每个控制器
-                for name, controller in self.controller_instances.items():
-                    instance = controller["instance"]
-                    channels = controller["config"]["channels"]
-
-                    # 逐个通道读取数据
-                    for channel in channels:
-                        distance = read_channel_data(self.protocol, instance, name, channel)
-                        key = f"{name}通道{channel}距离(mm)"
-
-                        if distance is not None:
-                            current_data[key] = distance
-                            data_str = f"{current_data['时间']}, 端口: {controller['config']['controller_port']}, 通道: {channel}, 距离: {distance:.4f} mm"
-                            self.callback(data_str, distance, name, channel)
-                            if name == "控制器1":
-                                if channel == 1:
-                                    measure_list.append(distance)
-                                elif channel == 2:
-                                    measure_list.append(distance)
-                            elif name == "控制器2" and channel == 1:
-                                measure_list.append(distance)
-                        else:
-                            current_data[key] = "N/A"
-                            print(f"[{name}] 通道{channel}数据读取失败")
-
-                # 添加数据点到列表
-                self.data_list.append(current_data)
-
-                # 等待采样间隔
-                time.sleep(self.sampling_interval)
+            self.last_connection_check = time.time()
+            while self.running and time.monotonic() < end_time:
+                for frame in self.aligner.align():
+                    self._handle_frame(frame)
+                self.check_and_reconnect_controllers()
+                time.sleep(ALIGN_INTERVAL)
+
+            # 处理队列中剩余的样本
+            for frame in self.aligner.align(now=float("inf")):
+                self._handle_frame(frame)
 
         except OverflowError as oe:
             print(f"[严重错误] 内存溢出，错误: {str(oe)}")
@@ -407,11 +695,90 @@ class Acquisition:
             print("\n[用户中断] 停止数据采集")
         except Exception as e:
             print(f"[运行异常] {str(e)}")
+        finally:
+            self._stop_readers()
+            self._finish_reconnect()
+            if self.writer is not None:
+                self.writer.close()
+            self.print_acquisition_stats()
+
+    def _start_reader(self, name):
+        """为控制器启动读取线程并登记到对齐器"""
+        controller = self.controller_instances[name]
+        reader = ControllerReader(self.protocol, name, controller["instance"],
+                                  controller["config"]["channels"], self.sampling_interval)
+        self.readers[name] = reader
+        if self.aligner is not None:
+            self.aligner.set_queue(name, reader.queue)
+        reader.start()
+
+    def _stop_reader(self, name):
+        """停止控制器的读取线程；统计保留在 self.readers 中，直到重连后被新的读取线程替换"""
+        reader = self.readers.get(name)
+        if reader is not None:
+            reader.stop()
+        if self.aligner is not None:
+            self.aligner.set_queue(name, None)
+
+    def _stop_readers(self):
+        for reader in self.readers.values():
+            reader.stop()
+
+    def _handle_frame(self, frame):
+        """将对齐后的一帧写入内存数据、流式存储并回调"""
+        wall_time = frame.timestamp + self._wall_offset
+        row = self._row
+        row.fill(np.nan)
+        row[0] = wall_time
+        for key, distance in frame.values.items():
+            index = self._field_index.get(key)
+            if index is not None:
+                row[index] = distance
+        self.data_tail.append(row)
+        if self.writer is not None:
+            self.writer.append(row)
+
+        time_str = None
+        for name, controller in self.controller_instances.items():
+            config = controller["config"]
+            for channel in config["channels"]:
+                distance = frame.values.get((name, channel))
+                if distance is not None:
+                    if time_str is None:
+                        time_str = datetime.fromtimestamp(wall_time).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                    data_str = f"{time_str}, 端口: {config['controller_port']}, 通道: {channel}, 距离: {distance:.4f} mm"
+                    self.callback(data_str, distance, name, channel)
+
+        measure_list = frame.measure_list
+        if measure_list is not None and self.frame_callback is not None:
+            self.frame_callback(measure_list)
+
+    def get_acquisition_stats(self):
+        """获取采集统计：各控制器采样率、读取失败和队列丢弃数，以及帧率和时间偏差"""
+        return {
+            'controllers': {name: reader.get_stats() for name, reader in self.readers.items()},
+            'alignment': self.aligner.get_stats() if self.aligner is not None else {}
+        }
+
+    def print_acquisition_stats(self):
+        """打印采集统计"""
+        stats = self.get_acquisition_stats()
+        print("\n[统计] 采集性能:")
+        for name, reader_stats in stats['controllers'].items():
+            print(f"  {name}: {reader_stats['samples']} 样本, {reader_stats['rate_hz']:.1f} Hz, "
+                  f"读取失败 {reader_stats['read_errors']}, 队列丢弃 {reader_stats['queue_drops']}")
+        alignment = stats['alignment']
+        if alignment:
+            print(f"  对齐: {alignment['frames']} 帧, {alignment['frame_rate_hz']:.1f} Hz, "
+                  f"不完整 {alignment['incomplete_frames']}, "
+                  f"时间偏差 平均 {alignment['skew_mean_ms']:.2f} ms / 最大 {alignment['skew_max_ms']:.2f} ms")
 
     def stop(self):
         if not self.running:
             return
         self.running = False
+        # 先停止读取线程，再释放控制器资源
+        self._stop_readers()
         # 释放所有控制器资源
         print("\n[步骤] 断开所有连接并释放资源")
         for name, controller in self.controller_instances.items():
@@ -426,8 +793,8 @@ class Acquisition:
         print("[完成] 所有资源释放成功")
         print("=== 程序执行完毕 ===")
 
-    def check_and_reconnect_controllers(self):
-        """检查控制器连接状态并尝试重连"""
+    def check_connections(self):
+        """按检查间隔检查控制器连接状态，断开的控制器交给后台线程重连"""
         current_time = time.time()
 
         # 检查是否到了连接检查时间
@@ -447,7 +814,8 @@ class Acquisition:
                 print(f"[连接监控] {name} 连接已断开")
                 disconnected_controllers.append((name, controller))
 
-                # 清理断开的连接
+                # 停止读取线程并清理断开的连接
+                self._stop_reader(name)
                 try:
                     disconnect_controller(self.protocol, instance, name)
                 except:
@@ -456,12 +824,44 @@ class Acquisition:
                 # 从活动控制器列表中移除
                 del self.controller_instances[name]
 
-        # 尝试重连断开的控制器
+        # 在后台线程中重连断开的控制器，对齐循环继续处理其余控制器的样本
         if disconnected_controllers and self.auto_reconnect:
-            self.reconnect_controllers(disconnected_controllers)
+            self._start_reconnect(disconnected_controllers)
+
+    def check_and_reconnect_controllers(self):
+        """登记后台重连成功的控制器，并按检查间隔检查连接状态"""
+        self._apply_reconnected()
+        self.check_connections()
+
+    def _start_reconnect(self, disconnected_controllers):
+        """为本次检查断开的控制器启动后台重连线程"""
+        self._reconnect_threads = [thread for thread in self._reconnect_threads if thread.is_alive()]
+        thread = threading.Thread(target=self.reconnect_controllers, args=(disconnected_controllers,),
+                                  name="CR1500Reconnect", daemon=True)
+        self._reconnect_threads.append(thread)
+        thread.start()
+
+    def _apply_reconnected(self, start_readers=True):
+        """在采集线程中登记重连成功的控制器并启动其读取线程"""
+        while self._reconnected:
+            name, instance, config = self._reconnected.popleft()
+            self.controller_instances[name] = {
+                "instance": instance,
+                "config": config
+            }
+            if start_readers and self.running:
+                self._start_reader(name)
+            print(f"[自动重连] {name} 重连成功")
+
+    def _finish_reconnect(self):
+        """采集结束时等待进行中的重连，重连上的控制器只登记，由 stop() 释放"""
+        for thread in self._reconnect_threads:
+            thread.join()
+        self._reconnect_threads = []
+        self._apply_reconnected(start_readers=False)
 
     def reconnect_controllers(self, disconnected_controllers):
-        """重连断开的控制器"""
+        """重连断开的控制器（在后台重连线程中运行，成功的连接交由采集线程登记）"""
         print(f"[自动重连] 尝试重连 {len(disconnected_controllers)} 个控制器...")
 
         for name, controller in disconnected_controllers:
@@ -484,12 +884,8 @@ class Acquisition:
             if new_instance:
                 # 重新配置数据输出
                 if configure_data_output(self.protocol, new_instance, config):
-                    # 重连成功，添加回控制器列表
-                    self.controller_instances[name] = {
-                        "instance": new_instance,
-                        "config": config
-                    }
-                    print(f"[自动重连] {name} 重连成功")
+                    # 重连成功，交回采集线程添加到控制器列表
+                    self._reconnected.append((name, new_instance, config))
 
                     # 从失败列表中移除（如果存在）
                     self.failed_controllers.discard(name)
@@ -528,11 +924,19 @@ class Acquisition:
         return status
 
     def get_data_list(self):
-        return self.data_list
+        """最近数据点列表（每点一个字典，缺失值为"N/A"），可直接传给 save_data_to_csv"""
+        data_list = []
+        for row in self.data_tail.rows().tolist():
+            data_point = {'时间': datetime.fromtimestamp(row[0]).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
+            for key, value in zip(self.fields[1:], row[1:]):
+                data_point[key] = value if value == value else "N/A"
+            data_list.append(data_point)
+        return data_list
 
 
 if __name__ == "__main__":
     protocol = load_dll()
     if protocol:
-        acquisition = Acquisition(protocol, simple_callback)
-        acquisition.start()
\ No newline at end of file
+        acquisition = Acquisition(protocol, simple_callback, output_dir=SAMPLE_OUTPUT_DIR)
+        acquisition.start()
+        print(f"采集数据已写入: {', '.join(acquisition.writer.files)}")
\ No newline at end of file
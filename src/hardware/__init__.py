@@ -3,6 +3,9 @@
 包含所有硬件设备控制器
 """
 
-from .CR1500_controller import CR1500Controller
+from .CR1500_controller import Acquisition, ControllerReader, FrameAligner, AlignedFrame
+from .sample_writer import StreamingSampleWriter, SampleTail, read_sample_file
+from .simulated_sdk import SimulatedCR1500Protocol
 
-__all__ = ['CR1500Controller']
+__all__ = ['Acquisition', 'ControllerReader', 'FrameAligner', 'AlignedFrame',
+           'StreamingSampleWriter', 'SampleTail', 'read_sample_file', 'SimulatedCR1500Protocol']
@@ -0,0 +1,224 @@
+"""
+采集样本流式存储
+按块追加写入定宽二进制或CSV文件，定期fsync、按大小轮换文件，
+并为界面保留有界的最近样本，长时间采集内存占用保持恒定。
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+# 二进制文件头：魔数行 + 一行JSON描述（字段名、数据类型），之后为定宽float64记录
+BINARY_MAGIC = b"CR1500SAMPLES\n"
+BINARY_DTYPE = "<f8"
+
+FILE_FORMATS = ("binary", "csv")
+
+# 默认参数
+DEFAULT_CHUNK_ROWS = 4096  # 每块行数，攒满或到达fsync间隔时写入
+DEFAULT_FSYNC_INTERVAL = 1.0  # fsync间隔（秒），崩溃时最多丢失这段时间的数据
+DEFAULT_MAX_FILE_BYTES = 64 * 1024 * 1024  # 单个文件最大字节数，超过后轮换
+
+
+class SampleTail:
+    """
+    保留最近 capacity 行样本的二维环形缓冲区
+
+    预分配 capacity × 字段数 的float64数组，追加为O(1)且不分配内存。
+    """
+
+    def __init__(self, capacity, field_count):
+        if capacity < 1:
+            raise ValueError(f"缓冲区容量必须大于0: {capacity}")
+        self.capacity = int(capacity)
+        self._data = np.full((self.capacity, field_count), np.nan)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, row):
+        """追加一行"""
+        self._data[self._next] = row
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def rows(self):
+        """按时间顺序返回保留的所有行（副本）"""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._next:], self._data[:self._next]))
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+
+class StreamingSampleWriter:
+    """
+    采集样本流式写入器
+
+    append() 只把一行写入预分配的块缓冲；块写满或距上次写入超过
+    fsync_interval 时整块写入文件并fsync。文件超过 max_file_bytes 时
+    关闭并开始下一个文件（文件名带序号），files 记录所有已写文件。
+    """
+
+    def __init__(self, directory, fields, prefix="acquisition", file_format="binary",
+                 chunk_rows=DEFAULT_CHUNK_ROWS, fsync_interval=DEFAULT_FSYNC_INTERVAL,
+                 max_file_bytes=DEFAULT_MAX_FILE_BYTES):
+        """
+        初始化
+
+        Args:
+            directory: 输出目录（不存在时创建）
+            fields: 字段名列表，每行按此顺序给出数值
+            prefix: 文件名前缀
+            file_format: "binary"（定宽float64）或 "csv"
+            chunk_rows: 每块行数
+            fsync_interval: 写入并fsync的最长间隔（秒）
+            max_file_bytes: 单个文件最大字节数
+        """
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"未知的文件格式: {file_format}")
+        self.directory = directory
+        self.fields = list(fields)
+        self.prefix = prefix
+        self.file_format = file_format
+        self.fsync_interval = fsync_interval
+        self.max_file_bytes = max_file_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._chunk = np.empty((max(1, int(chunk_rows)), len(self.fields)), dtype=np.float64)
+        self._pending = 0
+        self._file = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self._session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._last_sync = time.monotonic()
+
+        # 统计
+        self.files = []
+        self.rows_written = 0
+        self.fsync_count = 0
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+    def append(self, row):
+        """追加一行（长度与字段数相同的数值序列，缺失值用NaN）"""
+        self._chunk[self._pending] = row
+        self._pending += 1
+        if self._pending == len(self._chunk) or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+    def append_rows(self, rows):
+        """批量追加多行"""
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(self.fields))
+        while len(rows):
+            count = min(len(rows), len(self._chunk) - self._pending)
+            self._chunk[self._pending:self._pending + count] = rows[:count]
+            self._pending += count
+            rows = rows[count:]
+            if self._pending == len(self._chunk):
+                self.flush()
+        if self._pending and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+    def flush(self):
+        """写入块缓冲中的行，并在到达fsync间隔时同步到磁盘"""
+        if self._pending:
+            data = self._encode(self._chunk[:self._pending])
+            if self._file is None or self._file_bytes + len(data) > self.max_file_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file_bytes += len(data)
+            self.rows_written += self._pending
+            self._pending = 0
+
+        if self._file is not None and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self._sync()
+
+    def close(self):
+        """写入剩余数据、fsync并关闭文件"""
+        self.flush()
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 内部实现
+    # ------------------------------------------------------------------
+    def _encode(self, rows):
+        if self.file_format == "binary":
+            return rows.astype(BINARY_DTYPE, copy=False).tobytes()
+        lines = "\n".join(",".join(f"{value:.6f}" if value == value else "" for value in row)
+                          for row in rows.tolist())
+        return (lines + "\n").encode("utf-8")
+
+    def _header(self):
+        if self.file_format == "binary":
+            description = json.dumps({"fields": self.fields, "dtype": BINARY_DTYPE}, ensure_ascii=False)
+            return BINARY_MAGIC + description.encode("utf-8") + b"\n"
+        return (",".join(self.fields) + "\n").encode("utf-8")
+
+    def _rotate(self):
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+        self._file_index += 1
+        extension = "bin" if self.file_format == "binary" else "csv"
+        path = os.path.join(self.directory,
+                            f"{self.prefix}_{self._session}_{self._file_index:03d}.{extension}")
+        self._file = open(path, "wb")
+        header = self._header()
+        self._file.write(header)
+        self._file_bytes = len(header)
+        self.files.append(path)
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsync_count += 1
+        self._last_sync = time.monotonic()
+
+
+def read_sample_file(path):
+    """
+    读取流式写入器生成的文件
+
+    采集中途崩溃时文件末尾可能是不完整的记录：二进制文件截去不足一整行的字节，
+    CSV文件丢弃没有换行结尾或字段数不符的最后一行，其余数据照常读取。
+
+    Returns:
+        tuple: (字段名列表, 二维float64数组)；CSV中的空值读为NaN
+    """
+    with open(path, "rb") as f:
+        first_line = f.readline()
+        if first_line == BINARY_MAGIC:
+            description = json.loads(f.readline().decode("utf-8"))
+            fields = description["fields"]
+            dtype = np.dtype(description["dtype"])
+            buffer = f.read()
+            record_bytes = dtype.itemsize * len(fields)
+            complete = len(buffer) // record_bytes * record_bytes
+            data = np.frombuffer(buffer[:complete], dtype=dtype)
+            return fields, data.reshape(-1, len(fields)).astype(np.float64)
+
+        fields = first_line.decode("utf-8").rstrip("\n").split(",")
+        lines = [line for line in f if line.strip()]
+        if lines and (not lines[-1].endswith(b"\n") or lines[-1].count(b",") != len(fields) - 1):
+            lines.pop()
+        rows = [[float(value) if value else np.nan for value in line.decode("utf-8").rstrip("\n").split(",")]
+                for line in lines]
+        return fields, np.array(rows, dtype=np.float64).reshape(-1, len(fields))
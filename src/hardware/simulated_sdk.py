@@ -0,0 +1,247 @@
+"""
+CR1500 模拟SDK
+在进程内实现采集代码用到的 TSCMCAPI_* 接口，用于在没有厂商DLL的环境下
+对 Acquisition、断线检测和自动重连做压力测试。
+可配置采样率、调用延迟分布、数据丢失率和断线（随机或手动注入）。
+"""
+
+import math
+import random
+import threading
+import time
+
+from .CR1500_controller import (
+    CONTROLLERS, TS_ERRCODE_OK, TS_ERRCODE_DEVICE_NOT_CONNECTED,
+    TS_ERRCODE_INVALID_PARAMETER, TS_ERRCODE_TIMEOUT
+)
+
+# 以太网通信类型
+CONNECTION_TYPE_ETHERNET = 2
+
+# 模拟距离信号（μm）：基准值 + 正弦起伏 + 噪声
+SIGNAL_BASE = 1000.0
+SIGNAL_AMPLITUDE = 20.0
+SIGNAL_PERIOD = 2.0  # 秒
+SIGNAL_NOISE = 0.5
+
+
+class _SimulatedInstance:
+    """一个SDK实例的状态"""
+
+    def __init__(self):
+        self.connection_type = None
+        self.udp_port = None
+        self.ip = None
+        self.controller_port = None
+        self.port_open = False
+        self.connected = False
+        self.output_channels = set()
+        self.last_sample_index = -1
+
+
+class SimulatedCR1500Protocol:
+    """
+    模拟的CR1500协议对象
+
+    接口签名与 load_dll() 返回的 ctypes 协议对象一致，可直接传给
+    connect_to_controller、configure_data_output 和 Acquisition。
+    每个控制器按 sample_rate 产生样本；GetSingleDataNode 返回最新样本，
+    没有新样本时阻塞到下一个样本产生。
+    """
+
+    def __init__(self, sample_rate=1000.0, latency=(0.0002, 0.0001), dropout_rate=0.0,
+                 disconnect_rate=0.0, outage_duration=0.5, controller_ips=None, seed=None):
+        """
+        初始化
+
+        Args:
+            sample_rate: 每个控制器的采样率（Hz）
+            latency: 每次读取调用的延迟，(均值, 标准差) 秒的正态分布，或返回秒数的可调用对象
+            dropout_rate: 每次读取返回超时（无数据）的概率
+            disconnect_rate: 每个控制器每秒随机断线的平均次数
+            outage_duration: 断线后控制器不可连接的时长（秒）
+            controller_ips: 可连接的控制器IP，默认取 CONTROLLERS 配置
+            seed: 随机种子
+        """
+        self.sample_rate = float(sample_rate)
+        self.latency = latency
+        self.dropout_rate = dropout_rate
+        self.disconnect_rate = disconnect_rate
+        self.outage_duration = outage_duration
+        self.controller_ips = set(controller_ips or [config["ip"] for config in CONTROLLERS])
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._instances = {}
+        self._next_handle = 1
+        self._outage_until = {}  # {ip: 不可连接的截止时间}
+        self._epoch = time.monotonic()
+
+        # 统计
+        self.read_calls = 0
+        self.nodes_returned = 0
+        self.dropouts = 0
+        self.disconnects = 0
+
+    # ------------------------------------------------------------------
+    # 故障注入
+    # ------------------------------------------------------------------
+    def disconnect(self, ip, outage_duration=None):
+        """
+        断开指定IP控制器的所有连接
+
+        Args:
+            ip: 控制器IP
+            outage_duration: 不可连接时长（秒），默认使用构造参数
+        """
+        duration = self.outage_duration if outage_duration is None else outage_duration
+        with self._lock:
+            self._outage_until[ip] = time.monotonic() + duration
+            for instance in self._instances.values():
+                if instance.ip == ip and instance.connected:
+                    instance.connected = False
+            self.disconnects += 1
+
+    def _is_available(self, ip):
+        return ip in self.controller_ips and time.monotonic() >= self._outage_until.get(ip, 0.0)
+
+    def _delay(self):
+        if callable(self.latency):
+            delay = self.latency()
+        else:
+            mean, std = self.latency
+            delay = self._random.gauss(mean, std) if std > 0 else mean
+        if delay > 0:
+            time.sleep(delay)
+
+    def _get(self, handle):
+        return self._instances.get(int(handle))
+
+    # ------------------------------------------------------------------
+    # TSCMCAPI 接口
+    # ------------------------------------------------------------------
+    def TSCMCAPI_CreateInstance(self):
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._instances[handle] = _SimulatedInstance()
+        return handle
+
+    def TSCMCAPI_ReleaseInstance(self, handle):
+        with self._lock:
+            self._instances.pop(int(handle), None)
+
+    def TSCMCAPI_SetConnectionType(self, handle, connection_type):
+        instance = self._get(handle)
+        if instance is None or connection_type != CONNECTION_TYPE_ETHERNET:
+            return False
+        instance.connection_type = connection_type
+        return True
+
+    def TSCMCAPI_SetUdpPort(self, handle, port):
+        instance = self._get(handle)
+        if instance is None:
+            return False
+        instance.udp_port = port
+        return True
+
+    def TSCMCAPI_SetDestUdpEndPoint(self, handle, ip, port):
+        instance = self._get(handle)
+        if instance is None:
+            return False
+        instance.ip = ip.decode('utf-8') if isinstance(ip, bytes) else ip
+        instance.controller_port = port
+        return True
+
+    def TSCMCAPI_OpenConnectionPort(self, handle):
+        instance = self._get(handle)
+        if instance is None or instance.udp_port is None or instance.ip is None:
+            return False
+        instance.port_open = True
+        return True
+
+    def TSCMCAPI_CloseConnectionPort(self, handle):
+        instance = self._get(handle)
+        if instance is not None:
+            instance.port_open = False
+            instance.connected = False
+
+    def TSCMCAPI_SetConnectionOn(self, handle, index):
+        instance = self._get(handle)
+        if instance is None or not instance.port_open:
+            return TS_ERRCODE_INVALID_PARAMETER
+        self._delay()
+        if not self._is_available(instance.ip):
+            return TS_ERRCODE_DEVICE_NOT_CONNECTED
+        instance.connected = True
+        return TS_ERRCODE_OK
+
+    def TSCMCAPI_SetConnectionOff(self, handle, index):
+        instance = self._get(handle)
+        if instance is None:
+            return TS_ERRCODE_INVALID_PARAMETER
+        instance.connected = False
+        return TS_ERRCODE_OK
+
+    def TSCMCAPI_isConnected(self, handle, index):
+        instance = self._get(handle)
+        return instance is not None and instance.connected
+
+    def TSCMCAPI_SetConfigOutputSignals(self, handle, index, channel, signal_group, data_types, count):
+        instance = self._get(handle)
+        if instance is None or not instance.connected:
+            return TS_ERRCODE_DEVICE_NOT_CONNECTED
+        if count < 1:
+            return TS_ERRCODE_INVALID_PARAMETER
+        instance.output_channels.add(int(channel))
+        return TS_ERRCODE_OK
+
+    def TSCMCAPI_GetSingleDataNode(self, handle, index, nodes, nread, size):
+        count = _pointer_target(nread)
+        count.value = 0
+        instance = self._get(handle)
+        if instance is None or not instance.connected:
+            return TS_ERRCODE_DEVICE_NOT_CONNECTED
+
+        self.read_calls += 1
+        self._delay()
+
+        # 随机断线（泊松过程，按两次调用间隔折算概率）
+        if self.disconnect_rate > 0 and self._random.random() < self.disconnect_rate / self.sample_rate:
+            self.disconnect(instance.ip)
+        if not instance.connected:
+            return TS_ERRCODE_DEVICE_NOT_CONNECTED
+
+        # 没有新样本时等待下一个样本产生
+        elapsed = time.monotonic() - self._epoch
+        sample_index = int(elapsed * self.sample_rate)
+        if sample_index <= instance.last_sample_index:
+            sample_index = instance.last_sample_index + 1
+            wait = self._epoch + sample_index / self.sample_rate - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        instance.last_sample_index = sample_index
+
+        if self._random.random() < self.dropout_rate:
+            self.dropouts += 1
+            return TS_ERRCODE_TIMEOUT
+
+        sample_time = sample_index / self.sample_rate
+        channels = sorted(instance.output_channels)[:size]
+        for i, channel in enumerate(channels):
+            nodes[i].cfg.channel = channel
+            nodes[i].cfg.type = 1
+            nodes[i].data = (SIGNAL_BASE
+                             + SIGNAL_AMPLITUDE * math.sin(2 * math.pi * sample_time / SIGNAL_PERIOD + channel)
+                             + self._random.gauss(0.0, SIGNAL_NOISE))
+        count.value = len(channels)
+        self.nodes_returned += len(channels)
+        return TS_ERRCODE_OK if channels else TS_ERRCODE_TIMEOUT
+
+
+def _pointer_target(pointer):
+    """取 ctypes.byref()/pointer() 参数指向的对象"""
+    target = getattr(pointer, '_obj', None)
+    if target is not None:
+        return target
+    return pointer.contents
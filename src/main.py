@@ -5,6 +5,7 @@
 
 import sys
 import os
+import argparse
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
 
@@ -16,6 +17,7 @@ sys.path.insert(0, os.path.join(current_dir, 'hardware'))
 
 from main_window import MainWindow
 from modules.models import db_manager
+from modules.realtime_chart import CHART_BACKENDS, DEFAULT_CHART_BACKEND
 
 
 def check_dependencies():
@@ -45,9 +47,22 @@ def check_dependencies():
     return True
 
 
-def setup_application():
+def parse_arguments(argv):
+    """解析命令行参数，未识别的参数（如Qt参数）原样交给QApplication"""
+    parser = argparse.ArgumentParser(description="管孔检测系统")
+    parser.add_argument(
+        "--chart-backend",
+        choices=CHART_BACKENDS,
+        default=DEFAULT_CHART_BACKEND,
+        help="实时监控图表后端，高速数据流建议使用 pyqtgraph（默认: %(default)s）",
+    )
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, [argv[0]] + qt_args
+
+
+def setup_application(qt_argv):
     """设置应用程序属性"""
-    app = QApplication(sys.argv)
+    app = QApplication(qt_argv)
 
     # 设置应用程序信息
     app.setApplicationName("上位机软件")
@@ -82,6 +97,8 @@ def main():
     print("负责人: Tsinghua")
     print("=" * 50)
     
+    args, qt_argv = parse_arguments(sys.argv)
+
     # 检查依赖
     if not check_dependencies():
         input("按回车键退出...")
@@ -89,14 +106,15 @@ def main():
     
     try:
         # 创建应用程序
-        app = setup_application()
+        app = setup_application(qt_argv)
 
         # 初始化数据库
         print("初始化数据库...")
         db_manager.create_sample_data()
 
         # 创建主窗口
-        main_window = MainWindow()
+        print(f"实时监控图表后端: {args.chart_backend}")
+        main_window = MainWindow(chart_backend=args.chart_backend)
 
         # 显示主窗口
         main_window.show()
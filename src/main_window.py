@@ -5,6 +5,7 @@
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from PySide6.QtWidgets import (
@@ -12,16 +13,17 @@ from PySide6.QtWidgets import (
     QTabWidget, QMenuBar, QStatusBar, QMessageBox, QFileDialog,
     QPushButton, QLabel, QLineEdit, QComboBox, QGroupBox,
     QProgressBar, QTextEdit, QSplitter, QScrollArea, QFrame,
-    QCompleter, QSpacerItem, QSizePolicy
+    QCompleter, QSpacerItem, QSizePolicy, QSpinBox
 )
 from PySide6.QtCore import Qt, QTimer, Signal, QStringListModel
 from PySide6.QtGui import QAction, QFont, QPalette, QColor
 
 # 导入所有功能模块
-from modules.realtime_chart import RealtimeChart
+from modules.realtime_chart import RealtimeChart, DEFAULT_CHART_BACKEND
 from modules.worker_thread import WorkerThread
 from modules.unified_history_viewer import UnifiedHistoryViewer
 from modules.report_output_interface import ReportOutputInterface
+from modules.operation_log import OperationLogPanel
 
 # 导入AIDCIS2核心组件
 from aidcis2.models.hole_data import HoleData, HoleCollection, HoleStatus
@@ -29,6 +31,24 @@ from aidcis2.models.status_manager import StatusManager
 from aidcis2.dxf_parser import DXFParser
 from aidcis2.data_adapter import DataAdapter
 from aidcis2.graphics.graphics_view import OptimizedGraphicsView
+from aidcis2.detection.probe_scheduler import ProbeScheduler, DEFAULT_MIN_SEPARATION
+from aidcis2.detection.detection_engine import (
+    DetectionEngine, DETECTION_CYCLE_INTERVAL, SIMULATION_CYCLE_INTERVAL
+)
+from aidcis2.detection.eta_predictor import EtaPredictor
+
+
+# 界面按帧取出检测事件的间隔（约60fps）
+EVENT_DRAIN_INTERVAL_MS = 16
+
+# 每帧最多应用的事件数量，防止单帧阻塞
+MAX_EVENTS_PER_FRAME = 4000
+
+# 状态统计面板的最小刷新间隔（秒）
+STATUS_REFRESH_INTERVAL = 0.2
+
+# 检测进度汇总日志的最小间隔（秒），避免每帧写一条日志
+PROGRESS_LOG_INTERVAL = 5.0
 
 
 class MainWindow(QMainWindow):
@@ -43,9 +63,14 @@ class MainWindow(QMainWindow):
     navigate_to_report = Signal(str)    # 导航到报告输出，传递工件ID
     status_updated = Signal(str, str)   # 孔位ID, 新状态
     
-    def __init__(self):
+    def __init__(self, chart_backend: str = DEFAULT_CHART_BACKEND):
+        """
+        Args:
+            chart_backend: 实时监控面板A的绘图后端，"matplotlib" 或 "pyqtgraph"
+        """
         super().__init__()
         self.logger = logging.getLogger(__name__)
+        self.chart_backend = chart_backend
         
         # 原主窗口的属性
         self.worker_thread = None
@@ -65,15 +90,26 @@ class MainWindow(QMainWindow):
         self.detection_running = False
         self.detection_paused = False
         self.detection_holes = []
+        self.detection_scheduler: Optional[ProbeScheduler] = None
+        self.detection_engine: Optional[DetectionEngine] = None
+        self.eta_predictor: Optional[EtaPredictor] = None
+        self.probe_count = 1
+        self.probe_min_separation = DEFAULT_MIN_SEPARATION
+        self._last_status_refresh = 0.0
+        self._last_progress_log = 0.0
+        self._completed_since_log = 0
+        # 检测引擎在工作线程中运行，定时器只负责按帧取出状态事件
         self.detection_timer = QTimer()
+        self.detection_timer.setInterval(EVENT_DRAIN_INTERVAL_MS)
         self.detection_timer.timeout.connect(self._process_detection_step)
-        
+
         # 模拟进度控制
-        self.simulation_running = False
-        self.simulation_timer = QTimer()
-        self.simulation_timer.timeout.connect(self._update_simulation_progress)
-        self.pending_holes = []
-        self.simulation_hole_index = 0
+        self.simulation_running_v2 = False
+        self.simulation_engine: Optional[DetectionEngine] = None
+        self.simulation_eta_predictor: Optional[EtaPredictor] = None
+        self.simulation_timer_v2 = QTimer()
+        self.simulation_timer_v2.setInterval(EVENT_DRAIN_INTERVAL_MS)
+        self.simulation_timer_v2.timeout.connect(self._update_simulation_v2)
 
         # 检测时间相关
         self.detection_start_time = None
@@ -132,7 +168,7 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self.main_detection_widget, "主检测视图")
 
         # 添加实时监控选项卡（二级页面）
-        self.realtime_tab = RealtimeChart()
+        self.realtime_tab = RealtimeChart(backend=self.chart_backend)
         self.tab_widget.addTab(self.realtime_tab, "实时监控")
 
         # 添加统一历史数据选项卡（三级页面，合并3.1和3.2）
@@ -307,6 +343,12 @@ class MainWindow(QMainWindow):
 
         progress_layout.addLayout(stats_grid_layout)
 
+        # 各探头吞吐量
+        self.probe_status_label = QLabel("探头: -")
+        self.probe_status_label.setFont(label_font)
+        self.probe_status_label.setWordWrap(True)
+        progress_layout.addWidget(self.probe_status_label)
+
         # 原有的完成率和合格率 - 使用水平布局节省空间
         rate_layout = QHBoxLayout()
         rate_layout.setSpacing(10)
@@ -561,6 +603,18 @@ class MainWindow(QMainWindow):
         detection_group.setFont(group_title_font)
         detection_layout = QVBoxLayout(detection_group)
 
+        # 探头数量设置
+        probe_count_layout = QHBoxLayout()
+        probe_count_label = QLabel("探头数量:")
+        probe_count_label.setFont(panel_font)
+        self.probe_count_spin = QSpinBox()
+        self.probe_count_spin.setRange(1, 3)
+        self.probe_count_spin.setValue(self.probe_count)
+        self.probe_count_spin.setFont(panel_font)
+        probe_count_layout.addWidget(probe_count_label)
+        probe_count_layout.addWidget(self.probe_count_spin)
+        detection_layout.addLayout(probe_count_layout)
+
         self.start_detection_btn = QPushButton("开始检测")
         self.start_detection_btn.setMinimumHeight(45)  # 增加按钮高度
         self.start_detection_btn.setFont(button_font)
@@ -659,12 +713,14 @@ class MainWindow(QMainWindow):
         log_group.setFont(group_title_font)
         log_layout = QVBoxLayout(log_group)
 
-        self.log_text = QTextEdit()
-        self.log_text.setMaximumHeight(150)
-        self.log_text.setReadOnly(True)
-        self.log_text.setFont(panel_font)  # 设置日志文本字体
+        # 环形缓冲 + 按帧批量刷新，长时间检测时内存和追加开销保持恒定
+        self.log_panel = OperationLogPanel()
+        self.log_panel.setMaximumHeight(180)
+        self.log_panel.text_view.setFont(panel_font)  # 设置日志文本字体
+        # 兼容旧接口：toPlainText() 会先刷新尚未显示的记录
+        self.log_text = self.log_panel
 
-        log_layout.addWidget(self.log_text)
+        log_layout.addWidget(self.log_panel)
 
         layout.addWidget(log_group)
 
@@ -755,11 +811,26 @@ class MainWindow(QMainWindow):
 
     def _update_estimated_time(self):
         """更新预计用时"""
-        if not self.hole_collection or self.detection_elapsed_seconds == 0:
+        if not self.hole_collection:
             self.estimated_time_label.setText("预计用时: 00:00:00")
             return
 
         try:
+            predictor = self._active_eta_predictor()
+            if predictor:
+                # 预测器随完成事件增量更新，这里只读取当前预测
+                estimated_remaining = predictor.predict_remaining_seconds()
+                if estimated_remaining is None:
+                    self.estimated_time_label.setText("预计用时: 计算中...")
+                else:
+                    self.estimated_time_label.setText(
+                        f"预计用时: {self._format_duration(int(estimated_remaining))}")
+                return
+
+            if self.detection_elapsed_seconds == 0:
+                self.estimated_time_label.setText("预计用时: 00:00:00")
+                return
+
             total_holes = len(self.hole_collection)
             completed_holes = self._get_completed_holes_count()
 
@@ -768,18 +839,29 @@ class MainWindow(QMainWindow):
                 avg_time_per_hole = self.detection_elapsed_seconds / completed_holes
                 remaining_holes = total_holes - completed_holes
                 estimated_remaining_seconds = int(avg_time_per_hole * remaining_holes)
-
-                hours = estimated_remaining_seconds // 3600
-                minutes = (estimated_remaining_seconds % 3600) // 60
-                seconds = estimated_remaining_seconds % 60
-                time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-                self.estimated_time_label.setText(f"预计用时: {time_str}")
+                self.estimated_time_label.setText(
+                    f"预计用时: {self._format_duration(estimated_remaining_seconds)}")
             else:
                 self.estimated_time_label.setText("预计用时: 计算中...")
         except Exception:
             self.estimated_time_label.setText("预计用时: 00:00:00")
 
+    def _active_eta_predictor(self) -> Optional[EtaPredictor]:
+        """获取当前运行中的检测或模拟对应的剩余时间预测器"""
+        if self.detection_running and self.eta_predictor:
+            return self.eta_predictor
+        if self.simulation_running_v2 and self.simulation_eta_predictor:
+            return self.simulation_eta_predictor
+        return None
+
+    @staticmethod
+    def _format_duration(total_seconds: int) -> str:
+        """格式化秒数为 HH:MM:SS"""
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
     def _get_completed_holes_count(self):
         """获取已完成检测的孔位数量"""
         if not self.hole_collection:
@@ -804,6 +886,7 @@ class MainWindow(QMainWindow):
         self.start_detection_btn.clicked.connect(self.start_detection)
         self.pause_detection_btn.clicked.connect(self.pause_detection)
         self.stop_detection_btn.clicked.connect(self.stop_detection)
+        self.probe_count_spin.valueChanged.connect(self.set_probe_count)
 
         # 模拟功能连接
         self.simulate_btn.clicked.connect(self._start_simulation_progress_v2)
@@ -905,15 +988,15 @@ class MainWindow(QMainWindow):
                 self.log_message(f"🎯 设置选中孔位: {self.selected_hole.hole_id}")
 
                 # 强制调用UI更新并验证
-                self.log_message("🔄 强制调用孔位信息更新...")
+                self.log_message("🔄 强制调用孔位信息更新...", "DEBUG")
                 self.update_hole_info_display()
 
                 # 验证UI更新结果
-                self.log_message("🔍 验证UI更新结果:")
-                self.log_message(f"  ID标签: '{self.selected_hole_id_label.text()}'")
-                self.log_message(f"  位置标签: '{self.selected_hole_position_label.text()}'")
-                self.log_message(f"  状态标签: '{self.selected_hole_status_label.text()}'")
-                self.log_message(f"  半径标签: '{self.selected_hole_radius_label.text()}'")
+                self.log_message("🔍 验证UI更新结果:", "DEBUG")
+                self.log_message(f"  ID标签: '{self.selected_hole_id_label.text()}'", "DEBUG")
+                self.log_message(f"  位置标签: '{self.selected_hole_position_label.text()}'", "DEBUG")
+                self.log_message(f"  状态标签: '{self.selected_hole_status_label.text()}'", "DEBUG")
+                self.log_message(f"  半径标签: '{self.selected_hole_radius_label.text()}'", "DEBUG")
 
                 # 强制UI组件可见性和刷新
                 self.selected_hole_id_label.setVisible(True)
@@ -972,15 +1055,15 @@ class MainWindow(QMainWindow):
                     self.log_message(f"🎯 精确匹配设置选中孔位: {self.selected_hole.hole_id}")
 
                     # 强制调用UI更新并验证
-                    self.log_message("🔄 强制调用孔位信息更新(精确匹配)...")
+                    self.log_message("🔄 强制调用孔位信息更新(精确匹配)...", "DEBUG")
                     self.update_hole_info_display()
 
                     # 验证UI更新结果
-                    self.log_message("🔍 验证UI更新结果(精确匹配):")
-                    self.log_message(f"  ID标签: '{self.selected_hole_id_label.text()}'")
-                    self.log_message(f"  位置标签: '{self.selected_hole_position_label.text()}'")
-                    self.log_message(f"  状态标签: '{self.selected_hole_status_label.text()}'")
-                    self.log_message(f"  半径标签: '{self.selected_hole_radius_label.text()}'")
+                    self.log_message("🔍 验证UI更新结果(精确匹配):", "DEBUG")
+                    self.log_message(f"  ID标签: '{self.selected_hole_id_label.text()}'", "DEBUG")
+                    self.log_message(f"  位置标签: '{self.selected_hole_position_label.text()}'", "DEBUG")
+                    self.log_message(f"  状态标签: '{self.selected_hole_status_label.text()}'", "DEBUG")
+                    self.log_message(f"  半径标签: '{self.selected_hole_radius_label.text()}'", "DEBUG")
 
                     # 强制UI组件可见性和刷新
                     self.selected_hole_id_label.setVisible(True)
@@ -1157,14 +1240,14 @@ class MainWindow(QMainWindow):
             # 显示前几个孔位的信息用于调试
             for i, hole in enumerate(self.hole_collection):
                 if i < 3:  # 只显示前3个
-                    self.log_message(f"  孔位 {i+1}: {hole.hole_id} 位置=({hole.center_x:.2f}, {hole.center_y:.2f}) 半径={hole.radius:.2f}")
+                    self.log_message(f"  孔位 {i+1}: {hole.hole_id} 位置=({hole.center_x:.2f}, {hole.center_y:.2f}) 半径={hole.radius:.2f}", "DEBUG")
                 elif i == 3:
-                    self.log_message(f"  ... 还有 {len(self.hole_collection) - 3} 个孔位")
+                    self.log_message(f"  ... 还有 {len(self.hole_collection) - 3} 个孔位", "DEBUG")
                     break
 
             # 显示边界信息
             bounds = self.hole_collection.get_bounds()
-            self.log_message(f"孔位边界: X=[{bounds[0]:.2f}, {bounds[2]:.2f}], Y=[{bounds[1]:.2f}, {bounds[3]:.2f}]")
+            self.log_message(f"孔位边界: X=[{bounds[0]:.2f}, {bounds[2]:.2f}], Y=[{bounds[1]:.2f}, {bounds[3]:.2f}]", "DEBUG")
 
             # 使用图形视图加载孔位数据
             self.graphics_view.load_holes(self.hole_collection)
@@ -1172,7 +1255,7 @@ class MainWindow(QMainWindow):
 
             # 检查图形视图状态
             scene_rect = self.graphics_view.scene.sceneRect()
-            self.log_message(f"场景矩形: {scene_rect.x():.2f}, {scene_rect.y():.2f}, {scene_rect.width():.2f}x{scene_rect.height():.2f}")
+            self.log_message(f"场景矩形: {scene_rect.x():.2f}, {scene_rect.y():.2f}, {scene_rect.width():.2f}x{scene_rect.height():.2f}", "DEBUG")
 
         except Exception as e:
             error_msg = f"更新孔位显示失败: {e}"
@@ -1205,6 +1288,7 @@ class MainWindow(QMainWindow):
         self.blind_count_label.setText(f"盲孔: {status_counts[HoleStatus.BLIND]}")
         self.tie_rod_count_label.setText(f"拉杆孔: {status_counts[HoleStatus.TIE_ROD]}")
         self.processing_count_label.setText(f"检测中: {status_counts[HoleStatus.PROCESSING]}")
+        self._update_probe_status_display()
 
         # 更新进度
         try:
@@ -1238,7 +1322,7 @@ class MainWindow(QMainWindow):
 
     def update_hole_info_display(self):
         """更新选中孔位信息显示"""
-        self.log_message("🔄 开始UI更新...")
+        self.log_message("🔄 开始UI更新...", "DEBUG")
 
         # 验证UI组件是否存在
         ui_components = [
@@ -1254,13 +1338,13 @@ class MainWindow(QMainWindow):
                 return
             else:
                 # 检查组件的可见性和父组件
-                self.log_message(f"✅ {name}: 存在={component is not None}, 可见={component.isVisible()}, 启用={component.isEnabled()}")
+                self.log_message(f"✅ {name}: 存在={component is not None}, 可见={component.isVisible()}, 启用={component.isEnabled()}", "DEBUG")
 
-        self.log_message("✅ 所有UI组件验证通过")
+        self.log_message("✅ 所有UI组件验证通过", "DEBUG")
 
         # 检查selected_hole状态
         if self.selected_hole:
-            self.log_message(f"✅ selected_hole存在: {self.selected_hole.hole_id}")
+            self.log_message(f"✅ selected_hole存在: {self.selected_hole.hole_id}", "DEBUG")
         else:
             self.log_message("❌ selected_hole为None")
 
@@ -1283,24 +1367,24 @@ class MainWindow(QMainWindow):
 
         hole = self.selected_hole
         self.log_message(f"🔄 UI更新: 显示孔位 {hole.hole_id} 信息")
-        self.log_message(f"  📊 孔位数据: ID={hole.hole_id}, X={hole.center_x}, Y={hole.center_y}, R={hole.radius}, 状态={hole.status}")
+        self.log_message(f"  📊 孔位数据: ID={hole.hole_id}, X={hole.center_x}, Y={hole.center_y}, R={hole.radius}, 状态={hole.status}", "DEBUG")
 
         try:
             # 基本信息 - 只设置值部分（前缀由布局中的描述标签提供）
             id_text = f"{hole.hole_id}"
             position_text = f"({hole.center_x:.1f}, {hole.center_y:.1f})"
 
-            self.log_message(f"  📝 准备设置ID标签: '{id_text}'")
-            self.log_message(f"  📝 准备设置位置标签: '{position_text}'")
+            self.log_message(f"  📝 准备设置ID标签: '{id_text}'", "DEBUG")
+            self.log_message(f"  📝 准备设置位置标签: '{position_text}'", "DEBUG")
 
             # 设置文本并验证
             self.selected_hole_id_label.setText(id_text)
             actual_id_text = self.selected_hole_id_label.text()
-            self.log_message(f"  ✅ ID标签设置结果: 期望='{id_text}', 实际='{actual_id_text}'")
+            self.log_message(f"  ✅ ID标签设置结果: 期望='{id_text}', 实际='{actual_id_text}'", "DEBUG")
 
             self.selected_hole_position_label.setText(position_text)
             actual_position_text = self.selected_hole_position_label.text()
-            self.log_message(f"  ✅ 位置标签设置结果: 期望='{position_text}', 实际='{actual_position_text}'")
+            self.log_message(f"  ✅ 位置标签设置结果: 期望='{position_text}', 实际='{actual_position_text}'", "DEBUG")
 
             # 立即强制刷新
             self.selected_hole_id_label.repaint()
@@ -1324,19 +1408,19 @@ class MainWindow(QMainWindow):
             status_text = f"{hole.status.value}"
             radius_text = f"{hole.radius:.3f}mm"
 
-            self.log_message(f"  📝 准备设置状态标签: '{status_text}' (颜色: {status_color})")
-            self.log_message(f"  📝 准备设置半径标签: '{radius_text}'")
+            self.log_message(f"  📝 准备设置状态标签: '{status_text}' (颜色: {status_color})", "DEBUG")
+            self.log_message(f"  📝 准备设置半径标签: '{radius_text}'", "DEBUG")
 
             # 设置状态标签并验证
             self.selected_hole_status_label.setText(status_text)
             self.selected_hole_status_label.setStyleSheet(f"color: {status_color}; font-weight: bold;")
             actual_status_text = self.selected_hole_status_label.text()
-            self.log_message(f"  ✅ 状态标签设置结果: 期望='{status_text}', 实际='{actual_status_text}'")
+            self.log_message(f"  ✅ 状态标签设置结果: 期望='{status_text}', 实际='{actual_status_text}'", "DEBUG")
 
             # 设置半径标签并验证
             self.selected_hole_radius_label.setText(radius_text)
             actual_radius_text = self.selected_hole_radius_label.text()
-            self.log_message(f"  ✅ 半径标签设置结果: 期望='{radius_text}', 实际='{actual_radius_text}'")
+            self.log_message(f"  ✅ 半径标签设置结果: 期望='{radius_text}', 实际='{actual_radius_text}'", "DEBUG")
 
             # 强制刷新所有UI组件
             for _, component in ui_components:
@@ -1392,11 +1476,11 @@ class MainWindow(QMainWindow):
                 actual_status = self.selected_hole_status_label.text()
                 actual_radius = self.selected_hole_radius_label.text()
 
-                self.log_message(f"🔍 最终UI验证: {hole_id}")
-                self.log_message(f"  ID标签: '{actual_id}'")
-                self.log_message(f"  位置标签: '{actual_position}'")
-                self.log_message(f"  状态标签: '{actual_status}'")
-                self.log_message(f"  半径标签: '{actual_radius}'")
+                self.log_message(f"🔍 最终UI验证: {hole_id}", "DEBUG")
+                self.log_message(f"  ID标签: '{actual_id}'", "DEBUG")
+                self.log_message(f"  位置标签: '{actual_position}'", "DEBUG")
+                self.log_message(f"  状态标签: '{actual_status}'", "DEBUG")
+                self.log_message(f"  半径标签: '{actual_radius}'", "DEBUG")
 
                 if (hole_id in actual_id and
                     "(" in actual_position and
@@ -1532,14 +1616,14 @@ class MainWindow(QMainWindow):
         try:
             # 设置选中孔位
             self.selected_hole = hole
-            self.log_message(f"📝 设置selected_hole为: {hole.hole_id}")
+            self.log_message(f"📝 设置selected_hole为: {hole.hole_id}", "DEBUG")
 
             # 立即更新UI显示
             self.update_hole_info_display()
 
             # 根据数据可用性启用按钮
             has_data = hole.hole_id in ["H00001", "H00002"]
-            self.log_message(f"🔍 数据可用性检查: {hole.hole_id} -> {has_data}")
+            self.log_message(f"🔍 数据可用性检查: {hole.hole_id} -> {has_data}", "DEBUG")
 
             # 验证按钮对象存在
             buttons = [
@@ -1553,7 +1637,7 @@ class MainWindow(QMainWindow):
                     self.log_message(f"❌ 按钮不存在: {name}")
                     return
 
-            self.log_message("✅ 所有按钮对象验证通过")
+            self.log_message("✅ 所有按钮对象验证通过", "DEBUG")
 
             # 设置按钮状态并验证
             self.goto_realtime_btn.setEnabled(has_data)
@@ -1565,10 +1649,10 @@ class MainWindow(QMainWindow):
             history_enabled = self.goto_history_btn.isEnabled()
             mark_enabled = self.mark_defective_btn.isEnabled()
 
-            self.log_message(f"🎮 按钮状态设置结果:")
-            self.log_message(f"  实时监控: 期望={has_data}, 实际={realtime_enabled}")
-            self.log_message(f"  历史数据: 期望={has_data}, 实际={history_enabled}")
-            self.log_message(f"  标记异常: 期望=True, 实际={mark_enabled}")
+            self.log_message(f"🎮 按钮状态设置结果:", "DEBUG")
+            self.log_message(f"  实时监控: 期望={has_data}, 实际={realtime_enabled}", "DEBUG")
+            self.log_message(f"  历史数据: 期望={has_data}, 实际={history_enabled}", "DEBUG")
+            self.log_message(f"  标记异常: 期望=True, 实际={mark_enabled}", "DEBUG")
 
             # 更新按钮提示文本
             if has_data:
@@ -1589,10 +1673,10 @@ class MainWindow(QMainWindow):
             actual_history_tooltip = self.goto_history_btn.toolTip()
             actual_mark_tooltip = self.mark_defective_btn.toolTip()
 
-            self.log_message(f"💬 工具提示设置结果:")
-            self.log_message(f"  实时监控: '{actual_realtime_tooltip}'")
-            self.log_message(f"  历史数据: '{actual_history_tooltip}'")
-            self.log_message(f"  标记异常: '{actual_mark_tooltip}'")
+            self.log_message(f"💬 工具提示设置结果:", "DEBUG")
+            self.log_message(f"  实时监控: '{actual_realtime_tooltip}'", "DEBUG")
+            self.log_message(f"  历史数据: '{actual_history_tooltip}'", "DEBUG")
+            self.log_message(f"  标记异常: '{actual_mark_tooltip}'", "DEBUG")
 
             # 检查数据关联
             self._check_hole_data_availability(hole.hole_id)
@@ -1631,16 +1715,17 @@ class MainWindow(QMainWindow):
         # 可以在这里更新缩放信息等
         pass
 
-    def log_message(self, message: str):
-        """添加日志消息"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_text.append(formatted_message)
+    def log_message(self, message: str, level: Optional[str] = None):
+        """
+        添加日志消息
+
+        消息先写入日志模型，由日志面板每帧批量显示一次。
 
-        # 自动滚动到底部
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        Args:
+            message: 日志内容
+            level: 日志级别 (DEBUG/INFO/WARNING/ERROR)，None时根据消息前缀推断
+        """
+        self.log_panel.append(message, level)
 
     def filter_holes(self, filter_type: str):
         """过滤孔位显示"""
@@ -1683,6 +1768,12 @@ class MainWindow(QMainWindow):
 
         # 创建有序的孔位列表（按孔位ID顺序）
         self.detection_holes = self._create_ordered_hole_list()
+        self.detection_scheduler = ProbeScheduler(
+            self.detection_holes, self.probe_count, self.probe_min_separation)
+        # 预测器读取初始分配，必须在引擎启动前创建
+        self.eta_predictor = EtaPredictor.from_scheduler(self.detection_scheduler)
+        self.detection_engine = DetectionEngine(
+            self.detection_scheduler, self._simulate_detection_result, DETECTION_CYCLE_INTERVAL)
         self.detection_running = True
         self.detection_paused = False
 
@@ -1690,16 +1781,20 @@ class MainWindow(QMainWindow):
         from datetime import datetime
         self.detection_start_time = datetime.now()
         self.detection_elapsed_seconds = 0
+        self._last_progress_log = time.monotonic()
+        self._completed_since_log = 0
 
         # 更新按钮状态
         self.start_detection_btn.setEnabled(False)
         self.pause_detection_btn.setEnabled(True)
         self.stop_detection_btn.setEnabled(True)
+        self.probe_count_spin.setEnabled(False)
 
-        # 启动检测定时器
-        self.detection_timer.start(1000)  # 每秒处理一个孔位
+        # 启动检测引擎和事件取出定时器
+        self.detection_engine.start()
+        self.detection_timer.start()
 
-        self.log_message("开始检测")
+        self.log_message(f"开始检测 ({self.probe_count} 个探头)")
         self.status_label.setText("检测进行中...")
 
     def pause_detection(self):
@@ -1709,15 +1804,20 @@ class MainWindow(QMainWindow):
 
         if self.detection_paused:
             # 恢复检测
-            self.detection_timer.start(1000)
+            self.detection_engine.resume()
+            if self.eta_predictor:
+                # 暂停时长不计入检测耗时
+                self.eta_predictor.mark_idle(time.monotonic())
+            self.detection_timer.start()
             self.detection_paused = False
             self.pause_detection_btn.setText("暂停检测")
             self.log_message("恢复检测")
             self.status_label.setText("检测进行中...")
         else:
-            # 暂停检测
-            self.detection_timer.stop()
+            # 暂停检测；进行中的周期仍会完成，定时器继续取出事件直到引擎空闲
+            self.detection_engine.pause()
             self.detection_paused = True
+            self._process_detection_step()
             self.pause_detection_btn.setText("恢复检测")
             self.log_message("暂停检测")
             self.status_label.setText("检测已暂停")
@@ -1731,6 +1831,11 @@ class MainWindow(QMainWindow):
         self.detection_running = False
         self.detection_paused = False
 
+        # 停止检测引擎，未完成的孔位由引擎放回队列并恢复为待检
+        if self.detection_engine:
+            self.detection_engine.stop()
+            self._apply_status_events(self.detection_engine.drain())
+
         # 重置检测时间相关变量
         self.detection_start_time = None
 
@@ -1739,205 +1844,157 @@ class MainWindow(QMainWindow):
         self.pause_detection_btn.setEnabled(False)
         self.pause_detection_btn.setText("暂停检测")
         self.stop_detection_btn.setEnabled(False)
+        self.probe_count_spin.setEnabled(True)
 
         self.log_message("停止检测")
         self.status_label.setText("检测已停止")
 
+    def set_probe_count(self, count: int):
+        """设置检测使用的探头数量（下次开始检测时生效）"""
+        self.probe_count = max(1, int(count))
+
     def _process_detection_step(self):
-        """处理检测步骤"""
-        if not self.detection_holes or not self.detection_running:
+        """按帧取出检测引擎产生的状态事件并批量应用到界面"""
+        engine = self.detection_engine
+        if not engine or not self.detection_running:
             self.stop_detection()
             return
 
-        # 获取下一个待检测的孔位
-        current_hole = self.detection_holes.pop(0)
-
-        # 模拟检测过程
-        current_hole.status = HoleStatus.PROCESSING
-        self.graphics_view.update_hole_status(current_hole.hole_id, current_hole.status)
-
-        # 模拟检测结果（这里可以接入真实的检测算法）- 按照指定比例分配状态
-        import random
-        rand_value = random.random()
-
-        if rand_value < 0.995:  # 99.5%概率合格
-            current_hole.status = HoleStatus.QUALIFIED
-        elif rand_value < 0.9999:  # 0.49%概率异常
-            current_hole.status = HoleStatus.DEFECTIVE
-        else:  # 0.01%概率其他状态
-            # 随机分配其他状态
-            other_statuses = [HoleStatus.BLIND, HoleStatus.TIE_ROD]
-            current_hole.status = random.choice(other_statuses)
-
-        self.graphics_view.update_hole_status(current_hole.hole_id, current_hole.status)
-        self.update_status_display()
+        completed = self._apply_status_events(engine.drain(MAX_EVENTS_PER_FRAME))
+        for event in completed:
+            if self.eta_predictor:
+                self.eta_predictor.record_completion(event.probe_id, event.hole_id, event.timestamp)
+            if event.status != HoleStatus.QUALIFIED:
+                self.log_message(f"检测完成: 探头{event.probe_id} {event.hole_id} - {event.status.value}", "WARNING")
+        if completed:
+            self._completed_since_log += len(completed)
+            now = time.monotonic()
+            if now - self._last_progress_log >= PROGRESS_LOG_INTERVAL:
+                last = completed[-1]
+                self.log_message(f"最近 {now - self._last_progress_log:.0f} 秒完成 {self._completed_since_log} 个孔位，"
+                                 f"最新: {last.hole_id} - {last.status.value}", "DEBUG")
+                self._last_progress_log = now
+                self._completed_since_log = 0
+
+        if engine.error:
+            self.stop_detection()
+            self.log_message(f"❌ 检测引擎异常: {engine.error}")
+            return
 
-        self.log_message(f"检测完成: {current_hole.hole_id} - {current_hole.status.value}")
+        # 暂停后等引擎完成进行中的周期并取完事件，再停止定时器
+        if self.detection_paused and engine.is_idle() and engine.events.empty():
+            self.detection_timer.stop()
+            return
 
         # 检查是否完成所有检测
-        if not self.detection_holes:
+        if engine.is_finished() and engine.events.empty():
             self.stop_detection()
+            self.update_status_display()
             self.log_message("所有孔位检测完成")
+            self._log_eta_accuracy(self.eta_predictor)
             QMessageBox.information(self, "完成", "所有孔位检测完成！")
 
-    def _create_ordered_hole_list(self):
-        """创建有序的孔位列表（按孔位ID顺序）"""
-        holes = list(self.hole_collection.holes.values())
-
-        # 按孔位ID排序，确保从H00001开始顺序进行
-        holes.sort(key=lambda h: h.hole_id)
-
-        return holes
+    def _apply_status_events(self, events: list) -> list:
+        """
+        将一批状态事件应用到孔位数据和图形视图
 
-    # 模拟进度功能
-    def _start_simulation_progress(self):
-        """开始模拟进度"""
-        if not self.hole_collection:
-            QMessageBox.warning(self, "警告", "请先加载DXF文件")
-            return
+        Args:
+            events: 按产生顺序排列的 HoleStatusEvent 列表
 
-        if self.simulation_running:
-            # 停止模拟
-            self.simulation_timer.stop()
-            self.simulation_running = False
-            self.simulate_btn.setText("使用模拟进度")
-            self.log_message("⏹️ 停止模拟进度")
-            return
+        Returns:
+            list: 其中表示检测完成（最终状态）的事件
+        """
+        if not events or not self.hole_collection:
+            return []
 
-        # 创建待处理孔位列表（按孔位ID顺序）
-        self.pending_holes = list(self.hole_collection.holes.values())
-        # 按孔位ID排序，确保从H00001开始顺序进行
-        self.pending_holes.sort(key=lambda hole: hole.hole_id)
-        self.simulation_hole_index = 0
+        # 同一孔位在一帧内的多次变化只保留最终状态
+        updates = DetectionEngine.coalesce(events)
 
-        self.log_message(f"🎯 准备模拟 {len(self.pending_holes)} 个孔位")
-        self.log_message(f"📋 孔位列表: {[h.hole_id for h in self.pending_holes[:5]]}{'...' if len(self.pending_holes) > 5 else ''}")
+        # 图形项与孔位共享数据对象，先更新图形项才能触发外观变化
+        self.graphics_view.batch_update_status(updates)
+        for hole_id, status in updates.items():
+            hole = self.hole_collection.holes.get(hole_id)
+            if hole is not None:
+                hole.status = status
 
-        # 检查图形视图状态
-        graphics_hole_count = len(self.graphics_view.hole_items) if hasattr(self.graphics_view, 'hole_items') else 0
-        self.log_message(f"🖼️ 图形视图中的孔位数量: {graphics_hole_count}")
-
-        if graphics_hole_count == 0:
-            self.log_message("⚠️ 图形视图中没有孔位，模拟可能无法显示颜色变化")
-
-        # 启动模拟定时器
-        self.simulation_timer.start(1000)  # 每1000ms更新一个孔位，便于观察
-        self.simulation_running = True
-        self.simulate_btn.setText("停止模拟")
-
-        self.log_message("🚀 开始模拟进度")
-
-    def _update_simulation_progress(self):
-        """更新模拟进度"""
-        if not self.pending_holes or self.simulation_hole_index >= len(self.pending_holes):
-            # 模拟完成
-            self.simulation_timer.stop()
-            self.simulation_running = False
-            self.simulate_btn.setText("使用模拟进度")
-            self.log_message("✅ 模拟进度完成")
-            return
-
-        # 获取当前孔位
-        current_hole = self.pending_holes[self.simulation_hole_index]
-
-        self.log_message(f"🔄 正在处理孔位: {current_hole.hole_id} (索引: {self.simulation_hole_index}/{len(self.pending_holes)})")
-
-        # 检查图形视图中是否有这个孔位
-        if current_hole.hole_id not in self.graphics_view.hole_items:
-            self.log_message(f"⚠️ 图形视图中未找到孔位: {current_hole.hole_id}")
-            self.simulation_hole_index += 1
-            return
-
-        # 获取图形项
-        hole_item = self.graphics_view.hole_items[current_hole.hole_id]
-
-        # 先设置为检测中状态
-        old_status = current_hole.status
-        old_brush = hole_item.brush().color().name()
-
-        # 更新为检测中状态
-        current_hole.status = HoleStatus.PROCESSING
-        hole_item.update_status(current_hole.status)
-
-        processing_brush = hole_item.brush().color().name()
-        self.log_message(f"🔵 {current_hole.hole_id}: {old_status.value} → {current_hole.status.value}")
-        self.log_message(f"🎨 颜色变化: {old_brush} → {processing_brush}")
-
-        # 强制刷新显示检测中状态
-        hole_item.update()
-        self.graphics_view.scene.update(hole_item.boundingRect())
-        self.graphics_view.viewport().update()
+        now = time.monotonic()
+        if now - self._last_status_refresh >= STATUS_REFRESH_INTERVAL:
+            self._last_status_refresh = now
+            self.update_status_display()
 
-        self.update_status_display()
+        return [event for event in events
+                if event.status not in (HoleStatus.PROCESSING, HoleStatus.PENDING)]
 
-        # 保存当前状态，准备延迟更新最终状态
+    def _simulate_detection_result(self, hole: Optional[HoleData] = None) -> HoleStatus:
+        """模拟检测结果（这里可以接入真实的检测算法）- 按照指定比例分配状态"""
         import random
         rand_value = random.random()
 
         if rand_value < 0.995:  # 99.5%概率合格
-            final_status = HoleStatus.QUALIFIED
-            color_emoji = "🟢"
+            return HoleStatus.QUALIFIED
         elif rand_value < 0.9999:  # 0.49%概率异常
-            final_status = HoleStatus.DEFECTIVE
-            color_emoji = "🔴"
+            return HoleStatus.DEFECTIVE
         else:  # 0.01%概率其他状态
             # 随机分配其他状态
             other_statuses = [HoleStatus.BLIND, HoleStatus.TIE_ROD]
-            final_status = random.choice(other_statuses)
-            color_emoji = "🟡" if final_status == HoleStatus.BLIND else "🔵"
-
-        # 使用定时器延迟更新最终状态，让用户看到检测中状态
-        def update_final_status():
-            # 更新最终状态显示
-            final_old_brush = hole_item.brush().color().name()
-            current_hole.status = final_status
-            hole_item.update_status(final_status)
-            final_new_brush = hole_item.brush().color().name()
-
-            self.log_message(f"{color_emoji} {current_hole.hole_id}: 检测完成 → {final_status.value}")
-            self.log_message(f"🎨 最终颜色变化: {final_old_brush} → {final_new_brush}")
-
-            # 多重强制刷新
-            hole_item.update()
-            self.graphics_view.scene.update(hole_item.boundingRect())
-            self.graphics_view.viewport().update()
-            self.graphics_view.update()
-
-            # 验证状态是否真的更新了
-            actual_status = hole_item.hole_data.status
-            if actual_status == final_status:
-                self.log_message(f"✅ 状态更新成功: {actual_status.value}")
-            else:
-                self.log_message(f"❌ 状态更新失败: 期望 {final_status.value}, 实际 {actual_status.value}")
+            return random.choice(other_statuses)
 
-            self.update_status_display()
+    def _log_eta_accuracy(self, predictor: Optional[EtaPredictor]):
+        """检测完成后记录剩余时间预测的误差"""
+        if not predictor:
+            return
+        errors = predictor.prediction_errors()
+        if not errors:
+            return
+        max_error = max(abs(error) for _, error in errors)
+        # 检测后半程的预测用于排班，单独统计
+        half = predictor.finish_elapsed / 2 if predictor.finish_elapsed else 0
+        late_errors = [abs(error) for elapsed, error in errors if elapsed >= half]
+        late_max = max(late_errors) if late_errors else 0.0
+        self.log_message(f"预计用时误差: 最大 {max_error:.1f} 秒，后半程最大 {late_max:.1f} 秒")
+
+    def _update_probe_status_display(self):
+        """更新各探头吞吐量显示"""
+        if not self.detection_engine:
+            self.probe_status_label.setText("探头: -")
+            return
 
-            # 移动到下一个孔位
-            self.simulation_hole_index += 1
+        parts = []
+        for stats in self.detection_engine.get_probe_statistics():
+            throughput = stats['throughput']
+            if self.eta_predictor:
+                # 优先显示指数加权吞吐量
+                throughput = self.eta_predictor.probe_throughput(stats['probe_id']) or throughput
+            holes_per_minute = throughput * 60
+            parts.append(f"探头{stats['probe_id']}: 已完成 {stats['completed']} "
+                         f"剩余 {stats['remaining']} ({holes_per_minute:.1f}孔/分)")
+        self.probe_status_label.setText("\n".join(parts))
 
-        # 500ms后更新最终状态
-        QTimer.singleShot(500, update_final_status)
+    def _create_ordered_hole_list(self):
+        """创建有序的孔位列表（按孔位ID顺序）"""
+        holes = list(self.hole_collection.holes.values())
+
+        # 按孔位ID排序，确保从H00001开始顺序进行
+        holes.sort(key=lambda h: h.hole_id)
 
+        return holes
+
+    # 模拟进度功能
     def _start_simulation_progress_v2(self):
-        """开始模拟进度 V2 - 强制颜色更新版本"""
+        """开始/停止模拟进度 - 模拟引擎在工作线程中运行，界面按帧批量刷新"""
         if not self.hole_collection:
             QMessageBox.warning(self, "警告", "请先加载DXF文件")
             return
 
-        if hasattr(self, 'simulation_running_v2') and self.simulation_running_v2:
-            # 停止模拟
-            if hasattr(self, 'simulation_timer_v2'):
-                self.simulation_timer_v2.stop()
-            self.simulation_running_v2 = False
-            self.simulate_btn.setText("使用模拟进度")
-            self.log_message("⏹️ 停止模拟进度 V2")
+        if self.simulation_running_v2:
+            self._stop_simulation_v2()
+            self.log_message("⏹️ 停止模拟进度")
             return
 
-        # 初始化V2模拟
-        self.simulation_running_v2 = True
-        self.simulation_index_v2 = 0
+        # 初始化模拟
         self.holes_list_v2 = list(self.hole_collection.holes.values())
         self.holes_list_v2.sort(key=lambda h: h.hole_id)
+        self.simulation_index_v2 = 0
 
         # 初始化统计计数器
         self.v2_stats = {
@@ -1947,122 +2004,86 @@ class MainWindow(QMainWindow):
             "拉杆孔": 0
         }
 
+        scheduler = ProbeScheduler(self.holes_list_v2, self.probe_count, self.probe_min_separation)
+        self.simulation_eta_predictor = EtaPredictor.from_scheduler(scheduler)
+        self.simulation_engine = DetectionEngine(
+            scheduler, self._simulate_detection_result, SIMULATION_CYCLE_INTERVAL)
+
         total_holes = len(self.holes_list_v2)
-        self.log_message(f"🚀 开始模拟进度 V2 - 高频检测模式")
-        self.log_message(f"🎯 将处理 {total_holes} 个孔位")
-        self.log_message(f"⏱️ 检测频率: 1000ms/孔位 (蓝色→最终颜色: 100ms)")
+        holes_per_second = int(self.probe_count / SIMULATION_CYCLE_INTERVAL)
+        self.log_message(f"🚀 开始模拟进度 - 高频检测模式")
+        self.log_message(f"🎯 将处理 {total_holes} 个孔位 ({self.probe_count} 个探头)")
+        self.log_message(f"⏱️ 模拟速度: 约 {holes_per_second} 孔位/秒，界面每 {EVENT_DRAIN_INTERVAL_MS}ms 批量刷新")
         self.log_message(f"📊 预期分布比例:")
         self.log_message(f"  🟢 合格: 99.5% (约 {int(total_holes * 0.995)} 个)")
         self.log_message(f"  🔴 异常: 0.49% (约 {int(total_holes * 0.0049)} 个)")
         self.log_message(f"  🟡🔵 其他: 0.01% (约 {int(total_holes * 0.0001)} 个)")
 
-        # 创建定时器
-        if not hasattr(self, 'simulation_timer_v2'):
-            self.simulation_timer_v2 = QTimer()
-            self.simulation_timer_v2.timeout.connect(self._update_simulation_v2)
-
-        self.simulation_timer_v2.start(1000)  # 1000ms一个孔位
+        self.simulation_running_v2 = True
+        self.simulation_engine.start()
+        self.simulation_timer_v2.start()
         self.simulate_btn.setText("停止模拟")
 
+    def _stop_simulation_v2(self):
+        """停止模拟引擎并应用剩余事件"""
+        self.simulation_timer_v2.stop()
+        self.simulation_running_v2 = False
+        self.simulate_btn.setText("使用模拟进度")
+        if self.simulation_engine:
+            self.simulation_engine.stop()
+            self._record_simulation_results(self._apply_status_events(self.simulation_engine.drain()))
+        self.update_status_display()
+
+    def _record_simulation_results(self, completed: list):
+        """统计模拟完成的孔位"""
+        status_names = {
+            HoleStatus.QUALIFIED: "合格",
+            HoleStatus.DEFECTIVE: "异常",
+            HoleStatus.BLIND: "盲孔",
+            HoleStatus.TIE_ROD: "拉杆孔",
+        }
+        for event in completed:
+            if self.simulation_eta_predictor:
+                self.simulation_eta_predictor.record_completion(event.probe_id, event.hole_id, event.timestamp)
+            self.v2_stats[status_names[event.status]] += 1
+            if event.status != HoleStatus.QUALIFIED:
+                self.log_message(f"⚠️ 模拟: {event.hole_id} 检测完成 → {status_names[event.status]}", "WARNING")
+        self.simulation_index_v2 += len(completed)
+
     def _update_simulation_v2(self):
-        """更新模拟进度 V2 - 强制颜色更新"""
-        if self.simulation_index_v2 >= len(self.holes_list_v2):
-            # 模拟完成
-            self.simulation_timer_v2.stop()
-            self.simulation_running_v2 = False
-            self.simulate_btn.setText("使用模拟进度")
-
-            # 显示最终统计结果
-            total = sum(self.v2_stats.values())
-            self.log_message("✅ 模拟进度 V2 完成")
-            self.log_message("📊 最终统计结果:")
-
-            for status, count in self.v2_stats.items():
-                percentage = (count / total * 100) if total > 0 else 0
-                emoji_map = {"合格": "🟢", "异常": "🔴", "盲孔": "🟡", "拉杆孔": "🔵"}
-                emoji = emoji_map.get(status, "⚫")
-                self.log_message(f"  {emoji} {status}: {count} 个 ({percentage:.2f}%)")
-
-            # 显示合格率
-            qualified_rate = (self.v2_stats["合格"] / total * 100) if total > 0 else 0
-            self.log_message(f"🎯 总合格率: {qualified_rate:.2f}%")
+        """按帧取出模拟事件并批量应用到界面"""
+        engine = self.simulation_engine
+        if not engine:
             return
 
-        # 获取当前孔位
-        current_hole = self.holes_list_v2[self.simulation_index_v2]
-        hole_id = current_hole.hole_id
+        self._record_simulation_results(self._apply_status_events(engine.drain(MAX_EVENTS_PER_FRAME)))
 
-        self.log_message(f"🔄 V2处理孔位: {hole_id} ({self.simulation_index_v2 + 1}/{len(self.holes_list_v2)})")
+        if engine.error:
+            self._stop_simulation_v2()
+            self.log_message(f"❌ 模拟引擎异常: {engine.error}")
+            return
 
-        # 检查图形项是否存在
-        if hole_id not in self.graphics_view.hole_items:
-            self.log_message(f"⚠️ V2: 图形项不存在 {hole_id}")
-            self.simulation_index_v2 += 1
+        if not (engine.is_finished() and engine.events.empty()):
             return
 
-        # 获取图形项并强制设置颜色
-        hole_item = self.graphics_view.hole_items[hole_id]
-
-        # 直接设置蓝色（检测中）
-        from PySide6.QtGui import QColor, QPen, QBrush
-        processing_color = QColor(0, 123, 255)  # 蓝色
-        hole_item.setBrush(QBrush(processing_color))
-        hole_item.setPen(QPen(processing_color.darker(120), 2.0))
-        hole_item.update()
-
-        self.log_message(f"🔵 V2: {hole_id} 强制设置蓝色（检测中）")
-
-        # 多重强制刷新
-        self.graphics_view.scene.update()
-        self.graphics_view.viewport().update()
-        self.graphics_view.update()
-
-        # 500ms后设置最终颜色
-        def set_final_color():
-            import random
-            rand = random.random()
-
-            # 按照精确的规格要求分配状态
-            if rand < 0.995:  # 99.5%概率 - 合格
-                final_color = QColor(0, 255, 0)  # 绿色
-                status_text = "合格"
-                emoji = "🟢"
-            elif rand < 0.9999:  # 0.49%概率 - 异常 (99.5% + 0.49% = 99.99%)
-                final_color = QColor(255, 0, 0)  # 红色
-                status_text = "异常"
-                emoji = "🔴"
-            else:  # 0.01%概率 - 其他状态
-                # 随机选择其他状态
-                other_rand = random.random()
-                if other_rand < 0.5:  # 50%概率是盲孔
-                    final_color = QColor(255, 255, 0)  # 黄色
-                    status_text = "盲孔"
-                    emoji = "🟡"
-                else:  # 50%概率是拉杆孔
-                    final_color = QColor(0, 0, 255)  # 蓝色
-                    status_text = "拉杆孔"
-                    emoji = "🔵"
-
-            # 直接设置最终颜色
-            hole_item.setBrush(QBrush(final_color))
-            hole_item.setPen(QPen(final_color.darker(120), 2.0))
-            hole_item.update()
-
-            self.log_message(f"{emoji} V2: {hole_id} 检测完成 → {status_text} ({final_color.name()})")
-
-            # 更新统计计数
-            self.v2_stats[status_text] += 1
-
-            # 多重强制刷新
-            self.graphics_view.scene.update()
-            self.graphics_view.viewport().update()
-            self.graphics_view.update()
-
-            # 移动到下一个孔位
-            self.simulation_index_v2 += 1
-
-        # 延迟设置最终颜色
-        QTimer.singleShot(100, set_final_color)  # 100ms后设置最终颜色
+        # 模拟完成
+        self._stop_simulation_v2()
+
+        # 显示最终统计结果
+        total = sum(self.v2_stats.values())
+        self.log_message("✅ 模拟进度完成")
+        self.log_message("📊 最终统计结果:")
+
+        for status, count in self.v2_stats.items():
+            percentage = (count / total * 100) if total > 0 else 0
+            emoji_map = {"合格": "🟢", "异常": "🔴", "盲孔": "🟡", "拉杆孔": "🔵"}
+            emoji = emoji_map.get(status, "⚫")
+            self.log_message(f"  {emoji} {status}: {count} 个 ({percentage:.2f}%)")
+
+        # 显示合格率
+        qualified_rate = (self.v2_stats["合格"] / total * 100) if total > 0 else 0
+        self.log_message(f"🎯 总合格率: {qualified_rate:.2f}%")
+        self._log_eta_accuracy(self.simulation_eta_predictor)
 
     # 孔位操作方法
     def goto_realtime(self):
@@ -2213,17 +2234,25 @@ class MainWindow(QMainWindow):
         # 停止所有定时器
         if hasattr(self, 'detection_timer'):
             self.detection_timer.stop()
-        if hasattr(self, 'simulation_timer'):
-            self.simulation_timer.stop()
+        if hasattr(self, 'simulation_timer_v2'):
+            self.simulation_timer_v2.stop()
         if hasattr(self, 'update_timer'):
             self.update_timer.stop()
 
+        # 停止检测/模拟引擎
+        for engine in (self.detection_engine, self.simulation_engine):
+            if engine:
+                engine.stop()
+
         # 停止工作线程
         if self.worker_thread and self.worker_thread.isRunning():
             self.worker_thread.quit()
             self.worker_thread.wait()
 
         self.logger.info("主窗口关闭")
+
+        # 子控件收不到closeEvent，在这里写出最后一帧的日志
+        self.log_panel.shutdown()
         event.accept()
 
 
@@ -0,0 +1,264 @@
+"""
+超差监控模块
+对测量样本做向量化超差分类，把连续超差样本合并为深度区间，
+并通过列表模型按帧增量刷新异常面板
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor
+
+
+# 超差方向
+SIDE_UPPER = "upper"
+SIDE_LOWER = "lower"
+
+# 异常面板保留的最大区间数（超过后丢弃最早的区间）
+DEFAULT_MAX_ROWS = 1000
+
+# 异常文字颜色，与原异常面板一致
+ANOMALY_TEXT_COLOR = QColor("#FFC0CB")
+
+
+@dataclass
+class AnomalyInterval:
+    """一段连续超差的深度区间"""
+    start_depth: float
+    end_depth: float
+    sample_count: int
+    peak_depth: float
+    peak_diameter: float
+    peak_deviation: float
+    side: str
+
+    def format(self) -> str:
+        """格式化为异常面板显示文本"""
+        direction = "偏大" if self.side == SIDE_UPPER else "偏小"
+        if self.sample_count == 1:
+            depth_text = f"深度: {self.start_depth:.1f}mm"
+        else:
+            depth_text = f"深度: {self.start_depth:.1f}~{self.end_depth:.1f}mm ({self.sample_count}点)"
+        return (f"{depth_text}\n"
+                f"直径: {self.peak_diameter:.3f}mm {direction}  偏差: {self.peak_deviation:.3f}mm")
+
+
+class AnomalyTracker:
+    """
+    超差区间跟踪器
+
+    每块样本用NumPy一次完成超差分类和区间划分；与上一块末尾同方向相连的
+    超差样本并入最后一个区间，因此逐点和分块输入得到相同的区间。
+    """
+
+    def __init__(self, max_intervals: int = DEFAULT_MAX_ROWS):
+        """
+        初始化
+
+        Args:
+            max_intervals: 保留的最大区间数
+        """
+        self.max_intervals = max(1, int(max_intervals))
+        self.intervals: List[AnomalyInterval] = []
+        self.anomaly_count = 0
+        self.sample_count = 0
+        self.dropped_count = 0
+        self.revision = 0
+        self.generation = 0
+        self._open_side: Optional[str] = None
+
+    def clear(self) -> None:
+        """清除所有区间和计数"""
+        self.intervals = []
+        self.anomaly_count = 0
+        self.sample_count = 0
+        self.dropped_count = 0
+        self._open_side = None
+        self.revision += 1
+        self.generation += 1
+
+    @property
+    def anomaly_rate(self) -> float:
+        """超差样本占比（百分比）"""
+        return self.anomaly_count / self.sample_count * 100 if self.sample_count else 0.0
+
+    def add_chunk(self, depths, diameters, lower: float, upper: float) -> int:
+        """
+        分类一块样本并合并超差区间
+
+        Args:
+            depths: 深度数组
+            diameters: 直径数组
+            lower: 公差下限
+            upper: 公差上限
+
+        Returns:
+            int: 本块超差样本数
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        diameters = np.asarray(diameters, dtype=np.float64)
+        if len(diameters) == 0:
+            return 0
+        self.sample_count += len(diameters)
+
+        # 方向编码：1 偏大，-1 偏小，0 合格
+        sides = (diameters > upper).astype(np.int8) - (diameters < lower).astype(np.int8)
+        outside = np.flatnonzero(sides)
+        if len(outside) == 0:
+            self._open_side = None
+            return 0
+
+        # 下标不连续或方向改变处开始新区间
+        outside_sides = sides[outside]
+        starts = np.concatenate(([True], (np.diff(outside) > 1) | (np.diff(outside_sides) != 0)))
+        run_ids = np.cumsum(starts) - 1
+        run_starts = np.flatnonzero(starts)
+        run_ends = np.concatenate((run_starts[1:], [len(outside)])) - 1
+
+        deviation = np.where(outside_sides > 0, diameters[outside] - upper, lower - diameters[outside])
+        order = np.lexsort((-deviation, run_ids))
+        peaks = order[np.concatenate(([True], np.diff(run_ids[order]) != 0))]
+        counts = np.bincount(run_ids)
+
+        new_intervals = [
+            AnomalyInterval(
+                start_depth=float(depths[outside[s]]),
+                end_depth=float(depths[outside[e]]),
+                sample_count=int(c),
+                peak_depth=float(depths[outside[p]]),
+                peak_diameter=float(diameters[outside[p]]),
+                peak_deviation=float(deviation[p]),
+                side=SIDE_UPPER if outside_sides[s] > 0 else SIDE_LOWER,
+            )
+            for s, e, p, c in zip(run_starts.tolist(), run_ends.tolist(), peaks.tolist(), counts.tolist())
+        ]
+
+        # 与上一块末尾相连的同方向区间合并
+        if outside[0] == 0 and self._open_side == new_intervals[0].side and self.intervals:
+            self._merge_into_last(new_intervals.pop(0))
+        self._append(new_intervals)
+
+        # 本块以超差样本结尾时，下一块开头的同方向超差继续并入该区间
+        if outside[-1] == len(diameters) - 1:
+            self._open_side = SIDE_UPPER if outside_sides[-1] > 0 else SIDE_LOWER
+        else:
+            self._open_side = None
+        self.anomaly_count += len(outside)
+        self.revision += 1
+        return len(outside)
+
+    def add_sample(self, depth: float, diameter: float, lower: float, upper: float) -> bool:
+        """
+        分类单个样本（逐点输入的快速路径）
+
+        Returns:
+            bool: 样本是否超差
+        """
+        self.sample_count += 1
+        if lower <= diameter <= upper:
+            self._open_side = None
+            return False
+
+        side = SIDE_UPPER if diameter > upper else SIDE_LOWER
+        deviation = diameter - upper if side == SIDE_UPPER else lower - diameter
+        interval = AnomalyInterval(depth, depth, 1, depth, diameter, deviation, side)
+        if self._open_side == side and self.intervals:
+            self._merge_into_last(interval)
+        else:
+            self._append([interval])
+        self._open_side = side
+        self.anomaly_count += 1
+        self.revision += 1
+        return True
+
+    def _merge_into_last(self, interval: AnomalyInterval) -> None:
+        last = self.intervals[-1]
+        last.end_depth = interval.end_depth
+        last.sample_count += interval.sample_count
+        if interval.peak_deviation > last.peak_deviation:
+            last.peak_depth = interval.peak_depth
+            last.peak_diameter = interval.peak_diameter
+            last.peak_deviation = interval.peak_deviation
+
+    def _append(self, intervals: List[AnomalyInterval]) -> None:
+        self.intervals.extend(intervals)
+        overflow = len(self.intervals) - self.max_intervals
+        if overflow > 0:
+            del self.intervals[:overflow]
+            self.dropped_count += overflow
+
+
+class AnomalyListModel(QAbstractListModel):
+    """
+    异常区间列表模型
+
+    sync() 由界面每帧调用一次：只插入新增的区间、只通知最后一个区间的变化，
+    不重建任何控件。
+    """
+
+    def __init__(self, tracker: AnomalyTracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self._rows: List[AnomalyInterval] = []
+        self._dropped = 0
+        self._revision = tracker.revision
+        self._generation = tracker.generation
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        interval = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return interval.format()
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return ANOMALY_TEXT_COLOR
+        if role == Qt.ItemDataRole.UserRole:
+            return interval
+        return None
+
+    def sync(self) -> bool:
+        """
+        与跟踪器同步
+
+        Returns:
+            bool: 是否有变化
+        """
+        tracker = self.tracker
+        if tracker.revision == self._revision:
+            return False
+        self._revision = tracker.revision
+
+        intervals = tracker.intervals
+        dropped = tracker.dropped_count - self._dropped
+        if tracker.generation != self._generation or dropped > len(self._rows):
+            # 跟踪器被清空或一帧内滚动超过整个列表，整体重置
+            self.beginResetModel()
+            self._rows = list(intervals)
+            self._dropped = tracker.dropped_count
+            self._generation = tracker.generation
+            self.endResetModel()
+            return True
+
+        if dropped:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            del self._rows[:dropped]
+            self._dropped = tracker.dropped_count
+            self.endRemoveRows()
+
+        # 最后一行可能因合并而变化
+        if self._rows:
+            last_row = len(self._rows) - 1
+            index = self.index(last_row)
+            self.dataChanged.emit(index, index)
+
+        added = len(intervals) - len(self._rows)
+        if added > 0:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(intervals) - 1)
+            self._rows.extend(intervals[len(self._rows):])
+            self.endInsertRows()
+        return True
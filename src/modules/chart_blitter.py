@@ -0,0 +1,81 @@
+"""
+matplotlib 局部重绘（blitting）辅助模块
+缓存坐标轴、网格、公差线和文字等静态背景，每帧只重绘动态的数据线和异常标记
+"""
+
+from typing import Iterable, List
+
+from matplotlib.artist import Artist
+
+
+class ChartBlitter:
+    """
+    管理一个画布上的动态图元
+
+    背景在每次完整重绘（draw_event）后自动重新截取，因此窗口缩放、
+    坐标轴范围或公差线变化时只需调用 canvas.draw_idle()；数据更新时调用
+    update() 即可只重绘动态图元。
+    """
+
+    def __init__(self, canvas, artists: Iterable[Artist] = ()):
+        """
+        初始化
+
+        Args:
+            canvas: matplotlib 画布（需支持 copy_from_bbox/blit）
+            artists: 需要逐帧重绘的图元
+        """
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self._background = None
+        self._artists: List[Artist] = []
+        self.full_draw_count = 0
+        self.blit_count = 0
+        self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+        self.set_artists(artists)
+
+    def set_artists(self, artists: Iterable[Artist]) -> None:
+        """替换动态图元（坐标轴被清空并重建图元后调用）"""
+        for artist in self._artists:
+            artist.set_animated(False)
+        self._artists = list(artists)
+        for artist in self._artists:
+            artist.set_animated(True)
+        self.invalidate()
+
+    @property
+    def artists(self) -> List[Artist]:
+        """当前的动态图元"""
+        return list(self._artists)
+
+    def invalidate(self) -> None:
+        """丢弃背景缓存并请求一次完整重绘"""
+        self._background = None
+        self.canvas.draw_idle()
+
+    def _on_draw(self, event) -> None:
+        """完整重绘后截取背景并补画动态图元"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self.full_draw_count += 1
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        for artist in self._artists:
+            if artist.axes is not None and artist.figure is self.figure:
+                self.figure.draw_artist(artist)
+
+    def update(self) -> None:
+        """只重绘动态图元；背景尚未就绪时退化为一次完整重绘"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.figure.bbox)
+        self.blit_count += 1
+
+    def disconnect(self) -> None:
+        """断开与画布的事件连接"""
+        self.canvas.mpl_disconnect(self._draw_cid)
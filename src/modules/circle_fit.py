@@ -0,0 +1,226 @@
+"""
+代数圆拟合模块
+Kåsa、Pratt 和 Taubin 闭式代数拟合，支持一次拟合多组点集（批量、向量化）。
+Pratt/Taubin 按 Chernov 的牛顿迭代求特征多项式根，精度与几何最小二乘相当；
+SciPy least_squares 只作为可选的几何精化步骤。
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from scipy.optimize import least_squares
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+FIT_METHODS = ("kasa", "pratt", "taubin")
+DEFAULT_FIT_METHOD = "taubin"
+
+# 牛顿迭代参数
+NEWTON_MAX_ITERATIONS = 20
+NEWTON_EPSILON = 1e-12
+
+CircleArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _as_point_sets(x, y):
+    """
+    整理为 M×N 的点集数组和有效点掩码
+
+    一维输入视为一组点；点数不同的点集可用NaN补齐到相同长度。
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=np.float64))
+    y = np.atleast_2d(np.asarray(y, dtype=np.float64))
+    if x.shape != y.shape:
+        raise ValueError(f"x和y形状不一致: {x.shape} != {y.shape}")
+    valid = np.isfinite(x) & np.isfinite(y)
+    return np.where(valid, x, 0.0), np.where(valid, y, 0.0), valid
+
+
+class _Moments:
+    """以质心为原点的点集矩（每组点集一个值）"""
+
+    def __init__(self, x, y, valid):
+        count = valid.sum(axis=1)
+        self.count = count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.x_mean = x.sum(axis=1) / count
+            self.y_mean = y.sum(axis=1) / count
+        u = np.where(valid, x - self.x_mean[:, None], 0.0)
+        v = np.where(valid, y - self.y_mean[:, None], 0.0)
+        z = u * u + v * v
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.uu = (u * u).sum(axis=1) / count
+            self.vv = (v * v).sum(axis=1) / count
+            self.uv = (u * v).sum(axis=1) / count
+            self.uz = (u * z).sum(axis=1) / count
+            self.vz = (v * z).sum(axis=1) / count
+            self.zz = (z * z).sum(axis=1) / count
+
+
+def _residuals(x, y, valid, xc, yc, r):
+    """各组点集到拟合圆的距离偏差平方和 sum((Ri - R)^2)"""
+    distances = np.hypot(x - xc[:, None], y - yc[:, None])
+    return np.where(valid, (distances - r[:, None]) ** 2, 0.0).sum(axis=1)
+
+
+def _finish(x, y, valid, moments, center_u, center_v, radius) -> CircleArrays:
+    """平移回原坐标系并计算残差；点数不足3个的点集结果为NaN"""
+    xc = center_u + moments.x_mean
+    yc = center_v + moments.y_mean
+    bad = (moments.count < 3) | ~np.isfinite(xc) | ~np.isfinite(yc) | ~np.isfinite(radius)
+    xc, yc, radius = (np.where(bad, np.nan, value) for value in (xc, yc, radius))
+    return xc, yc, radius, _residuals(x, y, valid, xc, yc, radius)
+
+
+def fit_circles_kasa(x, y) -> CircleArrays:
+    """
+    Kåsa拟合（代数距离最小二乘，线性求解）
+
+    速度最快；圆弧较短时半径偏小。
+
+    Args:
+        x, y: 长度N的一维数组（一组点）或 M×N 数组（M组点，可用NaN补齐）
+
+    Returns:
+        tuple: (圆心x, 圆心y, 半径, 残差) 数组，长度为点集数；无法拟合的点集为NaN
+    """
+    x, y, valid = _as_point_sets(x, y)
+    m = _Moments(x, y, valid)
+    # 正规方程：[uu uv; uv vv]·[a b]' = [uz vz]'/2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        det = m.uu * m.vv - m.uv * m.uv
+        a = (m.uz * m.vv - m.vz * m.uv) / det / 2
+        b = (m.vz * m.uu - m.uz * m.uv) / det / 2
+        radius = np.sqrt(a * a + b * b + m.uu + m.vv)
+    return _finish(x, y, valid, m, a, b, radius)
+
+
+def _newton_root(a0, a1, a2, a3, quartic):
+    """
+    向量化牛顿迭代求特征多项式从0出发的第一个根
+
+    Pratt: P(t) = a0 + a1·t + a2·t² + 4t⁴；Taubin: P(t) = a0 + a1·t + a2·t² + a3·t³
+    """
+    t = np.zeros_like(a0)
+    active = np.isfinite(a0)
+    previous = np.full_like(a0, np.inf)
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        for _ in range(NEWTON_MAX_ITERATIONS):
+            if quartic:
+                value = a0 + t * (a1 + t * (a2 + 4 * t * t))
+                slope = a1 + t * (2 * a2 + 16 * t * t)
+            else:
+                value = a0 + t * (a1 + t * (a2 + t * a3))
+                slope = a1 + t * (2 * a2 + 3 * a3 * t)
+            # 函数值增大说明迭代方向错误，退回初值0
+            wrong = active & (np.abs(value) > np.abs(previous))
+            t = np.where(wrong, 0.0, t)
+            active &= ~wrong
+            previous = value
+            step = np.where(active & (slope != 0), value / slope, 0.0)
+            new_t = t - step
+            converged = np.abs(step) <= NEWTON_EPSILON * np.maximum(np.abs(new_t), 1.0)
+            negative = new_t < 0
+            t = np.where(active, np.where(negative, 0.0, new_t), t)
+            active &= ~converged & ~negative
+            if not active.any():
+                break
+    return t
+
+
+def _fit_pratt_taubin(x, y, pratt: bool) -> CircleArrays:
+    x, y, valid = _as_point_sets(x, y)
+    m = _Moments(x, y, valid)
+    mz = m.uu + m.vv
+    cov_uv = m.uu * m.vv - m.uv * m.uv
+    var_z = m.zz - mz * mz
+
+    a0 = m.uz * (m.uz * m.vv - m.vz * m.uv) + m.vz * (m.vz * m.uu - m.uz * m.uv) - var_z * cov_uv
+    a1 = var_z * mz + 4 * cov_uv * mz - m.uz * m.uz - m.vz * m.vz
+    if pratt:
+        a2 = 4 * cov_uv - 3 * mz * mz - m.zz
+        a3 = None
+    else:
+        a2 = -3 * mz * mz - m.zz
+        a3 = 4 * mz
+    t = _newton_root(a0, a1, a2, a3, quartic=pratt)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        det = t * t - t * mz + cov_uv
+        center_u = (m.uz * (m.vv - t) - m.vz * m.uv) / det / 2
+        center_v = (m.vz * (m.uu - t) - m.uz * m.uv) / det / 2
+        radius_sq = center_u * center_u + center_v * center_v + mz
+        if pratt:
+            radius_sq = radius_sq + 2 * t
+        radius = np.sqrt(radius_sq)
+    return _finish(x, y, valid, m, center_u, center_v, radius)
+
+
+def fit_circles_pratt(x, y) -> CircleArrays:
+    """Pratt拟合（代数距离按梯度归一化），参数和返回值同 fit_circles_kasa"""
+    return _fit_pratt_taubin(x, y, pratt=True)
+
+
+def fit_circles_taubin(x, y) -> CircleArrays:
+    """Taubin拟合（短圆弧上偏差最小的代数拟合），参数和返回值同 fit_circles_kasa"""
+    return _fit_pratt_taubin(x, y, pratt=False)
+
+
+_FITTERS = {
+    "kasa": fit_circles_kasa,
+    "pratt": fit_circles_pratt,
+    "taubin": fit_circles_taubin,
+}
+
+
+def fit_circles(x, y, method: str = DEFAULT_FIT_METHOD) -> CircleArrays:
+    """按指定方法批量拟合，参数和返回值同 fit_circles_kasa"""
+    if method not in _FITTERS:
+        raise ValueError(f"未知的拟合方法: {method}，可选: {', '.join(FIT_METHODS)}")
+    return _FITTERS[method](x, y)
+
+
+def refine_circle(x, y, xc: float, yc: float) -> Tuple[float, float, float, float]:
+    """
+    以给定圆心为初值做几何最小二乘精化（需要SciPy）
+
+    Returns:
+        tuple: (圆心x, 圆心y, 半径, 残差)
+    """
+    if not HAS_SCIPY:
+        raise ImportError("几何精化需要安装scipy")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    mask = np.isfinite(x) & np.isfinite(y)
+    x, y = x[mask], y[mask]
+
+    def deviations(center):
+        distances = np.hypot(x - center[0], y - center[1])
+        return distances - distances.mean()
+
+    xc, yc = least_squares(deviations, (xc, yc)).x
+    distances = np.hypot(x - xc, y - yc)
+    radius = distances.mean()
+    return float(xc), float(yc), float(radius), float(np.sum((distances - radius) ** 2))
+
+
+def fit_circle(x, y, method: str = DEFAULT_FIT_METHOD,
+               refine: bool = False) -> Tuple[float, float, float, float]:
+    """
+    拟合单组点
+
+    Args:
+        x, y: 点坐标
+        method: "kasa"、"pratt" 或 "taubin"
+        refine: 是否以代数拟合结果为初值做几何最小二乘精化
+
+    Returns:
+        tuple: (圆心x, 圆心y, 半径, 残差)
+    """
+    xc, yc, radius, residual = fit_circles(np.ravel(x), np.ravel(y), method)
+    if refine and np.isfinite(xc[0]):
+        return refine_circle(x, y, xc[0], yc[0])
+    return float(xc[0]), float(yc[0]), float(radius[0]), float(residual[0])
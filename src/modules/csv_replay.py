@@ -0,0 +1,143 @@
+"""
+CSV数据回放模块
+按真实经过时间推进回放位置（可设置1x~1000x倍速），每帧把自上一帧以来到期的
+所有数据点作为一个数据块交给图表，并支持按深度定位。
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+
+# 1倍速下每秒回放的数据点数（与原先每50ms播放一个点的速度一致）
+REPLAY_POINTS_PER_SECOND = 20.0
+# 回放帧间隔（毫秒），与批量工作线程的UI帧率一致
+REPLAY_FRAME_INTERVAL_MS = 33
+
+MIN_REPLAY_SPEED = 1.0
+MAX_REPLAY_SPEED = 1000.0
+
+
+class CsvReplayEngine:
+    """
+    基于时间的CSV回放引擎
+
+    回放位置 = 锚点位置 + (当前时间 - 锚点时间) × 每秒点数 × 倍速。
+    改变倍速、暂停/继续和定位时重新设定锚点，因此位置连续、不会跳变；
+    advance() 返回自上次调用以来到期的数据点区间，与调用频率无关。
+    """
+
+    def __init__(self, depths, diameters, speed: float = MIN_REPLAY_SPEED,
+                 points_per_second: float = REPLAY_POINTS_PER_SECOND):
+        """
+        初始化
+
+        Args:
+            depths: 深度数组（递增）
+            diameters: 直径数组
+            speed: 倍速
+            points_per_second: 1倍速下每秒回放的点数
+        """
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.diameters = np.asarray(diameters, dtype=np.float64)
+        if len(self.depths) != len(self.diameters):
+            raise ValueError("深度和直径数组长度不一致")
+        self.points_per_second = float(points_per_second)
+        self._speed = self._clamp_speed(speed)
+
+        self.index = 0  # 下一个待回放的数据点
+        self.running = False
+        self._anchor_position = 0.0
+        self._anchor_time = 0.0
+
+    def __len__(self):
+        return len(self.depths)
+
+    @staticmethod
+    def _clamp_speed(speed: float) -> float:
+        return min(max(float(speed), MIN_REPLAY_SPEED), MAX_REPLAY_SPEED)
+
+    @property
+    def speed(self) -> float:
+        """倍速"""
+        return self._speed
+
+    @property
+    def finished(self) -> bool:
+        """是否已回放完所有数据点"""
+        return self.index >= len(self.depths)
+
+    @property
+    def progress(self) -> float:
+        """回放进度（百分比）"""
+        return self.index / len(self.depths) * 100 if len(self.depths) else 100.0
+
+    def _position(self, now: float) -> float:
+        if not self.running:
+            return self._anchor_position
+        return self._anchor_position + (now - self._anchor_time) * self.points_per_second * self._speed
+
+    def _reanchor(self, now: float) -> None:
+        self._anchor_position = min(self._position(now), float(len(self.depths)))
+        self._anchor_time = now
+
+    # ------------------------------------------------------------------
+    # 控制
+    # ------------------------------------------------------------------
+    def start(self, now: Optional[float] = None) -> None:
+        """开始或继续回放"""
+        now = time.monotonic() if now is None else now
+        if not self.running:
+            self._anchor_time = now
+            self.running = True
+
+    def pause(self, now: Optional[float] = None) -> None:
+        """暂停回放（保留位置）"""
+        now = time.monotonic() if now is None else now
+        if self.running:
+            self._reanchor(now)
+            self.running = False
+
+    def set_speed(self, speed: float, now: Optional[float] = None) -> float:
+        """
+        设置倍速（限制在1x~1000x）
+
+        Returns:
+            float: 实际生效的倍速
+        """
+        now = time.monotonic() if now is None else now
+        self._reanchor(now)
+        self._speed = self._clamp_speed(speed)
+        return self._speed
+
+    def seek_index(self, index: int, now: Optional[float] = None) -> int:
+        """定位到数据点下标，返回实际下标"""
+        now = time.monotonic() if now is None else now
+        self.index = min(max(int(index), 0), len(self.depths))
+        self._anchor_position = float(self.index)
+        self._anchor_time = now
+        return self.index
+
+    def seek_depth(self, depth: float, now: Optional[float] = None) -> int:
+        """
+        定位到指定深度（第一个深度不小于该值的数据点）
+
+        Returns:
+            int: 定位后的下一个待回放下标
+        """
+        return self.seek_index(int(np.searchsorted(self.depths, depth, side='left')), now)
+
+    def advance(self, now: Optional[float] = None) -> slice:
+        """
+        取出到期的数据点
+
+        Returns:
+            slice: 自上次调用以来到期的数据点区间（可能为空）
+        """
+        now = time.monotonic() if now is None else now
+        due = min(int(self._position(now)) + 1, len(self.depths)) if self.running else self.index
+        start = self.index
+        if due > start:
+            self.index = due
+        return slice(start, self.index)
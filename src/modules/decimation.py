@@ -0,0 +1,192 @@
+"""
+直径曲线降采样模块
+长行程、高采样率的测量曲线点数远多于图表像素，按像素宽度降采样后再绘制。
+提供最小/最大包络和LTTB两种算法（NumPy向量化），并保证每段超差区间都保留在结果中。
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# 每个像素列保留的点数（最小/最大包络每列保留最小值和最大值）
+POINTS_PER_PIXEL = 2
+# 坐标轴尚未布局时使用的最少点数
+MIN_TARGET_POINTS = 200
+
+DECIMATION_METHODS = ("minmax", "lttb")
+
+
+def _bucketed(values: np.ndarray, bucket_size: int, fill: float) -> np.ndarray:
+    """将一维数组按固定长度分桶为二维数组，末桶不足部分用fill填充"""
+    bucket_count = -(-len(values) // bucket_size)
+    padded = np.full(bucket_count * bucket_size, fill, dtype=np.float64)
+    padded[:len(values)] = values
+    return padded.reshape(bucket_count, bucket_size)
+
+
+def minmax_indices(y: np.ndarray, bucket_count: int) -> np.ndarray:
+    """
+    最小/最大包络降采样
+
+    把样本均分为 bucket_count 个桶，每桶保留最小值和最大值所在的点，
+    并保留首尾点。曲线的上下包络（包括单点尖峰）完整保留。
+
+    Args:
+        y: 样本值
+        bucket_count: 桶数（通常等于像素列数）
+
+    Returns:
+        np.ndarray: 递增的样本下标
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= 2 * bucket_count or bucket_count < 1:
+        return np.arange(n)
+
+    bucket_size = -(-n // bucket_count)
+    offsets = np.arange(0, n, bucket_size)
+    lows = np.argmin(_bucketed(y, bucket_size, np.inf), axis=1) + offsets
+    highs = np.argmax(_bucketed(y, bucket_size, -np.inf), axis=1) + offsets
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB（Largest-Triangle-Three-Buckets）降采样
+
+    首尾点固定保留，中间样本均分为 threshold-2 个桶，每桶选出与相邻两桶
+    构成最大三角形面积的点。为便于整体向量化，三角形的前一顶点取前一桶的
+    均值点（经典算法取前一桶已选出的点），视觉效果基本一致。
+
+    Args:
+        x: 样本横坐标
+        y: 样本值
+        threshold: 输出点数
+
+    Returns:
+        np.ndarray: 递增的样本下标
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= threshold or threshold < 3:
+        return np.arange(n)
+
+    # 中间样本按 threshold-2 个桶均分（桶长可能相差1），聚成二维数组，空位为NaN
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    columns = np.arange(np.diff(edges).max())
+    gather = edges[:-1, None] + columns[None, :]
+    empty = gather >= edges[1:, None]
+    gather[empty] = 0
+    bx = np.where(empty, np.nan, x[gather])
+    by = np.where(empty, np.nan, y[gather])
+    mean_x = np.nanmean(bx, axis=1)
+    mean_y = np.nanmean(by, axis=1)
+
+    # 三角形另外两个顶点：前一桶均值（首桶用第一个点）和后一桶均值（末桶用最后一个点）
+    ax = np.concatenate(([x[0]], mean_x[:-1]))[:, None]
+    ay = np.concatenate(([y[0]], mean_y[:-1]))[:, None]
+    cx = np.concatenate((mean_x[1:], [x[-1]]))[:, None]
+    cy = np.concatenate((mean_y[1:], [y[-1]]))[:, None]
+
+    areas = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+    areas = np.nan_to_num(areas, nan=-1.0)
+    picks = np.argmax(areas, axis=1) + edges[:-1]
+    return np.concatenate(([0], picks, [n - 1]))
+
+
+def excursion_indices(y: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """
+    超差区间的关键点
+
+    每段连续的超差样本保留起点、终点和偏离公差带最远的点，保证降采样后
+    每一段超差都仍然可见。
+
+    Args:
+        y: 样本值
+        lower: 公差下限
+        upper: 公差上限
+
+    Returns:
+        np.ndarray: 递增的样本下标
+    """
+    y = np.asarray(y, dtype=np.float64)
+    outside = np.flatnonzero((y < lower) | (y > upper))
+    if len(outside) == 0:
+        return outside
+
+    breaks = np.diff(outside) > 1
+    run_starts = np.concatenate(([True], breaks))
+    run_ends = np.concatenate((breaks, [True]))
+    run_ids = np.cumsum(run_starts) - 1
+
+    # 每段内按偏离量降序排序，取每段第一个即为极值点
+    deviation = np.maximum(y[outside] - upper, lower - y[outside])
+    order = np.lexsort((-deviation, run_ids))
+    run_firsts = np.concatenate(([True], np.diff(run_ids[order]) != 0))
+    extremes = outside[order[run_firsts]]
+
+    return np.unique(np.concatenate((outside[run_starts], outside[run_ends], extremes)))
+
+
+def visible_slice(x: np.ndarray, x_range: Tuple[float, float]) -> slice:
+    """
+    覆盖可见范围的连续样本区间
+
+    区间两端各多保留一个相邻样本，使曲线能延伸到坐标轴边缘。
+    """
+    x_min, x_max = min(x_range), max(x_range)
+    visible = np.flatnonzero((x >= x_min) & (x <= x_max))
+    if len(visible) == 0:
+        return slice(0, 0)
+    return slice(max(visible[0] - 1, 0), min(visible[-1] + 2, len(x)))
+
+
+def decimate_trace(x, y, max_points: int, method: str = "minmax",
+                   tolerance: Optional[Tuple[float, float]] = None,
+                   x_range: Optional[Tuple[float, float]] = None) -> np.ndarray:
+    """
+    按目标点数降采样一条曲线
+
+    Args:
+        x: 深度数组
+        y: 直径数组
+        max_points: 目标点数（通常由 target_points_for_axes 根据像素宽度给出）
+        method: "minmax" 或 "lttb"
+        tolerance: (下限, 上限)，给出时保留每段超差区间的关键点
+        x_range: 当前X轴显示范围，给出时只对可见部分降采样（缩放后重新降采样）
+
+    Returns:
+        np.ndarray: 递增的样本下标，可同时用于索引 x 和 y
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"未知的降采样算法: {method}")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    window = visible_slice(x, x_range) if x_range is not None else slice(0, len(x))
+    start = window.start
+    xs, ys = x[window], y[window]
+    if len(ys) <= max_points:
+        return np.arange(start, start + len(ys))
+
+    if method == "minmax":
+        indices = minmax_indices(ys, max(max_points // 2, 1))
+    else:
+        indices = lttb_indices(xs, ys, max_points)
+
+    if tolerance is not None:
+        indices = np.union1d(indices, excursion_indices(ys, *tolerance))
+    return indices + start
+
+
+def target_points_for_axes(ax, points_per_pixel: int = POINTS_PER_PIXEL) -> int:
+    """根据坐标轴的像素宽度计算目标点数"""
+    width = int(ax.bbox.width)
+    return max(width * points_per_pixel, MIN_TARGET_POINTS)
+
+
+def is_decimated(indices: np.ndarray) -> bool:
+    """下标是否跳过了样本（连续下标表示未降采样）"""
+    return len(indices) > 0 and indices[-1] - indices[0] + 1 != len(indices)
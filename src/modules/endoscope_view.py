@@ -3,19 +3,53 @@
 (此部分已留白，用于集成外部图像处理算法)
 """
 
+import threading
+import time
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QToolButton,
-    QGraphicsView, QGraphicsScene, QGraphicsTextItem
+    QGraphicsView, QGraphicsScene, QGraphicsTextItem, QGraphicsPixmapItem
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QFont
+from PySide6.QtCore import Qt, QRectF, QSize, Signal, Slot
+from PySide6.QtGui import QPainter, QFont, QPixmap, QImage
+
+from .image_pipeline import ImagePipeline, numpy_to_qimage
+
+
+# 图像与视图边缘之间保留的边距（像素）
+IMAGE_MARGIN = 20
+# 视图尺寸小于该值时视为尚未布局，按原始尺寸显示
+MIN_VIEW_SIZE = 50
+# 实时帧率统计窗口（秒）
+FRAME_STATS_INTERVAL = 1.0
 
 
 class EndoscopeView(QWidget):
     """内窥镜视图组件"""
-    
+
+    # 有新的实时帧待显示（跨线程排队到界面线程）
+    frame_available = Signal()
+    # 实时帧率统计更新：{'displayed_fps', 'dropped_fps', 'displayed', 'dropped'}
+    frame_stats_updated = Signal(dict)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 后台解码流水线：文件图像在线程池中解码并缩放，界面线程只显示已就绪的图像
+        self.image_pipeline = ImagePipeline(self)
+        self.image_pipeline.image_ready.connect(self._on_image_ready)
+        self._requested_path = None  # 最近一次请求显示、尚未解码完成的文件
+
+        # 实时帧：只保留最新一帧，界面来不及显示的帧直接丢弃
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None  # (ndarray, bgr)
+        self._live_image = None  # 当前显示帧的QImage（引用相机缓冲区）
+        self.displayed_frames = 0
+        self.dropped_frames = 0
+        self._stats_window_start = time.monotonic()
+        self._stats_window_counts = (0, 0)
+        self.frame_stats = {'displayed_fps': 0.0, 'dropped_fps': 0.0, 'displayed': 0, 'dropped': 0}
+        self.frame_available.connect(self._present_latest_frame, Qt.QueuedConnection)
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -44,8 +78,15 @@ class EndoscopeView(QWidget):
         fullscreen_button.setText("🔍")  # 使用emoji作为图标
         fullscreen_button.setToolTip("全屏查看")
 
+        # 实时帧率（接收到实时帧后显示）
+        self.frame_rate_label = QLabel()
+        self.frame_rate_label.setObjectName("PanelHeaderText")
+        self.frame_rate_label.setVisible(False)
+        self.frame_stats_updated.connect(self._show_frame_stats)
+
         endo_header_layout.addWidget(endo_title)
         endo_header_layout.addStretch()
+        endo_header_layout.addWidget(self.frame_rate_label)
         endo_header_layout.addWidget(fullscreen_button)
         endo_header_layout.addWidget(save_snapshot_button)
 
@@ -73,10 +114,15 @@ class EndoscopeView(QWidget):
         # 设置对齐方式 - 图像左对齐以增强动感
         self.graphics_view.setAlignment(Qt.AlignLeft | Qt.AlignTop)
 
-        # # 添加提示信息
-        # self.placeholder_text = QGraphicsTextItem("等待外部算法图像输入...")
-        # self.placeholder_text.setFont(QFont("Arial", 12))
-        # self.graphics_scene.addItem(self.placeholder_text)
+        # 添加提示信息
+        self.placeholder_text = QGraphicsTextItem("")
+        self.placeholder_text.setFont(QFont("Arial", 12))
+        self.graphics_scene.addItem(self.placeholder_text)
+
+        # 图像图元常驻场景，切换图像时只替换其中的图像
+        self.pixmap_item = QGraphicsPixmapItem()
+        self.pixmap_item.setTransformationMode(Qt.SmoothTransformation)
+        self.graphics_scene.addItem(self.pixmap_item)
         
         layout.addWidget(self.graphics_view)
         
@@ -85,6 +131,13 @@ class EndoscopeView(QWidget):
         
 
 
+    def target_image_size(self):
+        """图像显示尺寸（视图尺寸减去边距），视图尚未布局时返回空尺寸表示原始尺寸"""
+        view_size = self.graphics_view.size()
+        if view_size.width() > MIN_VIEW_SIZE and view_size.height() > MIN_VIEW_SIZE:
+            return QSize(view_size.width() - IMAGE_MARGIN, view_size.height() - IMAGE_MARGIN)
+        return QSize()
+
     def update_image(self, image_data):
         """
         更新图像显示的公共接口。
@@ -92,72 +145,167 @@ class EndoscopeView(QWidget):
 
         Args:
             image_data: 图像数据 (例如, QPixmap, QImage, or a numpy array).
+                文件路径在后台解码，已缓存时立即显示，否则解码完成后显示。
         """
-        # 清除占位符文本
-        if self.placeholder_text.scene() == self.graphics_scene:
-            self.graphics_scene.removeItem(self.placeholder_text)
-
-        # 处理和显示图像数据
-        from PySide6.QtGui import QPixmap, QImage
-
         try:
+            if isinstance(image_data, str):
+                self._requested_path = image_data
+                image = self.image_pipeline.request(image_data, self.target_image_size())
+                if image is not None:
+                    self._requested_path = None
+                    self._show_pixmap(QPixmap.fromImage(image))
+                    print(f"✅ 内窥镜图像更新成功，尺寸: {image.width()}x{image.height()}")
+                return
+
             if isinstance(image_data, QPixmap):
                 pixmap = image_data
             elif isinstance(image_data, QImage):
                 pixmap = QPixmap.fromImage(image_data)
-            elif isinstance(image_data, str):
-                # 如果是文件路径
-                pixmap = QPixmap(image_data)
             else:
                 print(f"⚠️ 不支持的图像数据类型: {type(image_data)}")
                 return
 
-            if not pixmap.isNull():
-                # 清除场景并添加新图像
-                self.graphics_scene.clear()
-
-                # 缩放图像以获得更好的显示效果
-                view_size = self.graphics_view.size()
-                # 确保视图大小有效
-                if view_size.width() > 50 and view_size.height() > 50:
-                    scaled_pixmap = pixmap.scaled(
-                        view_size.width() - 20,  # 留一些边距
-                        view_size.height() - 20,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                else:
-                    # 如果视图尺寸无效，使用原始图像
-                    scaled_pixmap = pixmap
-
-                pixmap_item = self.graphics_scene.addPixmap(scaled_pixmap)
-
-                # 设置场景矩形以确保左对齐
-                from PySide6.QtCore import QRectF
-                scene_rect = QRectF(scaled_pixmap.rect())
-                self.graphics_scene.setSceneRect(scene_rect)
-
-                # 确保图像左对齐显示，增强动感效果
-                self.graphics_view.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-                self.graphics_view.ensureVisible(scene_rect, 0, 0)  # 确保左上角可见
-
-                print(f"✅ 内窥镜图像更新成功，尺寸: {scaled_pixmap.width()}x{scaled_pixmap.height()}")
-            else:
+            if pixmap.isNull():
                 print("❌ 图像数据无效")
+                return
+
+            # 缩放图像以获得更好的显示效果
+            target_size = self.target_image_size()
+            if target_size.isValid():
+                pixmap = pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # 内存中的图像直接显示，取消尚未完成的文件请求
+            self._requested_path = None
+            self._show_pixmap(pixmap)
+            print(f"✅ 内窥镜图像更新成功，尺寸: {pixmap.width()}x{pixmap.height()}")
 
         except Exception as e:
             print(f"❌ 更新内窥镜图像失败: {e}")
 
+    def prefetch_images(self, paths):
+        """在后台预先解码即将显示的图像文件"""
+        self.image_pipeline.prefetch(paths, self.target_image_size())
+
+    def _on_image_ready(self, path, image):
+        """后台解码完成：只显示最近一次请求的图像"""
+        if path == self._requested_path:
+            self._requested_path = None
+            self._show_pixmap(QPixmap.fromImage(image))
+
+    def _show_pixmap(self, pixmap, scale=1.0):
+        """
+        显示图像
+
+        Args:
+            pixmap: 要显示的图像
+            scale: 图元缩放比例（实时帧由图元变换缩放，不重新采样像素）
+        """
+        self.placeholder_text.setVisible(False)
+        self.pixmap_item.setPixmap(pixmap)
+        self.pixmap_item.setScale(scale)
+
+        # 设置场景矩形以确保左对齐
+        scene_rect = QRectF(0, 0, pixmap.width() * scale, pixmap.height() * scale)
+        if scene_rect != self.graphics_scene.sceneRect():
+            self.graphics_scene.setSceneRect(scene_rect)
+            # 确保图像左对齐显示，增强动感效果
+            self.graphics_view.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+            self.graphics_view.ensureVisible(scene_rect, 0, 0)  # 确保左上角可见
+
+    # ------------------------------------------------------------------
+    # 实时帧
+    # ------------------------------------------------------------------
+    def submit_frame(self, frame, bgr=False):
+        """
+        提交一帧实时图像（可从相机回调线程调用）
+
+        帧在界面线程显示前以零拷贝方式包装为QImage，调用方交出 frame 后不应再修改它。
+        界面来不及显示时只保留最新一帧，被覆盖的帧计为丢弃。
+
+        Args:
+            frame: NumPy图像帧，格式见 numpy_to_qimage
+            bgr: 彩色帧是否为BGR顺序
+        """
+        with self._frame_lock:
+            pending = self._latest_frame is not None
+            self._latest_frame = (frame, bgr)
+            if pending:
+                self.dropped_frames += 1
+        if not pending:
+            self.frame_available.emit()
+
+    @Slot()
+    def _present_latest_frame(self):
+        """界面线程：显示最新的实时帧"""
+        with self._frame_lock:
+            latest, self._latest_frame = self._latest_frame, None
+        if latest is None:
+            return
+        frame, bgr = latest
+        try:
+            image = numpy_to_qimage(frame, bgr)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            return
+
+        # 保持QImage（及其引用的缓冲区）存活到下一帧
+        self._requested_path = None
+        self._live_image = image
+        target_size = self.target_image_size()
+        scale = 1.0
+        if target_size.isValid():
+            scale = min(target_size.width() / image.width(), target_size.height() / image.height())
+        self._show_pixmap(QPixmap.fromImage(image), scale)
+        self.displayed_frames += 1
+        self._update_frame_stats()
+
+    def _update_frame_stats(self):
+        """按统计窗口计算显示/丢弃帧率"""
+        now = time.monotonic()
+        elapsed = now - self._stats_window_start
+        if elapsed < FRAME_STATS_INTERVAL:
+            return
+        displayed_before, dropped_before = self._stats_window_counts
+        self.frame_stats = {
+            'displayed_fps': (self.displayed_frames - displayed_before) / elapsed,
+            'dropped_fps': (self.dropped_frames - dropped_before) / elapsed,
+            'displayed': self.displayed_frames,
+            'dropped': self.dropped_frames
+        }
+        self._stats_window_start = now
+        self._stats_window_counts = (self.displayed_frames, self.dropped_frames)
+        self.frame_stats_updated.emit(self.frame_stats)
+
+    def _show_frame_stats(self, stats):
+        self.frame_rate_label.setText(
+            f"显示 {stats['displayed_fps']:.1f} fps / 丢弃 {stats['dropped_fps']:.1f} fps")
+        self.frame_rate_label.setVisible(True)
+
+    def get_frame_stats(self):
+        """最近一个统计窗口的实时帧率统计"""
+        return dict(self.frame_stats)
+
+    def reset_frame_stats(self):
+        """清零实时帧计数"""
+        self.displayed_frames = 0
+        self.dropped_frames = 0
+        self._stats_window_start = time.monotonic()
+        self._stats_window_counts = (0, 0)
+        self.frame_stats = {'displayed_fps': 0.0, 'dropped_fps': 0.0, 'displayed': 0, 'dropped': 0}
+        self.frame_rate_label.setVisible(False)
+
     def load_image_from_file(self, file_path):
         """从文件加载图像"""
         self.update_image(file_path)
         
     def clear_image(self):
         """清除图像并恢复占位符"""
-        self.graphics_scene.clear()
-        self.placeholder_text = QGraphicsTextItem("")
-        self.placeholder_text.setFont(QFont("Arial", 12))
-        self.graphics_scene.addItem(self.placeholder_text)
+        self._requested_path = None
+        with self._frame_lock:
+            self._latest_frame = None
+        self._live_image = None
+        self.pixmap_item.setPixmap(QPixmap())
+        self.pixmap_item.setScale(1.0)
+        self.placeholder_text.setVisible(True)
 
     def set_hole_id(self, hole_id):
         """设置当前检测的孔ID"""
@@ -0,0 +1,254 @@
+"""
+历史数据查询模块
+把孔位查询拆成后台的加载/计算阶段和界面线程的应用阶段：工作线程查找并读取孔位CSV、
+批量拟合偏心度，每完成一个阶段就把结果发回界面；新查询会取消尚未完成的旧查询，
+同一孔位文件未变化时直接使用缓存的结果。
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from .measurement_csv import read_probe_columns, probe_records, empty_probe_columns
+
+
+# 孔位CSV文件的查找目录（相对于当前工作目录，按顺序优先）
+HOLE_CSV_DIRS = (
+    "Data/{hole_id}/CCIDM",
+    "data/{hole_id}/CCIDM",
+    "cache/{hole_id}",
+    "Data/{hole_id}",
+    "data/{hole_id}",
+)
+
+# 缓存的孔位查询结果数
+DEFAULT_QUERY_CACHE_SIZE = 8
+
+# 查询阶段
+STAGE_MEASUREMENTS = "measurements"  # 测量数据已读取：可显示表格和二维包络图
+STAGE_ANALYSIS = "analysis"          # 偏心度拟合完成：可显示偏心度曲线和三维模型
+
+
+def find_hole_csv_file(hole_id: str) -> Optional[str]:
+    """
+    查找孔位的测量CSV文件
+
+    Returns:
+        Optional[str]: 第一个含CSV文件的目录中按文件名排序的第一个文件；找不到时为None
+    """
+    for pattern in HOLE_CSV_DIRS:
+        path = pattern.format(hole_id=hole_id)
+        if not os.path.isdir(path):
+            continue
+        csv_files = sorted(name for name in os.listdir(path) if name.endswith('.csv'))
+        if csv_files:
+            return os.path.join(path, csv_files[0])
+    return None
+
+
+@dataclass
+class HoleQueryResult:
+    """一次孔位查询的结果，随阶段逐步填充"""
+    hole_id: str
+    file_path: Optional[str]
+    measurements: List[dict] = field(default_factory=list)
+    columns: Dict[str, np.ndarray] = field(default_factory=empty_probe_columns)  # read_probe_columns 的结果
+    depths: np.ndarray = field(default_factory=lambda: np.empty(0))
+    channels: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
+    fit_result: Optional[Dict[str, np.ndarray]] = None
+    model_geometry: Optional[object] = None  # build_model 的结果（三维模型网格）
+    from_cache: bool = False
+
+
+class HoleQueryCache:
+    """
+    孔位查询结果的LRU缓存
+
+    以 (孔位, 文件路径, 文件大小, 修改时间) 为键，文件变化后旧条目自然失效。
+    工作线程和界面线程都会访问，内部加锁。条目只保存只读的按列数据和分析结果，
+    不保存交给界面的逐行记录（界面会就地修改记录，例如人工复查）。
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_SIZE):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[tuple, HoleQueryResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(hole_id: str, file_path: str) -> tuple:
+        stat = os.stat(file_path)
+        return (hole_id, os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, key: tuple) -> Optional[HoleQueryResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: tuple, result: HoleQueryResult):
+        for values in (*result.columns.values(), result.depths, result.channels):
+            values.flags.writeable = False
+        result = replace(result, measurements=[], from_cache=True)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _QueryNotifier(QObject):
+    """查询任务在工作线程发出、在界面线程接收的信号"""
+    stage_ready = Signal(int, str, object)  # (请求号, 阶段, HoleQueryResult)
+    failed = Signal(int, str)               # (请求号, 错误信息)
+
+
+class _QueryTask(QRunnable):
+    """单次孔位查询；每个阶段前检查是否已被新查询取消"""
+
+    def __init__(self, request_id: int, hole_id: str, service: "HistoryQueryService"):
+        super().__init__()
+        self.request_id = request_id
+        self.hole_id = hole_id
+        self.service = service
+        self.cancelled = threading.Event()
+
+    def run(self):
+        try:
+            self._run()
+        except Exception as e:
+            self.service._notifier.failed.emit(self.request_id, str(e))
+
+    def _emit(self, stage: str, result: HoleQueryResult) -> bool:
+        if self.cancelled.is_set():
+            return False
+        self.service._notifier.stage_ready.emit(self.request_id, stage, result)
+        return True
+
+    def _run(self):
+        if self.cancelled.is_set():
+            return
+        service = self.service
+        file_path = find_hole_csv_file(self.hole_id)
+        if file_path is None:
+            self._emit(STAGE_MEASUREMENTS, HoleQueryResult(self.hole_id, None))
+            return
+
+        cache_key = service.cache.key(self.hole_id, file_path)
+        cached = service.cache.get(cache_key)
+        if cached is not None:
+            # 每次查询都从缓存的按列数据重新生成逐行记录，界面对记录的修改不会进入缓存
+            result = replace(cached, measurements=probe_records(cached.columns))
+            if self._emit(STAGE_MEASUREMENTS, result):
+                self._emit(STAGE_ANALYSIS, result)
+            return
+
+        columns = read_probe_columns(file_path, service.tolerance_band)
+        measurements = probe_records(columns)
+        result = HoleQueryResult(self.hole_id, file_path, measurements, columns)
+        result.depths = columns['position']
+        result.channels = np.column_stack([columns['channel1'], columns['channel2'], columns['channel3']])
+        if not self._emit(STAGE_MEASUREMENTS, result) or not measurements:
+            return
+
+        fit_result = service.analyze(result.channels) if service.analyze else None
+        if self.cancelled.is_set():
+            return
+        model_geometry = service.build_model(result.depths, columns['diameter']) if service.build_model else None
+        # 分析结果放入新对象发出，界面已收到的测量阶段结果不被改动
+        analysis = replace(result, fit_result=fit_result, model_geometry=model_geometry)
+        service.cache.put(cache_key, analysis)
+        self._emit(STAGE_ANALYSIS, analysis)
+
+
+class HistoryQueryService(QObject):
+    """
+    后台孔位查询服务
+
+    submit() 在工作线程执行查询并返回请求号；界面只处理请求号等于 current_request
+    的结果，因此取消的查询即使已在执行也不会覆盖新查询的显示。
+    """
+
+    stage_ready = Signal(int, str, object)  # (请求号, 阶段, HoleQueryResult)
+    query_failed = Signal(int, str)         # (请求号, 错误信息)
+
+    def __init__(self, tolerance_band: Tuple[float, float],
+                 analyze: Optional[Callable[[np.ndarray], Dict[str, np.ndarray]]] = None,
+                 parent=None, cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+                 build_model: Optional[Callable[[np.ndarray, np.ndarray], object]] = None):
+        """
+        初始化
+
+        Args:
+            tolerance_band: 合格直径范围 (下限, 上限)
+            analyze: 以 N×3 通道数据为参数的分析函数（在工作线程调用），结果存入 fit_result
+            cache_size: 缓存的查询结果数
+            build_model: 以 (深度, 直径) 为参数生成三维模型网格的函数（在工作线程调用），
+                结果存入 model_geometry
+        """
+        super().__init__(parent)
+        self.tolerance_band = tolerance_band
+        self.analyze = analyze
+        self.build_model = build_model
+        self.cache = HoleQueryCache(cache_size)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.current_request = 0
+        self._task: Optional[_QueryTask] = None
+        self._notifier = _QueryNotifier(self)
+        self._notifier.stage_ready.connect(self._on_stage_ready)
+        self._notifier.failed.connect(self._on_failed)
+
+    def submit(self, hole_id: str) -> int:
+        """提交查询并取消尚未完成的旧查询，返回请求号"""
+        self.cancel()
+        self.current_request += 1
+        self._task = _QueryTask(self.current_request, hole_id, self)
+        # 线程池只有一个线程：排队中的旧任务启动后立即因取消而返回
+        self.thread_pool.start(self._task)
+        return self.current_request
+
+    def cancel(self):
+        """取消当前查询"""
+        if self._task is not None:
+            self._task.cancelled.set()
+            self._task = None
+
+    def is_current(self, request_id: int) -> bool:
+        return self._task is not None and request_id == self.current_request
+
+    @Slot(int, str, object)
+    def _on_stage_ready(self, request_id: int, stage: str, result: HoleQueryResult):
+        if not self.is_current(request_id):
+            return
+        if stage == STAGE_ANALYSIS or not result.measurements:
+            self._task = None
+        self.stage_ready.emit(request_id, stage, result)
+
+    @Slot(int, str)
+    def _on_failed(self, request_id: int, message: str):
+        if not self.is_current(request_id):
+            return
+        self._task = None
+        self.query_failed.emit(request_id, message)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """等待后台查询结束（测试和退出时使用）"""
+        return self.thread_pool.waitForDone(msecs)
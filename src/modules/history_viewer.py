@@ -41,13 +41,12 @@ except ImportError:
     except ImportError:
         from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from matplotlib.figure import Figure
-from scipy.optimize import least_squares
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                                QLabel, QPushButton, QLineEdit, QComboBox,
-                               QGroupBox, QTableWidget, QTableWidgetItem,
+                               QGroupBox, QTableView, QAbstractItemView,
                                QSplitter, QTextEdit, QMessageBox, QFileDialog,
                                QDialog, QFormLayout, QDoubleSpinBox, QDialogButtonBox,
-                               QScrollArea, QFrame, QTabWidget, QToolButton)
+                               QScrollArea, QFrame, QTabWidget, QToolButton, QListWidget)
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 import csv
@@ -56,39 +55,59 @@ import glob
 from datetime import datetime
 
 from .models import db_manager
+from .decimation import decimate_trace, target_points_for_axes, is_decimated
+from .streaming_stats import StreamingStatistics
+from .circle_fit import fit_circle, fit_circles, DEFAULT_FIT_METHOD
+from .measurement_csv import read_probe_measurements
+from .table_models import MeasurementTableModel, RESIZE_SAMPLE_ROWS
+from .history_query import HistoryQueryService, find_hole_csv_file, HOLE_CSV_DIRS, STAGE_MEASUREMENTS, STAGE_ANALYSIS
+from .hole_comparison import HoleComparisonService
 
 # 导入三维模型渲染器
 try:
-    from .hole_3d_renderer import Hole3DViewer
+    from .hole_3d_renderer import Hole3DViewer, prepare_hole_mesh
     HAS_3D_RENDERER = True
 except ImportError:
     HAS_3D_RENDERER = False
     print("警告: 三维模型渲染器不可用")
 
 
+# 探头通道数据转换：通道值为μm时按 2.1 - 通道值*0.001 转换为拟合参数（对应matlab中的measure_list）
+CHANNEL_UM_THRESHOLD = 100  # 通道1大于该值时视为μm格式
+CHANNEL_PARAMETER_OFFSET = 2.1
+CHANNEL_UM_TO_MM = 0.001
+# 三点共线判定阈值（拟合分母绝对值）
+COLLINEAR_EPSILON = 1e-10
+
+# 合格判定：标准直径17.6mm，非对称公差+0.05/-0.07mm
+STANDARD_DIAMETER = 17.6
+UPPER_TOLERANCE = 0.05
+LOWER_TOLERANCE = 0.07
+TOLERANCE_BAND = (STANDARD_DIAMETER - LOWER_TOLERANCE, STANDARD_DIAMETER + UPPER_TOLERANCE)
+
+
 class ProbeCircleFitter:
     """基于探头测量的拟合圆算法 - 根据matlab代码实现"""
 
+    # 三个子探头的方向角度
+    THETA_LIST = (0, 2*np.pi/3, 4*np.pi/3)
+
     @staticmethod
-    def circle_from_polar(p1, p2, p3):
+    def circles_from_points(x, y):
         """
-        根据三个极坐标点拟合圆
-        p1, p2, p3: [r, theta] 格式的极坐标点
-        返回: (xc, yc, D) - 圆心坐标和直径
+        三点定圆（向量化）
+        x, y: N×3 数组，每行为一组三个点的直角坐标
+        返回: (xc, yc, D, collinear) - 圆心坐标、直径数组和共线标记；共线行的结果为NaN
         """
-        # 将极坐标转换为直角坐标
-        x1 = p1[0] * np.cos(p1[1])
-        y1 = p1[0] * np.sin(p1[1])
-        x2 = p2[0] * np.cos(p2[1])
-        y2 = p2[0] * np.sin(p2[1])
-        x3 = p3[0] * np.cos(p3[1])
-        y3 = p3[0] * np.sin(p3[1])
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        x1, x2, x3 = x[:, 0], x[:, 1], x[:, 2]
+        y1, y2, y3 = y[:, 0], y[:, 1], y[:, 2]
 
         # 计算分母
         D = 2 * (x1*(y2 - y3) + x2*(y3 - y1) + x3*(y1 - y2))
-
-        if abs(D) < 1e-10:
-            raise ValueError("三点共线，无法拟合圆")
+        collinear = ~(np.abs(D) >= COLLINEAR_EPSILON)  # NaN输入同样视为无法拟合
+        D = np.where(collinear, np.nan, D)
 
         # 计算平方和
         x1s = x1**2 + y1**2
@@ -100,10 +119,62 @@ class ProbeCircleFitter:
         yc = (x1s*(x3 - x2) + x2s*(x1 - x3) + x3s*(x2 - x1)) / D
 
         # 计算半径和直径
-        R = np.sqrt((x1 - xc)**2 + (y1 - yc)**2)
-        diameter = 2 * R
+        diameter = 2 * np.hypot(x1 - xc, y1 - yc)
+        return xc, yc, diameter, collinear
 
-        return xc, yc, diameter
+    @staticmethod
+    def circle_from_polar(p1, p2, p3):
+        """
+        根据三个极坐标点拟合圆
+        p1, p2, p3: [r, theta] 格式的极坐标点
+        返回: (xc, yc, D) - 圆心坐标和直径
+        """
+        r = np.array([[p1[0], p2[0], p3[0]]], dtype=np.float64)
+        theta = np.array([[p1[1], p2[1], p3[1]]], dtype=np.float64)
+        xc, yc, diameter, collinear = ProbeCircleFitter.circles_from_points(
+            r * np.cos(theta), r * np.sin(theta))
+        if collinear[0]:
+            raise ValueError("三点共线，无法拟合圆")
+        return float(xc[0]), float(yc[0]), float(diameter[0])
+
+    @staticmethod
+    def channels_to_parameters(channels):
+        """
+        通道数据转换为拟合参数（向量化）
+        channels: N×3 通道数据；通道1大于100的行视为μm格式，按 2.1 - 通道值*0.001 转换，
+                  其余行视为已处理的参数
+        返回: N×3 拟合参数数组
+        """
+        channels = np.asarray(channels, dtype=np.float64).reshape(-1, 3)
+        in_um = channels[:, 0] > CHANNEL_UM_THRESHOLD
+        return np.where(in_um[:, None], CHANNEL_PARAMETER_OFFSET - channels * CHANNEL_UM_TO_MM, channels)
+
+    @staticmethod
+    def fit_batch(measure_array, probe_r=18.85):
+        """
+        批量拟合整次扫描的所有样本
+        measure_array: N×3 拟合参数（三个通道的处理后参数）
+        probe_r: 探头主圆半径 (mm)
+        返回: 字典，center_x/center_y/diameter/eccentricity 为长度N的数组，
+              collinear 为共线（无法拟合）标记，对应行的结果为NaN
+        """
+        measure_array = np.asarray(measure_array, dtype=np.float64).reshape(-1, 3)
+        r = probe_r + measure_array
+        theta = np.asarray(ProbeCircleFitter.THETA_LIST)
+        xc, yc, diameter, collinear = ProbeCircleFitter.circles_from_points(
+            r * np.cos(theta), r * np.sin(theta))
+        return {
+            'center_x': xc,
+            'center_y': yc,
+            'diameter': diameter,
+            'eccentricity': np.hypot(xc, yc),  # 拟合圆心相对探头中心的偏移
+            'collinear': collinear
+        }
+
+    @staticmethod
+    def fit_channels(channels, probe_r=18.85):
+        """批量拟合原始通道数据（先转换为拟合参数），返回值同 fit_batch"""
+        return ProbeCircleFitter.fit_batch(ProbeCircleFitter.channels_to_parameters(channels), probe_r)
 
     @staticmethod
     def process_channel_data(measure_list, probe_r=18.85, probe_small_r=4):
@@ -118,7 +189,7 @@ class ProbeCircleFitter:
             raise ValueError("需要三个通道的测量数据")
 
         # 三个子探头的方向角度
-        theta_list = [0, 2*np.pi/3, 4*np.pi/3]
+        theta_list = list(ProbeCircleFitter.THETA_LIST)
 
         # 构建三个极坐标点
         p1 = [probe_r + measure_list[0], theta_list[0]]
@@ -145,33 +216,22 @@ class CircleFitter:
     """圆形拟合算法"""
 
     @staticmethod
-    def fit_circle(x, y):
+    def fit_circle(x, y, method=DEFAULT_FIT_METHOD, refine=False):
         """
-        使用最小二乘法拟合圆
+        拟合圆（默认Taubin代数拟合，闭式求解）
+        method: "kasa"、"pratt" 或 "taubin"
+        refine: 是否再用least_squares做几何精化（需要scipy）
         返回: (center_x, center_y, radius, residual)
         """
-        def calc_R(xc, yc):
-            """计算到圆心的距离"""
-            return np.sqrt((x - xc)**2 + (y - yc)**2)
-
-        def f_2(c):
-            """目标函数"""
-            Ri = calc_R(*c)
-            return Ri - Ri.mean()
-
-        # 初始估计
-        x_m = np.mean(x)
-        y_m = np.mean(y)
-        center_estimate = x_m, y_m
+        return fit_circle(x, y, method, refine)
 
-        # 拟合
-        center_2, _ = least_squares(f_2, center_estimate).x, _
-        xc_2, yc_2 = center_2
-        Ri_2 = calc_R(*center_2)
-        R_2 = Ri_2.mean()
-        residual = np.sum((Ri_2 - R_2)**2)
-
-        return xc_2, yc_2, R_2, residual
+    @staticmethod
+    def fit_circles(x, y, method=DEFAULT_FIT_METHOD):
+        """
+        批量拟合多组点（M×N数组，点数不同时用NaN补齐）
+        返回: (center_x, center_y, radius, residual) 数组
+        """
+        return fit_circles(x, y, method)
 
     @staticmethod
     def generate_circle_points(center_x, center_y, radius, num_points=100):
@@ -340,14 +400,13 @@ class HistoryDataPlot(FigureCanvas):
         self.ax.plot(depth_range, standard_line, 'g-', linewidth=1.5, alpha=0.7,
                     label=f'标准直径 ({standard_diameter:.1f}mm)')
 
-        # 绘制测量数据曲线
-        self.ax.plot(depths, diameters, 'b-', linewidth=2, marker='o',
-                    markersize=3, label='测量数据')
-
-        # 标记超出公差的点
-        for i, (depth, diameter) in enumerate(zip(depths, diameters)):
-            if diameter > standard_diameter + upper_tolerance or diameter < standard_diameter + lower_tolerance:
-                self.ax.plot(depth, diameter, 'ro', markersize=5, alpha=0.8)
+        # 绘制测量数据曲线和超差点（按像素宽度降采样，数据在坐标轴范围确定后填入）
+        self.trace_depths = depths
+        self.trace_diameters = diameters
+        self.trace_tolerance = (standard_diameter + lower_tolerance, standard_diameter + upper_tolerance)
+        self.data_line, = self.ax.plot([], [], 'b-', linewidth=2, marker='o',
+                                       markersize=3, label='测量数据')
+        self.anomaly_line, = self.ax.plot([], [], 'ro', linestyle='None', markersize=5, alpha=0.8)
 
         # 设置坐标轴
         self.ax.set_xlabel('深度 (mm)', fontsize=12)
@@ -369,26 +428,45 @@ class HistoryDataPlot(FigureCanvas):
         self.ax.grid(True, alpha=0.3)
         self.ax.legend(loc='best', fontsize=10)
 
+        # 按当前视图降采样，缩放时重新降采样（ax.clear()会清除回调，每次绘图重新连接）
+        self.update_decimated_trace()
+        self.ax.callbacks.connect('xlim_changed', lambda ax: self.update_decimated_trace())
+
         # 刷新画布
         self.draw()
 
+    def update_decimated_trace(self):
+        """按当前X轴范围和像素宽度重新降采样测量曲线"""
+        depths = self.trace_depths
+        diameters = self.trace_diameters
+        indices = decimate_trace(depths, diameters, target_points_for_axes(self.ax),
+                                 tolerance=self.trace_tolerance, x_range=self.ax.get_xlim())
+        depths, diameters = depths[indices], diameters[indices]
+
+        # 降采样后的点不再等间距，只在显示原始样本时绘制圆点标记
+        self.data_line.set_data(depths, diameters)
+        self.data_line.set_marker('None' if is_decimated(indices) else 'o')
+
+        lower_limit, upper_limit = self.trace_tolerance
+        mask = (diameters > upper_limit) | (diameters < lower_limit)
+        self.anomaly_line.set_data(depths[mask], diameters[mask])
+
 
 
     def plot_statistics(self, diameters, target_diameter=17.6, upper_tolerance=0.05, lower_tolerance=0.07):
         """在二维图表上显示统计信息"""
-        if not diameters:
+        if len(diameters) == 0:
             return
 
-        # 计算统计量
-        mean_diameter = np.mean(diameters)
-        std_diameter = np.std(diameters)
-        min_diameter = np.min(diameters)
-        max_diameter = np.max(diameters)
-
-        # 合格率（使用非对称公差）
-        qualified_count = sum(1 for d in diameters
-                            if target_diameter - lower_tolerance <= d <= target_diameter + upper_tolerance)
-        qualification_rate = qualified_count / len(diameters) * 100
+        # 计算统计量（合格率使用非对称公差）
+        stats = StreamingStatistics.from_values(
+            diameters, (target_diameter - lower_tolerance, target_diameter + upper_tolerance))
+        mean_diameter = stats.mean
+        std_diameter = stats.std
+        min_diameter = stats.min
+        max_diameter = stats.max
+        qualified_count = stats.in_tolerance_count
+        qualification_rate = stats.qualification_rate
 
         # 创建统计文本
         stats_text = f"""统计信息:
@@ -430,6 +508,150 @@ class HistoryDataPlot(FigureCanvas):
             delattr(self, '_stats_text_box')
 
 
+class EccentricityPlot(HistoryDataPlot):
+    """整孔拟合圆偏心度随深度变化曲线"""
+
+    def init_empty_plot(self):
+        """初始化空的偏心度曲线"""
+        self.ax.clear()
+        self.apply_dark_theme()
+        self.ax.set_xlabel('深度 (mm)')
+        self.ax.set_ylabel('偏心度 (mm)')
+        self.ax.set_title('拟合圆偏心度-深度曲线')
+        self.ax.grid(True, alpha=0.3)
+        self.draw()
+
+    def plot_eccentricity(self, depths, fit_result):
+        """
+        绘制偏心度曲线
+        depths: 深度数组
+        fit_result: ProbeCircleFitter.fit_batch 的返回值，共线样本在曲线上断开并在深度轴上标出
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        eccentricity = fit_result['eccentricity']
+        collinear = fit_result['collinear']
+        if len(depths) == 0:
+            self.init_empty_plot()
+            return
+
+        self.ax.clear()
+        self.apply_dark_theme()
+        self.ax.plot(depths, eccentricity, '-', color='#4FC3F7', linewidth=1.5, label='偏心度')
+        if collinear.any():
+            self.ax.plot(depths[collinear], np.zeros(int(collinear.sum())), 'rx', linestyle='None',
+                         label=f'无法拟合 ({int(collinear.sum())}点)')
+
+        valid = eccentricity[~collinear]
+        if len(valid):
+            self.ax.axhline(float(valid.mean()), color='#FFB74D', linestyle='--', linewidth=1,
+                            label=f'平均 {valid.mean():.4f}mm / 最大 {valid.max():.4f}mm')
+
+        self.ax.set_xlabel('深度 (mm)')
+        self.ax.set_ylabel('偏心度 (mm)')
+        self.ax.set_title('拟合圆偏心度-深度曲线', fontsize=14, fontweight='bold')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.legend(loc='best', fontsize=10)
+        self.draw()
+
+
+class HoleComparisonPlot(HistoryDataPlot):
+    """多孔直径对比图：中位数、分位数带和离群点，图元数量与孔位数无关"""
+
+    # 离群孔位文本框中列出的孔位数
+    MAX_LISTED_OUTLIER_HOLES = 8
+
+    def init_empty_plot(self):
+        """初始化空的多孔对比图"""
+        self.ax.clear()
+        self.apply_dark_theme()
+        self.ax.set_xlabel('深度 (mm)')
+        self.ax.set_ylabel('直径 (mm)')
+        self.ax.set_title('多孔直径对比')
+        self.ax.grid(True, alpha=0.3)
+        self.draw()
+
+    def plot_comparison(self, result, tolerance_band=TOLERANCE_BAND, standard_diameter=STANDARD_DIAMETER):
+        """
+        绘制多孔对比
+        result: hole_comparison.ComparisonResult
+        """
+        if not result.hole_ids:
+            self.init_empty_plot()
+            return
+
+        grid = result.grid
+        percentiles = result.percentiles
+        self.ax.clear()
+        self.apply_dark_theme()
+        self.ax.fill_between(grid, percentiles[5], percentiles[95], color='#4FC3F7', alpha=0.2,
+                             linewidth=0, label='P5–P95')
+        self.ax.fill_between(grid, percentiles[25], percentiles[75], color='#4FC3F7', alpha=0.45,
+                             linewidth=0, label='P25–P75')
+        self.ax.plot(grid, result.median, '-', color='#FFFFFF', linewidth=1.5, label='中位数')
+
+        outlier_depths, outlier_diameters = result.outlier_points()
+        if len(outlier_depths):
+            self.ax.plot(outlier_depths, outlier_diameters, '.', color='#FF5252', markersize=2,
+                         linestyle='None', label=f'离群点 ({len(outlier_depths)})')
+
+        lower_limit, upper_limit = tolerance_band
+        self.ax.axhline(upper_limit, color='r', linestyle='--', linewidth=1, label=f'上公差线 ({upper_limit:.2f}mm)')
+        self.ax.axhline(lower_limit, color='r', linestyle='--', linewidth=1, label=f'下公差线 ({lower_limit:.2f}mm)')
+        self.ax.axhline(standard_diameter, color='g', linewidth=1, alpha=0.7,
+                        label=f'标准直径 ({standard_diameter:.1f}mm)')
+
+        if result.outlier_holes:
+            listed = result.outlier_holes[:self.MAX_LISTED_OUTLIER_HOLES]
+            lines = [f"{hole_id}: {fraction * 100:.1f}%" for hole_id, fraction in listed]
+            if len(result.outlier_holes) > len(listed):
+                lines.append(f"... 共 {len(result.outlier_holes)} 个")
+            self.ax.text(0.02, 0.98, "离群孔位（离群点比例）:\n" + "\n".join(lines),
+                         transform=self.ax.transAxes, fontsize=9, verticalalignment='top',
+                         bbox=dict(boxstyle='round,pad=0.5', facecolor='#505869', alpha=0.8),
+                         color='#FFFFFF')
+
+        title = f'多孔直径对比 ({len(result.hole_ids)} 个孔位)'
+        if result.missing_holes:
+            title += f'，{len(result.missing_holes)} 个无数据'
+        self.ax.set_xlabel('深度 (mm)')
+        self.ax.set_ylabel('直径 (mm)')
+        self.ax.set_title(title, fontsize=14, fontweight='bold')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.legend(loc='upper right', fontsize=9)
+        self.draw()
+
+
+class HoleComparisonDialog(QDialog):
+    """多孔对比的孔位选择对话框"""
+
+    def __init__(self, hole_ids, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("多孔对比 - 选择孔位")
+        self.resize(320, 480)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("选择要对比的孔位（可按住Ctrl/Shift多选）:"))
+
+        self.hole_list = QListWidget()
+        self.hole_list.setSelectionMode(QListWidget.ExtendedSelection)
+        self.hole_list.addItems(list(hole_ids))
+        layout.addWidget(self.hole_list)
+
+        select_all_button = QPushButton("全选")
+        select_all_button.clicked.connect(self.hole_list.selectAll)
+        layout.addWidget(select_all_button)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_selected_holes(self):
+        """按列表顺序返回选中的孔位"""
+        return [self.hole_list.item(row).text() for row in range(self.hole_list.count())
+                if self.hole_list.item(row).isSelected()]
+
+
 class HistoryViewer(QWidget):
     """历史数据查看器 - 3.1页面"""
 
@@ -437,6 +659,17 @@ class HistoryViewer(QWidget):
         super().__init__(parent)
         self.current_hole_data = None
         self.circle_plot_index = 0  # 用于跟踪当前绘制拟合圆的子图索引 (0-3)
+        # 后台查询：读取CSV、偏心度拟合和三维模型网格生成在工作线程执行，界面按阶段逐步更新
+        self.query_service = HistoryQueryService(TOLERANCE_BAND, ProbeCircleFitter.fit_channels, self,
+                                                 build_model=prepare_hole_mesh if HAS_3D_RENDERER else None)
+        self.query_service.stage_ready.connect(self.on_query_stage_ready)
+        self.query_service.query_failed.connect(self.on_query_failed)
+        self._query_workpiece_id = ""
+        # 多孔对比：各孔位在线程池中并发读取和重采样
+        self.comparison_service = HoleComparisonService(self)
+        self.comparison_service.progress.connect(self.on_comparison_progress)
+        self.comparison_service.comparison_ready.connect(self.on_comparison_ready)
+        self.comparison_service.comparison_failed.connect(self.on_comparison_failed)
         self.setup_ui()
         self.load_workpiece_list()
 
@@ -472,11 +705,20 @@ class HistoryViewer(QWidget):
         """创建可视化标签页（二维图表和三维模型）"""
         # 创建标签页控件
         tab_widget = QTabWidget()
+        self.visualization_tabs = tab_widget
 
         # 二维图表标签页
         self.plot_widget = HistoryDataPlot()
         tab_widget.addTab(self.plot_widget, "二维公差带图表")
 
+        # 偏心度曲线标签页
+        self.eccentricity_plot = EccentricityPlot()
+        tab_widget.addTab(self.eccentricity_plot, "偏心度曲线")
+
+        # 多孔对比标签页
+        self.comparison_plot = HoleComparisonPlot()
+        tab_widget.addTab(self.comparison_plot, "多孔对比")
+
         # 三维模型标签页
         if HAS_3D_RENDERER:
             self.model_3d_viewer = Hole3DViewer()
@@ -542,12 +784,18 @@ class HistoryViewer(QWidget):
         self.manual_review_button.clicked.connect(self.open_manual_review)
         action_layout.addWidget(self.manual_review_button)
 
+        self.compare_button = QPushButton("多孔对比")
+        self.compare_button.clicked.connect(self.open_hole_comparison)
+        action_layout.addWidget(self.compare_button)
+
         # --- 当前管孔状态显示 ---
         status_group = QGroupBox("当前状态")
         status_layout = QVBoxLayout(status_group)
         self.current_hole_label = QLabel("当前管孔: --")
         self.current_hole_label.setObjectName("CurrentHoleLabel")
         status_layout.addWidget(self.current_hole_label)
+        self.comparison_status_label = QLabel("多孔对比: --")
+        status_layout.addWidget(self.comparison_status_label)
 
         # 将所有部分添加到侧边栏布局中
         sidebar_layout.addWidget(filter_group)
@@ -637,23 +885,23 @@ class HistoryViewer(QWidget):
         table_group = QGroupBox("测量数据")
         table_layout = QVBoxLayout(table_group)
 
-        self.data_table = QTableWidget()
+        self.data_model = MeasurementTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_table.verticalHeader().setVisible(False)  # 隐藏左侧的行号表头
-        self.data_table.setColumnCount(10)  # 从9增加到10列
-        self.data_table.setHorizontalHeaderLabels([
-            "序号", "位置(mm)", "直径(mm)", "通道1值(μm)", "通道2值(μm)", "通道3值(μm)", "合格", "时间", "操作员", "备注"
-        ])
+        self.data_table.horizontalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
 
         # 设置表格属性
         self.data_table.setAlternatingRowColors(True)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.data_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.data_table.setSortingEnabled(True)
+        self.data_table.sortByColumn(-1, Qt.AscendingOrder)  # 初始保持数据顺序
 
         # 禁用表格编辑
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.data_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
-        # 连接双击事件
-        self.data_table.cellDoubleClicked.connect(self.on_table_double_clicked)
+        # 连接双击事件（视图行号映射为数据行号）
+        self.data_table.doubleClicked.connect(self.on_table_index_double_clicked)
 
         table_layout.addWidget(self.data_table)
         splitter.addWidget(table_group)
@@ -853,100 +1101,143 @@ class HistoryViewer(QWidget):
             QMessageBox.warning(self, "警告", "孔ID格式错误，请输入以H开头的孔ID，如：H001")
             return
 
-        print("🔍 开始加载CSV数据...")
-        # 从CSV文件加载数据
-        measurements = self.load_csv_data_for_hole(hole_id)
+        print("🔍 后台加载CSV数据...")
+        # 新查询取消尚未完成的旧查询；结果按阶段在 on_query_stage_ready 中应用
+        self._query_workpiece_id = workpiece_id
+        self.query_service.submit(hole_id)
+        self.current_hole_label.setText(f"当前管孔: {hole_id} (加载中...)")
+
+    def available_hole_ids(self):
+        """合格和不合格下拉框中的全部孔位（不含提示项）"""
+        hole_ids = []
+        for combo in (self.qualified_hole_combo, self.unqualified_hole_combo):
+            hole_ids.extend(combo.itemText(i) for i in range(combo.count())
+                            if combo.itemText(i) not in ("", "请选择合格孔ID", "请选择不合格孔ID"))
+        return hole_ids
+
+    def open_hole_comparison(self):
+        """选择孔位并开始多孔对比"""
+        hole_ids = self.available_hole_ids()
+        if not hole_ids:
+            QMessageBox.warning(self, "警告", "当前工件没有可对比的孔位")
+            return
+        dialog = HoleComparisonDialog(hole_ids, self)
+        if dialog.exec() == QDialog.Accepted:
+            selected = dialog.get_selected_holes()
+            if len(selected) < 2:
+                QMessageBox.warning(self, "警告", "请至少选择两个孔位进行对比")
+                return
+            self.start_hole_comparison(selected)
+
+    def start_hole_comparison(self, hole_ids):
+        """后台并发读取孔位并在“多孔对比”标签页显示结果"""
+        self.comparison_service.submit(hole_ids)
+        self.comparison_status_label.setText(f"多孔对比: 加载中 0/{len(hole_ids)}")
+        self.visualization_tabs.setCurrentWidget(self.comparison_plot)
+
+    def on_comparison_progress(self, request_id, loaded, total):
+        """多孔对比读取进度"""
+        self.comparison_status_label.setText(f"多孔对比: 加载中 {loaded}/{total}")
+
+    def on_comparison_ready(self, request_id, result):
+        """显示多孔对比结果"""
+        self.comparison_plot.plot_comparison(result)
+        status = f"多孔对比: {len(result.hole_ids)} 个孔位"
+        if result.outlier_holes:
+            status += f"，{len(result.outlier_holes)} 个离群"
+        self.comparison_status_label.setText(status)
+        if result.missing_holes:
+            print(f"⚠️ 以下孔位没有测量数据: {', '.join(result.missing_holes)}")
+
+    def on_comparison_failed(self, request_id, message):
+        """多孔对比失败"""
+        print(f"❌ 多孔对比失败: {message}")
+        self.comparison_status_label.setText("多孔对比: 失败")
+        QMessageBox.warning(self, "错误", f"多孔对比失败: {message}")
+
+    def on_query_stage_ready(self, request_id, stage, result):
+        """应用后台查询的一个阶段结果（只会收到当前查询的结果）"""
+        if stage == STAGE_MEASUREMENTS:
+            self.apply_query_measurements(result)
+        elif stage == STAGE_ANALYSIS:
+            self.apply_query_analysis(result)
+
+    def on_query_failed(self, request_id, message):
+        """后台查询失败"""
+        print(f"❌ 查询数据失败: {message}")
+        self.update_current_hole_display("")
+        QMessageBox.warning(self, "错误", f"查询数据失败: {message}")
 
-        print(f"📊 CSV加载结果: {len(measurements) if measurements else 0} 条数据")
+    def apply_query_measurements(self, result):
+        """第一阶段：显示数据表格和二维包络图"""
+        workpiece_id = self._query_workpiece_id
+        hole_id = result.hole_id
+        measurements = result.measurements
+        print(f"📊 CSV加载结果: {len(measurements)} 条数据{' (缓存)' if result.from_cache else ''}")
 
         if not measurements:
             print("❌ 没有找到数据")
+            if result.file_path is None:
+                print(f"CSV数据目录不存在或无CSV文件，已检查路径: "
+                      f"{[path.format(hole_id=hole_id) for path in HOLE_CSV_DIRS]}")
             QMessageBox.information(self, "信息", f"孔 {hole_id} 没有找到对应的CSV数据文件")
             self.clear_display()
             return
 
+        # 即使图表更新失败，也要设置current_hole_data以支持双击功能
+        self.current_hole_data = {
+            'workpiece_id': workpiece_id,
+            'hole_id': hole_id,
+            'measurements': measurements,
+            'hole_info': {}
+        }
+        self.update_current_hole_display(hole_id)
+
         try:
             print("🔍 开始更新显示...")
-            # 更新显示
-            self.update_data_table(measurements)
+            self.update_data_table(measurements, result.columns)
             print("✅ 数据表格更新成功")
 
             self.plot_widget.plot_measurement_data(measurements, {})
+            # 偏心度曲线在拟合完成后显示，先清除上一个孔位的曲线
+            self.eccentricity_plot.init_empty_plot()
             print("✅ 图表更新成功")
-
-            # 更新三维模型
-            if HAS_3D_RENDERER and hasattr(self, 'model_3d_viewer'):
-                self.model_3d_viewer.update_models(measurements)
-                print("✅ 三维模型更新成功")
-
-            print("🔍 设置current_hole_data...")
-            self.current_hole_data = {
-                'workpiece_id': workpiece_id,
-                'hole_id': hole_id,
-                'measurements': measurements,
-                'hole_info': {}
-            }
-
-            # 更新当前管孔ID显示
-            self.update_current_hole_display(hole_id)
-
-            print(f"✅ 查询数据成功: 工件ID={workpiece_id}, 孔ID={hole_id}")
-            print(f"📊 加载了 {len(measurements)} 条测量数据")
-            print(f"🔍 current_hole_data 已设置: {self.current_hole_data is not None}")
-            print(f"🔍 current_hole_data 内容: {list(self.current_hole_data.keys()) if self.current_hole_data else 'None'}")
-
         except Exception as e:
             print(f"❌ 更新显示时出错: {e}")
             import traceback
             traceback.print_exc()
-
-            # 即使图表更新失败，也要设置current_hole_data以支持双击功能
-            print("🔍 设置current_hole_data（忽略图表错误）...")
-            self.current_hole_data = {
-                'workpiece_id': workpiece_id,
-                'hole_id': hole_id,
-                'measurements': measurements,
-                'hole_info': {}
-            }
-            print(f"✅ current_hole_data 已设置: {self.current_hole_data is not None}")
-
             QMessageBox.warning(self, "警告", f"数据加载成功，但图表显示出错: {str(e)}")
             return
 
-    def load_csv_data_for_hole(self, hole_id):
-        """根据孔ID加载对应的CSV数据"""
-        # 修复路径问题：使用相对路径查找CSV文件
-        csv_paths = [
-            f"Data/{hole_id}/CCIDM",
-            f"data/{hole_id}/CCIDM",
-            f"cache/{hole_id}",
-            f"Data/{hole_id}",
-            f"data/{hole_id}"
-        ]
-
-        csv_files = []
-        csv_dir = None
-
-        # 查找存在的CSV目录
-        for path in csv_paths:
-            if os.path.exists(path):
-                csv_dir = path
-                # 查找CSV文件
-                for csv_file in os.listdir(path):
-                    if csv_file.endswith('.csv'):
-                        csv_files.append(os.path.join(path, csv_file))
-                if csv_files:
-                    break
+        print(f"✅ 查询数据成功: 工件ID={workpiece_id}, 孔ID={hole_id}")
+        print(f"📊 加载了 {len(measurements)} 条测量数据")
 
-        if not csv_files:
-            print(f"CSV数据目录不存在或无CSV文件，已检查路径: {csv_paths}")
-            return []
+    def apply_query_analysis(self, result):
+        """第二阶段：显示偏心度曲线和三维模型"""
+        try:
+            if result.fit_result is not None:
+                self.eccentricity_plot.plot_eccentricity(result.depths, result.fit_result)
+                collinear_count = int(result.fit_result['collinear'].sum())
+                if collinear_count:
+                    print(f"⚠️ {collinear_count} 个样本三点共线，无法拟合圆")
+
+            # 更新三维模型（网格已在后台生成）
+            if HAS_3D_RENDERER and hasattr(self, 'model_3d_viewer') and result.model_geometry is not None:
+                self.model_3d_viewer.show_geometry(result.model_geometry)
+                print("✅ 三维模型更新成功")
+        except Exception as e:
+            print(f"❌ 更新偏心度曲线或三维模型时出错: {e}")
+            import traceback
+            traceback.print_exc()
 
-        # 按时间排序
-        csv_files.sort()
+    def load_csv_data_for_hole(self, hole_id):
+        """根据孔ID加载对应的CSV数据（同步读取）"""
+        selected_file = find_hole_csv_file(hole_id)
+        if selected_file is None:
+            print(f"CSV数据目录不存在或无CSV文件，已检查路径: "
+                  f"{[path.format(hole_id=hole_id) for path in HOLE_CSV_DIRS]}")
+            return []
 
-        # 选择第一个CSV文件（通常每个孔位只有一个CSV文件）
-        selected_file = csv_files[0]
         print(f"为孔ID {hole_id} 选择文件: {selected_file}")
 
         # 读取CSV文件数据
@@ -954,168 +1245,37 @@ class HistoryViewer(QWidget):
 
     def read_csv_file(self, file_path):
         """读取CSV文件并返回测量数据"""
-        measurements = []
-
         try:
-            # 尝试不同的编码
-            encodings = ['gbk', 'gb2312', 'utf-8', 'latin-1']
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        reader = csv.reader(file)
-                        headers = next(reader)
-
-                        print(f"成功使用编码 {encoding} 读取文件")
-                        print(f"CSV文件列头: {headers}")
-
-                        # 查找列索引 - 根据实际CSV文件结构调整
-                        measurement_col = 0  # 第一列是测量序号
-                        channel1_col = 1     # 通道1值
-                        channel2_col = 2     # 通道2值
-                        channel3_col = 3     # 通道3值
-                        diameter_col = 4     # 计算直径
-
-                        # 验证列数是否足够
-                        if len(headers) < 5:
-                            print(f"CSV文件列数不足: {len(headers)} < 5")
-                            continue
-
-                        # 读取数据行 - 在同一个with块中
-                        for row_num, row in enumerate(reader, start=2):
-                            try:
-                                if len(row) > max(measurement_col, diameter_col, channel1_col, channel2_col, channel3_col):
-                                    position = float(row[measurement_col])  # 测量序号对应位置(mm)
-                                    diameter = float(row[diameter_col])
-                                    channel1 = float(row[channel1_col])
-                                    channel2 = float(row[channel2_col])
-                                    channel3 = float(row[channel3_col])
-
-                                    # 判断是否合格（标准直径17.6mm，非对称公差+0.05/-0.07mm）
-                                    standard_diameter = 17.6
-                                    upper_tolerance = 0.05
-                                    lower_tolerance = 0.07
-                                    is_qualified = (standard_diameter - lower_tolerance <= diameter <= standard_diameter + upper_tolerance)
-
-                                    # 模拟时间（基于文件修改时间）
-                                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                                    # 为每个数据点添加秒数偏移，正确处理分钟进位
-                                    total_seconds = file_time.second + (row_num - 2)
-                                    additional_minutes = total_seconds // 60
-                                    new_seconds = total_seconds % 60
-
-                                    # 计算新的分钟数，也要处理小时进位
-                                    total_minutes = file_time.minute + additional_minutes
-                                    additional_hours = total_minutes // 60
-                                    new_minutes = total_minutes % 60
-
-                                    # 计算新的小时数
-                                    new_hours = (file_time.hour + additional_hours) % 24
-
-                                    data_time = file_time.replace(hour=new_hours, minute=new_minutes, second=new_seconds)
-
-                                    measurements.append({
-                                        'position': position,
-                                        'diameter': diameter,
-                                        'channel1': channel1,
-                                        'channel2': channel2,
-                                        'channel3': channel3,
-                                        'is_qualified': is_qualified,
-                                        'timestamp': data_time,
-                                        'operator': ''  # 暂不显示
-                                    })
-
-                            except (ValueError, IndexError) as e:
-                                print(f"解析第{row_num}行数据时出错: {e}")
-                                continue
-
-                        # 成功读取，跳出编码循环
-                        break
-
-                except UnicodeDecodeError:
-                    continue
-            else:
-                print(f"无法使用任何编码读取文件: {file_path}")
-                return []
-
-        except Exception as e:
+            measurements = read_probe_measurements(file_path, TOLERANCE_BAND)
+        except (OSError, ValueError) as e:
             print(f"读取CSV文件时出错: {e}")
             return []
 
         print(f"成功读取 {len(measurements)} 条测量数据")
         return measurements
 
-    def update_data_table(self, measurements):
-        """更新数据表格"""
-        self.data_table.setRowCount(len(measurements))
-
-        for row, measurement in enumerate(measurements):
-            # 序号列 (第0列) - 新增
-            seq_item = QTableWidgetItem(str(row + 1))
-            seq_item.setTextAlignment(Qt.AlignCenter)  # 让序号居中显示
-            self.data_table.setItem(row, 0, seq_item)
-
-            # 位置(mm) - 对应测量序号 (现在是第1列)
-            position = measurement.get('position', measurement.get('depth', 0))
-            self.data_table.setItem(row, 1, QTableWidgetItem(f"{position:.1f}"))
-
-            # 直径(mm) (现在是第2列)
-            diameter = measurement.get('diameter', 0)
-            self.data_table.setItem(row, 2, QTableWidgetItem(f"{diameter:.4f}"))
-
-            # 通道1值(mm) (现在是第3列)
-            channel1 = measurement.get('channel1', 0)
-            self.data_table.setItem(row, 3, QTableWidgetItem(f"{channel1:.2f}"))
-
-            # 通道2值(mm) (现在是第4列)
-            channel2 = measurement.get('channel2', 0)
-            self.data_table.setItem(row, 4, QTableWidgetItem(f"{channel2:.2f}"))
-
-            # 通道3值(mm) (现在是第5列)
-            channel3 = measurement.get('channel3', 0)
-            self.data_table.setItem(row, 5, QTableWidgetItem(f"{channel3:.2f}"))
-
-            # 合格性 (现在是第6列)
-            is_qualified = measurement.get('is_qualified', True)
-            qualified_text = "✓" if is_qualified else "✗"
-            item = QTableWidgetItem(qualified_text)
-            if not is_qualified:
-                item.setBackground(Qt.red)
-            else:
-                item.setBackground(Qt.green)
-            self.data_table.setItem(row, 6, item)
-
-            # 时间 (现在是第7列)
-            timestamp = measurement.get('timestamp', '')
-            if timestamp:
-                time_str = timestamp.strftime("%H:%M:%S")
-            else:
-                time_str = "--"
-            self.data_table.setItem(row, 7, QTableWidgetItem(time_str))
-
-            # 操作员 (现在是第8列)
-            operator = measurement.get('operator', '--')
-            self.data_table.setItem(row, 8, QTableWidgetItem(operator))
-
-            # 备注 - 只有实际进行了人工复查的行才显示复查信息 (现在是第9列)
-            notes = ""
-            if 'manual_review_value' in measurement:
-                # 只有存在manual_review_value的行才显示复查信息
-                review_value = measurement['manual_review_value']
-                reviewer = measurement.get('reviewer', '未知')
-                review_time = measurement.get('review_time', '')
-                notes = f"人工复查值: {review_value:.4f}mm, 复查员: {reviewer}, 复查时间: {review_time}"
+    def update_data_table(self, measurements, columns=None):
+        """
+        更新数据表格（模型按列保存数据，单元格文本在显示时格式化）
 
-            self.data_table.setItem(row, 9, QTableWidgetItem(notes))
+        Args:
+            measurements: 逐行测量记录（人工复查后使用）
+            columns: 按列存储的同一份数据，给出时模型直接使用这些数组
+        """
+        if columns is not None:
+            self.data_model.set_columns(columns)
+        else:
+            self.data_model.set_measurements(measurements)
 
         # 调整列宽
         self.data_table.resizeColumnsToContents()
 
     def clear_display(self):
         """清除显示"""
-        self.data_table.setRowCount(0)
+        self.data_model.clear()
         self.plot_widget.clear_plots()
         self.plot_widget.draw()
+        self.eccentricity_plot.init_empty_plot()
 
         # 清除三维模型
         if HAS_3D_RENDERER and hasattr(self, 'model_3d_viewer'):
@@ -1141,6 +1301,11 @@ class HistoryViewer(QWidget):
         # 这里可以实现数据导出功能
         QMessageBox.information(self, "信息", "数据导出功能待实现")
 
+    def on_table_index_double_clicked(self, index):
+        """表格双击：视图行号（可能已排序）映射为测量数据行号"""
+        if index.isValid():
+            self.on_table_double_clicked(self.data_model.source_row(index.row()), index.column())
+
     def on_table_double_clicked(self, row, column):
         """处理表格双击事件"""
         print(f"🔍 双击事件触发: 行{row}, 列{column}")
@@ -1167,8 +1332,8 @@ class HistoryViewer(QWidget):
             QMessageBox.warning(self, "提示", "当前没有测量数据")
             return
 
-        if row >= self.data_table.rowCount():
-            print(f"❌ 行索引超出范围: {row} >= {self.data_table.rowCount()}")
+        if row >= self.data_model.rowCount():
+            print(f"❌ 行索引超出范围: {row} >= {self.data_model.rowCount()}")
             return
 
         try:
@@ -1192,22 +1357,16 @@ class HistoryViewer(QWidget):
 
             # 数据转换：通道数据单位为μm，使用公式 2.1 - 通道值*0.001 进行处理
             # 这个公式将μm数据转换为绘图所需的参数，对应matlab.txt中的measure_list数组值
-            if channel1 > 100:  # 检测到大数值格式（μm单位）
-                # 转换公式：2.1 - 通道值 * 0.001
-                # 例如：1385.62μm → 2.1 - 1385.62*0.001 = 2.1 - 1.38562 = 0.71438
-                channel1_processed = 2.1 - channel1 * 0.001
-                channel2_processed = 2.1 - channel2 * 0.001
-                channel3_processed = 2.1 - channel3 * 0.001
-
+            # 例如：1385.62μm → 2.1 - 1385.62*0.001 = 2.1 - 1.38562 = 0.71438
+            channel1_processed, channel2_processed, channel3_processed = (
+                ProbeCircleFitter.channels_to_parameters([channel1, channel2, channel3])[0].tolist())
+            if channel1 > CHANNEL_UM_THRESHOLD:  # 检测到大数值格式（μm单位）
                 print(f"🔄 数据转换: μm -> 绘图参数")
                 print(f"   原始数据(μm): [{measurement.get('channel1'):.2f}, {measurement.get('channel2'):.2f}, {measurement.get('channel3'):.2f}]")
                 print(f"   转换公式: 2.1 - 通道值*0.001")
                 print(f"   转换后: [{channel1_processed:.6f}, {channel2_processed:.6f}, {channel3_processed:.6f}]")
             else:
                 # 如果是小数值，假设已经是处理后的参数
-                channel1_processed = channel1
-                channel2_processed = channel2
-                channel3_processed = channel3
                 print(f"🔄 数据已为处理后参数: [{channel1_processed:.6f}, {channel2_processed:.6f}, {channel3_processed:.6f}]")
 
             measure_list = [channel1_processed, channel2_processed, channel3_processed]
@@ -1267,14 +1426,6 @@ class HistoryViewer(QWidget):
             QMessageBox.warning(self, "警告", "请先查询数据后再导出")
             return
 
-        # 在导出数据时，先清除之前的三维模型，然后重新绘制当前管孔的模型
-        if HAS_3D_RENDERER and hasattr(self, 'model_3d_viewer'):
-            # 清除之前的模型
-            self.model_3d_viewer.clear_models()
-            # 重新绘制当前管孔的模型
-            if 'measurements' in self.current_hole_data:
-                self.model_3d_viewer.update_models(self.current_hole_data['measurements'])
-
         # 弹出文件保存对话框
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -1297,14 +1448,15 @@ class HistoryViewer(QWidget):
             upper_tolerance = 0.05
             lower_tolerance = 0.07
 
-            qualified_count = sum(1 for d in diameters
-                                if standard_diameter - lower_tolerance <= d <= standard_diameter + upper_tolerance)
-            total_count = len(diameters)
-            qualification_rate = qualified_count / total_count * 100 if total_count > 0 else 0
+            stats = StreamingStatistics.from_values(
+                diameters, (standard_diameter - lower_tolerance, standard_diameter + upper_tolerance))
+            qualified_count = stats.in_tolerance_count
+            total_count = stats.count
+            qualification_rate = stats.qualification_rate
 
-            max_diameter = max(diameters) if diameters else 0
-            min_diameter = min(diameters) if diameters else 0
-            avg_diameter = sum(diameters) / len(diameters) if diameters else 0
+            max_diameter = stats.max if total_count else 0
+            min_diameter = stats.min if total_count else 0
+            avg_diameter = stats.mean
 
             # 添加调试输出
             print(f"🔍 导出统计计算调试:")
@@ -25,6 +25,7 @@ from matplotlib.figure import Figure
 from scipy.optimize import least_squares
 
 from .models import db_manager
+from .measurement_csv import read_probe_measurements
 
 
 class ManualReviewDialog(QDialog):
@@ -440,95 +441,20 @@ class HistoryViewer(QWidget):
 
     def read_csv_file(self, file_path):
         """读取CSV文件并返回测量数据（与原始版本完全一致）"""
-        measurements = []
-
+        # 判断是否合格（标准直径17.6mm，非对称公差+0.05/-0.07mm）
+        standard_diameter = 17.6
+        upper_tolerance = 0.05
+        lower_tolerance = 0.07
         try:
-            # 尝试不同的编码
-            encodings = ['gbk', 'gb2312', 'utf-8', 'latin-1']
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        reader = csv.reader(file)
-                        headers = next(reader)
-
-                        print(f"成功使用编码 {encoding} 读取文件")
-                        print(f"CSV文件列头: {headers}")
-
-                        # 查找列索引 - 根据实际CSV文件结构调整
-                        measurement_col = 0  # 第一列是测量序号
-                        channel1_col = 1     # 通道1值
-                        channel2_col = 2     # 通道2值
-                        channel3_col = 3     # 通道3值
-                        diameter_col = 4     # 计算直径
-
-                        # 验证列数是否足够
-                        if len(headers) < 5:
-                            print(f"CSV文件列数不足: {len(headers)} < 5")
-                            continue
-
-                        # 读取数据行 - 在同一个with块中
-                        for row_num, row in enumerate(reader, start=2):
-                            try:
-                                if len(row) > max(measurement_col, diameter_col, channel1_col, channel2_col, channel3_col):
-                                    position = float(row[measurement_col])  # 测量序号对应位置(mm)
-                                    diameter = float(row[diameter_col])
-                                    channel1 = float(row[channel1_col])
-                                    channel2 = float(row[channel2_col])
-                                    channel3 = float(row[channel3_col])
-
-                                    # 判断是否合格（标准直径17.6mm，非对称公差+0.05/-0.07mm）
-                                    standard_diameter = 17.6
-                                    upper_tolerance = 0.05
-                                    lower_tolerance = 0.07
-                                    is_qualified = (standard_diameter - lower_tolerance <= diameter <= standard_diameter + upper_tolerance)
-
-                                    # 模拟时间（基于文件修改时间）
-                                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                                    # 为每个数据点添加秒数偏移，正确处理分钟进位
-                                    total_seconds = file_time.second + (row_num - 2)
-                                    additional_minutes = total_seconds // 60
-                                    new_seconds = total_seconds % 60
-
-                                    # 计算新的分钟数，也要处理小时进位
-                                    total_minutes = file_time.minute + additional_minutes
-                                    additional_hours = total_minutes // 60
-                                    new_minutes = total_minutes % 60
-
-                                    # 计算新的小时数
-                                    new_hours = (file_time.hour + additional_hours) % 24
-
-                                    data_time = file_time.replace(hour=new_hours, minute=new_minutes, second=new_seconds)
-
-                                    measurements.append({
-                                        'position': position,
-                                        'diameter': diameter,
-                                        'channel1': channel1,
-                                        'channel2': channel2,
-                                        'channel3': channel3,
-                                        'is_qualified': is_qualified,
-                                        'qualified': is_qualified,  # 兼容性
-                                        'timestamp': data_time,
-                                        'operator': ''  # 暂不显示
-                                    })
-
-                            except (ValueError, IndexError) as e:
-                                print(f"解析第{row_num}行数据时出错: {e}")
-                                continue
-
-                        # 成功读取，跳出编码循环
-                        break
-
-                except UnicodeDecodeError:
-                    continue
-            else:
-                print(f"无法使用任何编码读取文件: {file_path}")
-                return []
-
-        except Exception as e:
+            measurements = read_probe_measurements(
+                file_path, (standard_diameter - lower_tolerance, standard_diameter + upper_tolerance))
+        except (OSError, ValueError) as e:
             print(f"读取CSV文件时出错: {e}")
             return []
 
+        for measurement in measurements:
+            measurement['qualified'] = measurement['is_qualified']  # 兼容性
+
         print(f"成功读取 {len(measurements)} 条测量数据")
         return measurements
 
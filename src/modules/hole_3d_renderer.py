@@ -4,9 +4,14 @@
 生成实测管径、最大正误差、最小负误差的三维模型
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.colors import ListedColormap
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
@@ -15,6 +20,159 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QL
 from PySide6.QtCore import Qt
 import math
 
+from .decimation import minmax_indices
+
+
+# 标准参数
+STANDARD_DIAMETER = 17.6
+UPPER_TOLERANCE = 0.05
+LOWER_TOLERANCE = 0.07
+
+# 圆周方向的网格点数
+MESH_THETA_STEPS = 48
+# 实测表面的面片预算：深度方向按最小/最大包络降采样到 预算/圆周面片数 列
+MEASURED_FACE_BUDGET = 2400
+# 公差圆柱半径不变，深度方向只保留少量网格线
+TOLERANCE_DEPTH_STEPS = 9
+# 缓存的几何数据份数
+GEOMETRY_CACHE_SIZE = 4
+
+# 默认视角 (仰角, 方位角)
+DEFAULT_VIEW = (25, 35)
+
+# 实测表面颜色：超下公差、合格、超上公差
+MEASURED_COLORMAP = ListedColormap(['blue', 'lime', 'red'])
+
+
+@dataclass
+class HoleMeshGeometry:
+    """三维管孔模型的面片数据（已降采样），可在多次绘制间复用"""
+    measured_quads: np.ndarray         # 实测表面四边形顶点 (F, 4, 3)
+    measured_colors: np.ndarray        # 实测表面面片颜色 (F, 4)
+    upper_quads: np.ndarray            # 上公差圆柱
+    lower_quads: np.ndarray            # 下公差圆柱
+    sample_count: int                  # 降采样前的样本数
+    max_positive_error: float
+    min_negative_error: float
+    depth_range: Tuple[float, float]
+    max_radius: float                  # 坐标轴半宽
+
+
+def cylinder_quads(theta: np.ndarray, radii, depths) -> np.ndarray:
+    """
+    生成圆柱面的四边形面片（向量化）
+
+    Args:
+        theta: 圆周角 (T,)
+        radii: 各深度的半径 (D,) 或常数
+        depths: 深度 (D,)
+
+    Returns:
+        np.ndarray: (T-1)*(D-1) 个面片的顶点，形状 (F, 4, 3)，按圆周方向优先排列
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), depths.shape)
+    grid = np.empty((len(theta), len(depths), 3))
+    grid[..., 0] = np.outer(np.cos(theta), radii)
+    grid[..., 1] = np.outer(np.sin(theta), radii)
+    grid[..., 2] = depths
+    # 每个面片的四个角：(i, j), (i+1, j), (i+1, j+1), (i, j+1)
+    quads = np.stack((grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]), axis=2)
+    return quads.reshape(-1, 4, 3)
+
+
+def extract_depths_diameters(measurements) -> Tuple[np.ndarray, np.ndarray]:
+    """从测量数据字典中取出深度和直径，去掉无效值并按深度排序"""
+    depths = np.fromiter((m.get('position', m.get('depth', 0)) for m in measurements),
+                         dtype=np.float64, count=len(measurements))
+    diameters = np.fromiter((m.get('diameter', 0) for m in measurements),
+                            dtype=np.float64, count=len(measurements))
+    return sorted_valid_samples(depths, diameters)
+
+
+def sorted_valid_samples(depths, diameters) -> Tuple[np.ndarray, np.ndarray]:
+    """去掉无效值并按深度排序"""
+    depths = np.asarray(depths, dtype=np.float64)
+    diameters = np.asarray(diameters, dtype=np.float64)
+    valid = np.isfinite(depths) & np.isfinite(diameters)
+    depths, diameters = depths[valid], diameters[valid]
+    order = np.argsort(depths, kind='stable')
+    return depths[order], diameters[order]
+
+
+def build_hole_mesh(depths, diameters, standard_diameter: float = STANDARD_DIAMETER,
+                    upper_tolerance: float = UPPER_TOLERANCE, lower_tolerance: float = LOWER_TOLERANCE,
+                    face_budget: int = MEASURED_FACE_BUDGET,
+                    theta_steps: int = MESH_THETA_STEPS) -> HoleMeshGeometry:
+    """
+    生成三维管孔模型的网格数据
+
+    深度方向按最小/最大包络降采样到面片预算以内：每段深度保留直径最小和最大的样本，
+    超差样本必然是所在段的极值，因此每一处超差都仍然可见。误差统计和坐标范围使用全部样本。
+
+    Args:
+        depths: 按深度排序的深度数组
+        diameters: 对应的直径数组
+        face_budget: 实测表面的面片数上限
+
+    Returns:
+        HoleMeshGeometry: 网格数据
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    diameters = np.asarray(diameters, dtype=np.float64)
+    theta = np.linspace(0, 2 * np.pi, theta_steps)
+
+    # 深度方向最多 max_columns 个网格点（max_columns-1 列面片）
+    max_columns = max(face_budget // (theta_steps - 1), 2) + 1
+    if len(depths) > max_columns:
+        # minmax_indices 每段保留两个点并附加首尾点
+        indices = minmax_indices(diameters, max((max_columns - 2) // 2, 1))
+    else:
+        indices = np.arange(len(depths))
+    mesh_depths = depths[indices]
+    mesh_diameters = diameters[indices]
+
+    # 面片颜色取其起始深度的公差状态：0 超下公差，1 合格，2 超上公差
+    errors = mesh_diameters[:-1] - standard_diameter
+    color_index = np.ones(len(errors), dtype=np.intp)
+    color_index[errors > upper_tolerance] = 2
+    color_index[errors < -lower_tolerance] = 0
+    measured_colors = np.tile(MEASURED_COLORMAP(color_index), (theta_steps - 1, 1))
+
+    all_errors = diameters - standard_diameter
+    positive = all_errors[all_errors > 0]
+    negative = all_errors[all_errors < 0]
+    depth_range = (float(depths[0]), float(depths[-1]))
+    tolerance_depths = np.linspace(depth_range[0], depth_range[1], TOLERANCE_DEPTH_STEPS)
+    upper_diameter = standard_diameter + upper_tolerance
+    lower_diameter = standard_diameter - lower_tolerance
+
+    return HoleMeshGeometry(
+        measured_quads=cylinder_quads(theta, mesh_diameters / 2, mesh_depths),
+        measured_colors=measured_colors,
+        upper_quads=cylinder_quads(theta, upper_diameter / 2, tolerance_depths),
+        lower_quads=cylinder_quads(theta, lower_diameter / 2, tolerance_depths),
+        sample_count=len(depths),
+        max_positive_error=float(positive.max()) if len(positive) else 0,
+        min_negative_error=float(negative.min()) if len(negative) else 0,
+        depth_range=depth_range,
+        max_radius=max(upper_diameter, float(np.max(diameters))) / 2 * 1.05,
+    )
+
+
+def prepare_hole_mesh(depths, diameters) -> Optional[HoleMeshGeometry]:
+    """
+    由按列的深度和直径生成网格数据（不涉及界面对象，可在工作线程调用）
+
+    Returns:
+        Optional[HoleMeshGeometry]: 没有有效样本时为None
+    """
+    depths, diameters = sorted_valid_samples(depths, diameters)
+    if len(depths) == 0:
+        return None
+    return build_hole_mesh(depths, diameters)
+
+
 class Hole3DRenderer(FigureCanvas):
     """管孔三维模型渲染器"""
     
@@ -24,6 +182,14 @@ class Hole3DRenderer(FigureCanvas):
         super().__init__(self.figure)
         self.setParent(parent)
 
+        # 几何数据缓存：(测量数据标识, 公差参数) -> (测量数据, HoleMeshGeometry)
+        # 条目保存测量数据列表本身的引用，避免列表被回收后 id 被复用
+        self._geometry_cache = OrderedDict()
+        self._geometry = None
+        self._displayed_key = None
+        # 模型图的布局（为图例和标题留白）只需计算一次
+        self._model_layout_applied = False
+
         # 创建单个三维子图，调整位置以充分利用空间
         self.ax = self.figure.add_subplot(111, projection='3d')
 
@@ -112,6 +278,8 @@ class Hole3DRenderer(FigureCanvas):
     def init_empty_model(self):
         """初始化空的三维模型"""
         self.ax.clear()
+        self._geometry = None
+        self._displayed_key = None
         self.ax.set_xlabel('X (mm)', fontsize=12)
         self.ax.set_ylabel('Y (mm)', fontsize=12)
         self.ax.set_zlabel('深度 (mm)', fontsize=12)
@@ -137,126 +305,83 @@ class Hole3DRenderer(FigureCanvas):
             self.init_empty_model()
             return
 
-        # 清除之前的图例引用（如果存在）
-        if hasattr(self, '_legend_text_box'):
-            delattr(self, '_legend_text_box')
+        key = (id(measurements), len(measurements), STANDARD_DIAMETER, UPPER_TOLERANCE, LOWER_TOLERANCE)
+        if key == self._displayed_key:
+            # 同一份测量数据已在显示，不重新生成
+            return
 
-        # 保存当前测量数据，供reset_view使用
+        # 保存当前测量数据引用
         self._current_measurements = measurements
 
-        # 提取数据
-        depths = []
-        diameters = []
-
-        for measurement in measurements:
-            depth = measurement.get('position', measurement.get('depth', 0))
-            diameter = measurement.get('diameter', 0)
-            depths.append(depth)
-            diameters.append(diameter)
-
-        if not depths or not diameters:
+        geometry = self.get_geometry(measurements, key)
+        if geometry is None:
             self.init_empty_model()
             return
 
-        # 转换为numpy数组并排序
-        depths = np.array(depths)
-        diameters = np.array(diameters)
-
-        # 按深度排序
-        sort_indices = np.argsort(depths)
-        depths = depths[sort_indices]
-        diameters = diameters[sort_indices]
+        self.show_geometry(geometry)
+        self._displayed_key = key
 
-        # 标准参数
-        standard_diameter = 17.6
-        upper_tolerance = 0.05
-        lower_tolerance = 0.07
+    def show_geometry(self, geometry: HoleMeshGeometry):
+        """显示已生成的网格数据（例如后台查询中生成的）；同一份网格已在显示时不重新绘制"""
+        if geometry is self._geometry:
+            return
 
-        # 计算误差
-        errors = diameters - standard_diameter
-        max_positive_error = np.max(errors[errors > 0]) if np.any(errors > 0) else 0
-        min_negative_error = np.min(errors[errors < 0]) if np.any(errors < 0) else 0
+        # 清除之前的图例引用（如果存在）
+        if hasattr(self, '_legend_text_box'):
+            delattr(self, '_legend_text_box')
 
         # 在单个图中渲染所有模型
-        self.render_combined_hole_models(depths, diameters, standard_diameter,
-                                       upper_tolerance, lower_tolerance,
-                                       max_positive_error, min_negative_error)
+        self.render_combined_hole_models(geometry, STANDARD_DIAMETER, UPPER_TOLERANCE, LOWER_TOLERANCE)
+        self._displayed_key = None
 
         self.draw()
 
-    def render_combined_hole_models(self, depths, diameters, standard_diameter,
-                                   upper_tolerance, lower_tolerance,
-                                   max_positive_error, min_negative_error):
+    def get_geometry(self, measurements, key):
+        """取出缓存的网格数据，没有时生成并放入缓存；没有有效数据时返回None"""
+        entry = self._geometry_cache.get(key)
+        if entry is not None and entry[0] is measurements:
+            self._geometry_cache.move_to_end(key)
+            return entry[1]
+
+        depths, diameters = extract_depths_diameters(measurements)
+        if len(depths) == 0:
+            return None
+        geometry = build_hole_mesh(depths, diameters, *key[2:])
+        self._geometry_cache[key] = (measurements, geometry)
+        while len(self._geometry_cache) > GEOMETRY_CACHE_SIZE:
+            self._geometry_cache.popitem(last=False)
+        return geometry
+
+    def render_combined_hole_models(self, geometry, standard_diameter, upper_tolerance, lower_tolerance):
         """在单个图中渲染所有三维模型"""
         self.ax.clear()
         # 清除后重新应用深色主题
         self.apply_dark_theme()
+        self._geometry = geometry
+        max_positive_error = geometry.max_positive_error
+        min_negative_error = geometry.min_negative_error
 
-        # 生成圆柱面参数，增加分辨率以提高模型精度
-        theta = np.linspace(0, 2*np.pi, 48)  # 增加角度分辨率
-        z_range = np.linspace(np.min(depths), np.max(depths), 80)  # 增加深度分辨率
-        Z, THETA = np.meshgrid(z_range, theta)
-
+        # 面片已在几何数据中向量化生成，直接加入坐标轴，不经过 plot_surface 的逐面片循环
         # 1. 绘制上公差管径模型（鲜明的红色，增强对比度）
-        upper_diameter = standard_diameter + upper_tolerance
-        R_upper = np.full_like(Z, upper_diameter / 2)
-        X_upper = R_upper * np.cos(THETA)
-        Y_upper = R_upper * np.sin(THETA)
-
-        surf_upper = self.ax.plot_surface(X_upper, Y_upper, Z,
-                                        alpha=0.4, color='crimson',  # 使用更鲜明的红色
-                                        linewidth=0.5, edgecolor='darkred',  # 添加边缘线
-                                        label=f'上公差 (+{upper_tolerance:.2f}mm)')
+        surf_upper = Poly3DCollection(geometry.upper_quads, shade=True,
+                                      alpha=0.4, facecolors='crimson',  # 使用更鲜明的红色
+                                      linewidths=0.5, edgecolors='darkred',  # 添加边缘线
+                                      label=f'上公差 (+{upper_tolerance:.2f}mm)')
+        self.ax.add_collection3d(surf_upper)
 
         # 2. 绘制下公差管径模型（鲜明的蓝色，增强对比度）
-        lower_diameter = standard_diameter - lower_tolerance
-        R_lower = np.full_like(Z, lower_diameter / 2)
-        X_lower = R_lower * np.cos(THETA)
-        Y_lower = R_lower * np.sin(THETA)
-
-        surf_lower = self.ax.plot_surface(X_lower, Y_lower, Z,
-                                        alpha=0.4, color='royalblue',  # 使用更鲜明的蓝色
-                                        linewidth=0.5, edgecolor='darkblue',  # 添加边缘线
-                                        label=f'下公差 (-{lower_tolerance:.2f}mm)')
-
-        # 3. 绘制实测管径模型（根据公差状态着色，增强视觉效果）
-        # 插值实测直径数据
-        Z_measured, THETA_measured = np.meshgrid(depths, theta)
-        R_measured = np.zeros_like(Z_measured)
-
-        for i, depth in enumerate(depths):
-            R_measured[:, i] = diameters[i] / 2
-
-        X_measured = R_measured * np.cos(THETA_measured)
-        Y_measured = R_measured * np.sin(THETA_measured)
-
-        # 根据公差状态着色，使用明确的颜色区分
-        colors = np.zeros_like(R_measured, dtype=int)
-        for i, diameter in enumerate(diameters):
-            error = diameter - standard_diameter
-            if error > upper_tolerance:  # 超上公差
-                colors[:, i] = 2  # 红色索引
-            elif error < -lower_tolerance:  # 超下公差
-                colors[:, i] = 0  # 蓝色索引
-            else:
-                colors[:, i] = 1  # 绿色索引
-
-        # 绘制实测表面，使用自定义颜色映射确保绿色明显
-        # 创建自定义颜色映射：蓝色-绿色-红色
-        from matplotlib.colors import ListedColormap
-        import matplotlib.colors as mcolors
-
-        # 使用更鲜明的颜色
-        custom_colors = ['blue', 'lime', 'red']  # 使用更亮的绿色
-        custom_cmap = ListedColormap(custom_colors)
-
-        # 将颜色索引转换为RGBA颜色
-        face_colors = custom_cmap(colors.flatten()).reshape(colors.shape + (4,))
-
-        surf_measured = self.ax.plot_surface(X_measured, Y_measured, Z_measured,
-                                           facecolors=face_colors,
-                                           alpha=0.9, linewidth=0.3,
-                                           edgecolor='black', antialiased=True)
+        surf_lower = Poly3DCollection(geometry.lower_quads, shade=True,
+                                      alpha=0.4, facecolors='royalblue',  # 使用更鲜明的蓝色
+                                      linewidths=0.5, edgecolors='darkblue',  # 添加边缘线
+                                      label=f'下公差 (-{lower_tolerance:.2f}mm)')
+        self.ax.add_collection3d(surf_lower)
+
+        # 3. 绘制实测管径模型（根据公差状态着色：蓝色-绿色-红色）
+        surf_measured = Poly3DCollection(geometry.measured_quads, shade=True,
+                                         facecolors=geometry.measured_colors,
+                                         alpha=0.9, linewidths=0.3,
+                                         edgecolors='black', antialiased=True)
+        self.ax.add_collection3d(surf_measured)
 
         # 设置坐标轴，增大字体以提高可读性
         self.ax.set_xlabel('X (mm)', fontsize=14, fontweight='bold')
@@ -265,14 +390,9 @@ class Hole3DRenderer(FigureCanvas):
         # 修改标题字体大小并增加顶部边距以确保完整显示
         self.ax.set_title('管孔三维模型对比', fontsize=15, fontweight='bold', pad=40)
 
-        # 优化坐标轴范围，减少边距以放大模型显示
-        max_radius = max(upper_diameter, np.max(diameters)) / 2 * 1.05  # 减少边距从1.2到1.05
-        self.ax.set_xlim(-max_radius, max_radius)
-        self.ax.set_ylim(-max_radius, max_radius)
-        self.ax.set_zlim(np.min(depths), np.max(depths))
-
-        # 优化视角，使模型更加突出
-        self.ax.view_init(elev=25, azim=35)  # 调整仰角和方位角
+        # 优化坐标轴范围，减少边距以放大模型显示，并使用默认视角
+        self.apply_view_limits()
+        self.ax.view_init(*DEFAULT_VIEW)
 
         # 清除之前的图例信息
         if hasattr(self, '_legend_text_box'):
@@ -315,7 +435,10 @@ class Hole3DRenderer(FigureCanvas):
 
         # 调整布局以确保图例不被裁剪，为右侧图例留出空间，最大化绘图区域
         # 为标题留出更多顶部空间，确保标题完全显示
-        self.figure.tight_layout(rect=[0, 0, 0.82, 0.95])
+        # 图例和标题每次相同，布局只在首次渲染时计算（tight_layout 需要完整测量三维坐标轴，较慢）
+        if not self._model_layout_applied:
+            self.figure.tight_layout(rect=[0, 0, 0.82, 0.95])
+            self._model_layout_applied = True
 
     def clear_models(self):
         """清除所有模型"""
@@ -327,37 +450,34 @@ class Hole3DRenderer(FigureCanvas):
             except Exception as e:
                 print(f"清除图例引用时出错（忽略）: {e}")
 
-        # 清除当前测量数据引用
+        # 清除当前测量数据引用（几何缓存保留，再次显示同一孔位时直接使用）
         if hasattr(self, '_current_measurements'):
             delattr(self, '_current_measurements')
 
         self.init_empty_model()
 
-    def reset_view(self):
-        """重置视图到初始状态"""
-        # 恢复优化后的默认视角
-        self.ax.view_init(elev=25, azim=35)
-
-        # 如果有模型数据，重新计算合适的坐标轴范围
-        if hasattr(self, '_current_measurements') and self._current_measurements:
-            measurements = self._current_measurements
-            # 重新计算坐标轴范围
-            diameters = [m.get('diameter', 17.6) for m in measurements]
-            depths = [m.get('position', m.get('depth', i)) for i, m in enumerate(measurements)]
-
-            # 设置坐标轴范围，减少边距以放大模型
-            max_radius = max(17.65, max(diameters)) / 2 * 1.05  # 减少边距
+    def apply_view_limits(self):
+        """按当前模型设置坐标轴范围；没有模型时使用默认范围"""
+        if self._geometry is not None:
+            max_radius = self._geometry.max_radius
             self.ax.set_xlim(-max_radius, max_radius)
             self.ax.set_ylim(-max_radius, max_radius)
-            self.ax.set_zlim(min(depths), max(depths))
+            self.ax.set_zlim(*self._geometry.depth_range)
         else:
-            # 如果没有数据，使用默认范围
             self.ax.set_xlim(-10, 10)
             self.ax.set_ylim(-10, 10)
             self.ax.set_zlim(0, 100)
 
-        # 重新绘制
-        self.draw()
+    def set_view_angle(self, elev, azim):
+        """只改变相机视角，不重新生成模型"""
+        self.ax.view_init(elev=elev, azim=azim)
+        self.draw_idle()
+
+    def reset_view(self):
+        """重置视图到初始状态：恢复默认视角和坐标轴范围，不重新生成模型"""
+        self.ax.view_init(*DEFAULT_VIEW)
+        self.apply_view_limits()
+        self.draw_idle()
 
 
 
@@ -416,9 +536,7 @@ class Hole3DViewer(QWidget):
         }
 
         if view_name in angles:
-            elev, azim = angles[view_name]
-            self.renderer.ax.view_init(elev=elev, azim=azim)
-            self.renderer.draw()
+            self.renderer.set_view_angle(*angles[view_name])
     
     def fit_view(self):
         """适应视图 - 恢复模型初始导入时的视图和缩放大小"""
@@ -431,3 +549,7 @@ class Hole3DViewer(QWidget):
     def update_models(self, measurements):
         """更新三维模型"""
         self.renderer.generate_3d_hole_models(measurements)
+
+    def show_geometry(self, geometry):
+        """显示已生成的三维模型网格"""
+        self.renderer.show_geometry(geometry)
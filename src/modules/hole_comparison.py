@@ -0,0 +1,300 @@
+"""
+多孔对比模块
+并发读取多个孔位的测量数据，重采样到统一的深度网格，按深度计算中位数、分位数带和离群点。
+每个孔位只保留一行网格数据，统计全部向量化，几百个孔位的对比图的图元数量也保持不变。
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from .measurement_csv import read_measurement_csv
+from .history_query import find_hole_csv_file
+
+
+# 统一深度网格步长（mm），与测量序号间距一致
+COMPARISON_GRID_STEP_MM = 1.0
+
+# 分位数带（百分位）
+COMPARISON_PERCENTILES = (5, 25, 50, 75, 95)
+
+# 离群点：超出 P25/P75 各 1.5 倍四分位距（且至少 0.01mm）的点
+OUTLIER_IQR_FACTOR = 1.5
+OUTLIER_MIN_MARGIN_MM = 0.01
+
+# 离群点比例超过该值的孔位列为离群孔位
+OUTLIER_HOLE_FRACTION = 0.05
+
+# 并发读取孔位数据的线程数
+DEFAULT_LOAD_THREADS = 4
+
+
+@dataclass
+class HoleProfile:
+    """重采样到网格上的单孔直径曲线：values[i] 对应深度 (start_index + i) * 网格步长"""
+    hole_id: str
+    start_index: int
+    values: np.ndarray
+
+
+@dataclass
+class ComparisonResult:
+    """多孔对比统计结果"""
+    hole_ids: List[str]
+    grid: np.ndarray                       # 深度网格 (M,)
+    matrix: np.ndarray                     # 孔位×深度 直径矩阵 (N, M)，无数据处为NaN
+    percentiles: Dict[int, np.ndarray]     # {百分位: (M,)}
+    hole_counts: np.ndarray                # 每个深度上有数据的孔位数 (M,)
+    outlier_mask: np.ndarray               # 离群点掩码 (N, M)
+    outlier_holes: List[Tuple[str, float]] = field(default_factory=list)  # (孔位, 离群点比例)，比例降序
+    missing_holes: List[str] = field(default_factory=list)                # 没有数据的孔位
+
+    @property
+    def median(self) -> np.ndarray:
+        return self.percentiles[50]
+
+    def outlier_points(self) -> Tuple[np.ndarray, np.ndarray]:
+        """全部离群点的 (深度, 直径)"""
+        rows, columns = np.nonzero(self.outlier_mask)
+        return self.grid[columns], self.matrix[rows, columns]
+
+
+def resample_profile(depths, diameters, step: float = COMPARISON_GRID_STEP_MM) -> Tuple[int, np.ndarray]:
+    """
+    把一条直径曲线线性插值到以 step 为间距、以0为基准对齐的深度网格上
+
+    Returns:
+        tuple: (首个网格点序号, 网格上的直径)；有效点不足时为 (0, 空数组)
+    """
+    depths = np.asarray(depths, dtype=np.float64)
+    diameters = np.asarray(diameters, dtype=np.float64)
+    valid = np.isfinite(depths) & np.isfinite(diameters)
+    depths, diameters = depths[valid], diameters[valid]
+    if len(depths) == 0:
+        return 0, np.empty(0)
+    if np.any(np.diff(depths) < 0):
+        order = np.argsort(depths, kind='stable')
+        depths, diameters = depths[order], diameters[order]
+
+    start = int(np.ceil(depths[0] / step - 1e-9))
+    stop = int(np.floor(depths[-1] / step + 1e-9))
+    if stop < start:
+        return 0, np.empty(0)
+    grid = np.arange(start, stop + 1) * step
+    return start, np.interp(grid, depths, diameters)
+
+
+def load_hole_profile(hole_id: str, step: float = COMPARISON_GRID_STEP_MM) -> Optional[HoleProfile]:
+    """读取孔位测量文件并重采样；找不到文件或没有有效数据时返回None"""
+    file_path = find_hole_csv_file(hole_id)
+    if file_path is None:
+        return None
+    table = read_measurement_csv(file_path)
+    start, values = resample_profile(table.depth, table.diameter, step)
+    if len(values) == 0:
+        return None
+    return HoleProfile(hole_id, start, values)
+
+
+def nan_percentiles(matrix: np.ndarray, percentiles: Sequence[float]) -> Dict[float, np.ndarray]:
+    """
+    按列计算忽略NaN的百分位数（线性插值，与 np.nanpercentile 一致）
+
+    一次排序后按每列的有效点数取值，避免 np.nanpercentile 逐列处理。
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    ordered = np.sort(matrix, axis=0)  # NaN 排在每列末尾
+    counts = np.isfinite(matrix).sum(axis=0)
+    columns = np.arange(matrix.shape[1])
+    result = {}
+    for q in percentiles:
+        position = q / 100.0 * np.maximum(counts - 1, 0)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+        fraction = position - lower
+        if matrix.shape[0] == 0:
+            values = np.full(matrix.shape[1], np.nan)
+        else:
+            low_values = ordered[lower, columns]
+            high_values = ordered[upper, columns]
+            values = low_values + (high_values - low_values) * fraction
+        result[q] = np.where(counts > 0, values, np.nan)
+    return result
+
+
+def compare_profiles(profiles: List[HoleProfile], step: float = COMPARISON_GRID_STEP_MM,
+                     missing_holes: Optional[List[str]] = None) -> ComparisonResult:
+    """把各孔位曲线放入统一网格并计算分位数带和离群点"""
+    missing_holes = list(missing_holes or [])
+    if not profiles:
+        empty = np.empty((0, 0))
+        return ComparisonResult([], np.empty(0), empty,
+                                {q: np.empty(0) for q in COMPARISON_PERCENTILES},
+                                np.empty(0, dtype=np.int64), empty.astype(bool), [], missing_holes)
+
+    first = min(profile.start_index for profile in profiles)
+    last = max(profile.start_index + len(profile.values) for profile in profiles)
+    matrix = np.full((len(profiles), last - first), np.nan)
+    for row, profile in enumerate(profiles):
+        offset = profile.start_index - first
+        matrix[row, offset:offset + len(profile.values)] = profile.values
+    grid = np.arange(first, last) * step
+
+    percentiles = nan_percentiles(matrix, COMPARISON_PERCENTILES)
+    spread = np.maximum(OUTLIER_IQR_FACTOR * (percentiles[75] - percentiles[25]), OUTLIER_MIN_MARGIN_MM)
+    with np.errstate(invalid='ignore'):
+        outlier_mask = (matrix < percentiles[25] - spread) | (matrix > percentiles[75] + spread)
+
+    valid = np.isfinite(matrix)
+    fractions = outlier_mask.sum(axis=1) / np.maximum(valid.sum(axis=1), 1)
+    hole_ids = [profile.hole_id for profile in profiles]
+    outlier_holes = [(hole_ids[row], float(fractions[row]))
+                     for row in np.argsort(-fractions, kind='stable')
+                     if fractions[row] > OUTLIER_HOLE_FRACTION]
+
+    return ComparisonResult(hole_ids, grid, matrix, percentiles, valid.sum(axis=0),
+                            outlier_mask, outlier_holes, missing_holes)
+
+
+class _ComparisonNotifier(QObject):
+    """对比任务在工作线程发出、在界面线程接收的信号"""
+    profile_loaded = Signal(int, str, object)  # (请求号, 孔位, HoleProfile 或 None)
+    compared = Signal(int, object)             # (请求号, ComparisonResult)
+    failed = Signal(int, str)                  # (请求号, 错误信息)
+
+
+class _ProfileTask(QRunnable):
+    """读取并重采样单个孔位"""
+
+    def __init__(self, request_id: int, hole_id: str, step: float,
+                 cancelled: threading.Event, notifier: _ComparisonNotifier):
+        super().__init__()
+        self.request_id = request_id
+        self.hole_id = hole_id
+        self.step = step
+        self.cancelled = cancelled
+        self.notifier = notifier
+
+    def run(self):
+        profile = None
+        try:
+            if not self.cancelled.is_set():
+                profile = load_hole_profile(self.hole_id, self.step)
+        except Exception as e:
+            # 格式异常的文件可能引发任意异常；该孔位按缺失处理，对比照常完成
+            print(f"❌ 读取孔位 {self.hole_id} 数据失败: {e}")
+        finally:
+            # 总是报告该孔位，否则对比会一直停在“加载中”
+            self.notifier.profile_loaded.emit(self.request_id, self.hole_id, profile)
+
+
+class _CompareTask(QRunnable):
+    """全部孔位读取完成后计算对比统计"""
+
+    def __init__(self, request_id: int, profiles: List[HoleProfile], missing: List[str], step: float,
+                 cancelled: threading.Event, notifier: _ComparisonNotifier):
+        super().__init__()
+        self.request_id = request_id
+        self.profiles = profiles
+        self.missing = missing
+        self.step = step
+        self.cancelled = cancelled
+        self.notifier = notifier
+
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        try:
+            result = compare_profiles(self.profiles, self.step, self.missing)
+        except Exception as e:
+            self.notifier.failed.emit(self.request_id, str(e))
+            return
+        self.notifier.compared.emit(self.request_id, result)
+
+
+class HoleComparisonService(QObject):
+    """
+    多孔对比服务
+
+    submit() 把每个孔位的读取和重采样作为独立任务交给线程池并发执行，
+    全部完成后在线程池中计算统计；新的对比会取消尚未完成的旧对比。
+    """
+
+    progress = Signal(int, int, int)          # (请求号, 已读取孔位数, 孔位总数)
+    comparison_ready = Signal(int, object)    # (请求号, ComparisonResult)
+    comparison_failed = Signal(int, str)      # (请求号, 错误信息)
+
+    def __init__(self, parent=None, max_threads: int = DEFAULT_LOAD_THREADS,
+                 step: float = COMPARISON_GRID_STEP_MM):
+        super().__init__(parent)
+        self.step = step
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+        self.current_request = 0
+        self._cancelled: Optional[threading.Event] = None
+        self._hole_ids: List[str] = []
+        self._profiles: Dict[str, Optional[HoleProfile]] = {}
+        self._notifier = _ComparisonNotifier(self)
+        self._notifier.profile_loaded.connect(self._on_profile_loaded)
+        self._notifier.compared.connect(self._on_compared)
+        self._notifier.failed.connect(self._on_failed)
+
+    def submit(self, hole_ids: Sequence[str]) -> int:
+        """开始对比给定孔位（重复的孔位只计一次），返回请求号"""
+        self.cancel()
+        self.current_request += 1
+        self._cancelled = threading.Event()
+        self._hole_ids = list(dict.fromkeys(hole_ids))
+        self._profiles = {}
+        for hole_id in self._hole_ids:
+            self.thread_pool.start(_ProfileTask(self.current_request, hole_id, self.step,
+                                                self._cancelled, self._notifier))
+        if not self._hole_ids:
+            self._start_compare()
+        return self.current_request
+
+    def cancel(self):
+        """取消当前对比：丢弃排队中的任务，执行中的任务结果被忽略"""
+        if self._cancelled is not None:
+            self._cancelled.set()
+            self._cancelled = None
+            self.thread_pool.clear()
+
+    def is_current(self, request_id: int) -> bool:
+        return self._cancelled is not None and request_id == self.current_request
+
+    def _start_compare(self):
+        profiles = [self._profiles[hole_id] for hole_id in self._hole_ids if self._profiles[hole_id] is not None]
+        missing = [hole_id for hole_id in self._hole_ids if self._profiles[hole_id] is None]
+        self.thread_pool.start(_CompareTask(self.current_request, profiles, missing, self.step,
+                                            self._cancelled, self._notifier))
+
+    @Slot(int, str, object)
+    def _on_profile_loaded(self, request_id: int, hole_id: str, profile):
+        if not self.is_current(request_id):
+            return
+        self._profiles[hole_id] = profile
+        self.progress.emit(request_id, len(self._profiles), len(self._hole_ids))
+        if len(self._profiles) == len(self._hole_ids):
+            self._start_compare()
+
+    @Slot(int, object)
+    def _on_compared(self, request_id: int, result: ComparisonResult):
+        if not self.is_current(request_id):
+            return
+        self._cancelled = None
+        self.comparison_ready.emit(request_id, result)
+
+    @Slot(int, str)
+    def _on_failed(self, request_id: int, message: str):
+        if not self.is_current(request_id):
+            return
+        self._cancelled = None
+        self.comparison_failed.emit(request_id, message)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """等待线程池中的任务完成（测试和退出时使用）"""
+        return self.thread_pool.waitForDone(msecs)
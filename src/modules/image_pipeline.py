@@ -0,0 +1,214 @@
+"""
+内窥镜图像解码流水线
+在线程池中把图像文件解码并缩放为视图尺寸的QImage，解码结果存入按字节数
+限制的LRU缓存；界面线程只把已就绪的图像转换为QPixmap显示。
+实时相机的NumPy帧由 numpy_to_qimage 零拷贝包装为QImage。
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, Signal, Slot
+from PySide6.QtGui import QImage, QImageReader
+
+
+# 解码缓存默认上限（字节）
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+# 解码线程数
+DEFAULT_DECODE_THREADS = 2
+
+CacheKey = Tuple[str, int, int]
+
+
+class DecodedImageCache:
+    """
+    按字节数限制的LRU图像缓存
+
+    键为 (路径, 目标宽, 目标高)，值为解码后的QImage；插入后总字节数超过
+    上限时淘汰最久未使用的图像。只在界面线程访问，无需加锁。
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = int(max_bytes)
+        self.current_bytes = 0
+        self._images: "OrderedDict[CacheKey, QImage]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._images
+
+    def get(self, key: CacheKey) -> Optional[QImage]:
+        """取出图像并标记为最近使用，不存在时返回None"""
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(key)
+        self.hits += 1
+        return image
+
+    def put(self, key: CacheKey, image: QImage) -> None:
+        """加入图像，必要时淘汰最久未使用的图像（单张超过上限的图像不缓存）"""
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        old = self._images.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old.sizeInBytes()
+        self._images[key] = image
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self.current_bytes -= evicted.sizeInBytes()
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._images.clear()
+        self.current_bytes = 0
+
+
+def decode_image(path: str, width: int, height: int) -> QImage:
+    """
+    解码图像并按比例缩放到不超过 width×height
+
+    支持的格式（如JPEG）由QImageReader在解码时直接缩小，其余格式解码后平滑缩放。
+    尺寸无效时返回原始尺寸的图像；读取失败时返回空QImage。
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if width > 0 and height > 0 and source_size.isValid():
+        target = source_size.scaled(QSize(width, height), Qt.KeepAspectRatio)
+        if target.width() < source_size.width():
+            reader.setScaledSize(target)
+    image = reader.read()
+    if image.isNull() or width <= 0 or height <= 0:
+        return image
+    if image.width() > width or image.height() > height:
+        image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # 预先转换为显示用格式，界面线程转换QPixmap时无需再转换像素格式
+    return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+
+def numpy_to_qimage(frame: np.ndarray, bgr: bool = False) -> QImage:
+    """
+    把NumPy图像帧包装为QImage（C连续的uint8/uint16数组不拷贝像素）
+
+    返回的QImage直接引用 frame 的内存，调用方须在QImage使用期间保持 frame 存活且不修改。
+    非C连续的数组会先复制为连续数组（此时应保持复制后的数组存活，见返回值的 ndarray 属性）。
+
+    Args:
+        frame: H×W 灰度（uint8/uint16）、H×W×3 彩色或 H×W×4 带透明通道（uint8）
+        bgr: 三/四通道数据是否为BGR顺序（如OpenCV采集的帧）
+
+    Returns:
+        QImage: 包装后的图像，ndarray 属性为实际引用的数组
+    """
+    if frame.ndim == 2 and frame.dtype == np.uint8:
+        image_format = QImage.Format_Grayscale8
+    elif frame.ndim == 2 and frame.dtype == np.uint16:
+        image_format = QImage.Format_Grayscale16
+    elif frame.ndim == 3 and frame.dtype == np.uint8 and frame.shape[2] == 3:
+        image_format = QImage.Format_BGR888 if bgr else QImage.Format_RGB888
+    elif frame.ndim == 3 and frame.dtype == np.uint8 and frame.shape[2] == 4:
+        # Qt没有BGRA字节序格式；小端机器上ARGB32的内存字节序即为BGRA
+        image_format = QImage.Format_ARGB32 if bgr else QImage.Format_RGBA8888
+    else:
+        raise ValueError(f"不支持的图像帧: shape={frame.shape}, dtype={frame.dtype}")
+
+    if not frame.flags.c_contiguous:
+        frame = np.ascontiguousarray(frame)
+    height, width = frame.shape[:2]
+    image = QImage(frame.data, width, height, frame.strides[0], image_format)
+    image.ndarray = frame
+    return image
+
+
+class _DecodeNotifier(QObject):
+    """解码任务在工作线程发出、在界面线程接收的信号"""
+    decoded = Signal(object, object)  # (缓存键, QImage)
+
+
+class _DecodeTask(QRunnable):
+    """线程池中的单个解码任务"""
+
+    def __init__(self, key: CacheKey, notifier: _DecodeNotifier):
+        super().__init__()
+        self.key = key
+        self.notifier = notifier
+
+    def run(self):
+        path, width, height = self.key
+        self.notifier.decoded.emit(self.key, decode_image(path, width, height))
+
+
+class ImagePipeline(QObject):
+    """
+    图像预取与缓存
+
+    request() 命中缓存时立即返回图像，否则提交后台解码并在完成时发出
+    image_ready；prefetch() 提前解码即将显示的图像。同一图像不会重复提交。
+    """
+
+    image_ready = Signal(str, object)  # (路径, QImage)
+
+    def __init__(self, parent=None, max_cache_bytes: int = DEFAULT_CACHE_BYTES,
+                 max_threads: int = DEFAULT_DECODE_THREADS):
+        super().__init__(parent)
+        self.cache = DecodedImageCache(max_cache_bytes)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+        self._pending = set()
+        self._notifier = _DecodeNotifier(self)
+        self._notifier.decoded.connect(self._on_decoded)
+        self.decoded_count = 0
+
+    @staticmethod
+    def _key(path: str, size: QSize) -> CacheKey:
+        return (path, max(size.width(), 0), max(size.height(), 0))
+
+    def request(self, path: str, size: QSize) -> Optional[QImage]:
+        """
+        获取指定尺寸的解码图像
+
+        Returns:
+            Optional[QImage]: 已缓存时返回图像；否则返回None并在解码完成后发出 image_ready
+        """
+        key = self._key(path, size)
+        image = self.cache.get(key)
+        if image is None:
+            self._submit(key)
+        return image
+
+    def prefetch(self, paths: Iterable[str], size: QSize) -> None:
+        """后台解码尚未缓存的图像"""
+        for path in paths:
+            key = self._key(path, size)
+            if key not in self.cache:
+                self._submit(key)
+
+    def _submit(self, key: CacheKey) -> None:
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self.thread_pool.start(_DecodeTask(key, self._notifier))
+
+    @Slot(object, object)
+    def _on_decoded(self, key: CacheKey, image: QImage) -> None:
+        self._pending.discard(key)
+        if image.isNull():
+            print(f"❌ 图像解码失败: {key[0]}")
+            return
+        self.cache.put(key, image)
+        self.decoded_count += 1
+        self.image_ready.emit(key[0], image)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """等待所有解码任务完成（测试和退出时使用）"""
+        return self.thread_pool.waitForDone(msecs)
@@ -0,0 +1,449 @@
+"""
+测量数据CSV读取模块
+实时图表、历史数据查看器、报告生成器和孔位数据管理器共用的CCIDM测量文件读取器：
+只读取一次文件并检测编码，按列头映射列，数值列整体解析为NumPy数组，返回按列存储的结果。
+解析结果缓存为二进制旁路文件（Data/cache 下的 .npy + .json），再次打开时内存映射读取，
+CSV文件大小或修改时间变化时自动重建。
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# 依次尝试的编码（GB2312是GBK的子集，latin-1总能解码，作为最后手段）
+CSV_ENCODINGS = ('utf-8-sig', 'gbk', 'latin-1')
+
+# 标准列名及其列头关键字（列头包含任一关键字即匹配，按顺序优先）
+COLUMN_ALIASES = {
+    'measurement': ('测量序号', 'measurement', '序号'),
+    'channel1': ('通道1', 'channel1'),
+    'channel2': ('通道2', 'channel2'),
+    'channel3': ('通道3', 'channel3'),
+    'diameter': ('计算直径', '直径', 'diameter'),
+    'depth': ('深度', 'depth', 'position'),
+}
+
+# 列头无法识别时CCIDM文件的默认列位置：测量序号、三个通道值、计算直径
+DEFAULT_COLUMN_POSITIONS = {
+    'measurement': 0,
+    'channel1': 1,
+    'channel2': 2,
+    'channel3': 3,
+    'diameter': 4,
+}
+
+# 每个测量序号对应的深度（mm）
+MEASUREMENT_SPACING_MM = 1.0
+
+# 探头测量记录必需的标准列
+PROBE_COLUMNS = ('measurement', 'channel1', 'channel2', 'channel3', 'diameter')
+
+# 解析缓存：CSV位于Data目录下时存放在 Data/cache，否则存放在CSV同目录的隐藏子目录
+DATA_DIRNAME = 'Data'
+CACHE_DIRNAME = 'cache'
+SIDECAR_CACHE_DIRNAME = '.measurement_cache'
+CACHE_FORMAT_VERSION = 1
+
+
+class MeasurementTable:
+    """
+    按列存储的测量数据
+
+    columns 以原始列头为键：数值列为float64数组（无法解析的单元格为NaN），
+    其余列为字符串对象数组。标准列（测量序号、通道、直径、深度）通过
+    column() 或同名属性按标准名访问。
+    """
+
+    def __init__(self, path: str, encoding: str, headers: List[str],
+                 columns: Dict[str, np.ndarray], column_map: Dict[str, str], mtime: float = 0.0):
+        self.path = path
+        self.encoding = encoding
+        self.headers = headers
+        self.columns = columns
+        self.column_map = column_map  # {标准名: 原始列头}
+        self.mtime = mtime
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def has_column(self, name: str) -> bool:
+        """是否包含标准列（深度列总是可用，缺失时由测量序号换算）"""
+        if name == 'depth':
+            return 'depth' in self.column_map or 'measurement' in self.column_map
+        return name in self.column_map
+
+    def column(self, name: str) -> np.ndarray:
+        """按标准名取数值列；缺失的列返回全NaN数组"""
+        header = self.column_map.get(name)
+        if header is not None:
+            return self.columns[header]
+        if name == 'depth' and 'measurement' in self.column_map:
+            return self.column('measurement') * MEASUREMENT_SPACING_MM
+        return np.full(len(self), np.nan)
+
+    @property
+    def measurement(self) -> np.ndarray:
+        return self.column('measurement')
+
+    @property
+    def depth(self) -> np.ndarray:
+        return self.column('depth')
+
+    @property
+    def diameter(self) -> np.ndarray:
+        return self.column('diameter')
+
+    @property
+    def channels(self) -> np.ndarray:
+        """N×3 通道数据"""
+        return np.column_stack([self.column(name) for name in ('channel1', 'channel2', 'channel3')])
+
+    def valid_rows(self, *names: str) -> np.ndarray:
+        """给定标准列均为有限数值的行掩码"""
+        mask = np.ones(len(self), dtype=bool)
+        for name in names:
+            mask &= np.isfinite(self.column(name))
+        return mask
+
+    def take(self, rows) -> "MeasurementTable":
+        """按行掩码或下标取子表"""
+        columns = {header: values[rows] for header, values in self.columns.items()}
+        return MeasurementTable(self.path, self.encoding, self.headers, columns, self.column_map, self.mtime)
+
+    def records(self) -> List[Dict[str, object]]:
+        """按行返回 {原始列头: 值} 字典列表（数值列为float，NaN为None）"""
+        values = []
+        for header in self.headers:
+            column = self.columns[header]
+            if column.dtype.kind == 'f':
+                values.append([None if value != value else value for value in column.tolist()])
+            else:
+                values.append(column.tolist())
+        return [dict(zip(self.headers, row)) for row in zip(*values)]
+
+
+def detect_encoding(data: bytes) -> str:
+    """检测文件内容的编码"""
+    for encoding in CSV_ENCODINGS:
+        try:
+            data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return CSV_ENCODINGS[-1]
+
+
+def map_columns(headers: List[str]) -> Dict[str, str]:
+    """
+    按列头关键字映射标准列
+
+    Returns:
+        Dict[str, str]: {标准名: 原始列头}；没有任何列头能识别时按CCIDM默认列位置映射
+    """
+    column_map = {}
+    used = set()
+    for name, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            match = next((header for header in headers
+                          if header not in used and alias.lower() in header.lower()), None)
+            if match is not None:
+                column_map[name] = match
+                used.add(match)
+                break
+
+    if not column_map:
+        column_map = {name: headers[index] for name, index in DEFAULT_COLUMN_POSITIONS.items()
+                      if index < len(headers)}
+    return column_map
+
+
+def _parse_column(cells, numeric: bool) -> np.ndarray:
+    """把一列单元格解析为数组；numeric为True时无法解析的单元格记为NaN"""
+    try:
+        return np.array(cells, dtype=np.float64)
+    except ValueError:
+        pass
+    values = np.empty(len(cells), dtype=np.float64)
+    parsed = 0
+    for i, cell in enumerate(cells):
+        try:
+            values[i] = float(cell)
+            parsed += 1
+        except ValueError:
+            values[i] = np.nan
+    # 非标准列中非空单元格无法全部解析时按文本列保存
+    if numeric or parsed == sum(1 for cell in cells if cell.strip()):
+        return values
+    return np.array(cells, dtype=object)
+
+
+def parse_measurement_text(text: str, path: str = "", encoding: str = "", mtime: float = 0.0) -> MeasurementTable:
+    """解析已解码的CSV文本"""
+    header_line, _, body = text.partition('\n')
+    headers = [header.strip() for header in next(csv.reader([header_line]), [])]
+    if not headers or not any(headers):
+        raise ValueError(f"CSV文件没有列头: {path}")
+    # 重复或空的列头加上列号区分
+    seen = set()
+    for i, header in enumerate(headers):
+        if not header or header in seen:
+            headers[i] = f"{header or 'column'}_{i}"
+        seen.add(headers[i])
+    column_map = map_columns(headers)
+    numeric_headers = set(column_map.values())
+
+    # 快速路径：全部为数值的文件由 np.loadtxt 整体解析
+    columns = None
+    if body.strip():
+        try:
+            data = np.loadtxt(io.StringIO(body), delimiter=',', dtype=np.float64,
+                              ndmin=2, comments=None)
+            if data.shape[1] == len(headers):
+                columns = {header: data[:, i].copy() for i, header in enumerate(headers)}
+        except ValueError:
+            columns = None
+    else:
+        columns = {header: np.empty(0, dtype=np.float64) for header in headers}
+
+    # 通用路径：csv模块切分后按列解析（含文本列、缺失或无效单元格）
+    if columns is None:
+        width = len(headers)
+        rows = [row for row in csv.reader(body.splitlines()) if any(cell.strip() for cell in row)]
+        rows = [row[:width] if len(row) >= width else row + [''] * (width - len(row)) for row in rows]
+        cells_by_column = list(zip(*rows)) if rows else [()] * width
+        columns = {header: _parse_column(cells, header in numeric_headers)
+                   for header, cells in zip(headers, cells_by_column)}
+
+    return MeasurementTable(path, encoding, headers, columns, column_map, mtime)
+
+
+def measurement_cache_dir(path) -> str:
+    """CSV文件对应的缓存目录：最近的上级Data目录下的cache，没有则为同目录下的隐藏子目录"""
+    directory = os.path.dirname(os.path.abspath(os.fspath(path)))
+    current = directory
+    while True:
+        if os.path.basename(current) == DATA_DIRNAME:
+            return os.path.join(current, CACHE_DIRNAME)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return os.path.join(directory, SIDECAR_CACHE_DIRNAME)
+        current = parent
+
+
+def measurement_cache_paths(path, cache_dir: Optional[str] = None) -> Tuple[str, str]:
+    """
+    CSV文件对应的缓存文件路径
+
+    缓存文件名由CSV绝对路径的哈希决定，文件大小和修改时间记录在元数据中，
+    CSV变化后同名缓存被覆盖重建，不会堆积过期条目。
+
+    Returns:
+        tuple: (数值列 .npy 路径, 元数据 .json 路径)
+    """
+    abspath = os.path.abspath(os.fspath(path))
+    stem = os.path.splitext(os.path.basename(abspath))[0]
+    digest = hashlib.sha1(abspath.encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+    base = os.path.join(cache_dir or measurement_cache_dir(abspath), f"{stem}-{digest}")
+    return base + '.npy', base + '.json'
+
+
+def _source_signature(path: str, stat: os.stat_result) -> Dict[str, object]:
+    return {
+        'version': CACHE_FORMAT_VERSION,
+        'source': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+
+def _load_cached_table(path: str, stat: os.stat_result, cache_dir: Optional[str]) -> Optional[MeasurementTable]:
+    """读取有效的缓存；不存在、已过期或损坏时返回None"""
+    array_path, meta_path = measurement_cache_paths(path, cache_dir)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if any(meta.get(key) != value for key, value in _source_signature(path, stat).items()):
+            return None
+        # K×N 数组，每个数值列在文件中连续存放，按需分页读入
+        values = np.load(array_path, mmap_mode='r', allow_pickle=False)
+        numeric_headers = meta['numeric_headers']
+        if values.shape != (len(numeric_headers), meta['rows']):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    columns = {header: values[i] for i, header in enumerate(numeric_headers)}
+    for header, cells in meta['text_columns'].items():
+        columns[header] = np.array(cells, dtype=object)
+    return MeasurementTable(path, meta['encoding'], meta['headers'], columns,
+                            meta['column_map'], stat.st_mtime)
+
+
+def _save_cached_table(table: MeasurementTable, stat: os.stat_result, cache_dir: Optional[str]):
+    """写入缓存（先写临时文件再替换）；目录不可写等失败时忽略，下次仍从CSV解析"""
+    array_path, meta_path = measurement_cache_paths(table.path, cache_dir)
+    numeric_headers = [header for header in table.headers if table.columns[header].dtype.kind == 'f']
+    meta = _source_signature(table.path, stat)
+    meta.update({
+        'encoding': table.encoding,
+        'headers': table.headers,
+        'column_map': table.column_map,
+        'rows': len(table),
+        'numeric_headers': numeric_headers,
+        'text_columns': {header: table.columns[header].tolist()
+                         for header in table.headers if header not in numeric_headers},
+    })
+    values = np.array([table.columns[header] for header in numeric_headers],
+                      dtype=np.float64).reshape(len(numeric_headers), len(table))
+
+    suffix = f".{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(array_path), exist_ok=True)
+        with open(array_path + suffix, 'wb') as f:
+            np.save(f, values, allow_pickle=False)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        # 元数据最后替换：读取方以元数据中的行列数校验数组
+        os.replace(array_path + suffix, array_path)
+        os.replace(meta_path + suffix, meta_path)
+    except OSError as e:
+        print(f"⚠️ 写入测量数据缓存失败: {e}")
+        for temp_path in (array_path + suffix, meta_path + suffix):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def read_measurement_csv(path, use_cache: bool = True, cache_dir: Optional[str] = None) -> MeasurementTable:
+    """
+    读取测量数据CSV文件
+
+    Args:
+        path: 文件路径
+        use_cache: 是否使用解析缓存（缓存命中时数值列为只读的内存映射数组）
+        cache_dir: 缓存目录，默认由 measurement_cache_dir() 决定
+
+    Returns:
+        MeasurementTable: 按列存储的测量数据
+
+    Raises:
+        OSError: 文件无法读取
+        ValueError: 文件没有列头
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    if use_cache:
+        table = _load_cached_table(path, stat, cache_dir)
+        if table is not None:
+            return table
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    encoding = detect_encoding(data)
+    text = data.decode(encoding, errors='replace').replace('\r\n', '\n')
+    table = parse_measurement_text(text, path, encoding, stat.st_mtime)
+    if use_cache:
+        _save_cached_table(table, stat, cache_dir)
+    return table
+
+
+# 探头测量记录的列（read_probe_columns 返回的键）
+PROBE_RECORD_FIELDS = ('position', 'diameter', 'channel1', 'channel2', 'channel3', 'is_qualified', 'timestamp')
+
+
+def read_probe_columns(path, tolerance_band: Tuple[float, float]) -> Dict[str, np.ndarray]:
+    """
+    读取探头测量文件为按列存储的记录
+
+    跳过必需列无法解析的行；时间戳以文件修改时间为起点，每个数据行递增1秒。
+    表格模型和三维模型直接使用这些数组，不逐行构造字典。
+
+    Args:
+        path: 文件路径
+        tolerance_band: 合格直径范围 (下限, 上限)，含边界
+
+    Returns:
+        Dict[str, np.ndarray]: PROBE_RECORD_FIELDS 各列；position/diameter/channel1~3 为float64，
+            is_qualified 为bool，timestamp 为POSIX时间（秒，float64）。缺少必要列时各列为空数组
+    """
+    table = read_measurement_csv(path)
+    print(f"成功使用编码 {table.encoding} 读取文件")
+    print(f"CSV文件列头: {table.headers}")
+
+    missing = [name for name in PROBE_COLUMNS if not table.has_column(name)]
+    if missing:
+        print(f"CSV文件缺少必要的列: {missing}")
+        return empty_probe_columns()
+
+    valid = table.valid_rows(*PROBE_COLUMNS)
+    if not valid.all():
+        print(f"跳过 {int((~valid).sum())} 行无法解析的数据")
+    row_offsets = np.flatnonzero(valid)
+    table = table.take(valid)
+
+    diameters = table.diameter
+    lower, upper = tolerance_band
+    return {
+        'position': table.measurement,  # 测量序号对应位置(mm)
+        'diameter': diameters,
+        'channel1': table.column('channel1'),
+        'channel2': table.column('channel2'),
+        'channel3': table.column('channel3'),
+        'is_qualified': (diameters >= lower) & (diameters <= upper),
+        'timestamp': table.mtime + row_offsets.astype(np.float64),
+    }
+
+
+def empty_probe_columns() -> Dict[str, np.ndarray]:
+    """没有数据时的按列记录"""
+    columns = {name: np.empty(0) for name in PROBE_RECORD_FIELDS}
+    columns['is_qualified'] = np.empty(0, dtype=bool)
+    return columns
+
+
+def probe_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, object]]:
+    """
+    把按列记录展开为逐行字典（导出、人工复查等仍按行处理的功能使用）
+
+    Returns:
+        List[Dict]: 每行一条 {'position', 'diameter', 'channel1'~'channel3', 'is_qualified', 'timestamp', 'operator'}
+    """
+    timestamps = [datetime.fromtimestamp(value) for value in columns['timestamp'].tolist()]
+    return [
+        {
+            'position': position,
+            'diameter': diameter,
+            'channel1': channel1,
+            'channel2': channel2,
+            'channel3': channel3,
+            'is_qualified': is_qualified,
+            'timestamp': timestamp,
+            'operator': ''  # 暂不显示
+        }
+        for position, diameter, channel1, channel2, channel3, is_qualified, timestamp in zip(
+            columns['position'].tolist(), columns['diameter'].tolist(), columns['channel1'].tolist(),
+            columns['channel2'].tolist(), columns['channel3'].tolist(), columns['is_qualified'].tolist(),
+            timestamps)
+    ]
+
+
+def read_probe_measurements(path, tolerance_band: Tuple[float, float]) -> List[Dict[str, object]]:
+    """
+    读取探头测量文件为历史数据查看器使用的记录列表
+
+    Args:
+        path: 文件路径
+        tolerance_band: 合格直径范围 (下限, 上限)，含边界
+
+    Returns:
+        List[Dict]: 每行一条记录，见 probe_records()
+    """
+    return probe_records(read_probe_columns(path, tolerance_band))
@@ -0,0 +1,260 @@
+"""
+操作日志模块
+环形缓冲的日志模型 + 按帧批量刷新的日志面板，历史日志写入磁盘
+"""
+
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, List, Optional, TextIO, Union
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QComboBox, QLabel
+
+
+# 日志级别（数值越大越重要）
+LOG_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
+# 界面中保留的默认最大行数
+DEFAULT_MAX_LINES = 2000
+
+# 按帧刷新的间隔（毫秒）
+FLUSH_INTERVAL_MS = 16
+
+# 默认历史日志目录：固定在项目根目录下，不随进程工作目录变化
+DEFAULT_LOG_DIR = Path(__file__).resolve().parents[2] / "logs"
+
+
+def infer_level(message: str) -> str:
+    """根据消息前缀推断日志级别"""
+    if message.startswith("❌"):
+        return "ERROR"
+    if message.startswith("⚠️"):
+        return "WARNING"
+    return "INFO"
+
+
+@dataclass
+class LogRecord:
+    """单条日志记录"""
+    timestamp: datetime
+    level: str
+    message: str
+
+    def format(self) -> str:
+        """格式化为显示文本"""
+        return f"[{self.timestamp.strftime('%H:%M:%S')}] {self.message}"
+
+
+class OperationLogModel:
+    """
+    操作日志模型
+
+    内存中只保留最近 max_lines 条记录（环形缓冲），追加为O(1)；
+    新记录先进入待刷新列表，由界面每帧取出一次。所有记录在刷新时
+    批量追加到磁盘历史文件；历史文件保持打开，日期变化、clear() 或
+    close() 时才关闭。
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES,
+                 log_dir: Optional[Union[str, Path]] = DEFAULT_LOG_DIR):
+        """
+        初始化日志模型
+
+        Args:
+            max_lines: 内存中保留的最大记录数
+            log_dir: 历史日志目录，None表示不写磁盘
+        """
+        self.max_lines = max(1, int(max_lines))
+        self.records: Deque[LogRecord] = deque(maxlen=self.max_lines)
+        self._pending: List[LogRecord] = []
+        self._spill: List[LogRecord] = []
+        self.log_dir = Path(log_dir) if log_dir else None
+        self.total_count = 0
+        self.logger = logging.getLogger(__name__)
+        self._history_file: Optional[TextIO] = None
+        self._history_file_path: Optional[Path] = None
+
+    def append(self, message: str, level: Optional[str] = None) -> LogRecord:
+        """
+        追加一条日志
+
+        Args:
+            message: 日志内容
+            level: 日志级别，None时根据消息前缀推断
+
+        Returns:
+            LogRecord: 新建的日志记录
+        """
+        level = (level or infer_level(message)).upper()
+        if level not in LOG_LEVELS:
+            level = "INFO"
+
+        record = LogRecord(datetime.now(), level, message)
+        self.records.append(record)
+        self._pending.append(record)
+        if self.log_dir is not None:
+            self._spill.append(record)
+        self.total_count += 1
+
+        # 界面长时间未刷新时，待刷新列表同样保持有界
+        if len(self._pending) > self.max_lines:
+            del self._pending[:-self.max_lines]
+        return record
+
+    def take_pending(self) -> List[LogRecord]:
+        """取出自上次刷新以来的新记录"""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def filtered(self, min_level: str) -> List[LogRecord]:
+        """获取内存中不低于指定级别的记录"""
+        threshold = LOG_LEVELS.get(min_level, 0)
+        return [r for r in self.records if LOG_LEVELS[r.level] >= threshold]
+
+    def history_path(self, day: Optional[datetime] = None) -> Optional[Path]:
+        """获取指定日期的历史日志文件路径"""
+        if self.log_dir is None:
+            return None
+        day = day or datetime.now()
+        return self.log_dir / f"operation_log_{day.strftime('%Y%m%d')}.log"
+
+    def spill_to_disk(self) -> int:
+        """
+        将尚未写入磁盘的记录追加到历史文件
+
+        Returns:
+            int: 写入的记录数量
+        """
+        if not self._spill or self.log_dir is None:
+            return 0
+
+        records, self._spill = self._spill, []
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            lines = [f"{r.timestamp.isoformat(timespec='milliseconds')} {r.level:<7} {r.message}\n"
+                     for r in records]
+            f = self._open_history(self.history_path(records[0].timestamp))
+            f.writelines(lines)
+            f.flush()
+            return len(records)
+        except OSError as e:
+            self.logger.error(f"写入历史日志失败: {e}")
+            self.close()
+            return 0
+
+    def _open_history(self, path: Path) -> TextIO:
+        """获取历史文件句柄，日期变化时换到新文件"""
+        if self._history_file is None or path != self._history_file_path:
+            self.close()
+            self._history_file = open(path, 'a', encoding='utf-8')
+            self._history_file_path = path
+        return self._history_file
+
+    def close(self) -> None:
+        """关闭历史文件（下次写入时重新打开）"""
+        if self._history_file is not None:
+            try:
+                self._history_file.close()
+            except OSError as e:
+                self.logger.error(f"关闭历史日志失败: {e}")
+            self._history_file = None
+            self._history_file_path = None
+
+    def clear(self) -> None:
+        """清空内存中的记录（磁盘历史保留），并关闭历史文件"""
+        self.records.clear()
+        self._pending.clear()
+        self.close()
+
+
+class OperationLogPanel(QWidget):
+    """操作日志面板：按帧批量刷新，支持级别过滤"""
+
+    def __init__(self, model: Optional[OperationLogModel] = None, parent=None):
+        super().__init__(parent)
+        self.model = model or OperationLogModel()
+        self.min_level = "INFO"
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # 级别过滤
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("级别:"))
+        self.level_combo = QComboBox()
+        self.level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
+        self.level_combo.setCurrentText(self.min_level)
+        self.level_combo.currentTextChanged.connect(self.set_min_level)
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        # 文本视图只保留最近 max_lines 行
+        self.text_view = QPlainTextEdit()
+        self.text_view.setReadOnly(True)
+        self.text_view.setMaximumBlockCount(self.model.max_lines)
+        self.text_view.setUndoRedoEnabled(False)
+        layout.addWidget(self.text_view)
+
+        # 每帧刷新一次
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
+
+    def append(self, message: str, level: Optional[str] = None) -> None:
+        """追加日志（只写入模型，不触发界面布局）"""
+        self.model.append(message, level)
+
+    def flush(self) -> None:
+        """将待刷新记录一次性追加到文本视图，并写入磁盘历史"""
+        pending = self.model.take_pending()
+        if pending:
+            threshold = LOG_LEVELS[self.min_level]
+            visible = [r.format() for r in pending if LOG_LEVELS[r.level] >= threshold]
+            if visible:
+                # 超出容量的部分不会显示，只追加最后 max_lines 行
+                self.text_view.appendPlainText("\n".join(visible[-self.model.max_lines:]))
+                scrollbar = self.text_view.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
+        self.model.spill_to_disk()
+
+    def set_min_level(self, level: str) -> None:
+        """设置显示的最低级别，并从内存缓冲重建视图"""
+        self.min_level = level if level in LOG_LEVELS else "INFO"
+        self.model.take_pending()
+        lines = [r.format() for r in self.model.filtered(self.min_level)]
+        self.text_view.setPlainText("\n".join(lines))
+        scrollbar = self.text_view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def set_max_lines(self, max_lines: int) -> None:
+        """修改行数上限"""
+        self.model.max_lines = max(1, int(max_lines))
+        self.model.records = deque(self.model.records, maxlen=self.model.max_lines)
+        self.text_view.setMaximumBlockCount(self.model.max_lines)
+
+    def toPlainText(self) -> str:
+        """返回当前显示的文本（立即刷新待显示记录）"""
+        self.flush()
+        return self.text_view.toPlainText()
+
+    def shutdown(self) -> None:
+        """停止按帧刷新，写出剩余记录并关闭历史文件（所属窗口关闭时调用）"""
+        self.flush_timer.stop()
+        self.flush()
+        self.model.close()
+
+    def closeEvent(self, event):
+        """作为独立窗口关闭时写出剩余历史"""
+        self.shutdown()
+        super().closeEvent(event)
@@ -0,0 +1,147 @@
+"""
+pyqtgraph 直径曲线面板
+作为 RealtimeChart 面板A的高速绘图后端：自动降采样、仅绘制可见区域，适用于kHz级探头数据流
+"""
+
+import pyqtgraph as pg
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+
+
+def _check_item_parenting():
+    """
+    检查pyqtgraph图元能否挂到ViewBox下
+
+    部分PySide6版本（如6.9.1）在 itemChange 返回父图元时丢失父子关系，
+    曲线不会被加入ViewBox，此时视为pyqtgraph不可用。
+    """
+    parent = pg.ItemGroup()
+    child = pg.GraphicsObject()
+    child.setParentItem(parent)
+    if child.parentItem() is not parent:
+        raise ImportError("当前PySide6版本与pyqtgraph不兼容（图元父子关系丢失）")
+
+
+_check_item_parenting()
+
+
+# 与matplotlib深色主题保持一致的配色
+BACKGROUND_COLOR = '#313642'
+AXIS_COLOR = '#D3D8E0'
+DATA_COLOR = '#4A90E2'
+TOLERANCE_COLOR = '#E67E22'
+ANOMALY_COLOR = '#E74C3C'
+
+# 滚轮缩放的范围限制，与matplotlib版本的 on_scroll 一致
+MIN_X_RANGE = 10
+MAX_X_RANGE = 2000
+MIN_Y_RANGE = 0.1
+MAX_Y_RANGE = 10
+
+
+class _DiameterPlotWidget(pg.PlotWidget):
+    """双击时发出重置视图请求的PlotWidget"""
+
+    reset_requested = Signal()
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_requested.emit()
+        event.accept()
+
+
+class PyqtgraphPlotPanel(QWidget):
+    """基于pyqtgraph的直径-深度曲线面板"""
+
+    reset_requested = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.plot_widget = _DiameterPlotWidget(background=BACKGROUND_COLOR)
+        self.plot_widget.reset_requested.connect(self.reset_requested)
+        layout.addWidget(self.plot_widget)
+
+        self.plot_item = self.plot_widget.getPlotItem()
+        self.plot_item.setLabel('bottom', '深度 (mm)', color=AXIS_COLOR)
+        self.plot_item.setLabel('left', '直径 (mm)', color=AXIS_COLOR)
+        self.plot_item.showGrid(x=True, y=True, alpha=0.3)
+        self.plot_item.setMenuEnabled(False)
+        for axis in ('bottom', 'left'):
+            self.plot_item.getAxis(axis).setTextPen(AXIS_COLOR)
+        self.legend = self.plot_item.addLegend(offset=(-10, 10))
+
+        # 范围由RealtimeChart管理，只保留鼠标滚轮缩放
+        self.view_box = self.plot_item.getViewBox()
+        self.view_box.disableAutoRange()
+        self.view_box.setLimits(minXRange=MIN_X_RANGE, maxXRange=MAX_X_RANGE,
+                                minYRange=MIN_Y_RANGE, maxYRange=MAX_Y_RANGE)
+
+        # 数据曲线：峰值降采样 + 只绘制可见范围
+        self.data_curve = self.plot_item.plot([], [], pen=pg.mkPen(DATA_COLOR, width=2), name='测量数据')
+        self.data_curve.setDownsampling(auto=True, method='peak')
+        self.data_curve.setClipToView(True)
+        self.data_curve.setSkipFiniteCheck(True)
+
+        # 异常标记
+        self.anomaly_markers = self.plot_item.plot([], [], pen=None, symbol='o', symbolSize=6,
+                                                   symbolPen=None, symbolBrush=ANOMALY_COLOR)
+        self.anomaly_markers.setClipToView(True)
+
+        self.max_error_line = None
+        self.min_error_line = None
+        self.draw_count = 0
+
+    # ------------------------------------------------------------------
+    # 数据
+    # ------------------------------------------------------------------
+    def set_data(self, depths, diameters) -> None:
+        """设置曲线数据（数组直接引用，不复制）"""
+        self.data_curve.setData(depths, diameters)
+        self.draw_count += 1
+
+    def set_anomalies(self, depths, diameters) -> None:
+        """设置异常标记位置"""
+        self.anomaly_markers.setData(depths, diameters)
+
+    def clear(self) -> None:
+        """清除曲线和异常标记"""
+        self.data_curve.setData([], [])
+        self.anomaly_markers.setData([], [])
+
+    # ------------------------------------------------------------------
+    # 公差线与坐标范围
+    # ------------------------------------------------------------------
+    def set_tolerance_lines(self, upper: float, lower: float) -> None:
+        """绘制上下公差线"""
+        self.clear_tolerance_lines()
+        pen = pg.mkPen(TOLERANCE_COLOR, width=1.5, style=Qt.DashLine)
+        self.max_error_line = pg.InfiniteLine(pos=upper, angle=0, pen=pen,
+                                              label=f'上限 {upper:.2f}mm',
+                                              labelOpts={'color': AXIS_COLOR, 'position': 0.95})
+        self.min_error_line = pg.InfiniteLine(pos=lower, angle=0, pen=pen,
+                                              label=f'下限 {lower:.2f}mm',
+                                              labelOpts={'color': AXIS_COLOR, 'position': 0.95})
+        self.plot_item.addItem(self.max_error_line, ignoreBounds=True)
+        self.plot_item.addItem(self.min_error_line, ignoreBounds=True)
+
+    def clear_tolerance_lines(self) -> None:
+        """移除公差线"""
+        for line in (self.max_error_line, self.min_error_line):
+            if line is not None:
+                self.plot_item.removeItem(line)
+        self.max_error_line = None
+        self.min_error_line = None
+
+    def get_x_range(self):
+        """当前X轴显示范围"""
+        return tuple(self.view_box.viewRange()[0])
+
+    def set_x_range(self, x_min: float, x_max: float) -> None:
+        """设置X轴显示范围"""
+        self.view_box.setXRange(x_min, x_max, padding=0)
+
+    def set_y_range(self, y_min: float, y_max: float) -> None:
+        """设置Y轴显示范围"""
+        self.view_box.setYRange(y_min, y_max, padding=0)
@@ -10,6 +10,14 @@ from matplotlib.figure import Figure
 import matplotlib
 import numpy as np
 
+from .sample_buffer import SampleRingBuffer
+from .chart_blitter import ChartBlitter
+from .decimation import decimate_trace, target_points_for_axes
+from .anomaly_monitor import AnomalyTracker, AnomalyListModel
+from .streaming_stats import StreamingStatistics
+from .csv_replay import CsvReplayEngine, REPLAY_FRAME_INTERVAL_MS
+from .measurement_csv import MeasurementTable, read_measurement_csv
+
 # 设置matplotlib支持中文显示 - 安全版本
 def setup_safe_chinese_font():
     """设置安全的中文字体支持"""
@@ -27,10 +35,10 @@ def setup_safe_chinese_font():
 # 初始化安全字体配置
 setup_safe_chinese_font()
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                               QPushButton, QSplitter, QGroupBox, QLineEdit, QMessageBox, QComboBox)
+                               QPushButton, QSplitter, QGroupBox, QLineEdit, QMessageBox, QComboBox,
+                               QDoubleSpinBox)
 from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QPixmap, QIcon
-from collections import deque
 from .endoscope_view import EndoscopeView
 
 # 尝试导入qtawesome用于图标支持
@@ -41,6 +49,34 @@ except ImportError:
     HAS_QTAWESOME = False
     print("⚠️ qtawesome未安装，将使用文本状态指示器")
 
+# 尝试导入pyqtgraph绘图后端
+try:
+    from .pyqtgraph_chart import PyqtgraphPlotPanel
+    HAS_PYQTGRAPH = True
+except ImportError as e:
+    HAS_PYQTGRAPH = False
+    print(f"⚠️ pyqtgraph图表后端不可用: {e}")
+
+# 面板A可选的绘图后端
+CHART_BACKENDS = ("matplotlib", "pyqtgraph")
+DEFAULT_CHART_BACKEND = "matplotlib"
+
+# 图表刷新间隔（毫秒），约30fps
+PLOT_REFRESH_INTERVAL_MS = 33
+
+# X轴扩展时在数据右侧预留的余量比例
+X_LIMIT_HEADROOM = 0.25
+# 无数据时的默认X轴范围（mm）；清除数据或切换孔位时恢复，不沿用上一个孔的范围
+DEFAULT_X_LIMITS = (0, 950)
+
+# 切换内窥镜图像时预先解码的后续图像数
+ENDOSCOPE_PREFETCH_COUNT = 2
+
+# 面板A回放倍速选项
+REPLAY_SPEED_OPTIONS = (1, 2, 5, 10, 50, 100, 500, 1000)
+# 深度定位输入框的最大深度（mm）
+MAX_SEEK_DEPTH_MM = 100000.0
+
 
 class RealtimeChart(QWidget):
     """
@@ -49,8 +85,20 @@ class RealtimeChart(QWidget):
     面板B: 内窥镜实时图像显示
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, backend: str = DEFAULT_CHART_BACKEND):
+        """
+        Args:
+            parent: 父控件
+            backend: 面板A绘图后端，"matplotlib" 或 "pyqtgraph"（高速数据流）
+        """
         super().__init__(parent)
+        if backend not in CHART_BACKENDS:
+            raise ValueError(f"未知的图表后端: {backend}")
+        if backend == "pyqtgraph" and not HAS_PYQTGRAPH:
+            print("⚠️ pyqtgraph不可用，使用matplotlib图表后端")
+            backend = "matplotlib"
+        self.chart_backend = backend
+        self.plot_panel = None
         self.current_hole_id = None
         self.is_data_loaded = False  # 标记是否已加载数据
         self.setup_ui()
@@ -186,40 +234,15 @@ class RealtimeChart(QWidget):
         # 将标题栏添加到布局
         chart_layout.addWidget(chart_header)
 
-        # 创建matplotlib图形，优化尺寸以最大化显示区域
-        self.figure = Figure(figsize=(24, 12), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
-        chart_layout.addWidget(self.canvas)
-
-        # 连接鼠标事件用于缩放和重置
-        self.canvas.mpl_connect('scroll_event', self.on_scroll)
-        self.canvas.mpl_connect('button_press_event', self.on_mouse_press)
-
-        # 创建子图 - 增大字体
-        self.ax = self.figure.add_subplot(111)
-        self.apply_matplotlib_dark_theme()  # 应用深色主题
-        self.ax.set_xlabel('深度 (mm)', fontsize=14, fontweight='bold')
-        self.ax.set_ylabel('直径 (mm)', fontsize=14, fontweight='bold')
-        # 移除matplotlib内部标题，使用外部标题栏
-        # self.ax.set_title('管孔直径实时监测', fontsize=16, fontweight='bold', pad=15)
-        self.ax.grid(True, alpha=0.3)
-
-        # 设置坐标轴刻度字体大小
-        self.ax.tick_params(axis='both', which='major', labelsize=12)
-        self.ax.tick_params(axis='both', which='minor', labelsize=10)
-
-        # 设置初始范围
-        self.ax.set_ylim(16.5, 20.5)
-        self.ax.set_xlim(0, 950)
-
-        # 初始化数据线 - 使用主题蓝色
-        self.data_line, = self.ax.plot([], [], color='#4A90E2', linewidth=3, label='直径数据')
-
-        # 设置图形样式，确保所有标签都能完整显示
-        self.figure.subplots_adjust(left=0.12, bottom=0.15, right=0.95, top=0.85)
-
-        # 设置图例位置，确保不被遮挡 - 增大字体
-        self.ax.legend(loc='upper right', bbox_to_anchor=(0.95, 0.95), fontsize=12)
+        # 创建绘图区域
+        if self.chart_backend == "pyqtgraph":
+            self.plot_panel = PyqtgraphPlotPanel()
+            self.plot_panel.reset_requested.connect(self.reset_zoom)
+            self.plot_panel.set_y_range(16.5, 20.5)
+            self.plot_panel.set_x_range(*DEFAULT_X_LIMITS)
+            chart_layout.addWidget(self.plot_panel)
+        else:
+            self.create_matplotlib_chart(chart_layout)
 
         # 在图表下方添加面板A专用控制按钮（移除标准直径输入）
         self.create_panel_a_controls(chart_layout)
@@ -293,10 +316,49 @@ class RealtimeChart(QWidget):
         self.clear_button.setToolTip("请先从主检测界面选择孔位")
 
     def create_panel_a_controls(self, parent_layout):
-        """创建面板A专用控制按钮"""
-        # 不再创建面板A的启动、停止按钮和状态标签
-        # 这些控制功能已被移除
-        pass
+        """创建面板A专用控制：CSV回放倍速和按深度定位（启动、停止按钮在状态栏中）"""
+        controls = QWidget()
+        controls.setObjectName("PanelAControls")
+        layout = QHBoxLayout(controls)
+        layout.setContentsMargins(15, 2, 15, 2)
+        layout.setSpacing(8)
+
+        layout.addWidget(QLabel("回放倍速:"))
+        self.replay_speed_combo = QComboBox()
+        self.replay_speed_combo.setObjectName("ReplaySpeedCombo")
+        for speed in REPLAY_SPEED_OPTIONS:
+            self.replay_speed_combo.addItem(f"{speed}x", float(speed))
+        self.replay_speed_combo.setToolTip("CSV回放速度，播放中立即生效")
+        self.replay_speed_combo.currentIndexChanged.connect(self.on_replay_speed_changed)
+        layout.addWidget(self.replay_speed_combo)
+
+        layout.addSpacing(20)
+        layout.addWidget(QLabel("定位深度:"))
+        self.seek_depth_spin = QDoubleSpinBox()
+        self.seek_depth_spin.setObjectName("SeekDepthSpin")
+        self.seek_depth_spin.setRange(0.0, MAX_SEEK_DEPTH_MM)
+        self.seek_depth_spin.setDecimals(1)
+        self.seek_depth_spin.setSuffix(" mm")
+        layout.addWidget(self.seek_depth_spin)
+
+        self.seek_depth_button = QPushButton("定位")
+        self.seek_depth_button.setObjectName("SeekDepthButton")
+        self.seek_depth_button.setToolTip("从该深度继续回放，图表显示之前的全部数据")
+        self.seek_depth_button.clicked.connect(self.on_seek_depth_clicked)
+        layout.addWidget(self.seek_depth_button)
+        layout.addStretch()
+
+        parent_layout.addWidget(controls)
+
+    def on_replay_speed_changed(self, index):
+        """回放倍速下拉框变化"""
+        speed = self.replay_speed_combo.itemData(index)
+        if speed is not None:
+            self.set_csv_replay_speed(speed)
+
+    def on_seek_depth_clicked(self):
+        """按输入的深度定位回放"""
+        self.seek_csv_depth(self.seek_depth_spin.value())
 
     def update_comm_status(self, status, message):
         """更新通信状态显示，支持图标"""
@@ -396,11 +458,63 @@ class RealtimeChart(QWidget):
 
         print("⏳ 实时监控界面等待状态 - 请从主检测界面选择孔位后跳转")
 
+    def create_matplotlib_chart(self, chart_layout):
+        """创建matplotlib绘图区域（默认后端）"""
+        # 创建matplotlib图形，优化尺寸以最大化显示区域
+        self.figure = Figure(figsize=(24, 12), dpi=100)
+        self.canvas = FigureCanvas(self.figure)
+        chart_layout.addWidget(self.canvas)
+
+        # 连接鼠标事件用于缩放和重置
+        self.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self.canvas.mpl_connect('button_press_event', self.on_mouse_press)
+
+        # 创建子图 - 增大字体
+        self.ax = self.figure.add_subplot(111)
+        self.apply_matplotlib_dark_theme()  # 应用深色主题
+        self.ax.set_xlabel('深度 (mm)', fontsize=14, fontweight='bold')
+        self.ax.set_ylabel('直径 (mm)', fontsize=14, fontweight='bold')
+        # 移除matplotlib内部标题，使用外部标题栏
+        # self.ax.set_title('管孔直径实时监测', fontsize=16, fontweight='bold', pad=15)
+        self.ax.grid(True, alpha=0.3)
+
+        # 设置坐标轴刻度字体大小
+        self.ax.tick_params(axis='both', which='major', labelsize=12)
+        self.ax.tick_params(axis='both', which='minor', labelsize=10)
+
+        # 设置初始范围
+        self.ax.set_ylim(16.5, 20.5)
+        self.ax.set_xlim(*DEFAULT_X_LIMITS)
+
+        # 初始化数据线 - 使用主题蓝色
+        self.blitter = ChartBlitter(self.canvas)
+        self.create_animated_artists(linewidth=3, label='直径数据')
+
+        # 设置图形样式，确保所有标签都能完整显示
+        self.figure.subplots_adjust(left=0.12, bottom=0.15, right=0.95, top=0.85)
+
+        # 设置图例位置，确保不被遮挡 - 增大字体
+        self.ax.legend(loc='upper right', bbox_to_anchor=(0.95, 0.95), fontsize=12)
+
+    def create_animated_artists(self, linewidth, label):
+        """创建逐帧重绘的数据线和异常标记，并交给blitter管理"""
+        self.data_line, = self.ax.plot([], [], color='#4A90E2', linewidth=linewidth, label=label)
+        self.anomaly_markers, = self.ax.plot([], [], linestyle='None', marker='o', markersize=5,
+                                             color='#E74C3C', label='_nolegend_')
+        self.blitter.set_artists([self.data_line, self.anomaly_markers])
+
     def show_waiting_message(self):
         """在图表区域显示等待状态（无提示文字）"""
+        if self.plot_panel:
+            self.plot_panel.clear()
+            self.plot_panel.set_x_range(0, 100)
+            self.plot_panel.set_y_range(16, 20)
+            return
+
         try:
-            # 清除现有数据
+            # 清除现有数据（动态图元随坐标轴一起被移除）
             self.ax.clear()
+            self.blitter.set_artists([])
 
             # 移除matplotlib内部标题，使用外部标题栏
             # self.ax.set_title("管孔直径实时监测", fontsize=16, fontweight='bold', pad=20)
@@ -435,6 +549,12 @@ class RealtimeChart(QWidget):
 
     def setup_chart_for_data(self):
         """为数据显示设置图表"""
+        if self.plot_panel:
+            self.plot_panel.clear()
+            if getattr(self, 'standard_diameter', None) is not None:
+                self.draw_error_lines_and_adjust_y_axis()
+            return
+
         try:
             # 清除现有内容
             self.ax.clear()
@@ -450,7 +570,7 @@ class RealtimeChart(QWidget):
             self.ax.grid(True, alpha=0.3)
 
             # 初始化数据线 - 使用主题蓝色
-            self.data_line, = self.ax.plot([], [], color='#4A90E2', linewidth=2, label='测量数据')
+            self.create_animated_artists(linewidth=2, label='测量数据')
 
             # 重新绘制误差线（如果标准直径已设置）
             if hasattr(self, 'standard_diameter') and self.standard_diameter is not None:
@@ -518,20 +638,19 @@ class RealtimeChart(QWidget):
         title_label.setFixedHeight(25)  # 增加标题高度
         anomaly_layout.addWidget(title_label)
 
-        # 滚动区域用于显示异常数据
-        from PySide6.QtWidgets import QScrollArea
-        self.anomaly_scroll = QScrollArea()
-        self.anomaly_scroll.setWidgetResizable(True)
-        self.anomaly_scroll.setObjectName("anomaly_scroll")
+        # 异常区间列表（模型/视图，每帧增量同步一次，不重建控件）
+        from PySide6.QtWidgets import QListView
+        self.anomaly_tracker = AnomalyTracker()
+        self.anomaly_model = AnomalyListModel(self.anomaly_tracker, self)
+        self.anomaly_list = QListView()
+        self.anomaly_list.setObjectName("anomaly_list")
+        self.anomaly_list.setModel(self.anomaly_model)
+        self.anomaly_list.setUniformItemSizes(True)
+        self.anomaly_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.anomaly_list.setSelectionMode(QListView.SelectionMode.NoSelection)
 
-        self.anomaly_content = QWidget()
-        self.anomaly_content.setObjectName("anomaly_content")
-        self.anomaly_content_layout = QVBoxLayout(self.anomaly_content)
-        self.anomaly_content_layout.setContentsMargins(5, 5, 5, 5)
-        self.anomaly_scroll.setWidget(self.anomaly_content)
-
-        # 滚动区域占据可用空间，但为统计信息预留足够空间
-        anomaly_layout.addWidget(self.anomaly_scroll, 1)
+        # 列表占据可用空间，但为统计信息预留足够空间
+        anomaly_layout.addWidget(self.anomaly_list, 1)
 
         # 统计信息 - 使用栅格布局精确控制异常计数显示
         stats_widget = QWidget()
@@ -620,6 +739,9 @@ class RealtimeChart(QWidget):
         self.target_diameter = diameter
         self.tolerance = max(self.upper_tolerance, self.lower_tolerance)  # 使用最大误差进行异常检测
 
+        # 公差变化后按新公差带重建统计
+        self.rebuild_live_statistics()
+
         # 绘制误差线并调整Y轴范围
         self.draw_error_lines_and_adjust_y_axis()
 
@@ -640,6 +762,11 @@ class RealtimeChart(QWidget):
         y_min = self.standard_diameter - y_margin
         y_max = self.standard_diameter + y_margin
 
+        if self.plot_panel:
+            self.plot_panel.set_y_range(y_min, y_max)
+            self.plot_panel.set_tolerance_lines(max_error_line_y, min_error_line_y)
+            return
+
         # 设置Y轴范围
         self.ax.set_ylim(y_min, y_max)
 
@@ -684,7 +811,12 @@ class RealtimeChart(QWidget):
             print(f"matplotlib误差线绘制失败: {e}")
 
     def remove_error_lines_and_reset_y_axis(self):
-        """移除误差线并重置Y轴范围（matplotlib版本）"""
+        """移除误差线并重置Y轴范围"""
+        if self.plot_panel:
+            self.plot_panel.clear_tolerance_lines()
+            self.plot_panel.set_y_range(16.5, 20.5)
+            return
+
         # 移除最大直径误差线
         if hasattr(self, 'max_error_line') and self.max_error_line:
             try:
@@ -746,7 +878,7 @@ class RealtimeChart(QWidget):
 
     def adjust_anomaly_panel_height(self, panel_a_height):
         """动态调整异常面板高度，确保按钮不遮挡统计信息"""
-        if hasattr(self, 'anomaly_scroll') and hasattr(self, 'next_sample_button'):
+        if hasattr(self, 'anomaly_list') and hasattr(self, 'next_sample_button'):
             # 计算可用高度：面板A高度 - 状态面板高度 - 按钮高度 - 间距
             available_height = panel_a_height - 80  # 减去状态面板和其他组件的高度
             button_height = 35  # 按钮高度
@@ -763,8 +895,8 @@ class RealtimeChart(QWidget):
 
             # 应用高度限制
             if scroll_height > 0:
-                self.anomaly_scroll.setMaximumHeight(int(scroll_height))
-                self.anomaly_scroll.setMinimumHeight(min(min_scroll_height, int(scroll_height)))
+                self.anomaly_list.setMaximumHeight(int(scroll_height))
+                self.anomaly_list.setMinimumHeight(min(min_scroll_height, int(scroll_height)))
 
     def resizeEvent(self, event):
         """窗口大小变化事件处理"""
@@ -786,10 +918,10 @@ class RealtimeChart(QWidget):
         self.max_error_line = None  # 最大直径误差线
         self.min_error_line = None  # 最小直径误差线
 
-        # 设置更新定时器 - 使用更安全的频率
+        # 设置更新定时器 - 局部重绘开销小，按约30fps刷新
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_plot)
-        self.update_timer.start(200)  # 每1秒更新一次，更加安全
+        self.update_timer.start(PLOT_REFRESH_INTERVAL_MS)
 
         # 初始化缩放参数
         self.zoom_factor = 1.0
@@ -801,52 +933,56 @@ class RealtimeChart(QWidget):
         print(f"✅ 自动设置标准直径为: {self.standard_diameter}mm")
 
     def update_plot(self):
-        """更新matplotlib图表显示 - 超级安全版本"""
+        """更新matplotlib图表显示 - 只重绘数据线和异常标记，坐标轴范围变化时才完整重绘"""
         try:
             # 检查所有必要的属性是否存在
             if not hasattr(self, 'depth_data') or not hasattr(self, 'diameter_data'):
                 return
-            if not hasattr(self, 'data_line') or not hasattr(self, 'ax') or not hasattr(self, 'canvas'):
+            if not self.plot_panel and not hasattr(self, 'data_line'):
                 return
 
+            # 每帧同步一次异常面板
+            self.update_anomaly_display()
+
             # 检查数据是否有效
             if not self.depth_data or not self.diameter_data:
                 return
-            if len(self.depth_data) == 0 or len(self.diameter_data) == 0:
-                return
             if len(self.depth_data) != len(self.diameter_data):
                 return
 
-            # 安全地更新数据线
+            # 数据超出当前X轴范围时才调整范围（触发完整重绘并重新截取背景）
+            limits_changed = False
             try:
-                depth_list = list(self.depth_data)
-                diameter_list = list(self.diameter_data)
-                self.data_line.set_data(depth_list, diameter_list)
+                limits_changed = self.expand_x_limits_to_data()
             except Exception:
-                return
+                pass
 
-            # 安全地调整坐标轴范围
+            # 安全地更新数据线
             try:
-                if len(depth_list) > 1:
-                    x_min = min(depth_list)
-                    x_max = max(depth_list)
-                    x_range = x_max - x_min
-
-                    if x_range > 0:
-                        margin = max(x_range * 0.1, 50)
-                        # 确保X轴最小值不小于0（深度不能为负）
-                        x_min_display = max(0, x_min - margin)
-                        self.ax.set_xlim(x_min_display, x_max + margin)
-                    else:
-                        # 确保X轴最小值不小于0
-                        x_min_display = max(0, x_min - 50)
-                        self.ax.set_xlim(x_min_display, x_min + 50)
+                depths = self.depth_data.view()
+                diameters = self.diameter_data.view()
+                if self.plot_panel:
+                    # pyqtgraph自带峰值降采样，直接传入缓冲区的连续视图
+                    self.plot_panel.set_data(depths, diameters)
+                else:
+                    # matplotlib按像素宽度降采样可见部分，缩放后下一帧自动重新降采样
+                    indices = decimate_trace(depths, diameters, target_points_for_axes(self.ax),
+                                             tolerance=self._tolerance_limits(),
+                                             x_range=self.ax.get_xlim())
+                    depths, diameters = depths[indices], diameters[indices]
+                    self.data_line.set_data(depths, diameters)
+                self.update_anomaly_markers(depths, diameters)
             except Exception:
-                pass
+                return
 
-            # 安全地重绘画布
+            # 安全地重绘画布（pyqtgraph在设置数据后自行重绘）
             try:
-                self.canvas.draw_idle()
+                if self.plot_panel:
+                    pass
+                elif limits_changed:
+                    self.canvas.draw_idle()
+                else:
+                    self.blitter.update()
             except Exception:
                 pass
 
@@ -854,6 +990,78 @@ class RealtimeChart(QWidget):
             # 完全静默处理，确保不影响主程序
             pass
 
+    def update_anomaly_markers(self, depths, diameters):
+        """按公差向量化筛选超差点，更新异常标记"""
+        tolerance = self._tolerance_limits()
+        if tolerance is None or len(diameters) == 0:
+            depths = diameters = depths[:0]
+        else:
+            lower_limit, upper_limit = tolerance
+            mask = (diameters > upper_limit) | (diameters < lower_limit)
+            depths, diameters = depths[mask], diameters[mask]
+
+        if self.plot_panel:
+            self.plot_panel.set_anomalies(depths, diameters)
+        elif hasattr(self, 'anomaly_markers'):
+            self.anomaly_markers.set_data(depths, diameters)
+
+    def _tolerance_limits(self):
+        """当前公差带 (下限, 上限)，未设置标准直径时为None"""
+        if getattr(self, 'standard_diameter', None) is None:
+            return None
+        return (self.standard_diameter - self.lower_tolerance,
+                self.standard_diameter + self.upper_tolerance)
+
+    def expand_x_limits_to_data(self):
+        """
+        数据接近X轴右边界时按步长扩展范围
+
+        每次扩展预留一段余量，使坐标轴范围（以及需要完整重绘的静态背景）
+        只在数据越过边界时变化，而不是每帧变化。
+
+        Returns:
+            bool: 是否修改了坐标轴范围
+        """
+        if len(self.depth_data) < 2:
+            return False
+        x_min = self.depth_data.min
+        x_max = self.depth_data.max
+        view_min, view_max = self._get_x_range()
+        if view_min <= x_min and x_max <= view_max:
+            return False
+
+        x_range = x_max - x_min
+        margin = max(x_range * 0.1, 50)
+        headroom = max(x_range * X_LIMIT_HEADROOM, 50)
+        # 确保X轴最小值不小于0（深度不能为负）
+        self._set_x_range(max(0, x_min - margin), x_max + headroom)
+        return True
+
+    def _get_x_range(self):
+        """当前X轴显示范围（与绘图后端无关）"""
+        if self.plot_panel:
+            return self.plot_panel.get_x_range()
+        return self.ax.get_xlim()
+
+    def _set_x_range(self, x_min, x_max):
+        """设置X轴显示范围（与绘图后端无关）"""
+        if self.plot_panel:
+            self.plot_panel.set_x_range(x_min, x_max)
+        else:
+            self.ax.set_xlim(x_min, x_max)
+
+    def _set_y_range(self, y_min, y_max):
+        """设置Y轴显示范围（与绘图后端无关）"""
+        if self.plot_panel:
+            self.plot_panel.set_y_range(y_min, y_max)
+        else:
+            self.ax.set_ylim(y_min, y_max)
+
+    def _redraw(self):
+        """坐标范围变化后请求完整重绘（pyqtgraph自动重绘）"""
+        if not self.plot_panel:
+            self.canvas.draw_idle()
+
     def cleanup(self):
         """清理资源，停止定时器"""
         try:
@@ -941,31 +1149,16 @@ class RealtimeChart(QWidget):
         if hasattr(self, 'standard_diameter') and self.standard_diameter:
             # 如果设置了标准直径，使用聚焦视图
             y_margin = 0.15
-            y_min = self.standard_diameter - y_margin
-            y_max = self.standard_diameter + y_margin
-            self.ax.set_ylim(y_min, y_max)
+            self._set_y_range(self.standard_diameter - y_margin, self.standard_diameter + y_margin)
         else:
             # 否则使用默认范围
-            self.ax.set_ylim(16.5, 20.5)
+            self._set_y_range(16.5, 20.5)
 
         # X轴范围根据数据自动调整
-        if len(self.depth_data) > 0:
-            x_min = min(self.depth_data)
-            x_max = max(self.depth_data)
-            x_range = x_max - x_min
-
-            if x_range > 0:
-                margin = max(x_range * 0.1, 50)
-                # 确保X轴最小值不小于0（深度不能为负）
-                x_min_display = max(0, x_min - margin)
-                self.ax.set_xlim(x_min_display, x_max + margin)
-            else:
-                self.ax.set_xlim(0, 950)
-        else:
-            self.ax.set_xlim(0, 950)
+        self._set_x_range(*self._data_x_range())
 
         # 重绘图表
-        self.canvas.draw_idle()
+        self._redraw()
         print("缩放已重置到默认视图")
 
     def reset_to_standard_view(self):
@@ -973,36 +1166,34 @@ class RealtimeChart(QWidget):
         if hasattr(self, 'standard_diameter') and self.standard_diameter:
             # 还原到标准直径的聚焦视图
             y_margin = 0.15
-            y_min = self.standard_diameter - y_margin
-            y_max = self.standard_diameter + y_margin
-            self.ax.set_ylim(y_min, y_max)
+            self._set_y_range(self.standard_diameter - y_margin, self.standard_diameter + y_margin)
 
             # X轴范围根据当前数据自动调整
-            if len(self.depth_data) > 0:
-                x_min = min(self.depth_data)
-                x_max = max(self.depth_data)
-                x_range = x_max - x_min
-
-                if x_range > 0:
-                    margin = max(x_range * 0.1, 50)
-                    # 确保X轴最小值不小于0（深度不能为负）
-                    x_min_display = max(0, x_min - margin)
-                    self.ax.set_xlim(x_min_display, x_max + margin)
-                else:
-                    self.ax.set_xlim(0, 950)
-            else:
-                self.ax.set_xlim(0, 950)
+            self._set_x_range(*self._data_x_range())
 
             # 重绘图表
-            self.canvas.draw_idle()
+            self._redraw()
             print(f"视图已还原到标准直径 {self.standard_diameter}mm 的显示范围")
         else:
             # 如果没有设置标准直径，还原到默认视图
-            self.ax.set_ylim(16.5, 20.5)
-            self.ax.set_xlim(0, 950)
-            self.canvas.draw_idle()
+            self._set_y_range(16.5, 20.5)
+            self._set_x_range(*DEFAULT_X_LIMITS)
+            self._redraw()
             print("视图已还原到默认显示范围")
-        
+
+    def _data_x_range(self):
+        """根据当前数据计算X轴显示范围"""
+        if len(self.depth_data) > 0:
+            x_min = self.depth_data.min
+            x_max = self.depth_data.max
+            x_range = x_max - x_min
+
+            if x_range > 0:
+                margin = max(x_range * 0.1, 50)
+                # 确保X轴最小值不小于0（深度不能为负）
+                return max(0, x_min - margin), x_max + margin
+        return DEFAULT_X_LIMITS
+
     def init_data_buffers(self):
         """初始化数据缓冲区"""
         # 注意：孔位数据映射现在在init_hole_data_mapping()中初始化
@@ -1015,26 +1206,29 @@ class RealtimeChart(QWidget):
         self.endoscope_switching_enabled = False  # 图像切换功能是否启用
         self.current_hole_id = None  # 当前选中的孔位ID
         self.endoscope_switching_enabled = False  # 图像切换功能是否启用
-        self.max_points = 2000  # 最大显示点数
-        self.depth_data = deque(maxlen=self.max_points)
-        self.diameter_data = deque(maxlen=self.max_points)
+        self.max_points = 100000  # 最大显示点数
+        self.depth_data = SampleRingBuffer(self.max_points)
+        self.diameter_data = SampleRingBuffer(self.max_points)
 
         # 样品管理
         self.current_sample_index = 0
         self.sample_data_history = {}  # 存储多个样品的数据
 
-        # 异常数据管理
-        self.anomaly_data = []  # 存储异常数据点
+        # 异常数据管理（超差区间跟踪器在create_anomaly_panel中创建）
+        self.anomaly_tracker.clear()
 
-        # 最大最小直径跟踪
+        # 最大最小直径跟踪（由流式统计得出）
         self.max_diameter = None  # 当前样品的最大直径
         self.min_diameter = None  # 当前样品的最小直径
+        self.live_stats = StreamingStatistics(self._statistics_band())
 
         # CSV数据导入相关
         self.csv_data = []  # 存储CSV数据
         self.csv_data_index = 0  # 当前播放位置
         self.csv_timer = None  # CSV数据播放定时器
         self.is_csv_playing = False  # CSV数据播放状态
+        self.csv_replay = None  # CSV回放引擎（按真实时间推进）
+        self.csv_replay_speed = 1.0  # 回放倍速（1x~1000x）
 
         # 多文件管理（向后兼容，但主要使用新的孔位映射）
         self.csv_file_list = []
@@ -1057,25 +1251,63 @@ class RealtimeChart(QWidget):
         # 保存当前样品数据
         self.save_current_sample_data(depth, diameter)
 
-        # 更新最大最小直径
-        self.update_diameter_extremes(diameter)
+        # 更新流式统计和最大最小直径
+        self.live_stats.add(diameter)
+        self.update_diameter_extremes()
 
         # 更新图表（matplotlib版本在update_plot中处理）
         # matplotlib的数据更新由定时器驱动的update_plot方法处理
 
-    def update_diameter_extremes(self, diameter):
-        """更新最大最小直径"""
-        # 更新最大直径
-        if self.max_diameter is None or diameter > self.max_diameter:
-            self.max_diameter = diameter
+    @Slot(object, object)
+    def update_data_chunk(self, depths, diameters):
+        """
+        批量更新图表数据的槽函数
+        由批量模式工作线程的 data_chunk_updated 信号触发，每个UI帧一块
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        diameters = np.asarray(diameters, dtype=np.float64)
+        if len(depths) == 0:
+            return
+
+        # 添加新数据块
+        self.depth_data.extend(depths)
+        self.diameter_data.extend(diameters)
+
+        # 向量化检测异常数据并合并为超差区间（异常面板由update_plot每帧同步）
+        tolerance = self._tolerance_limits()
+        if tolerance is not None:
+            self.anomaly_tracker.add_chunk(depths, diameters, *tolerance)
+
+        # 保存当前样品数据
+        self.save_current_sample_chunk(depths, diameters)
 
-        # 更新最小直径
-        if self.min_diameter is None or diameter < self.min_diameter:
-            self.min_diameter = diameter
+        # 更新流式统计、最大最小直径和探头深度
+        self.live_stats.update(diameters)
+        self.update_diameter_extremes()
+        self.depth_label.setText(f"📏 探头深度: {depths[-1]:.1f} mm")
+
+    def update_diameter_extremes(self):
+        """由流式统计更新最大最小直径"""
+        self.max_diameter = self.live_stats.max
+        self.min_diameter = self.live_stats.min
 
         # 更新状态栏显示
         self.update_diameter_display()
 
+    def _statistics_band(self):
+        """统计合格数使用的公差带 (目标直径-公差, 目标直径+公差)"""
+        target = getattr(self, 'target_diameter', None)
+        if target is None:
+            return None
+        return (target - self.tolerance, target + self.tolerance)
+
+    def rebuild_live_statistics(self):
+        """按当前公差带和缓冲区数据重建流式统计（公差或数据源变化时调用）"""
+        if not hasattr(self, 'diameter_data'):
+            return  # 缓冲区尚未初始化（setup_chart阶段）
+        self.live_stats = StreamingStatistics.from_values(self.diameter_data.view(),
+                                                          self._statistics_band())
+
     def update_diameter_display(self):
         """更新直径显示"""
         if self.max_diameter is not None:
@@ -1110,11 +1342,17 @@ class RealtimeChart(QWidget):
         """清除所有数据"""
         self.depth_data.clear()
         self.diameter_data.clear()
-        self.data_line.set_data([], [])
-        self.canvas.draw()
+        # X轴范围只随数据扩展，清除数据时恢复默认范围
+        self._set_x_range(*DEFAULT_X_LIMITS)
+        if self.plot_panel:
+            self.plot_panel.clear()
+        else:
+            self.data_line.set_data([], [])
+            self.anomaly_markers.set_data([], [])
+            self.canvas.draw()
 
         # 清除异常数据
-        self.anomaly_data.clear()
+        self.anomaly_tracker.clear()
         self.update_anomaly_display()
 
         # 清除内窥镜图像
@@ -1127,7 +1365,8 @@ class RealtimeChart(QWidget):
         # 注意：不重置孔位显示，保持当前选中的孔位
         # 只有在完全重置时才清除孔位信息
 
-        # 重置最大最小直径
+        # 重置流式统计和最大最小直径
+        self.live_stats.clear()
         self.max_diameter = None
         self.min_diameter = None
         self.update_diameter_display()
@@ -1171,71 +1410,25 @@ class RealtimeChart(QWidget):
         self.endoscope_view.stop_acquisition()
 
     def check_anomaly(self, depth, diameter):
-        """检测异常数据点"""
+        """检测异常数据点（异常面板由update_plot每帧同步）"""
         # 只有在设置了标准直径时才进行异常检测
-        if hasattr(self, 'standard_diameter') and self.standard_diameter is not None:
-            # 检查是否超出上下公差范围
-            upper_limit = self.standard_diameter + self.upper_tolerance
-            lower_limit = self.standard_diameter - self.lower_tolerance
-
-            if diameter > upper_limit or diameter < lower_limit:
-                # 计算偏差（相对于最近的公差边界）
-                if diameter > upper_limit:
-                    deviation = diameter - upper_limit
-                else:
-                    deviation = lower_limit - diameter
-
-                # 添加到异常数据列表
-                anomaly_info = {
-                    'depth': depth,
-                    'diameter': diameter,
-                    'deviation': deviation,
-                    'standard_diameter': self.standard_diameter,
-                    'upper_limit': upper_limit,
-                    'lower_limit': lower_limit,
-                    'sample_id': self.current_hole_id or f"Sample_{self.current_sample_index}"
-                }
-                self.anomaly_data.append(anomaly_info)
-
-                # 更新异常显示
-                self.update_anomaly_display()
+        tolerance = self._tolerance_limits()
+        if tolerance is not None:
+            self.anomaly_tracker.add_sample(depth, diameter, *tolerance)
 
     def update_anomaly_display(self):
-        """更新异常数据显示"""
-        # 清除现有显示
-        for i in reversed(range(self.anomaly_content_layout.count())):
-            child = self.anomaly_content_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-
-        # 显示最近的异常数据（最多显示10个）
-        recent_anomalies = self.anomaly_data[-10:] if len(self.anomaly_data) > 10 else self.anomaly_data
-
-        for anomaly in recent_anomalies:
-            anomaly_widget = QWidget()
-            anomaly_layout = QHBoxLayout(anomaly_widget)
-            anomaly_layout.setContentsMargins(5, 2, 5, 2)
-
-            # 深度和直径信息
-            info_label = QLabel(f"深度: {anomaly['depth']:.1f}mm\n直径: {anomaly['diameter']:.3f}mm")
-            info_label.setStyleSheet("font-size: 10px; color: red;")
-            anomaly_layout.addWidget(info_label)
-
-            # 偏差信息
-            deviation_label = QLabel(f"偏差: {anomaly['deviation']:.3f}mm")
-            deviation_label.setStyleSheet("font-size: 10px; font-weight: bold; color: red;")
-            anomaly_layout.addWidget(deviation_label)
-
-            self.anomaly_content_layout.addWidget(anomaly_widget)
-
-        # 更新统计信息
-        total_points = len(self.depth_data)
-        anomaly_count = len(self.anomaly_data)
-        anomaly_rate = (anomaly_count / total_points * 100) if total_points > 0 else 0
+        """同步异常区间列表和统计信息（每帧最多一次）"""
+        rows_before = self.anomaly_model.rowCount()
+        if not self.anomaly_model.sync():
+            return
+
+        # 有新区间时滚动到最新
+        if self.anomaly_model.rowCount() > rows_before:
+            self.anomaly_list.scrollToBottom()
 
         # 更新大号异常计数显示
-        self.anomaly_count_number.setText(str(anomaly_count))
-        self.anomaly_rate_label.setText(f"异常率: {anomaly_rate:.1f}%")
+        self.anomaly_count_number.setText(str(self.anomaly_tracker.anomaly_count))
+        self.anomaly_rate_label.setText(f"异常率: {self.anomaly_tracker.anomaly_rate:.1f}%")
 
     def save_current_sample_data(self, depth, diameter):
         """保存当前样品数据"""
@@ -1259,6 +1452,30 @@ class RealtimeChart(QWidget):
                 'deviation': deviation
             })
 
+    def save_current_sample_chunk(self, depths, diameters):
+        """批量保存当前样品数据"""
+        sample_key = self.current_hole_id or f"Sample_{self.current_sample_index}"
+        if sample_key not in self.sample_data_history:
+            self.sample_data_history[sample_key] = {
+                'depths': [],
+                'diameters': [],
+                'anomalies': []
+            }
+
+        sample = self.sample_data_history[sample_key]
+        sample['depths'].extend(depths.tolist())
+        sample['diameters'].extend(diameters.tolist())
+
+        # 如果是异常点，也保存到样品的异常列表中
+        deviations = np.abs(diameters - self.target_diameter)
+        outside = np.flatnonzero(deviations > self.tolerance)
+        sample['anomalies'].extend(
+            {'depth': depth, 'diameter': diameter, 'deviation': deviation}
+            for depth, diameter, deviation in zip(depths[outside].tolist(),
+                                                  diameters[outside].tolist(),
+                                                  deviations[outside].tolist())
+        )
+
     def view_next_sample(self):
         """查看下一个样品 - 基于孔位ID切换（H00001 → H00002 → H00001...）"""
         # 停止当前播放
@@ -1333,22 +1550,23 @@ class RealtimeChart(QWidget):
         # 清除当前显示
         self.depth_data.clear()
         self.diameter_data.clear()
-        self.anomaly_data.clear()
+        self.anomaly_tracker.clear()
 
         # 加载历史数据
-        for depth, diameter in zip(sample_data['depths'], sample_data['diameters']):
-            self.depth_data.append(depth)
-            self.diameter_data.append(diameter)
+        self.depth_data.extend(sample_data['depths'])
+        self.diameter_data.extend(sample_data['diameters'])
 
-        # 加载异常数据
-        self.anomaly_data = sample_data['anomalies'].copy()
+        # 按当前公差重新计算超差区间
+        tolerance = self._tolerance_limits()
+        if tolerance is not None:
+            self.anomaly_tracker.add_chunk(self.depth_data.view(), self.diameter_data.view(), *tolerance)
+        self.rebuild_live_statistics()
+        self.update_diameter_extremes()
 
-        # 更新显示
-        if len(self.depth_data) > 0:
-            self.data_curve.setData(
-                x=list(self.depth_data),
-                y=list(self.diameter_data)
-            )
+        # 按该样品的数据重设X轴范围（不沿用上一个样品的范围）
+        self._set_x_range(*self._data_x_range())
+        self._redraw()
+        self.update_plot()
 
         self.update_anomaly_display()
         self.current_hole_id = sample_key
@@ -1357,33 +1575,18 @@ class RealtimeChart(QWidget):
         """设置公差限制 - 已废弃，删除目标线引用"""
         self.target_diameter = target
         self.tolerance = tolerance
+        self.rebuild_live_statistics()
 
         # 删除所有公差线和目标线相关代码
         # 调整Y轴范围
         margin = tolerance * 3
-        self.plot_widget.setYRange(target - margin, target + margin)
+        self._set_y_range(target - margin, target + margin)
         
     def get_current_statistics(self):
         """获取当前数据的统计信息"""
-        if len(self.diameter_data) == 0:
+        if self.live_stats.count == 0:
             return None
-            
-        diameters = list(self.diameter_data)
-        return {
-            'count': len(diameters),
-            'mean': np.mean(diameters),
-            'std': np.std(diameters),
-            'min': np.min(diameters),
-            'max': np.max(diameters),
-            'in_tolerance': sum(
-                1 for d in diameters 
-                if abs(d - self.target_diameter) <= self.tolerance
-            ),
-            'out_of_tolerance': sum(
-                1 for d in diameters 
-                if abs(d - self.target_diameter) > self.tolerance
-            )
-        }
+        return self.live_stats.to_dict()
 
     def load_data_for_hole(self, hole_id):
         """为指定的孔加载并显示其对应的CSV数据和内窥镜图片"""
@@ -1478,15 +1681,17 @@ class RealtimeChart(QWidget):
 
         # 重置播放位置
         self.csv_data_index = 0
+        self.csv_replay = self.create_csv_replay_engine()
 
         # 设置标准直径
         self.set_standard_diameter_for_csv()
 
-        # 开始播放 - 降低频率提高稳定性
+        # 开始播放：每帧推送自上一帧以来到期的所有数据点
         self.is_csv_playing = True
+        self.csv_replay.start()
         self.csv_timer = QTimer()
-        self.csv_timer.timeout.connect(self.update_csv_data_point)
-        self.csv_timer.start(50)  # 每100ms更新一个数据点，提高稳定性
+        self.csv_timer.timeout.connect(self.update_csv_replay_frame)
+        self.csv_timer.start(REPLAY_FRAME_INTERVAL_MS)
 
         # 更新按钮状态
         self.start_button.setText("测量中...")
@@ -1502,6 +1707,8 @@ class RealtimeChart(QWidget):
         if self.csv_timer:
             self.csv_timer.stop()
             self.csv_timer = None
+        if self.csv_replay is not None:
+            self.csv_replay.pause()
 
         self.is_csv_playing = False
 
@@ -1517,7 +1724,6 @@ class RealtimeChart(QWidget):
 
     def load_csv_data(self, file_path=None):
         """加载CSV数据文件"""
-        import csv
         import os
 
         # 如果未提供路径，则使用文件列表中的当前文件
@@ -1535,58 +1741,15 @@ class RealtimeChart(QWidget):
 
             print(f"📁 加载CSV文件: {file_path}")
 
-            # 尝试不同的编码
-            encodings = ['gbk', 'gb2312', 'utf-8', 'latin-1']
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        reader = csv.reader(file)
-                        headers = next(reader)
-
-                        # 找到目标列
-                        measurement_col = None
-                        diameter_col = None
-
-                        for i, header in enumerate(headers):
-                            if '测量序号' in header:
-                                measurement_col = i
-                            elif '计算直径' in header:
-                                diameter_col = i
-
-                        if measurement_col is None or diameter_col is None:
-                            print(f"⚠️ 未找到必要的列: 测量序号={measurement_col}, 计算直径={diameter_col}")
-                            # 尝试使用默认列索引
-                            measurement_col = 0
-                            diameter_col = 4  # 根据之前的分析，计算直径在第5列（索引4）
-
-                        # 读取数据
-                        self.csv_data = []
-                        for row in reader:
-                            if len(row) > max(measurement_col, diameter_col):
-                                try:
-                                    measurement_num = int(row[measurement_col])
-                                    diameter_value = float(row[diameter_col])
-
-                                    # 模拟深度数据（基于测量序号）
-                                    depth_value = measurement_num * 1.0  # 每个测量点1.0mm深度
-
-                                    self.csv_data.append({
-                                        'measurement': measurement_num,
-                                        'depth': depth_value,
-                                        'diameter': diameter_value
-                                    })
-                                except (ValueError, IndexError):
-                                    continue
-
-                        print(f"✅ 成功加载 {len(self.csv_data)} 个数据点 (编码: {encoding})")
-                        return True
-
-                except UnicodeDecodeError:
-                    continue
-
-            print(f"❌ 无法使用任何编码读取文件: {file_path}")
-            return False
+            table = read_measurement_csv(file_path)
+            if not table.has_column('measurement') or not table.has_column('diameter'):
+                print(f"⚠️ 未找到必要的列: {table.headers}")
+                return False
+
+            self.csv_data = table.take(table.valid_rows('measurement', 'diameter'))
+            self.csv_replay = None
+            print(f"✅ 成功加载 {len(self.csv_data)} 个数据点 (编码: {table.encoding})")
+            return True
 
         except Exception as e:
             print(f"❌ 加载CSV文件失败: {e}")
@@ -1594,7 +1757,6 @@ class RealtimeChart(QWidget):
 
     def load_csv_data_by_index(self, file_index):
         """按索引加载CSV数据文件"""
-        import csv
         import os
 
         if file_index >= len(self.csv_file_list):
@@ -1611,59 +1773,29 @@ class RealtimeChart(QWidget):
 
             print(f"📁 加载CSV文件: {file_path}")
 
-            with open(file_path, 'r', encoding='gbk') as file:
-                reader = csv.reader(file)
-                headers = next(reader)
-
-                # 找到目标列
-                measurement_col = None
-                diameter_col = None
-
-                for i, header in enumerate(headers):
-                    if '测量序号' in header:
-                        measurement_col = i
-                    if '计算直径' in header:
-                        diameter_col = i
-
-                if measurement_col is None or diameter_col is None:
-                    print(f"❌ 找不到必需的列")
-                    return False
-
-                # 读取数据
-                self.csv_data = []
-                for row in reader:
-                    try:
-                        if len(row) > max(measurement_col, diameter_col):
-                            measurement_num = int(row[measurement_col])
-                            diameter = float(row[diameter_col])
-                            # 每个测量点对应1.0mm深度
-                            depth = measurement_num * 1.0
-                            self.csv_data.append((depth, diameter))
-                    except (ValueError, IndexError):
-                        continue
-
-                if len(self.csv_data) == 0:
-                    print("❌ 没有有效数据")
-                    return False
-
-                # 计算统计信息
-                depths = [d[0] for d in self.csv_data]
-                diameters = [d[1] for d in self.csv_data]
-
-                min_depth = min(depths)
-                max_depth = max(depths)
-                min_diameter = min(diameters)
-                max_diameter = max(diameters)
-                avg_diameter = sum(diameters) / len(diameters)
-
-                print(f"✅ CSV数据加载成功:")
-                print(f"   数据点数量: {len(self.csv_data)}")
-                print(f"   深度范围: {min_depth:.0f} - {max_depth:.0f} mm")
-                print(f"   直径范围: {min_diameter:.3f} - {max_diameter:.3f} mm")
-                print(f"   平均直径: {avg_diameter:.3f} mm")
-
-                self.csv_avg_diameter = avg_diameter
-                return True
+            table = read_measurement_csv(file_path)
+            if not table.has_column('measurement') or not table.has_column('diameter'):
+                print(f"❌ 找不到必需的列")
+                return False
+
+            self.csv_data = table.take(table.valid_rows('measurement', 'diameter'))
+            self.csv_replay = None
+            if len(self.csv_data) == 0:
+                print("❌ 没有有效数据")
+                return False
+
+            # 计算统计信息
+            depths = self.csv_data.depth
+            stats = StreamingStatistics.from_values(self.csv_data.diameter)
+
+            print(f"✅ CSV数据加载成功:")
+            print(f"   数据点数量: {len(self.csv_data)}")
+            print(f"   深度范围: {depths.min():.0f} - {depths.max():.0f} mm")
+            print(f"   直径范围: {stats.min:.3f} - {stats.max:.3f} mm")
+            print(f"   平均直径: {stats.mean:.3f} mm")
+
+            self.csv_avg_diameter = stats.mean
+            return True
 
         except Exception as e:
             print(f"❌ CSV加载错误: {e}")
@@ -1674,66 +1806,99 @@ class RealtimeChart(QWidget):
         # 标准直径已固定为17.6mm，无需额外设置
         print(f"🎯 使用固定标准直径: {self.standard_diameter} mm")
 
-    def update_csv_data_point(self):
-        """更新CSV数据点"""
-        if self.csv_data_index >= len(self.csv_data):
-            # 播放完成
-            print("✅ CSV数据播放完成")
-            self.stop_csv_data_import()
+    def create_csv_replay_engine(self):
+        """由已加载的CSV数据创建回放引擎（支持测量数据表、字典和元组三种数据格式）"""
+        if isinstance(self.csv_data, MeasurementTable):
+            return CsvReplayEngine(self.csv_data.depth, self.csv_data.diameter, speed=self.csv_replay_speed)
+        depths = np.empty(len(self.csv_data))
+        diameters = np.empty(len(self.csv_data))
+        for i, data_point in enumerate(self.csv_data):
+            if isinstance(data_point, dict):
+                depths[i] = data_point['depth']
+                diameters[i] = data_point['diameter']
+            else:
+                depths[i], diameters[i] = data_point
+        return CsvReplayEngine(depths, diameters, speed=self.csv_replay_speed)
 
-            # 显示最终统计
-            final_max = self.max_diameter if self.max_diameter else 0
-            final_min = self.min_diameter if self.min_diameter else 0
+    def set_csv_replay_speed(self, speed):
+        """设置CSV回放倍速（1x~1000x），播放中立即生效"""
+        if self.csv_replay is not None:
+            speed = self.csv_replay.set_speed(speed)
+        self.csv_replay_speed = speed
+        return speed
 
-            print(f"📊 最终统计:")
-            print(f"   最大圆直径: {final_max:.3f} mm")
-            print(f"   最小圆直径: {final_min:.3f} mm")
-            print(f"   直径范围: {final_max - final_min:.3f} mm")
+    def seek_csv_depth(self, depth):
+        """
+        CSV回放定位到指定深度
 
+        图表重建为该深度之前的全部数据（一个数据块），之后从该深度继续回放，
+        内窥镜图像同步切换到对应位置。
+        """
+        if not self.csv_data:
             return
+        if self.csv_replay is None:
+            self.csv_replay = self.create_csv_replay_engine()
 
-        # 获取当前数据点 - 支持两种数据格式
-        data_point = self.csv_data[self.csv_data_index]
-        if isinstance(data_point, dict):
-            # 新格式：字典
-            depth = data_point['depth']
-            diameter = data_point['diameter']
-        else:
-            # 旧格式：元组
-            depth, diameter = data_point
-
-        # 更新图表
-        self.update_data(depth, diameter)
+        index = self.csv_replay.seek_depth(depth)
+        self.clear_data()
+        replay = self.csv_replay
+        if index > 0:
+            self.update_data_chunk(replay.depths[:index], replay.diameters[:index])
+        self.csv_data_index = index
+        self.update_endoscope_image_by_progress()
+        self.update_plot()
 
-        # 确定样品名称 - 兼容新旧两种模式
+    def _csv_sample_name(self):
+        """当前回放样品名称 - 兼容新旧两种模式"""
         if hasattr(self, 'current_hole_id') and self.current_hole_id:
             # 新模式：使用当前选中的孔位ID
-            sample_name = self.current_hole_id
-        elif hasattr(self, 'csv_file_list') and self.csv_file_list and hasattr(self, 'current_file_index'):
+            return self.current_hole_id
+        if hasattr(self, 'csv_file_list') and self.csv_file_list and hasattr(self, 'current_file_index'):
             # 旧模式：使用文件列表索引
-            try:
-                current_file = self.csv_file_list[self.current_file_index]
-                sample_name = f"H0{self.current_file_index + 1}"
-            except (IndexError, AttributeError):
-                sample_name = "未知样品"
-        else:
-            # 默认模式
-            sample_name = "当前样品"
+            if self.current_file_index < len(self.csv_file_list):
+                return f"H0{self.current_file_index + 1}"
+            return "未知样品"
+        # 默认模式
+        return "当前样品"
+
+    def update_csv_replay_frame(self):
+        """回放定时器每帧调用：推送到期的数据点并同步内窥镜图像"""
+        replay = self.csv_replay
+        if replay is None:
+            return
 
-        self.update_status(sample_name, depth, "测量中")
+        due = replay.advance()
+        if due.stop > due.start:
+            depths = replay.depths[due]
+            diameters = replay.diameters[due]
+            self.update_data_chunk(depths, diameters)
+            self.update_status(self._csv_sample_name(), depths[-1], "测量中")
 
-        # 输出进度（每100个数据点输出一次）
-        if self.csv_data_index % 100 == 0:
-            progress = ((self.csv_data_index + 1) / len(self.csv_data)) * 100
-            current_max = self.max_diameter if self.max_diameter else 0
-            current_min = self.min_diameter if self.min_diameter else 0
-            print(f"📊 测量进度: {progress:.1f}% - 深度: {depth:.0f}mm, 直径: {diameter:.3f}mm | "
-                  f"最大: {current_max:.3f}mm, 最小: {current_min:.3f}mm")
+            # 输出进度（每跨过100个数据点输出一次）
+            if due.start == 0 or due.start // 100 != (due.stop - 1) // 100:
+                current_max = self.max_diameter if self.max_diameter else 0
+                current_min = self.min_diameter if self.min_diameter else 0
+                print(f"📊 测量进度: {replay.progress:.1f}% - 深度: {depths[-1]:.0f}mm, 直径: {diameters[-1]:.3f}mm | "
+                      f"最大: {current_max:.3f}mm, 最小: {current_min:.3f}mm")
 
-        self.csv_data_index += 1
+            self.csv_data_index = replay.index
 
-        # 检查是否需要切换内窥镜图片
-        self.update_endoscope_image_by_progress()
+            # 检查是否需要切换内窥镜图片
+            self.update_endoscope_image_by_progress()
+
+        if replay.finished:
+            # 播放完成
+            print("✅ CSV数据播放完成")
+            self.stop_csv_data_import()
+
+            # 显示最终统计
+            final_max = self.max_diameter if self.max_diameter else 0
+            final_min = self.min_diameter if self.min_diameter else 0
+
+            print(f"📊 最终统计:")
+            print(f"   最大圆直径: {final_max:.3f} mm")
+            print(f"   最小圆直径: {final_min:.3f} mm")
+            print(f"   直径范围: {final_max - final_min:.3f} mm")
 
     def load_endoscope_images_for_hole(self, hole_id):
         """为指定孔位加载内窥镜图片"""
@@ -1774,6 +1939,9 @@ class RealtimeChart(QWidget):
         self.current_images = image_files
         self.current_image_index = 0
 
+        # 后台预先解码本孔位的图像，播放过程中切换时直接显示已就绪的图像
+        self.endoscope_view.prefetch_images(image_files)
+
         print(f"✅ 为孔位 {hole_id} 加载了 {len(image_files)} 张内窥镜图片:")
         for i, img in enumerate(image_files):
             print(f"   {i+1}. {os.path.basename(img)}")
@@ -1857,6 +2025,9 @@ class RealtimeChart(QWidget):
         try:
             # 使用内窥镜视图组件显示图片
             self.endoscope_view.update_image(image_path)
+            # 预取后续图像（已缓存的不会重复解码）
+            self.endoscope_view.prefetch_images(
+                self.current_images[image_index + 1:image_index + 1 + ENDOSCOPE_PREFETCH_COUNT])
             print(f"✅ 显示内窥镜图片: {os.path.basename(image_path)}")
 
         except Exception as e:
@@ -1880,6 +2051,7 @@ if __name__ == "__main__":
     # 创建数据源
     worker = WorkerThread()
     worker.data_updated.connect(chart.update_data)
+    worker.data_chunk_updated.connect(chart.update_data_chunk)
     worker.status_updated.connect(chart.update_status)
     
     # 注意：按钮已经连接到CSV数据导入功能
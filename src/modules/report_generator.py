@@ -4,14 +4,14 @@
 """
 
 import os
-import csv
 import json
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple
-import numpy as np
 
+from .streaming_stats import StreamingStatistics
+from .measurement_csv import read_measurement_csv
 from .report_models import (
     ReportData, ReportConfiguration, ReportType, ReportFormat,
     WorkpieceInfo, HoleQualityData, DefectData, ManualReviewRecord,
@@ -166,50 +166,27 @@ class ReportGenerator:
             # 使用最新的CSV文件
             latest_csv = max(csv_files, key=lambda f: f.stat().st_mtime)
             
-            # 读取CSV数据，尝试多种编码
-            measured_diameters = []
-            encodings = ['utf-8', 'gbk', 'gb2312', 'utf-8-sig']
+            # 读取CSV数据（过滤无效直径）
+            table = read_measurement_csv(latest_csv)
+            diameters = table.diameter
+            measured_diameters = diameters[diameters > 0].tolist()
 
-            for encoding in encodings:
-                try:
-                    with open(latest_csv, 'r', encoding=encoding) as f:
-                        reader = csv.reader(f)
-                        header = next(reader)  # 跳过标题行
-
-                        # 查找直径列的索引（通常是最后一列）
-                        diameter_col_index = -1  # 默认使用最后一列
-
-                        for row in reader:
-                            try:
-                                if len(row) > abs(diameter_col_index):
-                                    diameter = float(row[diameter_col_index])
-                                    if diameter > 0:  # 过滤无效数据
-                                        measured_diameters.append(diameter)
-                            except (ValueError, TypeError, IndexError):
-                                continue
-                    break  # 如果成功读取，跳出循环
-                except (UnicodeDecodeError, FileNotFoundError):
-                    continue  # 尝试下一种编码
-            
             if not measured_diameters:
                 return None
             
-            # 计算质量统计
-            qualified_count = sum(
-                1 for d in measured_diameters
-                if self.standard_diameter - self.lower_tolerance <= d <= self.standard_diameter + self.upper_tolerance
-            )
-            total_count = len(measured_diameters)
-            qualification_rate = (qualified_count / total_count * 100) if total_count > 0 else 0.0
+            # 计算质量统计（一次遍历，汇总时按孔位合并）
+            statistics = StreamingStatistics.from_values(measured_diameters, self._tolerance_band())
+            qualified_count = statistics.in_tolerance_count
+            total_count = statistics.count
+            qualification_rate = statistics.qualification_rate
             is_qualified = qualification_rate >= 95.0  # 95%以上认为合格
             
-            # 计算偏差统计
-            deviations = [d - self.standard_diameter for d in measured_diameters]
+            # 计算偏差统计（偏差 = 直径 - 标准直径，平移不改变标准差）
             deviation_stats = {
-                'min': min(deviations),
-                'max': max(deviations),
-                'avg': np.mean(deviations),
-                'std': np.std(deviations)
+                'min': statistics.min - self.standard_diameter,
+                'max': statistics.max - self.standard_diameter,
+                'avg': statistics.mean - self.standard_diameter,
+                'std': statistics.std
             }
             
             # 估算孔位坐标（基于孔位ID）
@@ -228,13 +205,19 @@ class ReportGenerator:
                 qualification_rate=qualification_rate,
                 is_qualified=is_qualified,
                 deviation_stats=deviation_stats,
-                measurement_timestamp=datetime.fromtimestamp(latest_csv.stat().st_mtime)
+                measurement_timestamp=datetime.fromtimestamp(table.mtime),
+                statistics=statistics
             )
             
         except Exception as e:
             print(f"❌ 收集孔位 {hole_id} 数据失败: {e}")
             return None
     
+    def _tolerance_band(self) -> Tuple[float, float]:
+        """合格判定的公差带 (下限, 上限)"""
+        return (self.standard_diameter - self.lower_tolerance,
+                self.standard_diameter + self.upper_tolerance)
+
     def _estimate_hole_position(self, hole_id: str) -> Tuple[float, float]:
         """根据孔位ID估算坐标位置"""
         try:
@@ -296,19 +279,23 @@ class ReportGenerator:
         # 统计人工复检数量
         manual_review_count = len(manual_reviews)
         
-        # 计算直径统计
-        all_diameters = []
+        # 计算直径统计：合并各孔位的流式统计，不再拼接全部测量值
+        tolerance = self._tolerance_band()
+        combined = StreamingStatistics(tolerance)
         for hole in hole_data:
-            all_diameters.extend(hole.measured_diameters)
+            statistics = hole.statistics
+            if statistics is None or statistics.tolerance != tolerance:
+                statistics = StreamingStatistics.from_values(hole.measured_diameters, tolerance)
+            combined.merge(statistics)
         
         diameter_statistics = {}
-        if all_diameters:
+        if combined.count:
             diameter_statistics = {
-                'min': min(all_diameters),
-                'max': max(all_diameters),
-                'avg': np.mean(all_diameters),
-                'std': np.std(all_diameters),
-                'count': len(all_diameters)
+                'min': combined.min,
+                'max': combined.max,
+                'avg': combined.mean,
+                'std': combined.std,
+                'count': combined.count
             }
         
         return QualitySummary(
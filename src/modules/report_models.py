@@ -56,6 +56,7 @@ class HoleQualityData:
     is_qualified: bool
     deviation_stats: Dict[str, float]  # min, max, avg, std
     measurement_timestamp: Optional[datetime] = None
+    statistics: Optional[Any] = None  # StreamingStatistics，用于跨孔位合并汇总
 
 
 @dataclass
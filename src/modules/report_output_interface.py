@@ -11,7 +11,7 @@ from typing import List, Dict, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QComboBox, QGroupBox, QTextEdit,
-    QTableWidget, QTableWidgetItem, QProgressBar, QSplitter,
+    QTableWidget, QTableWidgetItem, QTableView, QProgressBar, QSplitter,
     QCheckBox, QSpinBox, QLineEdit, QFileDialog, QMessageBox,
     QTabWidget, QScrollArea, QFrame, QHeaderView, QDialog, QMenu
 )
@@ -25,6 +25,7 @@ from .report_models import (
 from .report_generator import ReportGenerator
 from .report_history_manager import ReportHistoryManager
 from .report_templates import ReportTemplateManager
+from .table_models import HoleQualityTableModel
 
 try:
     from .pdf_report_generator import PDFReportGenerator
@@ -436,19 +437,20 @@ class ReportOutputInterface(QWidget):
         table_group = QGroupBox("孔位数据")
         table_layout = QVBoxLayout(table_group)
 
-        self.hole_data_table = QTableWidget()
+        self.hole_data_model = HoleQualityTableModel(self)
+        self.hole_data_table = QTableView()
+        self.hole_data_table.setModel(self.hole_data_model)
         # 隐藏默认的垂直表头，解决左上角空白问题
         self.hole_data_table.verticalHeader().setVisible(False)
-        self.hole_data_table.setColumnCount(7)  # 增加序号列，从6列改为7列
-        self.hole_data_table.setHorizontalHeaderLabels([
-            "序号", "孔位ID", "位置(X,Y)", "合格率", "测量次数", "状态", "最后测量时间"
-        ])
         
         # 设置表格属性
         header = self.hole_data_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         self.hole_data_table.setAlternatingRowColors(True)
-        self.hole_data_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.hole_data_table.setSelectionBehavior(QTableView.SelectRows)
+        self.hole_data_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.hole_data_table.setSortingEnabled(True)
+        self.hole_data_table.sortByColumn(-1, Qt.AscendingOrder)  # 初始保持孔位顺序
         
         table_layout.addWidget(self.hole_data_table)
         preview_layout.addWidget(table_group)
@@ -603,44 +605,8 @@ class ReportOutputInterface(QWidget):
         self.db_qualification_rate_bar.setFormat(f"{summary.qualification_rate:.1f} %")
     
     def update_hole_data_table(self, report_data: ReportData):
-        """更新孔位数据表格"""
-        all_holes = report_data.qualified_holes + report_data.unqualified_holes
-        
-        self.hole_data_table.setRowCount(len(all_holes))
-        
-        for row, hole in enumerate(all_holes):
-            # 序号列（新增）
-            seq_item = QTableWidgetItem(str(row + 1))
-            seq_item.setTextAlignment(Qt.AlignCenter)
-            self.hole_data_table.setItem(row, 0, seq_item)
-
-            # 孔位ID（原第0列，现在是第1列）
-            self.hole_data_table.setItem(row, 1, QTableWidgetItem(hole.hole_id))
-
-            # 位置（原第1列，现在是第2列）
-            position_text = f"({hole.position_x:.1f}, {hole.position_y:.1f})"
-            self.hole_data_table.setItem(row, 2, QTableWidgetItem(position_text))
-
-            # 合格率（原第2列，现在是第3列）
-            rate_text = f"{hole.qualification_rate:.1f}%"
-            self.hole_data_table.setItem(row, 3, QTableWidgetItem(rate_text))
-
-            # 测量次数（原第3列，现在是第4列）
-            count_text = f"{hole.qualified_count}/{hole.total_count}"
-            self.hole_data_table.setItem(row, 4, QTableWidgetItem(count_text))
-
-            # 状态（原第4列，现在是第5列）
-            status_text = "合格" if hole.is_qualified else "不合格"
-            status_item = QTableWidgetItem(status_text)
-            if hole.is_qualified:
-                status_item.setBackground(QPalette().color(QPalette.ColorRole.Base))
-            else:
-                status_item.setBackground(QPalette().color(QPalette.ColorRole.AlternateBase))
-            self.hole_data_table.setItem(row, 5, status_item)
-
-            # 最后测量时间（原第5列，现在是第6列）
-            time_text = hole.measurement_timestamp.strftime("%Y-%m-%d %H:%M") if hole.measurement_timestamp else "未知"
-            self.hole_data_table.setItem(row, 6, QTableWidgetItem(time_text))
+        """更新孔位数据表格（模型按列保存数据，单元格文本在显示时格式化）"""
+        self.hole_data_model.set_holes(report_data.qualified_holes + report_data.unqualified_holes)
     
     def preview_report(self):
         """预览报告"""
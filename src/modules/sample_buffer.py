@@ -0,0 +1,162 @@
+"""
+测量样本环形缓冲区
+预分配的float64缓冲，O(1)追加，提供连续内存视图和滚动最小/最大/均值统计
+"""
+
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+class SampleRingBuffer:
+    """
+    保留最近 capacity 个样本的float64缓冲区
+
+    数据在长度为 2*capacity 的数组中线性写入，写满后把最近 capacity 个样本
+    复制到新分配的数组开头（均摊O(1)）。因此 view() 总是连续内存，可以直接
+    传给 matplotlib 的 set_data 而无需复制；追加只写入视图之外的位置，
+    已返回的视图内容不会被后续追加修改。
+
+    与原先使用的 deque 保持兼容：支持 append/clear/len/迭代/下标访问。
+    """
+
+    def __init__(self, capacity: int):
+        """
+        初始化缓冲区
+
+        Args:
+            capacity: 保留的最大样本数
+        """
+        if capacity < 1:
+            raise ValueError(f"缓冲区容量必须大于0: {capacity}")
+        self.capacity = int(capacity)
+        self._data = np.empty(2 * self.capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+        # 滚动统计：和在追加/淘汰时增量维护，极值在被淘汰时才重新计算
+        self._sum = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+        self._extremes_dirty = False
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+    def append(self, value: float) -> None:
+        """追加一个样本"""
+        if self._end == len(self._data):
+            self._compact()
+        if self._end - self._start == self.capacity:
+            self._evict(self._data[self._start:self._start + 1])
+            self._start += 1
+
+        value = float(value)
+        self._data[self._end] = value
+        self._end += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def extend(self, values) -> None:
+        """批量追加样本（向量化）"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        if values.size >= self.capacity:
+            # 新数据本身已超过容量，只保留最后 capacity 个
+            self.clear()
+            values = values[-self.capacity:]
+
+        if self._end + values.size > len(self._data):
+            self._compact()
+        overflow = (self._end - self._start) + values.size - self.capacity
+        if overflow > 0:
+            self._evict(self._data[self._start:self._start + overflow])
+            self._start += overflow
+
+        self._data[self._end:self._end + values.size] = values
+        self._end += values.size
+        self._sum += float(values.sum())
+        if not self._extremes_dirty:
+            self._min = min(self._min, float(values.min()))
+            self._max = max(self._max, float(values.max()))
+
+    def clear(self) -> None:
+        """清空缓冲区（使用新数组，已返回的视图不受影响）"""
+        self._data = np.empty(2 * self.capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._sum = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+        self._extremes_dirty = False
+
+    def _compact(self) -> None:
+        """将保留的样本移到新数组开头，旧视图保持不变"""
+        count = self._end - self._start
+        data = np.empty_like(self._data)
+        data[:count] = self._data[self._start:self._end]
+        self._data = data
+        self._start = 0
+        self._end = count
+        # 顺便重新求和，消除长时间增量更新的舍入误差
+        self._sum = float(data[:count].sum())
+
+    def _evict(self, evicted: np.ndarray) -> None:
+        """更新被淘汰样本对统计的影响"""
+        self._sum -= float(evicted.sum())
+        if not self._extremes_dirty and (evicted.min() <= self._min or evicted.max() >= self._max):
+            self._extremes_dirty = True
+
+    # ------------------------------------------------------------------
+    # 读取
+    # ------------------------------------------------------------------
+    def view(self) -> np.ndarray:
+        """返回按时间顺序排列的连续只读视图（不复制）"""
+        view = self._data[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.view().tolist())
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    # ------------------------------------------------------------------
+    # 统计
+    # ------------------------------------------------------------------
+    def _refresh_extremes(self) -> None:
+        if self._extremes_dirty:
+            view = self.view()
+            self._min = float(view.min()) if len(view) else np.inf
+            self._max = float(view.max()) if len(view) else -np.inf
+            self._extremes_dirty = False
+
+    @property
+    def min(self) -> Optional[float]:
+        """当前样本最小值，空时为None"""
+        if not len(self):
+            return None
+        self._refresh_extremes()
+        return self._min
+
+    @property
+    def max(self) -> Optional[float]:
+        """当前样本最大值，空时为None"""
+        if not len(self):
+            return None
+        self._refresh_extremes()
+        return self._max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """当前样本均值，空时为None"""
+        count = len(self)
+        return self._sum / count if count else None
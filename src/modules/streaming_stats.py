@@ -0,0 +1,310 @@
+"""
+流式统计模块
+按样本块增量更新的直径统计：Welford均值/方差、最小/最大值、公差内外计数和分位数草图。
+统计对象可跨孔位合并，实时图表、历史数据查看器和报告生成器共用，无需重新扫描完整数组。
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+# 分位数草图默认分辨率（mm），分位数误差不超过半个分辨率
+DEFAULT_SKETCH_RESOLUTION = 0.001
+# 草图最大桶数，超过后分辨率加倍
+DEFAULT_SKETCH_MAX_BINS = 65536
+
+
+class QuantileSketch:
+    """
+    等宽直方图分位数草图
+
+    样本按 floor(x / resolution) 落入整数桶，计数存放在连续数组中；取值跨度
+    超过 max_bins 时相邻桶两两合并、分辨率加倍，因此内存有界。分辨率只会按
+    2的幂变化，同一基准分辨率的草图可以直接合并。
+    """
+
+    def __init__(self, resolution: float = DEFAULT_SKETCH_RESOLUTION,
+                 max_bins: int = DEFAULT_SKETCH_MAX_BINS):
+        """
+        初始化草图
+
+        Args:
+            resolution: 桶宽
+            max_bins: 最大桶数
+        """
+        if resolution <= 0:
+            raise ValueError(f"草图分辨率必须大于0: {resolution}")
+        self.resolution = float(resolution)
+        self.max_bins = max(2, int(max_bins))
+        self._offset = 0
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        """样本总数"""
+        return int(self._counts.sum())
+
+    def add(self, values) -> None:
+        """批量加入样本"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        keys = np.floor(values / self.resolution).astype(np.int64)
+        self._add_keys(keys, np.ones(len(keys), dtype=np.int64))
+
+    def add_value(self, value: float) -> None:
+        """加入单个样本（逐点输入的快速路径）"""
+        index = math.floor(value / self.resolution) - self._offset
+        if len(self._counts) and 0 <= index < len(self._counts):
+            self._counts[index] += 1
+        else:
+            self.add((value,))
+
+    def _add_keys(self, keys: np.ndarray, weights: np.ndarray) -> None:
+        """按桶号加入计数（桶号对应当前分辨率）"""
+        low, high = int(keys.min()), int(keys.max())
+        if len(self._counts):
+            low = min(low, self._offset)
+            high = max(high, self._offset + len(self._counts) - 1)
+
+        # 跨度过大时合并相邻桶
+        while high - low + 1 > self.max_bins:
+            self._coarsen()
+            keys = np.floor_divide(keys, 2)
+            low, high = low // 2, high // 2
+
+        if not len(self._counts):
+            self._offset = low
+            self._counts = np.zeros(high - low + 1, dtype=np.int64)
+        elif low < self._offset or high >= self._offset + len(self._counts):
+            counts = np.zeros(high - low + 1, dtype=np.int64)
+            start = self._offset - low
+            counts[start:start + len(self._counts)] = self._counts
+            self._counts = counts
+            self._offset = low
+
+        self._counts += np.bincount(keys - self._offset, weights=weights,
+                                    minlength=len(self._counts)).astype(np.int64)
+
+    def _coarsen(self) -> None:
+        """分辨率加倍，相邻桶两两合并"""
+        self.resolution *= 2
+        if not len(self._counts):
+            return
+        keys = np.arange(self._offset, self._offset + len(self._counts)) // 2
+        offset = int(keys[0])
+        self._counts = np.bincount(keys - offset, weights=self._counts).astype(np.int64)
+        self._offset = offset
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """合并另一个草图（两者基准分辨率须相同）"""
+        if not len(other._counts):
+            return
+        other_resolution = other.resolution
+        keys = np.arange(other._offset, other._offset + len(other._counts))
+        while self.resolution < other_resolution * (1 - 1e-9):
+            self._coarsen()
+        while other_resolution < self.resolution * (1 - 1e-9):
+            keys = keys // 2
+            other_resolution *= 2
+        if not math.isclose(other_resolution, self.resolution):
+            raise ValueError("分位数草图的基准分辨率不一致，无法合并")
+        self._add_keys(keys, other._counts)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        估计分位数
+
+        Args:
+            q: 0~1之间的分位点
+
+        Returns:
+            Optional[float]: 所在桶的中点，无样本时为None
+        """
+        total = self.count
+        if total == 0:
+            return None
+        q = min(max(float(q), 0.0), 1.0)
+        rank = max(1, math.ceil(q * total))
+        index = int(np.searchsorted(np.cumsum(self._counts), rank))
+        return (self._offset + index + 0.5) * self.resolution
+
+    def copy(self) -> "QuantileSketch":
+        """复制草图"""
+        sketch = QuantileSketch(self.resolution, self.max_bins)
+        sketch._offset = self._offset
+        sketch._counts = self._counts.copy()
+        return sketch
+
+
+class StreamingStatistics:
+    """
+    流式直径统计
+
+    update() 对一块样本做向量化汇总，再用并行方差公式（Chan等）合并到
+    累计量，数值上与逐个Welford更新等价；add() 为逐点输入的快速路径。
+    merge() 合并另一组统计（如多个孔位汇总），结果与对全部样本一次统计一致。
+    """
+
+    def __init__(self, tolerance: Optional[Tuple[float, float]] = None,
+                 sketch_resolution: float = DEFAULT_SKETCH_RESOLUTION):
+        """
+        初始化
+
+        Args:
+            tolerance: (下限, 上限)，给出时统计公差内外样本数（含边界为合格）
+            sketch_resolution: 分位数草图分辨率
+        """
+        self.tolerance = tuple(tolerance) if tolerance is not None else None
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self.below_count = 0
+        self.above_count = 0
+        self.sketch = QuantileSketch(sketch_resolution)
+
+    @classmethod
+    def from_values(cls, values, tolerance: Optional[Tuple[float, float]] = None) -> "StreamingStatistics":
+        """由一组样本直接构建统计"""
+        stats = cls(tolerance)
+        stats.update(values)
+        return stats
+
+    # ------------------------------------------------------------------
+    # 更新
+    # ------------------------------------------------------------------
+    def update(self, values) -> None:
+        """加入一块样本（向量化）"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n = len(values)
+        if n == 0:
+            return
+
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(np.square(values - chunk_mean).sum())
+        self._combine(n, chunk_mean, chunk_m2, float(values.min()), float(values.max()))
+
+        if self.tolerance is not None:
+            lower, upper = self.tolerance
+            self.below_count += int(np.count_nonzero(values < lower))
+            self.above_count += int(np.count_nonzero(values > upper))
+        self.sketch.add(values)
+
+    def add(self, value: float) -> None:
+        """加入单个样本（Welford更新）"""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+        if self.tolerance is not None:
+            if value < self.tolerance[0]:
+                self.below_count += 1
+            elif value > self.tolerance[1]:
+                self.above_count += 1
+        self.sketch.add_value(value)
+
+    def _combine(self, n: int, mean: float, m2: float, minimum: float, maximum: float) -> None:
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self._min = min(self._min, minimum)
+        self._max = max(self._max, maximum)
+
+    def merge(self, other: "StreamingStatistics") -> "StreamingStatistics":
+        """合并另一组统计（原地），返回自身便于链式汇总"""
+        if other.count == 0:
+            return self
+        if self.tolerance != other.tolerance:
+            raise ValueError("公差不同的统计无法合并")
+        self._combine(other.count, other.mean, other._m2, other._min, other._max)
+        self.below_count += other.below_count
+        self.above_count += other.above_count
+        self.sketch.merge(other.sketch)
+        return self
+
+    @classmethod
+    def merged(cls, stats_list: Iterable["StreamingStatistics"],
+               tolerance: Optional[Tuple[float, float]] = None) -> "StreamingStatistics":
+        """汇总多组统计为新对象"""
+        result = cls(tolerance)
+        for stats in stats_list:
+            result.merge(stats)
+        return result
+
+    def clear(self) -> None:
+        """清空统计（保留公差设置）"""
+        self.__init__(self.tolerance, self.sketch.resolution)
+
+    # ------------------------------------------------------------------
+    # 结果
+    # ------------------------------------------------------------------
+    @property
+    def min(self) -> Optional[float]:
+        """最小值，无样本时为None"""
+        return self._min if self.count else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """最大值，无样本时为None"""
+        return self._max if self.count else None
+
+    @property
+    def variance(self) -> float:
+        """总体方差（与 np.var 一致）"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """总体标准差（与 np.std 一致）"""
+        return math.sqrt(max(self.variance, 0.0))
+
+    @property
+    def out_of_tolerance_count(self) -> int:
+        """超差样本数"""
+        return self.below_count + self.above_count
+
+    @property
+    def in_tolerance_count(self) -> int:
+        """公差内样本数"""
+        return self.count - self.out_of_tolerance_count
+
+    @property
+    def qualification_rate(self) -> float:
+        """合格率（百分比）"""
+        return self.in_tolerance_count / self.count * 100 if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """估计分位数（限制在实际最小/最大值之间，0和1分位返回精确的最小/最大值）"""
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        if q <= 0:
+            return self._min
+        if q >= 1:
+            return self._max
+        return min(max(value, self._min), self._max)
+
+    def to_dict(self) -> Dict[str, float]:
+        """常用统计量字典"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.min,
+            'max': self.max,
+            'median': self.quantile(0.5),
+            'in_tolerance': self.in_tolerance_count,
+            'out_of_tolerance': self.out_of_tolerance_count
+        }
@@ -0,0 +1,328 @@
+"""
+按列存储的只读表格模型
+测量数据表和孔位数据表共用：数据以NumPy数组按列保存，单元格文本在 data() 中按需格式化，
+排序只重排行号数组（argsort），行颜色由布尔掩码决定，不为每个单元格创建控件项。
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QPalette
+
+
+# 合格/不合格单元格背景色，与原测量数据表一致
+QUALIFIED_COLOR = QColor(Qt.GlobalColor.green)
+UNQUALIFIED_COLOR = QColor(Qt.GlobalColor.red)
+
+# 按内容调整列宽时采样的行数（各行格式一致，无需遍历全部行）
+RESIZE_SAMPLE_ROWS = 100
+
+
+def _object_array(values: Sequence) -> np.ndarray:
+    """构造一维对象数组（元素本身是序列时也不展开）"""
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _timestamp_keys(timestamps: np.ndarray) -> np.ndarray:
+    """时间列的排序键：无时间的行排在最前"""
+    return np.array([t.timestamp() if hasattr(t, 'timestamp') else -np.inf for t in timestamps],
+                    dtype=np.float64)
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    按列存储的只读表格模型基类
+
+    子类设置 HEADERS，并实现 format_cell()、sort_keys()，可选实现 cell_background()。
+    视图行号经 _order 映射到数据行号（source row），排序只重排 _order。
+    """
+
+    HEADERS: Sequence[str] = ()
+    # 居中显示的列
+    CENTERED_COLUMNS: Sequence[int] = (0,)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_count = 0
+        self._order = np.arange(0)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    # ---- 子类接口 ----
+
+    def format_cell(self, row: int, column: int) -> str:
+        """数据行 row 第 column 列的显示文本"""
+        raise NotImplementedError
+
+    def sort_keys(self, column: int) -> List[np.ndarray]:
+        """第 column 列的排序键（主键在前），每个键长度等于行数"""
+        raise NotImplementedError
+
+    def cell_background(self, row: int, column: int) -> Optional[QColor]:
+        """数据行 row 第 column 列的背景色，None 为默认"""
+        return None
+
+    # ---- 数据更新 ----
+
+    def _reset_rows(self, row_count: int, load):
+        """在 beginResetModel/endResetModel 之间调用 load() 替换数据，并保持当前排序"""
+        self.beginResetModel()
+        load()
+        self._row_count = row_count
+        self._order = np.arange(row_count)
+        if self._sort_column >= 0 and row_count:
+            self._order = self._sorted_order(self._sort_column, self._sort_order)
+        self.endResetModel()
+
+    def source_row(self, row: int) -> int:
+        """视图行号对应的数据行号"""
+        return int(self._order[row])
+
+    # ---- QAbstractTableModel ----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section] if 0 <= section < len(self.HEADERS) else None
+        return str(section + 1)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._row_count:
+            return None
+        row = int(self._order[index.row()])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.format_cell(row, index.column())
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.cell_background(row, index.column())
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() in self.CENTERED_COLUMNS:
+            return int(Qt.AlignmentFlag.AlignCenter)
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+
+    def _sorted_order(self, column: int, order) -> np.ndarray:
+        keys = self.sort_keys(column)
+        # lexsort 以最后一个键为主键，稳定排序
+        result = np.lexsort(tuple(reversed(keys))) if len(keys) > 1 else np.argsort(keys[0], kind='stable')
+        if order == Qt.SortOrder.DescendingOrder:
+            result = result[::-1]
+        return result
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """按列排序；column 为 -1 时恢复数据原始顺序"""
+        if column >= len(self.HEADERS):
+            return
+        self._sort_column = max(column, -1)
+        self._sort_order = order
+        if not self._row_count:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        source_rows = [int(self._order[index.row()]) for index in persistent]
+        if self._sort_column < 0:
+            self._order = np.arange(self._row_count)
+        else:
+            self._order = self._sorted_order(column, order)
+        # 选中项等持久索引跟随数据行移动
+        positions = np.empty(self._row_count, dtype=np.intp)
+        positions[self._order] = np.arange(self._row_count)
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(positions[row]), index.column()) for row, index in zip(source_rows, persistent)])
+        self.layoutChanged.emit()
+
+
+class MeasurementTableModel(ColumnarTableModel):
+    """历史数据查看器的测量数据表模型"""
+
+    HEADERS = ("序号", "位置(mm)", "直径(mm)", "通道1值(μm)", "通道2值(μm)", "通道3值(μm)",
+               "合格", "时间", "操作员", "备注")
+    QUALIFIED_COLUMN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._load_empty()
+
+    def _load_empty(self):
+        empty = np.empty(0)
+        self.positions = self.diameters = self.timestamps = empty
+        self.channels = np.empty((0, 3))
+        self.qualified = np.empty(0, dtype=bool)
+        self.operators = self.notes = np.empty(0, dtype=object)
+
+    def clear(self):
+        """清空表格"""
+        self._reset_rows(0, self._load_empty)
+
+    def set_columns(self, columns: Dict[str, np.ndarray], operators: Optional[np.ndarray] = None,
+                    notes: Optional[np.ndarray] = None):
+        """
+        直接使用按列存储的测量数据（read_probe_columns 的结果），不复制、不逐行处理
+
+        Args:
+            columns: position、diameter、channel1~3、is_qualified 数组，timestamp 为POSIX时间（NaN为无时间）
+            operators: 操作员对象数组，默认全部为空
+            notes: 人工复查记录对象数组（未复查的行为None），默认没有复查
+        """
+        row_count = len(columns['diameter'])
+
+        def load():
+            self.positions = np.asarray(columns['position'], dtype=np.float64)
+            self.diameters = np.asarray(columns['diameter'], dtype=np.float64)
+            self.channels = np.column_stack([np.asarray(columns[name], dtype=np.float64)
+                                             for name in ('channel1', 'channel2', 'channel3')])
+            self.qualified = np.asarray(columns['is_qualified'], dtype=bool)
+            self.timestamps = np.asarray(columns['timestamp'], dtype=np.float64)
+            self.operators = operators if operators is not None else np.full(row_count, '', dtype=object)
+            self.notes = notes if notes is not None else np.full(row_count, None, dtype=object)
+
+        self._reset_rows(row_count, load)
+
+    def set_measurements(self, measurements: List[dict]):
+        """
+        设置逐行字典形式的测量数据（人工复查后等仍按行保存的数据）
+
+        Args:
+            measurements: 测量记录列表（position/depth、diameter、channel1~3、is_qualified、
+                timestamp、operator，以及人工复查后的 manual_review_value 等字段）
+        """
+        columns = {
+            'position': np.array([m.get('position', m.get('depth', 0)) for m in measurements], dtype=np.float64),
+            'diameter': np.array([m.get('diameter', 0) for m in measurements], dtype=np.float64),
+            'is_qualified': np.array([bool(m.get('is_qualified', True)) for m in measurements], dtype=bool),
+            'timestamp': np.array([m['timestamp'].timestamp() if hasattr(m.get('timestamp'), 'timestamp')
+                                   else np.nan for m in measurements], dtype=np.float64),
+        }
+        for name in ('channel1', 'channel2', 'channel3'):
+            columns[name] = np.array([m.get(name, 0) for m in measurements], dtype=np.float64)
+        self.set_columns(
+            columns,
+            operators=_object_array([m.get('operator', '--') for m in measurements]),
+            # 只有实际进行了人工复查的行才有备注，其余行在显示时为空
+            notes=_object_array([m if 'manual_review_value' in m else None for m in measurements]))
+
+    def format_cell(self, row: int, column: int) -> str:
+        if column == 0:
+            return str(row + 1)
+        if column == 1:
+            return f"{self.positions[row]:.1f}"
+        if column == 2:
+            return f"{self.diameters[row]:.4f}"
+        if 3 <= column <= 5:
+            return f"{self.channels[row, column - 3]:.2f}"
+        if column == self.QUALIFIED_COLUMN:
+            return "✓" if self.qualified[row] else "✗"
+        if column == 7:
+            timestamp = self.timestamps[row]
+            return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S") if np.isfinite(timestamp) else "--"
+        if column == 8:
+            return str(self.operators[row])
+        if column == 9:
+            review = self.notes[row]
+            if review is None:
+                return ""
+            return (f"人工复查值: {review['manual_review_value']:.4f}mm, "
+                    f"复查员: {review.get('reviewer', '未知')}, 复查时间: {review.get('review_time', '')}")
+        return ""
+
+    def cell_background(self, row: int, column: int) -> Optional[QColor]:
+        if column == self.QUALIFIED_COLUMN:
+            return QUALIFIED_COLOR if self.qualified[row] else UNQUALIFIED_COLOR
+        return None
+
+    def sort_keys(self, column: int) -> List[np.ndarray]:
+        if column == 0:
+            return [np.arange(self._row_count)]
+        if column == 1:
+            return [self.positions]
+        if column == 2:
+            return [self.diameters]
+        if 3 <= column <= 5:
+            return [self.channels[:, column - 3]]
+        if column == self.QUALIFIED_COLUMN:
+            return [self.qualified]
+        if column == 7:
+            # 无时间的行排在最前
+            return [np.where(np.isnan(self.timestamps), -np.inf, self.timestamps)]
+        if column == 8:
+            return [self.operators.astype(str)]
+        return [np.array([self.format_cell(row, column) for row in range(self._row_count)])]
+
+
+class HoleQualityTableModel(ColumnarTableModel):
+    """报告输出界面的孔位数据表模型"""
+
+    HEADERS = ("序号", "孔位ID", "位置(X,Y)", "合格率", "测量次数", "状态", "最后测量时间")
+    STATUS_COLUMN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._load_holes([])
+
+    def _load_holes(self, holes):
+        self.hole_ids = _object_array([hole.hole_id for hole in holes])
+        self.position_x = np.array([hole.position_x for hole in holes], dtype=np.float64)
+        self.position_y = np.array([hole.position_y for hole in holes], dtype=np.float64)
+        self.qualification_rates = np.array([hole.qualification_rate for hole in holes], dtype=np.float64)
+        self.qualified_counts = np.array([hole.qualified_count for hole in holes], dtype=np.int64)
+        self.total_counts = np.array([hole.total_count for hole in holes], dtype=np.int64)
+        self.qualified = np.array([bool(hole.is_qualified) for hole in holes], dtype=bool)
+        self.timestamps = _object_array([hole.measurement_timestamp for hole in holes])
+
+    def set_holes(self, holes: list):
+        """
+        设置孔位质量数据
+
+        Args:
+            holes: HoleQualityData 列表
+        """
+        self._reset_rows(len(holes), lambda: self._load_holes(holes))
+
+    def format_cell(self, row: int, column: int) -> str:
+        if column == 0:
+            return str(row + 1)
+        if column == 1:
+            return str(self.hole_ids[row])
+        if column == 2:
+            return f"({self.position_x[row]:.1f}, {self.position_y[row]:.1f})"
+        if column == 3:
+            return f"{self.qualification_rates[row]:.1f}%"
+        if column == 4:
+            return f"{self.qualified_counts[row]}/{self.total_counts[row]}"
+        if column == self.STATUS_COLUMN:
+            return "合格" if self.qualified[row] else "不合格"
+        if column == 6:
+            timestamp = self.timestamps[row]
+            return timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else "未知"
+        return ""
+
+    def cell_background(self, row: int, column: int) -> Optional[QColor]:
+        if column == self.STATUS_COLUMN:
+            role = QPalette.ColorRole.Base if self.qualified[row] else QPalette.ColorRole.AlternateBase
+            return QPalette().color(role)
+        return None
+
+    def sort_keys(self, column: int) -> List[np.ndarray]:
+        if column == 0:
+            return [np.arange(self._row_count)]
+        if column == 1:
+            return [self.hole_ids.astype(str)]
+        if column == 2:
+            return [self.position_x, self.position_y]
+        if column == 3:
+            return [self.qualification_rates]
+        if column == 4:
+            return [self.qualified_counts, self.total_counts]
+        if column == self.STATUS_COLUMN:
+            return [self.qualified]
+        return [_timestamp_keys(self.timestamps)]
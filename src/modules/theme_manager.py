@@ -283,10 +283,8 @@ QScrollArea {{
 }}
 
 /* 异常列表项悬停效果 */
-QWidget#anomaly_content QLabel:hover {{
+QListView#anomaly_list::item:hover {{
     background-color: {cls.COLORS['hover']};
-    border-radius: 3px;
-    padding: 2px;
 }}
 
 /* 列表项通用悬停效果 */
@@ -630,25 +628,18 @@ QLabel#AnomalyTitle {{
     background-color: transparent;
 }}
 
-/* 异常滚动区域 */
-QScrollArea#anomaly_scroll {{
+/* 异常区间列表 */
+QListView#anomaly_list {{
     border: 1px solid {cls.COLORS['border_normal']};
     border-radius: 3px;
     background-color: {cls.COLORS['background_secondary']};
+    font-size: 10px;
 }}
-
-/* 异常内容区域 */
-QWidget#anomaly_content {{
-    background-color: transparent;
-}}
-QWidget#anomaly_content > QWidget {{
+QListView#anomaly_list::item {{
     background-color: #4F3A3A;
     border-radius: 4px;
     margin-bottom: 4px;
-}}
-QWidget#anomaly_content QLabel {{
-    color: #FFC0CB;
-    background-color: transparent;
+    padding: 2px 5px;
 }}
 
 /* 异常统计区域 */
@@ -9,19 +9,30 @@ import numpy as np
 from PySide6.QtCore import QThread, Signal
 
 
+# 批量模式下每块数据的发送间隔（秒），约等于一个UI帧
+CHUNK_INTERVAL = 1.0 / 30
+
+
 class WorkerThread(QThread):
     """
     数据工作线程类
     继承自QThread，专门用于后台数据处理和信号发射
+
+    逐点模式下每个样本发射一次 data_updated；批量模式（batched=True）下
+    按测量频率累积样本，每个UI帧发射一次 data_chunk_updated（NumPy数组），
+    状态信号只在孔位或通信状态变化时发射，适用于kHz级采样率。
     """
     
     # 定义信号：传递测量数据 (深度, 直径值)
     data_updated = Signal(float, float)  # depth, diameter
+
+    # 定义信号：批量传递测量数据 (深度数组, 直径数组)
+    data_chunk_updated = Signal(object, object)  # np.ndarray depths, np.ndarray diameters
     
     # 定义信号：传递状态信息
     status_updated = Signal(str, float, str)  # hole_id, probe_depth, comm_status
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, batched=False):
         super().__init__(parent)
         self.running = False
         self.hole_id = "H001"
@@ -33,11 +44,22 @@ class WorkerThread(QThread):
         self.tolerance = 0.5  # 公差 ±0.5mm
         self.noise_level = 0.05  # 噪声水平
         self.measurement_frequency = 50  # 测量频率 50Hz
+        self.depth_step = 1.0  # 每个样本探头深入1.0mm
+        self.max_depth = 900.0  # 测量完成深度
+
+        # 批量模式参数
+        self.batched = batched
+        self.chunk_interval = CHUNK_INTERVAL
+        self.samples_emitted = 0
+        self.chunks_emitted = 0
+        self._rng = np.random.default_rng()
         
     def start_measurement(self, hole_id="H001"):
         """开始测量指定孔"""
         self.hole_id = hole_id
         self.probe_depth = 0.0
+        self.samples_emitted = 0
+        self.chunks_emitted = 0
         self.running = True
         self.start()
         
@@ -49,11 +71,16 @@ class WorkerThread(QThread):
     def run(self):
         """线程主循环 - 模拟数据采集"""
         print(f"开始测量孔 {self.hole_id}")
+
+        if self.batched:
+            self.run_batched()
+            print(f"孔 {self.hole_id} 测量线程结束")
+            return
         
         while self.running:
             try:
                 # 模拟探头深度递增
-                self.probe_depth += 1.0  # 每次深入1.0mm（适应更大深度范围）
+                self.probe_depth += self.depth_step  # 每次深入1.0mm（适应更大深度范围）
 
                 # 模拟直径测量值（带噪声）
                 base_diameter = self.target_diameter
@@ -80,7 +107,7 @@ class WorkerThread(QThread):
                 time.sleep(1.0 / self.measurement_frequency)
 
                 # 模拟测量完成条件（深度达到900mm）
-                if self.probe_depth >= 900.0:
+                if self.probe_depth >= self.max_depth:
                     print(f"孔 {self.hole_id} 测量完成")
                     self.running = False
                     
@@ -91,6 +118,52 @@ class WorkerThread(QThread):
                 
         print(f"孔 {self.hole_id} 测量线程结束")
 
+    def run_batched(self):
+        """批量模式主循环 - 按测量频率补齐样本，每帧发射一块"""
+        total_samples = int(round(self.max_depth / self.depth_step))
+        start_time = time.perf_counter()
+        last_status = None
+
+        while self.running:
+            try:
+                # 按测量频率计算到当前时刻应产生的样本数
+                elapsed = time.perf_counter() - start_time
+                due = int(elapsed * self.measurement_frequency) - self.samples_emitted
+                count = min(due, total_samples - self.samples_emitted)
+
+                if count > 0:
+                    depths, diameters = self.generate_chunk(count)
+                    self.samples_emitted += count
+                    self.chunks_emitted += 1
+                    self.probe_depth = float(depths[-1])
+                    self.data_chunk_updated.emit(depths, diameters)
+
+                # 状态只在变化时发射，探头深度随数据块更新
+                status = (self.hole_id, self.comm_status)
+                if status != last_status:
+                    last_status = status
+                    self.status_updated.emit(self.hole_id, self.probe_depth, self.comm_status)
+
+                if self.samples_emitted >= total_samples:
+                    print(f"孔 {self.hole_id} 测量完成")
+                    self.running = False
+                    break
+
+                time.sleep(self.chunk_interval)
+
+            except Exception as e:
+                print(f"数据采集错误: {e}")
+                self.comm_status = "通信异常"
+                time.sleep(0.1)
+
+    def generate_chunk(self, count):
+        """向量化生成紧接已发射样本之后的 count 个样本"""
+        indices = np.arange(self.samples_emitted + 1, self.samples_emitted + count + 1)
+        depths = indices * self.depth_step
+        depth_variation = 0.1 * np.sin(depths * 0.01)
+        noise = self._rng.normal(0, self.noise_level, count)
+        return depths, self.target_diameter + depth_variation + noise
+
 
 class DataSimulator:
     """
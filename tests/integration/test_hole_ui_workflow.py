@@ -158,11 +158,13 @@ class TestHoleUIWorkflow(unittest.TestCase):
         # 验证定时器设置
         self.assertTrue(hasattr(self.window, 'simulation_timer_v2'))
         self.assertIsNotNone(self.window.simulation_timer_v2)
-        self.assertEqual(self.window.simulation_timer_v2.interval(), 1000)
+        from main_window import EVENT_DRAIN_INTERVAL_MS
+        self.assertEqual(self.window.simulation_timer_v2.interval(), EVENT_DRAIN_INTERVAL_MS)
         
         # 验证模拟状态
         self.assertTrue(self.window.simulation_running_v2)
         self.assertEqual(self.window.simulation_index_v2, 0)
+        self.window._stop_simulation_v2()
     
     def test_data_availability_logic_integration(self):
         """测试数据可用性逻辑集成"""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+圆拟合精度与速度性能测试
+在含噪声的合成圆弧上比较代数拟合（Kåsa/Pratt/Taubin，批量）与原先逐组
+least_squares 几何拟合的半径误差和耗时
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+
+from modules.circle_fit import fit_circles, FIT_METHODS, HAS_SCIPY
+
+# 合成数据参数
+SET_COUNT = 300
+POINTS_PER_SET = 60
+NOISE_STD = 0.02  # mm
+ARCS = {"整圆": 2 * np.pi, "半圆": np.pi, "60°圆弧": np.pi / 3}
+
+
+def make_arcs(arc, seed=0):
+    rng = np.random.default_rng(seed)
+    r = rng.uniform(8.5, 9.5, SET_COUNT)
+    xc = rng.normal(0, 0.1, SET_COUNT)
+    yc = rng.normal(0, 0.1, SET_COUNT)
+    theta = rng.uniform(0, arc, (SET_COUNT, POINTS_PER_SET))
+    x = xc[:, None] + r[:, None] * np.cos(theta) + rng.normal(0, NOISE_STD, theta.shape)
+    y = yc[:, None] + r[:, None] * np.sin(theta) + rng.normal(0, NOISE_STD, theta.shape)
+    return x, y, r
+
+
+def legacy_fit(x, y):
+    """原 CircleFitter.fit_circle：从质心出发的 least_squares"""
+    from scipy.optimize import least_squares
+
+    def deviations(center):
+        distances = np.hypot(x - center[0], y - center[1])
+        return distances - distances.mean()
+
+    center = least_squares(deviations, (np.mean(x), np.mean(y))).x
+    return np.hypot(x - center[0], y - center[1]).mean()
+
+
+@unittest.skipUnless(HAS_SCIPY, "需要scipy作为对照")
+class TestCircleFitSpeed(unittest.TestCase):
+    """圆拟合精度与速度性能测试"""
+
+    def test_algebraic_fits_vs_least_squares(self):
+        """测试Taubin批量拟合精度与least_squares相当且速度快一个数量级以上"""
+        print()
+        for name, arc in ARCS.items():
+            x, y, r = make_arcs(arc)
+
+            start = time.perf_counter()
+            legacy_r = np.array([legacy_fit(x[i], y[i]) for i in range(SET_COUNT)])
+            legacy_time = time.perf_counter() - start
+            legacy_error = np.sqrt(np.mean((legacy_r - r) ** 2))
+            print(f"{name}: least_squares 误差 {legacy_error * 1000:.2f} μm, "
+                  f"耗时 {legacy_time * 1000:.1f} ms")
+
+            results = {}
+            for method in FIT_METHODS:
+                start = time.perf_counter()
+                fitted_r = fit_circles(x, y, method)[2]
+                elapsed = time.perf_counter() - start
+                error = np.sqrt(np.mean((fitted_r - r) ** 2))
+                results[method] = (error, elapsed)
+                print(f"    {method:6s} 误差 {error * 1000:.2f} μm, 耗时 {elapsed * 1000:.2f} ms "
+                      f"({legacy_time / elapsed:.0f}x)")
+
+            taubin_error, taubin_time = results["taubin"]
+            self.assertLess(taubin_error, legacy_error * 1.2 + 1e-4)
+            self.assertLess(taubin_time * 10, legacy_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
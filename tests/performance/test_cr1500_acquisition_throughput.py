@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+CR1500采集吞吐量与重连恢复性能测试
+用模拟SDK驱动 Acquisition，测量持续采样速率和断线后的恢复时间
+"""
+
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from hardware.CR1500_controller import Acquisition, CONTROLLERS
+from hardware.simulated_sdk import SimulatedCR1500Protocol
+
+# 每个采样率的测量时长（秒）
+RUN_SECONDS = 1.0
+
+
+def silent_callback(data_str, distance, controller_name, channel):
+    pass
+
+
+class TestCR1500AcquisitionThroughput(unittest.TestCase):
+    """CR1500采集性能测试"""
+
+    def _run(self, protocol, duration, during=None):
+        """运行采集，during(acquisition) 在采集线程运行期间调用"""
+        frames = []
+        acquisition = Acquisition(protocol, silent_callback, sampling_interval=0,
+                                  frame_callback=frames.append)
+        acquisition.record_duration = duration
+        acquisition.connection_check_interval = 0.02
+        acquisition.reconnect_delay = 0.05
+
+        thread = threading.Thread(target=acquisition.start)
+        start = time.perf_counter()
+        thread.start()
+        result = during(acquisition) if during else None
+        thread.join(duration + 10)
+        elapsed = time.perf_counter() - start
+        acquisition.stop()
+        return acquisition, len(frames) / elapsed, result
+
+    def test_sustained_sample_rate(self):
+        """测试不同采样率和延迟下的持续帧率"""
+        for sample_rate, latency in [(1000, (0.0002, 0.0001)), (5000, (0.00005, 0.00002))]:
+            protocol = SimulatedCR1500Protocol(sample_rate=sample_rate, latency=latency,
+                                               dropout_rate=0.01, seed=1)
+            acquisition, frame_rate, _ = self._run(protocol, RUN_SECONDS)
+            stats = acquisition.get_acquisition_stats()
+            sample_rates = {name: round(s['rate_hz']) for name, s in stats['controllers'].items()}
+            print(f"{sample_rate} Hz: 完整帧 {frame_rate:.0f} 帧/秒, 各控制器 {sample_rates} 样本/秒, "
+                  f"最大偏差 {stats['alignment']['skew_max_ms']:.2f} ms")
+            self.assertGreater(frame_rate, sample_rate * 0.5)
+
+    def test_slow_controller_does_not_stall_others(self):
+        """测试一个控制器调用延迟较大时，其他控制器采样率不受影响"""
+        def latency():
+            return 0.005 if threading.current_thread().name.endswith("控制器2") else 0.0001
+
+        protocol = SimulatedCR1500Protocol(sample_rate=1000, latency=latency, seed=2)
+        acquisition, _, _ = self._run(protocol, RUN_SECONDS)
+        controllers = acquisition.get_acquisition_stats()['controllers']
+        print(f"慢控制器: 控制器1 {controllers['控制器1']['rate_hz']:.0f} 样本/秒, "
+              f"控制器2 {controllers['控制器2']['rate_hz']:.0f} 样本/秒")
+        self.assertGreater(controllers['控制器1']['rate_hz'], 800)
+        self.assertLess(controllers['控制器2']['rate_hz'], 250)
+
+    def test_reconnect_recovery_time(self):
+        """测试断线后到重新收到该控制器样本的恢复时间"""
+        outage = 0.05
+
+        def inject(acquisition):
+            time.sleep(0.3)
+            name = CONTROLLERS[1]["name"]
+            old_reader = acquisition.readers[name]
+            disconnected_at = time.monotonic()
+            protocol.disconnect(CONTROLLERS[1]["ip"], outage_duration=outage)
+            while time.monotonic() - disconnected_at < 5:
+                reader = acquisition.readers.get(name)
+                if reader is not old_reader and reader.samples > 0:
+                    return time.monotonic() - disconnected_at
+                time.sleep(0.001)
+            return None
+
+        protocol = SimulatedCR1500Protocol(sample_rate=1000, seed=3)
+        _, _, recovery = self._run(protocol, 1.5, during=inject)
+        self.assertIsNotNone(recovery)
+        print(f"重连恢复时间: {recovery * 1000:.0f} ms（断线时长 {outage * 1000:.0f} ms）")
+        self.assertLess(recovery, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
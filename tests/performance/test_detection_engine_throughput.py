@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+检测引擎吞吐量性能测试
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from aidcis2.models.hole_data import HoleData, HoleStatus
+from aidcis2.detection.probe_scheduler import ProbeScheduler
+from aidcis2.detection.detection_engine import DetectionEngine
+
+
+class TestDetectionEngineThroughput(unittest.TestCase):
+    """检测引擎吞吐量性能测试"""
+
+    def test_unpaced_rate_exceeds_thousands_per_second(self):
+        """测试不限速时每秒可处理数千个孔位"""
+        holes = [HoleData(f"H{i + 1:05d}", i * 12.0, (i // 100) * 12.0, 4.0) for i in range(5000)]
+        engine = DetectionEngine(ProbeScheduler(holes, probe_count=1),
+                                 lambda hole: HoleStatus.QUALIFIED, 0.0)
+        start = time.monotonic()
+        engine.start()
+        while engine.is_running() and time.monotonic() - start < 10.0:
+            time.sleep(0.01)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(engine.is_finished())
+        rate = len(holes) / elapsed
+        print(f"检测引擎吞吐量: {rate:.0f} 孔/秒")
+        self.assertGreater(rate, 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -69,22 +69,21 @@ class TestDetectionSpeed(unittest.TestCase):
         self.assertTrue(hasattr(self.window, 'simulation_timer_v2'))
         self.assertIsNotNone(self.window.simulation_timer_v2)
         
-        # 检查定时器间隔（1000ms）
+        # 定时器只负责按帧取出引擎事件
         # 注意：QTimer.interval()返回的是毫秒
-        expected_interval = 1000
+        from main_window import EVENT_DRAIN_INTERVAL_MS
         actual_interval = self.window.simulation_timer_v2.interval()
-        self.assertEqual(actual_interval, expected_interval)
+        self.assertEqual(actual_interval, EVENT_DRAIN_INTERVAL_MS)
     
-    def test_color_change_delay(self):
-        """测试颜色变化延迟"""
-        # 这个测试验证QTimer.singleShot的延迟设置
-        # 由于我们无法直接测试singleShot的延迟，我们检查代码中的设置
+    def test_engine_batch_drain(self):
+        """测试界面按帧批量取出模拟事件"""
         import inspect
         
         update_source = inspect.getsource(self.window._update_simulation_v2)
         
-        # 验证100ms延迟设置
-        self.assertIn('singleShot(100', update_source)
+        # 验证批量取出而非逐孔定时
+        self.assertIn('drain(', update_source)
+        self.assertNotIn('singleShot', update_source)
     
     def test_simulation_speed_calculation(self):
         """测试模拟速度计算"""
@@ -163,9 +162,11 @@ class TestDetectionSpeed(unittest.TestCase):
     
     def tearDown(self):
         """清理测试"""
-        # 停止所有定时器
+        # 停止所有定时器和模拟引擎
         if hasattr(self.window, 'simulation_timer_v2') and self.window.simulation_timer_v2:
             self.window.simulation_timer_v2.stop()
+        if getattr(self.window, 'simulation_engine', None):
+            self.window.simulation_engine.stop()
         
         # 重置模拟状态
         if hasattr(self.window, 'simulation_running_v2'):
@@ -183,15 +184,12 @@ class TestDetectionFrequencyIntegration(unittest.TestCase):
         start_source = inspect.getsource(MainWindow._start_simulation_progress_v2)
         update_source = inspect.getsource(MainWindow._update_simulation_v2)
         
-        # 验证主频率设置
-        self.assertIn('start(1000)', start_source)
+        # 验证模拟速度由引擎节拍决定，界面按帧刷新
+        self.assertIn('SIMULATION_CYCLE_INTERVAL', start_source)
+        self.assertIn('EVENT_DRAIN_INTERVAL_MS', start_source)
         
-        # 验证延迟设置
-        self.assertIn('singleShot(100', update_source)
-        
-        # 验证日志信息一致性
-        self.assertIn('1000ms/孔位', start_source)
-        self.assertIn('100ms', start_source)
+        # 验证批量取出事件
+        self.assertIn('drain(', update_source)
     
     def test_user_experience_timing(self):
         """测试用户体验时间"""
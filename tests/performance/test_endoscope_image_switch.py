@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+内窥镜图像切换性能测试
+比较界面线程同步解码与后台预取解码在切换大尺寸图像时阻塞界面线程的时间
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QColor, QPixmap, QPainter
+from PySide6.QtWidgets import QApplication
+
+from modules.endoscope_view import EndoscopeView
+
+# 模拟BISDM展开图尺寸
+IMAGE_WIDTH = 6000
+IMAGE_HEIGHT = 3000
+IMAGE_COUNT = 4
+# 图表刷新间隔（毫秒），切换图像不应阻塞超过一帧
+FRAME_BUDGET_MS = 33
+
+
+class TestEndoscopeImageSwitch(unittest.TestCase):
+    """内窥镜图像切换性能测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.paths = []
+        for i in range(IMAGE_COUNT):
+            image = QImage(IMAGE_WIDTH, IMAGE_HEIGHT, QImage.Format_RGB32)
+            image.fill(QColor.fromHsv(i * 60, 200, 200))
+            painter = QPainter(image)
+            painter.drawText(image.rect(), Qt.AlignCenter, f"image {i}")
+            painter.end()
+            path = os.path.join(cls.temp_dir.name, f"1-{i}.png")
+            image.save(path)
+            cls.paths.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _make_view(self):
+        view = EndoscopeView()
+        view.resize(900, 600)
+        view.show()
+        self.app.processEvents()
+        return view
+
+    def test_prefetched_switch_does_not_block_gui(self):
+        """测试预取后切换图像的界面线程耗时远小于同步解码"""
+        view = self._make_view()
+        target = view.target_image_size()
+
+        # 原实现：界面线程解码并平滑缩放
+        start = time.perf_counter()
+        for path in self.paths:
+            QPixmap(path).scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        sync_ms = (time.perf_counter() - start) / len(self.paths) * 1000
+
+        # 流水线：预取完成后切换只做QPixmap转换
+        view.prefetch_images(self.paths)
+        view.image_pipeline.wait_for_done()
+        self.app.processEvents()
+        switch_times = []
+        for path in self.paths:
+            start = time.perf_counter()
+            view.update_image(path)
+            switch_times.append((time.perf_counter() - start) * 1000)
+        worst_ms = max(switch_times)
+
+        print(f"\n同步解码: {sync_ms:.1f} ms/张, 预取后切换: 最长 {worst_ms:.2f} ms")
+        self.assertLess(worst_ms, FRAME_BUDGET_MS)
+        self.assertLess(worst_ms, sync_ms)
+
+
+if __name__ == '__main__':
+    unittest.main()
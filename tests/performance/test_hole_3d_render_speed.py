@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+三维管孔模型渲染性能测试
+10000个样本的孔位首次生成并绘制、再次显示（几何缓存）和切换视角的耗时
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.hole_3d_renderer import Hole3DViewer, MEASURED_FACE_BUDGET
+
+SAMPLE_COUNT = 10000
+
+# 交互性要求：生成并绘制模型、切换视角的耗时上限（秒）
+MAX_RENDER_SECONDS = 1.0
+MAX_VIEW_CHANGE_SECONDS = 0.5
+
+
+class TestHole3DRenderSpeed(unittest.TestCase):
+    """三维管孔模型渲染性能测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_10k_sample_hole(self):
+        """测试10000样本孔位的渲染耗时，面片数受预算限制，切换视角只重绘"""
+        rng = np.random.default_rng(0)
+        diameters = 17.6 + rng.normal(0, 0.02, SAMPLE_COUNT)
+        measurements = [{'position': float(i + 1), 'diameter': float(d)} for i, d in enumerate(diameters)]
+
+        viewer = Hole3DViewer()
+        viewer.resize(1200, 900)
+        renderer = viewer.renderer
+        # 首次渲染包含一次性的布局计算，先用少量数据预热
+        viewer.update_models(measurements[:50])
+
+        start = time.perf_counter()
+        viewer.update_models(measurements)
+        render_time = time.perf_counter() - start
+        face_count = sum(len(collection.get_paths()) for collection in renderer.ax.collections)
+
+        viewer.clear_models()
+        start = time.perf_counter()
+        viewer.update_models(measurements)
+        cached_time = time.perf_counter() - start
+
+        view_times = []
+        for view_name in ("正视图", "侧视图", "俯视图", "默认视角"):
+            start = time.perf_counter()
+            viewer.change_view_angle(view_name)
+            renderer.draw()
+            view_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        viewer.fit_view()
+        renderer.draw()
+        view_times.append(time.perf_counter() - start)
+        view_time = max(view_times)
+
+        print(f"\n{SAMPLE_COUNT} 样本: 生成并绘制 {render_time * 1000:.0f} ms, "
+              f"几何缓存命中 {cached_time * 1000:.0f} ms, 切换视角 {view_time * 1000:.0f} ms, "
+              f"面片数 {face_count}")
+
+        self.assertLess(render_time, MAX_RENDER_SECONDS)
+        self.assertLess(view_time, MAX_VIEW_CHANGE_SECONDS)
+        self.assertLessEqual(len(renderer.ax.collections[-1].get_paths()), MEASURED_FACE_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
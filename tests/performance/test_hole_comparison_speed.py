@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+多孔对比性能测试
+500个孔位并发读取、重采样和统计的耗时，以及对比图首次绘制和缩放重绘的耗时
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.hole_comparison import HoleComparisonService, compare_profiles, load_hole_profile
+from modules.history_viewer import HoleComparisonPlot
+
+HOLE_COUNT = 500
+SAMPLES_PER_HOLE = 900
+HEADER = "测量序号,通道1值(μm),通道2值(μm),通道3值(μm),计算直径(mm)"
+
+# 交互性要求：缩放重绘耗时上限（秒）
+MAX_REDRAW_SECONDS = 0.5
+
+
+class TestHoleComparisonSpeed(unittest.TestCase):
+    """多孔对比性能测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        cls.original_cwd = os.getcwd()
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(cls.temp_dir.name)
+
+        rng = np.random.default_rng(0)
+        cls.hole_ids = [f"H{i:05d}" for i in range(1, HOLE_COUNT + 1)]
+        for hole_id in cls.hole_ids:
+            directory = os.path.join("Data", hole_id, "CCIDM")
+            os.makedirs(directory)
+            count = SAMPLES_PER_HOLE - int(rng.integers(0, 100))
+            diameters = 17.6 + rng.normal(0, 0.01, count) + rng.normal(0, 0.005)
+            with open(os.path.join(directory, "measurement_data_1.csv"), 'w', encoding='gbk') as f:
+                f.write(HEADER + "\n")
+                f.writelines(f"{i + 1},1385,1390,1380,{d:.4f}\n" for i, d in enumerate(diameters))
+
+    @classmethod
+    def tearDownClass(cls):
+        os.chdir(cls.original_cwd)
+        cls.temp_dir.cleanup()
+
+    def run_comparison(self, service):
+        results = []
+        service.comparison_ready.connect(lambda request, result: results.append(result))
+        start = time.perf_counter()
+        service.submit(self.hole_ids)
+        while not results and time.perf_counter() - start < 120:
+            service.wait_for_done(50)
+            self.app.processEvents()
+        return results[0], time.perf_counter() - start
+
+    def test_500_hole_comparison(self):
+        """测试500孔对比的读取、统计和绘制耗时，缩放重绘保持交互"""
+        # 首次逐孔读取：解析CSV并建立解析缓存
+        start = time.perf_counter()
+        profiles = [load_hole_profile(hole_id) for hole_id in self.hole_ids]
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compare_profiles(profiles)
+        compare_time = time.perf_counter() - start
+
+        # 并发读取（命中解析缓存）+ 统计
+        service = HoleComparisonService()
+        result, concurrent_time = self.run_comparison(service)
+        self.assertEqual(len(result.hole_ids), HOLE_COUNT)
+
+        plot = HoleComparisonPlot()
+        plot.resize(1200, 700)
+        start = time.perf_counter()
+        plot.plot_comparison(result)
+        plot_time = time.perf_counter() - start
+
+        redraw_times = []
+        for scale in (0.5, 0.25, 1.0):
+            plot.ax.set_xlim(0, SAMPLES_PER_HOLE * scale)
+            start = time.perf_counter()
+            plot.draw()
+            redraw_times.append(time.perf_counter() - start)
+        redraw_time = max(redraw_times)
+
+        print(f"\n{HOLE_COUNT} 孔 × ~{SAMPLES_PER_HOLE} 点: 首次逐孔解析 {serial_time * 1000:.0f} ms, "
+              f"统计 {compare_time * 1000:.0f} ms, 并发读取(缓存)+统计 {concurrent_time * 1000:.0f} ms, "
+              f"首次绘制 {plot_time * 1000:.0f} ms, 缩放重绘 {redraw_time * 1000:.0f} ms, "
+              f"图元数 {len(plot.ax.lines) + len(plot.ax.collections)}")
+
+        self.assertLess(redraw_time, MAX_REDRAW_SECONDS)
+        self.assertLess(len(plot.ax.lines) + len(plot.ax.collections), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
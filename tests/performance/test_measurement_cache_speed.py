@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+测量数据缓存性能测试
+比较大尺寸CCIDM测量文件首次解析与命中二进制缓存（内存映射）时的读取耗时
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+
+from modules.measurement_csv import read_measurement_csv
+
+ROW_COUNT = 200_000
+REPEATS = 5
+HEADER = "测量序号,通道1值(μm),通道2值(μm),通道3值(μm),计算直径(mm)"
+
+
+class TestMeasurementCacheSpeed(unittest.TestCase):
+    """测量数据缓存性能测试"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        hole_dir = os.path.join(self.temp_dir.name, "Data", "H00001", "CCIDM")
+        os.makedirs(hole_dir)
+        self.path = os.path.join(hole_dir, "measurement_data_perf.csv")
+
+        rng = np.random.default_rng(0)
+        channels = rng.normal(1385, 5, (ROW_COUNT, 3))
+        diameters = rng.normal(17.6, 0.02, ROW_COUNT)
+        with open(self.path, 'w', encoding='gbk', newline='') as f:
+            f.write(HEADER + "\r\n")
+            f.writelines(f"{i + 1},{c[0]:.2f},{c[1]:.2f},{c[2]:.2f},{d:.4f}\r\n"
+                         for i, (c, d) in enumerate(zip(channels, diameters)))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cached_read_vs_parse(self):
+        """测试命中缓存的读取比解析CSV快一个数量级以上且结果一致"""
+        parse_times = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            parsed = read_measurement_csv(self.path, use_cache=False)
+            parse_times.append(time.perf_counter() - start)
+
+        read_measurement_csv(self.path)  # 建立缓存
+        cached_times = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            cached = read_measurement_csv(self.path)
+            diameters = np.asarray(cached.diameter)
+            cached_times.append(time.perf_counter() - start)
+
+        parse_time = min(parse_times)
+        cached_time = min(cached_times)
+        print(f"\n{ROW_COUNT} 行: 解析CSV {parse_time * 1000:.1f} ms, "
+              f"缓存读取 {cached_time * 1000:.2f} ms ({parse_time / cached_time:.0f}x)")
+
+        np.testing.assert_array_equal(diameters, parsed.diameter)
+        np.testing.assert_array_equal(cached.channels, parsed.channels)
+        self.assertLess(cached_time * 10, parse_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+实时图表吞吐量性能测试
+比较 matplotlib 与 pyqtgraph 后端在kHz级数据流下的刷新能力
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.realtime_chart import RealtimeChart, HAS_PYQTGRAPH
+
+# 模拟探头采样率和图表刷新间隔
+SAMPLE_RATE_HZ = 5000
+FRAME_INTERVAL_S = 0.033
+BENCHMARK_FRAMES = 60
+
+
+class TestRealtimeChartThroughput(unittest.TestCase):
+    """实时图表吞吐量性能测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _run_stream(self, backend):
+        """按帧推送模拟数据并刷新，返回 (样本/秒, 帧/秒)"""
+        chart = RealtimeChart(backend=backend)
+        chart.update_timer.stop()
+        chart.resize(1600, 900)
+        chart.show()
+        self.app.processEvents()
+
+        samples_per_frame = int(SAMPLE_RATE_HZ * FRAME_INTERVAL_S)
+        depth = 0.0
+        start = time.perf_counter()
+        for frame in range(BENCHMARK_FRAMES):
+            for i in range(samples_per_frame):
+                depth += 0.01
+                chart.update_data(depth, 17.6 + 0.04 * np.sin(depth))
+            chart.update_plot()
+            self.app.processEvents()
+        elapsed = time.perf_counter() - start
+
+        chart.cleanup()
+        chart.close()
+        samples = BENCHMARK_FRAMES * samples_per_frame
+        return samples / elapsed, BENCHMARK_FRAMES / elapsed
+
+    def test_matplotlib_throughput(self):
+        """测试matplotlib后端吞吐量"""
+        sample_rate, frame_rate = self._run_stream("matplotlib")
+        print(f"matplotlib: {sample_rate:.0f} 样本/秒, {frame_rate:.1f} 帧/秒")
+        self.assertGreater(frame_rate, 0)
+
+    @unittest.skipUnless(HAS_PYQTGRAPH, "pyqtgraph不可用")
+    def test_pyqtgraph_sustains_khz_stream(self):
+        """测试pyqtgraph后端能跟上kHz级数据流"""
+        sample_rate, frame_rate = self._run_stream("pyqtgraph")
+        print(f"pyqtgraph: {sample_rate:.0f} 样本/秒, {frame_rate:.1f} 帧/秒")
+        self.assertGreater(sample_rate, SAMPLE_RATE_HZ)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+采集样本流式存储性能测试
+测量逐行写入速率，并验证写入行数增加时内存占用保持不变
+"""
+
+import unittest
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import numpy as np
+
+from hardware.CR1500_controller import sample_fields
+from hardware.sample_writer import StreamingSampleWriter, SampleTail
+
+# 目标采样率（行/秒）
+TARGET_RATE = 10000
+
+
+class TestSampleWriterThroughput(unittest.TestCase):
+    """流式存储性能测试"""
+
+    def _write(self, file_format, count):
+        """逐行写入 count 行，返回 (行/秒, 内存峰值增量字节)"""
+        fields = sample_fields()
+        rows = np.random.default_rng(1).normal(1000, 10, (4096, len(fields)))
+        with tempfile.TemporaryDirectory() as directory:
+            writer = StreamingSampleWriter(directory, fields, file_format=file_format,
+                                           max_file_bytes=4 * 1024 * 1024)
+            tail = SampleTail(10000, len(fields))
+
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            for i in range(count):
+                row = rows[i & 4095]
+                tail.append(row)
+                writer.append(row)
+            writer.close()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            tracemalloc.stop()
+        return count / elapsed, peak
+
+    def test_keeps_up_with_flat_memory(self):
+        """测试二进制和CSV格式均超过10kHz，且内存峰值与写入行数无关"""
+        for file_format in ("binary", "csv"):
+            rate, peak_small = self._write(file_format, 50000)
+            _, peak_large = self._write(file_format, 200000)
+            print(f"{file_format}: {rate:.0f} 行/秒, 内存峰值 {peak_small / 1024:.0f} KB "
+                  f"(5万行) / {peak_large / 1024:.0f} KB (20万行)")
+            self.assertGreater(rate, TARGET_RATE * 2)
+            self.assertLess(peak_large, peak_small * 1.5 + 64 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
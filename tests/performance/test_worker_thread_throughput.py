@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+工作线程批量传输吞吐量性能测试
+在1kHz、10kHz、50kHz采样率下测量批量模式送达实时图表的样本速率
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from PySide6.QtWidgets import QApplication
+
+from modules.worker_thread import WorkerThread
+from modules.realtime_chart import RealtimeChart
+
+# 每个采样率的测量时长（秒）
+RUN_SECONDS = 1.0
+
+
+class TestWorkerThreadThroughput(unittest.TestCase):
+    """工作线程批量传输吞吐量性能测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _measure(self, frequency):
+        """以给定采样率运行批量模式，返回 (送达样本/秒, 数据块数)"""
+        chart = RealtimeChart()
+        chart.update_timer.stop()
+        worker = WorkerThread(batched=True)
+        worker.measurement_frequency = frequency
+        worker.depth_step = worker.max_depth / (frequency * RUN_SECONDS)
+        worker.data_chunk_updated.connect(chart.update_data_chunk)
+        worker.status_updated.connect(chart.update_status)
+
+        start = time.perf_counter()
+        worker.start_measurement("H001")
+        while worker.isRunning() and time.perf_counter() - start < RUN_SECONDS * 10:
+            self.app.processEvents()
+            chart.update_plot()
+        self.app.processEvents()
+        elapsed = time.perf_counter() - start
+
+        received = len(chart.depth_data)
+        chart.cleanup()
+        self.assertEqual(received, int(frequency * RUN_SECONDS))
+        return received / elapsed, worker.chunks_emitted
+
+    def test_throughput_at_khz_rates(self):
+        """测试1kHz、10kHz、50kHz下送达速率跟上采样率"""
+        for frequency in (1000, 10000, 50000):
+            rate, chunks = self._measure(frequency)
+            print(f"{frequency} Hz: 送达 {rate:.0f} 样本/秒, {chunks} 个数据块")
+            self.assertGreater(rate, frequency * 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+单元测试：超差区间跟踪与异常列表模型
+Unit Tests: AnomalyTracker and AnomalyListModel
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.anomaly_monitor import AnomalyTracker, AnomalyListModel, SIDE_UPPER, SIDE_LOWER
+
+LOWER = 17.53
+UPPER = 17.65
+
+
+def make_defect_trace():
+    """生成含多段缺陷区的测量数据"""
+    depths = np.arange(0.0, 900.0, 0.05)
+    diameters = np.full(len(depths), 17.6)
+    diameters[(depths >= 200) & (depths < 250)] = 17.45          # 50mm偏小区
+    diameters[(depths >= 500) & (depths < 500.2)] = 17.70        # 短偏大区
+    diameters[(depths >= 700) & (depths < 710)] = 17.68
+    diameters[(depths >= 710) & (depths < 720)] = 17.50          # 紧接的偏小区
+    diameters[np.searchsorted(depths, 230.0)] = 17.40            # 缺陷区内的峰值
+    return depths, diameters
+
+
+class TestAnomalyTracker(unittest.TestCase):
+    """AnomalyTracker单元测试类"""
+
+    def test_intervals_coalesced(self):
+        """测试连续超差样本合并为区间，方向改变时分段"""
+        depths, diameters = make_defect_trace()
+        tracker = AnomalyTracker()
+        tracker.add_chunk(depths, diameters, LOWER, UPPER)
+
+        sides = [interval.side for interval in tracker.intervals]
+        self.assertEqual(sides, [SIDE_LOWER, SIDE_UPPER, SIDE_UPPER, SIDE_LOWER])
+        defect = tracker.intervals[0]
+        self.assertAlmostEqual(defect.start_depth, 200.0)
+        self.assertAlmostEqual(defect.end_depth, 249.95)
+        self.assertEqual(defect.sample_count, 1000)
+        self.assertAlmostEqual(defect.peak_depth, 230.0)
+        self.assertAlmostEqual(defect.peak_deviation, LOWER - 17.40)
+        self.assertEqual(tracker.anomaly_count, sum(i.sample_count for i in tracker.intervals))
+
+    def test_chunked_and_per_sample_agree(self):
+        """测试分块输入和逐点输入得到相同区间"""
+        depths, diameters = make_defect_trace()
+        whole = AnomalyTracker()
+        whole.add_chunk(depths, diameters, LOWER, UPPER)
+
+        chunked = AnomalyTracker()
+        for chunk in np.array_split(np.arange(len(depths)), 97):
+            chunked.add_chunk(depths[chunk], diameters[chunk], LOWER, UPPER)
+
+        single = AnomalyTracker()
+        for depth, diameter in zip(depths[:20000].tolist(), diameters[:20000].tolist()):
+            single.add_sample(depth, diameter, LOWER, UPPER)
+
+        self.assertEqual(chunked.intervals, whole.intervals)
+        self.assertEqual(chunked.anomaly_count, whole.anomaly_count)
+        self.assertEqual(single.intervals, whole.intervals[:len(single.intervals)])
+        self.assertEqual(len(single.intervals), 4)
+
+    def test_max_intervals(self):
+        """测试超过最大区间数时丢弃最早的区间"""
+        tracker = AnomalyTracker(max_intervals=3)
+        diameters = np.tile([17.6, 17.7], 5)
+        tracker.add_chunk(np.arange(10.0), diameters, LOWER, UPPER)
+        self.assertEqual(len(tracker.intervals), 3)
+        self.assertEqual(tracker.dropped_count, 2)
+        self.assertEqual(tracker.anomaly_count, 5)
+        self.assertAlmostEqual(tracker.anomaly_rate, 50.0)
+
+
+class TestAnomalyListModel(unittest.TestCase):
+    """AnomalyListModel单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_incremental_sync(self):
+        """测试同步只插入新区间并通知最后一行变化"""
+        tracker = AnomalyTracker()
+        model = AnomalyListModel(tracker)
+        inserted = []
+        changed = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+
+        tracker.add_chunk([1.0, 2.0, 3.0], [17.6, 17.7, 17.7], LOWER, UPPER)
+        self.assertTrue(model.sync())
+        self.assertFalse(model.sync())
+        self.assertEqual(inserted, [(0, 0)])
+
+        # 区间延续到下一块：只更新最后一行
+        tracker.add_chunk([4.0, 5.0], [17.7, 17.6], LOWER, UPPER)
+        model.sync()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(changed[-1], 0)
+        self.assertIn("2.0~4.0mm", model.data(model.index(0)))
+
+        tracker.add_chunk([6.0], [17.4], LOWER, UPPER)
+        model.sync()
+        self.assertEqual(inserted[-1], (1, 1))
+
+        tracker.clear()
+        model.sync()
+        self.assertEqual(model.rowCount(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+单元测试：ChartBlitter
+Unit Tests: ChartBlitter
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from modules.chart_blitter import ChartBlitter
+
+
+class TestChartBlitter(unittest.TestCase):
+    """ChartBlitter单元测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.figure = Figure(figsize=(4, 3), dpi=50)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xlim(0, 100)
+        self.ax.set_ylim(17.4, 17.8)
+        self.ax.axhline(17.65, linestyle='--')
+        self.line, = self.ax.plot([], [])
+
+    def test_background_captured_on_full_draw(self):
+        """测试完整重绘后截取背景，之后只做局部重绘"""
+        blitter = ChartBlitter(self.canvas, [self.line])
+        self.assertTrue(self.line.get_animated())
+        self.assertEqual(blitter.full_draw_count, 1)
+
+        for i in range(5):
+            self.line.set_data(np.arange(i + 2), np.full(i + 2, 17.6))
+            blitter.update()
+        self.assertEqual(blitter.blit_count, 5)
+        self.assertEqual(blitter.full_draw_count, 1)
+
+    def test_limit_change_recaptures_background(self):
+        """测试坐标轴范围变化后的完整重绘会重新截取背景"""
+        blitter = ChartBlitter(self.canvas, [self.line])
+        self.ax.set_xlim(0, 200)
+        self.canvas.draw_idle()
+        self.assertEqual(blitter.full_draw_count, 2)
+
+        blitter.update()
+        self.assertEqual(blitter.blit_count, 1)
+
+    def test_blitted_frame_matches_full_draw(self):
+        """测试局部重绘结果与完整重绘一致"""
+        blitter = ChartBlitter(self.canvas, [self.line])
+        self.line.set_data(np.linspace(0, 100, 50), 17.6 + 0.1 * np.sin(np.linspace(0, 6, 50)))
+        blitter.update()
+        blitted = np.asarray(self.canvas.buffer_rgba()).copy()
+
+        self.canvas.draw()
+        full = np.asarray(self.canvas.buffer_rgba())
+        np.testing.assert_array_equal(blitted, full)
+
+    def test_replacing_artists(self):
+        """测试替换动态图元时恢复旧图元的静态绘制"""
+        blitter = ChartBlitter(self.canvas, [self.line])
+        blitter.set_artists([])
+        self.assertFalse(self.line.get_animated())
+        self.assertEqual(blitter.artists, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+单元测试：代数圆拟合
+Unit Tests: Kåsa / Pratt / Taubin circle fits
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from modules.circle_fit import (
+    fit_circle, fit_circles, fit_circles_kasa, fit_circles_pratt, fit_circles_taubin,
+    FIT_METHODS, HAS_SCIPY
+)
+
+
+def make_arcs(count, points, arc=2 * np.pi, noise=0.0, seed=0):
+    """生成 count 组圆弧点，返回 (x, y, 圆心x, 圆心y, 半径)"""
+    rng = np.random.default_rng(seed)
+    xc = rng.uniform(-5, 5, count)
+    yc = rng.uniform(-5, 5, count)
+    r = rng.uniform(5, 20, count)
+    theta = rng.uniform(0, arc, (count, points))
+    x = xc[:, None] + r[:, None] * np.cos(theta) + rng.normal(0, noise, (count, points))
+    y = yc[:, None] + r[:, None] * np.sin(theta) + rng.normal(0, noise, (count, points))
+    return x, y, xc, yc, r
+
+
+class TestAlgebraicCircleFit(unittest.TestCase):
+    """代数圆拟合单元测试类"""
+
+    def test_exact_points_recovered_by_all_methods(self):
+        """测试无噪声点集各方法均精确恢复圆"""
+        x, y, xc, yc, r = make_arcs(50, 8)
+        for fitter in (fit_circles_kasa, fit_circles_pratt, fit_circles_taubin):
+            fx, fy, fr, residual = fitter(x, y)
+            np.testing.assert_allclose(fx, xc, atol=1e-8)
+            np.testing.assert_allclose(fy, yc, atol=1e-8)
+            np.testing.assert_allclose(fr, r, atol=1e-8)
+            np.testing.assert_allclose(residual, 0.0, atol=1e-12)
+
+    def test_batch_matches_single_fits(self):
+        """测试批量拟合与逐组拟合结果一致"""
+        x, y, _, _, _ = make_arcs(20, 30, arc=np.pi, noise=0.05)
+        for method in FIT_METHODS:
+            batch = fit_circles(x, y, method)
+            for i in (0, 7, 19):
+                single = fit_circle(x[i], y[i], method)
+                np.testing.assert_allclose(single, [value[i] for value in batch], rtol=1e-9)
+
+    def test_taubin_less_biased_than_kasa_on_short_arcs(self):
+        """测试短圆弧含噪声时Taubin/Pratt的半径误差小于Kåsa"""
+        x, y, _, _, r = make_arcs(500, 40, arc=np.pi / 3, noise=0.05, seed=3)
+        errors = {method: np.sqrt(np.mean((fit_circles(x, y, method)[2] - r) ** 2))
+                  for method in FIT_METHODS}
+        self.assertLess(errors["taubin"], errors["kasa"])
+        self.assertLess(errors["pratt"], errors["kasa"])
+
+    def test_padded_and_degenerate_point_sets(self):
+        """测试NaN补齐的点集，少于3点或共线的点集返回NaN"""
+        x = np.array([[1.0, 0.0, -1.0, 0.0], [1.0, 0.0, -1.0, np.nan],
+                      [0.0, 1.0, np.nan, np.nan], [0.0, 1.0, 2.0, 3.0]])
+        y = np.array([[0.0, 1.0, 0.0, -1.0], [0.0, 1.0, 0.0, np.nan],
+                      [0.0, 1.0, np.nan, np.nan], [0.0, 1.0, 2.0, 3.0]])
+        for method in FIT_METHODS:
+            xc, yc, r, _ = fit_circles(x, y, method)
+            np.testing.assert_allclose(r[:2], [1.0, 1.0], atol=1e-12)
+            self.assertTrue(np.isnan(r[2]))
+            self.assertTrue(np.isnan(r[3]))
+
+    def test_unknown_method(self):
+        """测试未知拟合方法报错"""
+        with self.assertRaises(ValueError):
+            fit_circles([0, 1, 2], [0, 1, 0], "hyper")
+
+    @unittest.skipUnless(HAS_SCIPY, "需要scipy")
+    def test_refinement_does_not_increase_residual(self):
+        """测试几何精化后的残差不大于代数拟合残差"""
+        x, y, _, _, _ = make_arcs(1, 40, arc=np.pi / 2, noise=0.1, seed=5)
+        algebraic = fit_circle(x[0], y[0], "kasa")
+        refined = fit_circle(x[0], y[0], "kasa", refine=True)
+        self.assertLessEqual(refined[3], algebraic[3] + 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
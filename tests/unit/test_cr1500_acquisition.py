@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+单元测试：CR1500并发采集（读取线程与帧对齐）
+Unit Tests: CR1500 ControllerReader and FrameAligner
+"""
+
+import unittest
+import sys
+import os
+import time
+from collections import deque
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from hardware.CR1500_controller import (
+    ControllerReader, FrameAligner, TS_ERRCODE_OK, TS_ERRCODE_TIMEOUT
+)
+
+
+def make_queue(start, period, count, channels, jitter=0.0):
+    """生成按固定周期采样的样本队列"""
+    queue = deque()
+    for i in range(count):
+        timestamp = start + i * period + (jitter if i % 2 else -jitter)
+        queue.append((timestamp, {channel: 100.0 + i for channel in channels}))
+    return queue
+
+
+class NodeProtocol:
+    """只实现 TSCMCAPI_GetSingleDataNode 的最小协议对象，每次返回两个通道"""
+
+    def __init__(self, fail_every=0):
+        self.calls = 0
+        self.fail_every = fail_every
+
+    def TSCMCAPI_GetSingleDataNode(self, instance, index, nodes, nread, size):
+        self.calls += 1
+        if self.fail_every and self.calls % self.fail_every == 0:
+            nread._obj.value = 0
+            return TS_ERRCODE_TIMEOUT
+        for i, channel in enumerate((1, 2)):
+            nodes[i].cfg.channel = channel
+            nodes[i].data = channel * 1000.0 + self.calls
+        nread._obj.value = 2
+        return TS_ERRCODE_OK
+
+
+class TestFrameAligner(unittest.TestCase):
+    """FrameAligner单元测试类"""
+
+    def test_nearest_timestamp(self):
+        """测试按最近时间戳组帧，较快控制器多出的样本计为未匹配"""
+        fast = make_queue(0.0, 0.001, 1000, (1, 2))
+        slow = make_queue(0.0004, 0.002, 500, (1,), jitter=0.0002)
+        aligner = FrameAligner({"控制器1": fast, "控制器2": slow}, max_skew=0.01)
+        frames = aligner.align(now=10.0)
+
+        self.assertEqual(len(frames), 1000)
+        self.assertEqual(aligner.incomplete_frames, 0)
+        for frame in frames:
+            self.assertIsNotNone(frame.measure_list)
+            self.assertLessEqual(frame.skew, 0.0011)
+        stats = aligner.get_stats()
+        self.assertAlmostEqual(stats['frame_rate_hz'], 1000.0, delta=1.0)
+        self.assertLess(stats['skew_max_ms'], 1.1)
+
+        # 参考控制器较慢时，另一控制器多出的样本被丢弃
+        aligner = FrameAligner({"控制器1": make_queue(0.0, 0.004, 100, (1, 2)),
+                                "控制器2": make_queue(0.0, 0.001, 400, (1,))})
+        frames = aligner.align(now=10.0)
+        self.assertEqual(len(frames), 100)
+        self.assertTrue(all(frame.skew == 0.0 for frame in frames))
+        self.assertEqual(aligner.unmatched["控制器2"], 297)
+        self.assertEqual(aligner.unmatched["控制器1"], 0)
+
+    def test_waits_for_lagging_controller(self):
+        """测试其他控制器尚无更晚样本时暂缓出帧，超时后输出不完整帧"""
+        reference = make_queue(0.0, 0.01, 5, (1, 2))
+        lagging = make_queue(0.0, 0.01, 2, (1,))
+        aligner = FrameAligner({"控制器1": reference, "控制器2": lagging},
+                               max_skew=0.005, max_wait=0.1)
+
+        self.assertEqual(len(aligner.align(now=0.05)), 2)
+        lagging.append((0.02, {1: 7.0}))
+        frames = aligner.align(now=0.05)
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(frames[0].values[("控制器2", 1)], 7.0)
+
+        # 控制器2停止输出：超过最长等待后输出缺少该控制器的帧
+        self.assertEqual(aligner.align(now=0.1), [])
+        frames = aligner.align(now=0.5)
+        self.assertEqual(len(frames), 2)
+        self.assertIsNone(frames[0].measure_list)
+        self.assertEqual(aligner.incomplete_frames, 2)
+
+    def test_controller_removed(self):
+        """测试移除控制器后只按剩余控制器组帧"""
+        aligner = FrameAligner({"控制器1": make_queue(0.0, 0.01, 3, (1, 2)),
+                                "控制器2": deque()})
+        aligner.set_queue("控制器2", None)
+        self.assertEqual(len(aligner.align(now=0.0)), 3)
+
+    def test_reference_order_kept_after_readd(self):
+        """测试控制器重新登记后回到固定顺序中的位置，参考控制器不变"""
+        aligner = FrameAligner({"控制器1": deque(), "控制器2": deque()})
+        aligner.set_queue("控制器1", None)
+        self.assertEqual(list(aligner.queues), ["控制器2"])
+        aligner.set_queue("控制器1", make_queue(0.0, 0.01, 3, (1, 2)))
+        self.assertEqual(list(aligner.queues), ["控制器1", "控制器2"])
+
+        aligner = FrameAligner({}, order=["控制器1", "控制器2"])
+        aligner.set_queue("控制器2", deque())
+        aligner.set_queue("控制器1", deque())
+        self.assertEqual(list(aligner.queues), ["控制器1", "控制器2"])
+
+
+class TestControllerReader(unittest.TestCase):
+    """ControllerReader单元测试类"""
+
+    def test_reader_timestamps_and_stats(self):
+        """测试读取线程一次调用取出全部通道、时间戳递增并统计失败次数"""
+        protocol = NodeProtocol(fail_every=5)
+        reader = ControllerReader(protocol, "控制器1", 1, (1, 2), poll_interval=0.002)
+        reader.start()
+        time.sleep(0.2)
+        reader.stop()
+
+        samples = list(reader.queue)
+        self.assertGreater(len(samples), 10)
+        timestamps = [timestamp for timestamp, _ in samples]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(set(samples[0][1]), {1, 2})
+        self.assertEqual(reader.samples + reader.read_errors, protocol.calls)
+        self.assertGreater(reader.read_errors, 0)
+        # 按截止时间调度：采样率接近 1/poll_interval
+        self.assertLess(reader.sample_rate, 500 * 1.1)
+        self.assertFalse(reader.is_alive())
+
+    def test_queue_drops_counted(self):
+        """测试队列已满时丢弃最早样本并计数"""
+        reader = ControllerReader(NodeProtocol(), "控制器1", 1, (1,), queue_size=8)
+        reader.start()
+        time.sleep(0.05)
+        reader.stop()
+        self.assertEqual(len(reader.queue), 8)
+        self.assertEqual(reader.queue_drops, reader.samples - 8)
+        self.assertEqual(set(reader.queue[0][1]), {1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+单元测试：CSV数据回放
+Unit Tests: CsvReplayEngine and RealtimeChart CSV replay
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.csv_replay import CsvReplayEngine, MAX_REPLAY_SPEED
+from modules.realtime_chart import RealtimeChart
+
+
+def make_engine(count=900, speed=1.0):
+    depths = np.arange(1.0, count + 1.0)
+    diameters = 17.6 + 0.01 * np.sin(depths)
+    return CsvReplayEngine(depths, diameters, speed=speed, points_per_second=20.0)
+
+
+class TestCsvReplayEngine(unittest.TestCase):
+    """CsvReplayEngine单元测试类"""
+
+    def test_advances_by_elapsed_time(self):
+        """测试到期点数只取决于经过时间和倍速，与调用频率无关"""
+        engine = make_engine(speed=10.0)
+        engine.start(now=0.0)
+        self.assertEqual(engine.advance(now=0.0), slice(0, 1))
+        self.assertEqual(engine.advance(now=1.0), slice(1, 201))  # 20点/秒 × 10倍速
+        self.assertEqual(engine.advance(now=1.0), slice(201, 201))
+
+        frequent = make_engine(speed=10.0)
+        frequent.start(now=0.0)
+        for frame in range(31):
+            frequent.advance(now=frame / 30)
+        self.assertEqual(frequent.index, engine.index)
+
+    def test_full_scan_at_max_speed(self):
+        """测试1000倍速下900点扫描一帧内完成"""
+        engine = make_engine(speed=5000.0)
+        self.assertEqual(engine.speed, MAX_REPLAY_SPEED)
+        engine.start(now=0.0)
+        self.assertEqual(engine.advance(now=0.045), slice(0, 900))
+        self.assertTrue(engine.finished)
+        self.assertEqual(engine.progress, 100.0)
+
+    def test_speed_change_and_pause_are_continuous(self):
+        """测试改变倍速和暂停时位置连续"""
+        engine = make_engine()
+        engine.start(now=0.0)
+        engine.set_speed(100.0, now=1.0)  # 1秒 × 20点 = 位置20
+        self.assertEqual(engine.advance(now=1.5).stop, 900)  # 20 + 0.5 × 2000，截断到总点数
+        engine = make_engine()
+        engine.start(now=0.0)
+        engine.set_speed(4.0, now=1.0)
+        self.assertEqual(engine.advance(now=1.5).stop, 61)  # 20 + 0.5 × 80 + 1
+        engine.pause(now=1.5)
+        self.assertEqual(engine.advance(now=100.0).stop, 61)
+        engine.start(now=100.0)
+        self.assertEqual(engine.advance(now=100.5).stop, 101)
+
+    def test_seek_depth(self):
+        """测试按深度定位后从该深度继续"""
+        engine = make_engine()
+        engine.start(now=0.0)
+        self.assertEqual(engine.seek_depth(450.5, now=2.0), 450)
+        due = engine.advance(now=2.0)
+        self.assertEqual(due, slice(450, 451))
+        self.assertEqual(engine.depths[due.start], 451.0)
+        self.assertEqual(engine.seek_depth(10000.0), 900)
+        self.assertTrue(engine.finished)
+
+
+class TestRealtimeChartReplay(unittest.TestCase):
+    """RealtimeChart CSV回放集成测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.chart = RealtimeChart()
+        self.chart.update_timer.stop()
+        self.chart.csv_data = [{'measurement': i, 'depth': float(i), 'diameter': 17.6}
+                               for i in range(1, 901)]
+        self.chart.current_images = [f"image_{i}.png" for i in range(5)]
+        self.chart.calculate_image_switch_points()
+
+    def tearDown(self):
+        self.chart.cleanup()
+        self.chart.deleteLater()
+
+    def test_replay_pushes_chunks_and_switches_images(self):
+        """测试每帧推送一个数据块，图像按进度同步切换"""
+        self.chart.set_csv_replay_speed(1000)
+        with patch.object(self.chart, 'display_endoscope_image') as display:
+            self.chart.start_csv_data_import(auto_play=True)
+            self.chart.csv_timer.stop()
+            replay = self.chart.csv_replay
+            replay.seek_index(0, now=0.0)
+            replay._anchor_time = 0.0
+            with patch('modules.csv_replay.time.monotonic', return_value=0.02):
+                self.chart.update_csv_replay_frame()
+
+            self.assertEqual(len(self.chart.depth_data), 401)
+            self.assertEqual(self.chart.csv_data_index, 401)
+            display.assert_called_with(2)
+
+            with patch('modules.csv_replay.time.monotonic', return_value=1.0):
+                self.chart.update_csv_replay_frame()
+            self.assertEqual(len(self.chart.depth_data), 900)
+            display.assert_called_with(4)
+            self.assertFalse(self.chart.is_csv_playing)
+
+    def test_seek_rebuilds_history(self):
+        """测试按深度定位后图表包含该深度之前的数据，图像同步"""
+        with patch.object(self.chart, 'display_endoscope_image') as display:
+            self.chart.seek_csv_depth(600.0)
+        np.testing.assert_array_equal(self.chart.depth_data.view(), np.arange(1.0, 600.0))
+        self.assertEqual(self.chart.csv_data_index, 599)
+        display.assert_called_with(3)
+
+    def test_panel_a_controls(self):
+        """测试面板A的倍速选择和深度定位控件连接到回放"""
+        self.chart.replay_speed_combo.setCurrentIndex(self.chart.replay_speed_combo.findText("100x"))
+        self.assertEqual(self.chart.csv_replay_speed, 100.0)
+
+        self.chart.seek_depth_spin.setValue(300.0)
+        with patch.object(self.chart, 'display_endoscope_image'):
+            self.chart.seek_depth_button.click()
+        self.assertEqual(self.chart.csv_data_index, 299)
+        self.assertEqual(self.chart.csv_replay.speed, 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
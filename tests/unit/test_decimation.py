@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+单元测试：直径曲线降采样
+Unit Tests: diameter trace decimation
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from modules.decimation import (
+    minmax_indices, lttb_indices, excursion_indices, decimate_trace, is_decimated
+)
+
+
+def make_trace(count=200000, seed=3):
+    """生成900mm行程的模拟直径曲线"""
+    rng = np.random.default_rng(seed)
+    depths = np.linspace(0, 900, count)
+    diameters = 17.6 + 0.01 * np.sin(depths / 20) + rng.normal(0, 0.003, count)
+    return depths, diameters
+
+
+class TestDecimation(unittest.TestCase):
+    """降采样单元测试类"""
+
+    def test_minmax_keeps_envelope(self):
+        """测试最小/最大包络保留每桶极值和全局极值"""
+        depths, diameters = make_trace()
+        indices = minmax_indices(diameters, 1000)
+
+        self.assertLessEqual(len(indices), 2002)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual(diameters[indices].max(), diameters.max())
+        self.assertEqual(diameters[indices].min(), diameters.min())
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(diameters) - 1)
+
+    def test_lttb_output_size_and_spike(self):
+        """测试LTTB输出点数并保留明显尖峰"""
+        depths, diameters = make_trace()
+        diameters = diameters.copy()
+        diameters[123456] = 18.2
+        indices = lttb_indices(depths, diameters, 2000)
+
+        self.assertEqual(len(indices), 2000)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(123456, indices)
+
+    def test_small_input_returned_unchanged(self):
+        """测试点数不超过目标时不降采样"""
+        depths, diameters = make_trace(count=500)
+        for method in ("minmax", "lttb"):
+            indices = decimate_trace(depths, diameters, 1000, method=method)
+            np.testing.assert_array_equal(indices, np.arange(500))
+            self.assertFalse(is_decimated(indices))
+
+    def test_every_excursion_preserved(self):
+        """测试每段超差区间都保留在降采样结果中"""
+        depths, diameters = make_trace()
+        diameters = diameters.copy()
+        # 单点超差、短区间超差（下限）和长区间超差
+        diameters[5000] = 17.70
+        diameters[90000:90003] = 17.50
+        diameters[150000:152000] = 17.66
+        tolerance = (17.53, 17.65)
+
+        for method in ("minmax", "lttb"):
+            indices = decimate_trace(depths, diameters, 400, method=method, tolerance=tolerance)
+            self.assertTrue(is_decimated(indices))
+            for start, end in [(5000, 5001), (90000, 90003), (150000, 152000)]:
+                kept = indices[(indices >= start) & (indices < end)]
+                self.assertIn(start, kept, method)
+                self.assertIn(end - 1, kept, method)
+
+    def test_excursion_extreme_point(self):
+        """测试超差区间保留偏离最远的点"""
+        y = np.array([17.6, 17.7, 17.8, 17.7, 17.6, 17.4, 17.3, 17.45, 17.6])
+        indices = excursion_indices(y, 17.53, 17.65)
+        np.testing.assert_array_equal(indices, [1, 2, 3, 5, 6, 7])
+        self.assertEqual(len(excursion_indices(np.full(10, 17.6), 17.53, 17.65)), 0)
+
+    def test_zoom_decimates_visible_range(self):
+        """测试缩放后只对可见范围降采样，并包含边界外相邻点"""
+        depths, diameters = make_trace()
+        indices = decimate_trace(depths, diameters, 1000, x_range=(100.0, 102.0))
+        visible = np.flatnonzero((depths >= 100) & (depths <= 102))
+
+        self.assertEqual(indices[0], visible[0] - 1)
+        self.assertEqual(indices[-1], visible[-1] + 1)
+        self.assertFalse(is_decimated(indices))
+
+        indices = decimate_trace(depths, diameters, 1000, x_range=(0.0, 900.0))
+        self.assertTrue(is_decimated(indices))
+
+    def test_unknown_method(self):
+        """测试未知算法"""
+        with self.assertRaises(ValueError):
+            decimate_trace(np.arange(10.0), np.arange(10.0), 5, method="average")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+单元测试：DetectionEngine
+Unit Tests: DetectionEngine
+"""
+
+import unittest
+import time
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from aidcis2.models.hole_data import HoleData, HoleStatus
+from aidcis2.detection.probe_scheduler import ProbeScheduler
+from aidcis2.detection.detection_engine import DetectionEngine
+
+
+def make_holes(count: int):
+    """创建一行孔位"""
+    return [HoleData(f"H{i + 1:05d}", i * 12.0, (i // 100) * 12.0, 4.0) for i in range(count)]
+
+
+class FakeClock:
+    """每次读取前进固定步长的时钟"""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def qualified(hole):
+    """全部合格的检测结果"""
+    return HoleStatus.QUALIFIED
+
+
+class TestDetectionEngine(unittest.TestCase):
+    """DetectionEngine单元测试类"""
+
+    def wait_finished(self, engine, timeout=10.0):
+        """等待引擎完成"""
+        deadline = time.monotonic() + timeout
+        while engine.is_running() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(engine.is_running())
+
+    def test_events_cover_all_holes(self):
+        """测试每个孔位产生检测中和最终状态事件"""
+        holes = make_holes(500)
+        engine = DetectionEngine(ProbeScheduler(holes, probe_count=2, min_separation=0), qualified, 0.0)
+        engine.start()
+        self.wait_finished(engine)
+
+        self.assertTrue(engine.is_finished())
+        self.assertIsNone(engine.error)
+        events = engine.drain()
+        self.assertEqual(len(events), 1000)
+
+        final = DetectionEngine.coalesce(events)
+        self.assertEqual(set(final), {h.hole_id for h in holes})
+        self.assertTrue(all(status == HoleStatus.QUALIFIED for status in final.values()))
+
+        # 引擎不直接修改孔位数据，由界面线程应用事件
+        self.assertTrue(all(h.status == HoleStatus.PENDING for h in holes))
+
+    def test_cycles_paced_by_clock(self):
+        """测试检测周期按注入时钟的节拍推进"""
+        clock = FakeClock(step=0.0001)
+        holes = make_holes(200)
+        engine = DetectionEngine(ProbeScheduler(holes, probe_count=1, clock=clock),
+                                 qualified, cycle_interval=0.0002, clock=clock)
+        engine.start()
+        self.wait_finished(engine)
+        self.assertTrue(engine.is_finished())
+
+        # 单探头每周期完成一个孔位，相邻完成时刻间隔不小于一个节拍
+        finals = [e for e in engine.drain() if e.status == HoleStatus.QUALIFIED]
+        self.assertEqual(len(finals), 200)
+        gaps = [b.timestamp - a.timestamp for a, b in zip(finals, finals[1:])]
+        self.assertGreaterEqual(min(gaps), 0.0002 - 1e-9)
+
+    def test_drain_respects_batch_limit(self):
+        """测试按批次取出事件"""
+        holes = make_holes(50)
+        engine = DetectionEngine(ProbeScheduler(holes), qualified, 0.0)
+        engine.start()
+        self.wait_finished(engine)
+
+        first = engine.drain(30)
+        rest = engine.drain()
+        self.assertEqual(len(first), 30)
+        self.assertEqual(len(first) + len(rest), 100)
+        self.assertTrue(engine.events.empty())
+
+    def test_pause_and_stop_release_active_holes(self):
+        """测试暂停与停止：正在检测的孔位恢复为待检"""
+        holes = make_holes(100)
+        scheduler = ProbeScheduler(holes, probe_count=2, min_separation=0)
+        engine = DetectionEngine(scheduler, qualified, cycle_interval=10.0)
+        engine.start()
+        time.sleep(0.1)
+
+        engine.pause()
+        self.assertTrue(engine.is_paused)
+        engine.stop()
+        self.assertFalse(engine.is_running())
+        self.assertFalse(engine.is_finished())
+
+        final = DetectionEngine.coalesce(engine.drain())
+        self.assertEqual(len(final), 2)
+        self.assertTrue(all(status == HoleStatus.PENDING for status in final.values()))
+        self.assertEqual(scheduler.remaining_count, 100)
+
+    def test_pause_completes_active_cycle(self):
+        """测试暂停时进行中的周期正常完成，引擎空闲后不再有检测中的孔位"""
+        holes = make_holes(100)
+        engine = DetectionEngine(ProbeScheduler(holes, probe_count=2, min_separation=0),
+                                 qualified, cycle_interval=0.2)
+        engine.start()
+        time.sleep(0.05)
+        engine.pause()
+        self.assertFalse(engine.is_idle())
+
+        deadline = time.monotonic() + 2.0
+        while not engine.is_idle() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(engine.is_idle())
+
+        final = DetectionEngine.coalesce(engine.drain())
+        self.assertEqual(len(final), 2)
+        self.assertTrue(all(status == HoleStatus.QUALIFIED for status in final.values()))
+
+        # 暂停期间不再产生新事件
+        time.sleep(0.3)
+        self.assertTrue(engine.events.empty())
+        engine.stop()
+
+    def test_result_provider_error_is_reported(self):
+        """测试检测结果函数异常时引擎停止并记录错误"""
+        def failing(hole):
+            raise RuntimeError("probe failure")
+
+        engine = DetectionEngine(ProbeScheduler(make_holes(10)), failing, 0.0)
+        engine.start()
+        self.wait_finished(engine)
+        self.assertIsInstance(engine.error, RuntimeError)
+        self.assertFalse(engine.is_finished())
+
+
+if __name__ == '__main__':
+    unittest.main()
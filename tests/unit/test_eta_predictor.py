@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+单元测试：EtaPredictor
+Unit Tests: EtaPredictor
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from aidcis2.models.hole_data import HoleData
+from aidcis2.detection.probe_scheduler import ProbeScheduler
+from aidcis2.detection.eta_predictor import EtaPredictor, ProbeTimingModel
+
+
+class FakeClock:
+    """可控时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_grid(columns: int, rows: int, pitch: float = 10.0):
+    """创建网格排列的孔位"""
+    holes = []
+    for r in range(rows):
+        for c in range(columns):
+            holes.append(HoleData(f"H{r * columns + c + 1:05d}", c * pitch, r * pitch, 4.0))
+    return holes
+
+
+def run_to_completion(scheduler, predictor, clock, interval_of):
+    """按给定耗时函数推进调度器，并把完成事件送入预测器"""
+    predictions = []
+    while not scheduler.is_finished():
+        assignments = []
+        for probe_id in scheduler.probes:
+            hole = scheduler.next_hole(probe_id)
+            if hole is not None:
+                assignments.append((probe_id, hole))
+        clock.now += max(interval_of(probe_id, hole) for probe_id, hole in assignments)
+        for probe_id, hole in assignments:
+            scheduler.complete(probe_id, hole)
+            predictor.record_completion(probe_id, hole.hole_id, clock.now)
+        predictions.append((clock.now, predictor.predict_remaining_seconds()))
+    return predictions
+
+
+class TestEtaPredictor(unittest.TestCase):
+    """EtaPredictor单元测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.clock = FakeClock()
+
+    def test_timing_model_separates_travel(self):
+        """测试耗时模型能区分固定检测时间和移动时间"""
+        model = ProbeTimingModel(alpha=0.05)
+        for i in range(500):
+            distance = 10.0 if i % 3 else 40.0
+            model.update(distance, 0.5 + 0.02 * distance)
+        self.assertAlmostEqual(model.base, 0.5, places=3)
+        self.assertAlmostEqual(model.per_mm, 0.02, places=4)
+
+    def test_uniform_pitch_falls_back_to_mean(self):
+        """测试等间距时距离项不可辨识，退化为平均耗时"""
+        model = ProbeTimingModel()
+        for _ in range(20):
+            model.update(10.0, 1.0)
+        self.assertEqual(model.per_mm, 0.0)
+        self.assertAlmostEqual(model.base, 1.0)
+        self.assertAlmostEqual(model.throughput, 1.0)
+
+    def test_no_prediction_before_samples(self):
+        """测试没有完成样本时不给出预测"""
+        scheduler = ProbeScheduler(make_grid(10, 10), probe_count=2, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+        self.assertIsNone(predictor.predict_remaining_seconds())
+        self.assertEqual(predictor.remaining_count, 100)
+
+    def test_constant_rate_prediction(self):
+        """测试恒定节拍下的预测值接近真实剩余时间"""
+        scheduler = ProbeScheduler(make_grid(20, 10), probe_count=2, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+        predictions = run_to_completion(scheduler, predictor, self.clock, lambda p, h: 1.0)
+
+        finish = self.clock.now
+        self.assertEqual(finish, 100.0)
+        for now, remaining in predictions[5:]:
+            self.assertAlmostEqual(now + remaining, finish, delta=1.5)
+        self.assertEqual(predictor.remaining_count, 0)
+        self.assertEqual(predictor.finish_elapsed, finish)
+
+    def test_travel_distance_accounted(self):
+        """测试剩余计划移动距离计入预测"""
+        # 行间距远大于列间距，换行时移动时间明显更长
+        holes = [HoleData(f"H{r * 10 + c + 1:05d}", c * 10.0, r * 200.0, 4.0)
+                 for r in range(10) for c in range(10)]
+        scheduler = ProbeScheduler(holes, probe_count=1, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler, alpha=0.2)
+
+        last = {}
+
+        def interval_of(probe_id, hole):
+            previous = last.get(probe_id)
+            last[probe_id] = hole
+            distance = hole.distance_to(previous) if previous else 0.0
+            return 0.5 + 0.01 * distance
+
+        predictions = run_to_completion(scheduler, predictor, self.clock, interval_of)
+        finish = self.clock.now
+        model = predictor.probe_models[1]
+        self.assertGreater(model.per_mm, 0.0)
+        # 学习到移动耗时后，后半程的预测误差应在一个换行耗时以内
+        for now, remaining in predictions[len(predictions) // 2:]:
+            self.assertAlmostEqual(now + remaining, finish, delta=2.5)
+
+    def test_prediction_error_history(self):
+        """测试预测误差随时间记录"""
+        scheduler = ProbeScheduler(make_grid(10, 10), probe_count=1, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+
+        # 前半程快、后半程慢，早期预测偏小
+        run_to_completion(scheduler, predictor, self.clock,
+                          lambda p, h: 1.0 if int(h.hole_id[1:]) <= 50 else 2.0)
+
+        errors = predictor.prediction_errors()
+        self.assertTrue(errors)
+        self.assertLess(errors[0][1], 0)
+        self.assertAlmostEqual(errors[-1][1], 0.0)
+        self.assertEqual([e for e, _ in errors], sorted(e for e, _ in errors))
+
+    def test_pause_not_counted(self):
+        """测试暂停时长不计入单孔耗时"""
+        scheduler = ProbeScheduler(make_grid(50, 50), probe_count=2, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+
+        def run_cycles(count):
+            for _ in range(count):
+                assignments = [(pid, scheduler.next_hole(pid)) for pid in scheduler.probes]
+                self.clock.now += 1.0
+                for probe_id, hole in assignments:
+                    scheduler.complete(probe_id, hole)
+                    predictor.record_completion(probe_id, hole.hole_id, self.clock.now)
+
+        run_cycles(200)
+        self.assertAlmostEqual(predictor.predict_remaining_seconds(), 1050.0, delta=1.0)
+
+        # 暂停600秒后恢复
+        self.clock.now += 600.0
+        predictor.mark_idle(self.clock.now)
+        run_cycles(20)
+        self.assertAlmostEqual(predictor.predict_remaining_seconds(), 1030.0, delta=1.0)
+
+    def test_event_drained_after_resume(self):
+        """测试暂停前完成、恢复后取出的事件不会把暂停计入下一个孔位"""
+        scheduler = ProbeScheduler(make_grid(10, 10), probe_count=1, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+        holes = list(scheduler.probes[1].queue)
+
+        for index in range(10):
+            predictor.record_completion(1, holes[index].hole_id, index + 1.0)
+        predictor.mark_idle(500.0)
+        predictor.record_completion(1, holes[10].hole_id, 11.0)
+        predictor.record_completion(1, holes[11].hole_id, 501.0)
+        self.assertAlmostEqual(predictor.probe_models[1].mean_t, 1.0)
+
+    def test_unknown_hole_ignored(self):
+        """测试未登记的孔位事件被忽略"""
+        scheduler = ProbeScheduler(make_grid(5, 5), probe_count=1, min_separation=0, clock=self.clock)
+        predictor = EtaPredictor.from_scheduler(scheduler)
+        predictor.record_completion(1, "X99999", 1.0)
+        self.assertEqual(predictor.completed_count, 0)
+        self.assertEqual(predictor.remaining_count, 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+单元测试：后台历史数据查询
+Unit Tests: HistoryQueryService and HoleQueryCache
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.history_query import (
+    HistoryQueryService, find_hole_csv_file, STAGE_MEASUREMENTS, STAGE_ANALYSIS
+)
+
+HEADER = "测量序号,通道1值(μm),通道2值(μm),通道3值(μm),计算直径(mm)"
+TOLERANCE_BAND = (17.53, 17.65)
+
+
+def write_hole(hole_id, rows, diameter=17.6):
+    directory = os.path.join("Data", hole_id, "CCIDM")
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "measurement_data_1.csv"), 'w', encoding='gbk') as f:
+        f.write(HEADER + "\n")
+        for i in range(1, rows + 1):
+            f.write(f"{i},1385,1390,1380,{diameter}\n")
+
+
+class TestHistoryQueryService(unittest.TestCase):
+    """HistoryQueryService单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        write_hole("H00001", 20)
+        write_hole("H00002", 30, diameter=17.7)
+
+        self.analyzed = []
+        self.models_built = []
+        self.service = HistoryQueryService(TOLERANCE_BAND, self.analyze, build_model=self.build_model)
+        self.stages = []
+        self.failures = []
+        self.service.stage_ready.connect(lambda request, stage, result: self.stages.append((request, stage, result)))
+        self.service.query_failed.connect(lambda request, message: self.failures.append((request, message)))
+
+    def tearDown(self):
+        self.service.wait_for_done()
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def analyze(self, channels):
+        self.analyzed.append(threading.current_thread() is threading.main_thread())
+        return {'eccentricity': np.zeros(len(channels)), 'collinear': np.zeros(len(channels), dtype=bool)}
+
+    def build_model(self, depths, diameters):
+        self.models_built.append(threading.current_thread() is threading.main_thread())
+        return ('mesh', len(depths), float(diameters.max()))
+
+    def run_query(self, hole_id):
+        request = self.service.submit(hole_id)
+        self.service.wait_for_done()
+        self.app.processEvents()
+        return request
+
+    def test_find_hole_csv_file(self):
+        """测试按目录顺序查找孔位CSV文件"""
+        self.assertEqual(find_hole_csv_file("H00001"),
+                         os.path.join("Data", "H00001", "CCIDM", "measurement_data_1.csv"))
+        self.assertIsNone(find_hole_csv_file("H09999"))
+
+    def test_stages_delivered_in_order_off_gui_thread(self):
+        """测试测量阶段和分析阶段依次送达，分析在工作线程执行"""
+        request = self.run_query("H00001")
+
+        self.assertEqual([stage for _, stage, _ in self.stages], [STAGE_MEASUREMENTS, STAGE_ANALYSIS])
+        self.assertTrue(all(r == request for r, _, _ in self.stages))
+        measurements_result, analysis_result = self.stages[0][2], self.stages[1][2]
+        self.assertEqual(len(measurements_result.measurements), 20)
+        self.assertIsNone(measurements_result.fit_result)
+        self.assertEqual(analysis_result.depths.tolist(), list(np.arange(1.0, 21.0)))
+        self.assertEqual(analysis_result.channels.shape, (20, 3))
+        self.assertEqual(len(analysis_result.fit_result['eccentricity']), 20)
+        self.assertEqual(self.analyzed, [False])
+        self.assertEqual(self.models_built, [False])
+        self.assertEqual(analysis_result.model_geometry, ('mesh', 20, 17.6))
+        self.assertIs(analysis_result.measurements, measurements_result.measurements)
+        self.assertEqual(analysis_result.columns['diameter'].tolist(), [17.6] * 20)
+        self.assertFalse(self.failures)
+
+    def test_repeated_query_served_from_cache(self):
+        """测试同一孔位文件未变化时使用缓存，文件变化后重新读取"""
+        self.run_query("H00001")
+        self.stages.clear()
+        self.run_query("H00001")
+
+        self.assertEqual(len(self.analyzed), 1)
+        self.assertEqual(self.service.cache.hits, 1)
+        self.assertTrue(self.stages[0][2].from_cache)
+        self.assertEqual([stage for _, stage, _ in self.stages], [STAGE_MEASUREMENTS, STAGE_ANALYSIS])
+
+        write_hole("H00001", 25)
+        self.stages.clear()
+        self.run_query("H00001")
+        self.assertEqual(len(self.analyzed), 2)
+        self.assertEqual(len(self.stages[0][2].measurements), 25)
+
+    def test_cache_isolated_from_gui_edits(self):
+        """测试界面就地修改的记录不会进入缓存，缓存的按列数据只读"""
+        self.run_query("H00001")
+        first = self.stages[-1][2]
+        first.measurements[0]['manual_review_value'] = 17.61
+        first.measurements[1]['diameter'] = 99.0
+        self.stages.clear()
+        self.run_query("H00001")
+
+        cached = self.stages[-1][2]
+        self.assertTrue(cached.from_cache)
+        self.assertIsNot(cached.measurements, first.measurements)
+        self.assertNotIn('manual_review_value', cached.measurements[0])
+        self.assertEqual(cached.measurements[1]['diameter'], 17.6)
+        self.assertEqual(cached.model_geometry, ('mesh', 20, 17.6))
+        self.assertEqual(len(self.models_built), 1)
+        with self.assertRaises(ValueError):
+            cached.columns['diameter'][0] = 0.0
+
+    def test_new_query_cancels_stale_one(self):
+        """测试新查询取消旧查询，旧查询的结果不会送达"""
+        first = self.service.submit("H00001")
+        second = self.service.submit("H00002")
+        self.service.wait_for_done()
+        self.app.processEvents()
+
+        self.assertNotEqual(first, second)
+        self.assertTrue(self.stages)
+        self.assertTrue(all(request == second for request, _, _ in self.stages))
+        self.assertEqual(self.stages[-1][2].hole_id, "H00002")
+        self.assertFalse(self.stages[-1][2].measurements[0]['is_qualified'])
+
+        # 取消后到达的结果被忽略
+        self.service.submit("H00001")
+        self.service.cancel()
+        self.stages.clear()
+        self.service.wait_for_done()
+        self.app.processEvents()
+        self.assertEqual(self.stages, [])
+
+    def test_missing_hole(self):
+        """测试找不到CSV文件的孔位只送达空的测量阶段"""
+        self.run_query("H09999")
+        self.assertEqual(len(self.stages), 1)
+        _, stage, result = self.stages[0]
+        self.assertEqual(stage, STAGE_MEASUREMENTS)
+        self.assertIsNone(result.file_path)
+        self.assertEqual(result.measurements, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+单元测试：三维管孔模型渲染器
+Unit Tests: vectorized mesh generation, depth decimation and geometry cache
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.hole_3d_renderer import (
+    Hole3DViewer, build_hole_mesh, cylinder_quads, extract_depths_diameters, prepare_hole_mesh,
+    MEASURED_COLORMAP, MESH_THETA_STEPS, DEFAULT_VIEW
+)
+
+BLUE, LIME, RED = (tuple(color) for color in MEASURED_COLORMAP(np.arange(3)))
+
+
+class TestHoleMesh(unittest.TestCase):
+    """网格生成和降采样单元测试类"""
+
+    def test_cylinder_quads(self):
+        """测试圆柱面片的顶点位于各深度的半径上，相邻面片共享边"""
+        theta = np.linspace(0, 2 * np.pi, 5)
+        quads = cylinder_quads(theta, [1.0, 2.0, 3.0], [0.0, 1.0, 2.0])
+        self.assertEqual(quads.shape, (4 * 2, 4, 3))
+
+        radii = np.hypot(quads[..., 0], quads[..., 1])
+        np.testing.assert_allclose(radii, quads[..., 2] + 1.0)
+        # 第一个面片：(θ0, z0), (θ1, z0), (θ1, z1), (θ0, z1)；下一个面片从 z1 开始
+        np.testing.assert_allclose(quads[0], [[1, 0, 0], [0, 1, 0], [0, 2, 1], [2, 0, 1]], atol=1e-12)
+        np.testing.assert_allclose(quads[0, 2:], quads[1, 1::-1])
+
+    def test_extract_depths_diameters(self):
+        """测试提取深度和直径时按深度排序并去掉无效值"""
+        measurements = [{'position': 3, 'diameter': 17.7}, {'depth': 1, 'diameter': 17.5},
+                        {'position': 2, 'diameter': float('nan')}]
+        depths, diameters = extract_depths_diameters(measurements)
+        self.assertEqual(depths.tolist(), [1.0, 3.0])
+        self.assertEqual(diameters.tolist(), [17.5, 17.7])
+
+    def test_small_hole_not_decimated(self):
+        """测试样本数在预算以内时全部保留，颜色和误差统计按公差判断"""
+        geometry = build_hole_mesh([0.0, 1.0, 2.0, 3.0], [17.6, 17.7, 17.5, 17.6])
+        self.assertEqual(len(geometry.measured_quads), (MESH_THETA_STEPS - 1) * 3)
+        self.assertEqual([tuple(c) for c in geometry.measured_colors[:3]], [LIME, RED, BLUE])
+        self.assertAlmostEqual(geometry.max_positive_error, 0.1)
+        self.assertAlmostEqual(geometry.min_negative_error, -0.1)
+        self.assertEqual(geometry.depth_range, (0.0, 3.0))
+        self.assertAlmostEqual(geometry.max_radius, 17.7 / 2 * 1.05)
+
+    def test_decimated_to_face_budget_keeps_excursions(self):
+        """测试长孔按面片预算降采样，单点超差仍然显示，统计使用全部样本"""
+        depths = np.arange(10000.0)
+        diameters = np.full(10000, 17.6)
+        diameters[1234] = 17.8
+        diameters[8765] = 17.4
+        geometry = build_hole_mesh(depths, diameters, face_budget=1000)
+
+        self.assertLessEqual(len(geometry.measured_quads), 1000)
+        self.assertGreater(len(geometry.measured_quads), 500)
+        self.assertEqual(len(geometry.measured_colors), len(geometry.measured_quads))
+        colors = {tuple(c) for c in geometry.measured_colors}
+        self.assertEqual(colors, {LIME, RED, BLUE})
+        self.assertAlmostEqual(geometry.max_positive_error, 0.2)
+        self.assertAlmostEqual(geometry.min_negative_error, -0.2)
+        self.assertEqual(geometry.depth_range, (0.0, 9999.0))
+        self.assertEqual(geometry.measured_quads[..., 2].max(), 9999.0)
+
+
+class TestHole3DRenderer(unittest.TestCase):
+    """渲染器几何缓存和视角单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.viewer = Hole3DViewer()
+        self.renderer = self.viewer.renderer
+        self.measurements = [{'position': float(i), 'diameter': 17.6 + 0.001 * (i % 7)} for i in range(500)]
+        self.builds = []
+        original = self.renderer.get_geometry
+
+        def counting_get_geometry(measurements, key):
+            self.builds.append(key not in self.renderer._geometry_cache)
+            return original(measurements, key)
+
+        self.renderer.get_geometry = counting_get_geometry
+
+    def tearDown(self):
+        self.viewer.deleteLater()
+
+    def test_geometry_cache(self):
+        """测试同一份测量数据只生成一次网格，已显示时不重新渲染，清除后再次显示命中缓存"""
+        self.viewer.update_models(self.measurements)
+        self.assertEqual(len(self.renderer.ax.collections), 3)
+        self.assertEqual(self.builds, [True])
+
+        self.viewer.update_models(self.measurements)
+        self.assertEqual(self.builds, [True])
+
+        self.viewer.clear_models()
+        self.assertEqual(len(self.renderer.ax.collections), 0)
+        self.viewer.update_models(self.measurements)
+        self.assertEqual(self.builds, [True, False])
+        self.assertEqual(len(self.renderer.ax.collections), 3)
+
+        # 内容相同但不是同一份数据时重新生成
+        self.viewer.update_models(list(self.measurements))
+        self.assertEqual(self.builds, [True, False, True])
+
+    def test_show_prepared_geometry(self):
+        """测试显示后台生成的网格，同一份网格不重新绘制"""
+        self.assertIsNone(prepare_hole_mesh(np.array([np.nan]), np.array([17.6])))
+        geometry = prepare_hole_mesh(np.array([2.0, 1.0, 3.0]), np.array([17.6, 17.7, 17.5]))
+        self.assertEqual(geometry.depth_range, (1.0, 3.0))
+
+        self.viewer.show_geometry(geometry)
+        collections = list(self.renderer.ax.collections)
+        self.assertEqual(len(collections), 3)
+        self.viewer.show_geometry(geometry)
+        self.assertEqual(self.renderer.ax.collections[:], collections)
+        self.assertEqual(self.builds, [])
+
+    def test_view_changes_only_move_camera(self):
+        """测试切换视角和适应视图不重新生成模型"""
+        self.viewer.update_models(self.measurements)
+        collections = list(self.renderer.ax.collections)
+
+        self.viewer.change_view_angle("俯视图")
+        self.assertEqual((self.renderer.ax.elev, self.renderer.ax.azim), (90, 0))
+        self.renderer.ax.set_zlim(100, 200)
+        self.viewer.fit_view()
+        self.assertEqual((self.renderer.ax.elev, self.renderer.ax.azim), DEFAULT_VIEW)
+        self.assertEqual(self.renderer.ax.get_zlim(), (0.0, 499.0))
+
+        self.assertEqual(self.builds, [True])
+        self.assertEqual(self.renderer.ax.collections[:], collections)
+
+
+if __name__ == '__main__':
+    unittest.main()
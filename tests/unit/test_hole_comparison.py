@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+单元测试：多孔对比
+Unit Tests: profile resampling, percentile bands and HoleComparisonService
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules import hole_comparison
+from modules.hole_comparison import (
+    HoleProfile, HoleComparisonService, resample_profile, nan_percentiles, compare_profiles,
+    COMPARISON_PERCENTILES
+)
+
+HEADER = "测量序号,通道1值(μm),通道2值(μm),通道3值(μm),计算直径(mm)"
+
+
+def write_hole(hole_id, diameters, first=1):
+    directory = os.path.join("Data", hole_id, "CCIDM")
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "measurement_data_1.csv"), 'w', encoding='gbk') as f:
+        f.write(HEADER + "\n")
+        for i, diameter in enumerate(diameters, start=first):
+            f.write(f"{i},1385,1390,1380,{diameter}\n")
+
+
+class TestComparisonStatistics(unittest.TestCase):
+    """重采样和对比统计单元测试类"""
+
+    def test_resample_aligned_to_grid(self):
+        """测试重采样到以0为基准对齐的网格，未排序的深度先排序"""
+        start, values = resample_profile([2.5, 0.4, 1.5], [17.7, 17.5, 17.6])
+        self.assertEqual(start, 1)
+        np.testing.assert_allclose(values, [17.5 + 0.1 * 0.6 / 1.1, 17.65])
+
+        start, values = resample_profile([1.0, 2.0, np.nan, 3.0], [17.6, np.nan, 17.0, 17.8])
+        self.assertEqual(start, 1)
+        np.testing.assert_allclose(values, [17.6, 17.7, 17.8])
+        self.assertEqual(len(resample_profile([], [])[1]), 0)
+
+    def test_nan_percentiles_match_numpy(self):
+        """测试向量化百分位数与 np.nanpercentile 一致，全NaN列为NaN"""
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(17.6, 0.02, (40, 25))
+        matrix[rng.random(matrix.shape) < 0.3] = np.nan
+        matrix[:, 3] = np.nan
+        matrix[1:, 4] = np.nan
+
+        result = nan_percentiles(matrix, COMPARISON_PERCENTILES)
+        for q in COMPARISON_PERCENTILES:
+            expected = np.array([np.nanpercentile(column, q) if np.isfinite(column).any() else np.nan
+                                 for column in matrix.T])
+            np.testing.assert_allclose(result[q], expected, equal_nan=True)
+
+    def test_compare_profiles(self):
+        """测试不同深度范围的孔位放入统一网格，识别离群点和离群孔位"""
+        profiles = [HoleProfile(f"H{i:05d}", 0, np.full(10, 17.60 + 0.001 * i)) for i in range(9)]
+        profiles.append(HoleProfile("H00099", 5, np.full(10, 17.70)))
+        result = compare_profiles(profiles, missing_holes=["H00100"])
+
+        self.assertEqual(result.grid.tolist(), list(np.arange(15.0)))
+        self.assertEqual(result.matrix.shape, (10, 15))
+        self.assertEqual(result.hole_counts.tolist(), [9] * 5 + [10] * 5 + [1] * 5)
+        self.assertAlmostEqual(result.median[0], 17.604)
+        self.assertAlmostEqual(result.median[12], 17.70)
+        self.assertEqual([hole_id for hole_id, _ in result.outlier_holes], ["H00099"])
+        self.assertAlmostEqual(result.outlier_holes[0][1], 0.5)
+        depths, diameters = result.outlier_points()
+        self.assertEqual(depths.tolist(), [5.0, 6.0, 7.0, 8.0, 9.0])
+        self.assertTrue(np.all(diameters == 17.70))
+        self.assertEqual(result.missing_holes, ["H00100"])
+
+        empty = compare_profiles([], missing_holes=["H00001"])
+        self.assertEqual(empty.hole_ids, [])
+        self.assertEqual(empty.missing_holes, ["H00001"])
+
+
+class TestHoleComparisonService(unittest.TestCase):
+    """HoleComparisonService单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        for i in range(1, 7):
+            write_hole(f"H{i:05d}", [17.6 + 0.001 * i] * 20, first=i)
+
+        self.service = HoleComparisonService(max_threads=3)
+        self.progress = []
+        self.results = []
+        self.service.progress.connect(lambda request, loaded, total: self.progress.append((request, loaded, total)))
+        self.service.comparison_ready.connect(lambda request, result: self.results.append((request, result)))
+
+    def tearDown(self):
+        self.service.wait_for_done()
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def settle(self):
+        """等待读取任务、统计任务及其信号全部处理完"""
+        for _ in range(3):
+            self.service.wait_for_done()
+            self.app.processEvents()
+
+    def test_concurrent_load_and_compare(self):
+        """测试并发读取全部孔位后给出对比结果，缺失孔位单独列出"""
+        hole_ids = [f"H{i:05d}" for i in range(1, 7)] + ["H09999", "H00001"]
+        request = self.service.submit(hole_ids)
+        self.settle()
+
+        self.assertEqual([loaded for _, loaded, _ in self.progress], list(range(1, 8)))
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(self.results[0][0], request)
+        result = self.results[0][1]
+        self.assertEqual(result.hole_ids, [f"H{i:05d}" for i in range(1, 7)])
+        self.assertEqual(result.missing_holes, ["H09999"])
+        self.assertEqual(result.grid[0], 1.0)
+        self.assertEqual(result.grid[-1], 25.0)
+        self.assertEqual(result.hole_counts[0], 1)
+
+    def test_unexpected_load_error_counts_as_missing(self):
+        """测试读取孔位时的任意异常都按缺失孔位处理，对比仍然完成"""
+        def broken_load(hole_id, step):
+            if hole_id == "H00002":
+                raise KeyError("malformed")
+            return original_load(hole_id, step)
+
+        original_load = hole_comparison.load_hole_profile
+        hole_comparison.load_hole_profile = broken_load
+        try:
+            self.service.submit(["H00001", "H00002", "H00003"])
+            self.settle()
+        finally:
+            hole_comparison.load_hole_profile = original_load
+
+        self.assertEqual([loaded for _, loaded, _ in self.progress], [1, 2, 3])
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(self.results[0][1].hole_ids, ["H00001", "H00003"])
+        self.assertEqual(self.results[0][1].missing_holes, ["H00002"])
+
+    def test_new_comparison_cancels_old(self):
+        """测试新的对比取消旧对比，旧对比的结果不会送达"""
+        self.service.submit([f"H{i:05d}" for i in range(1, 7)])
+        second = self.service.submit(["H00001", "H00002"])
+        self.settle()
+
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(self.results[0][0], second)
+        self.assertEqual(self.results[0][1].hole_ids, ["H00001", "H00002"])
+        self.assertTrue(all(request == second for request, _, _ in self.progress))
+
+
+if __name__ == '__main__':
+    unittest.main()
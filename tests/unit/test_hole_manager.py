@@ -220,9 +220,10 @@ class TestHoleDataManager(unittest.TestCase):
         
         self.assertIsNotNone(loaded_data)
         self.assertEqual(len(loaded_data), 2)
-        self.assertEqual(loaded_data[0]["depth"], "0.0")
-        self.assertEqual(loaded_data[0]["diameter"], "8.865")
-        self.assertEqual(loaded_data[1]["depth"], "1.0")
+        self.assertEqual(loaded_data[0]["timestamp"], "2025-01-08T10:00:00")
+        self.assertEqual(loaded_data[0]["depth"], 0.0)
+        self.assertEqual(loaded_data[0]["diameter"], 8.865)
+        self.assertEqual(loaded_data[1]["depth"], 1.0)
         self.assertEqual(float(loaded_data[1]["diameter"]), 8.870)
     
     def test_load_measurement_data_not_exists(self):
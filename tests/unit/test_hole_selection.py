@@ -155,16 +155,15 @@ class TestHoleSelection(unittest.TestCase):
         # 检查V2模拟方法的频率设置
         start_source = inspect.getsource(self.window._start_simulation_progress_v2)
 
-        # 验证1000ms检测频率
-        self.assertIn('start(1000)', start_source)
+        # 验证模拟由后台引擎驱动
+        self.assertIn('SIMULATION_CYCLE_INTERVAL', start_source)
 
         # 验证日志信息
         self.assertIn('高频检测模式', start_source)
-        self.assertIn('1000ms/孔位', start_source)
 
-        # 检查颜色变化延迟
+        # 界面按帧批量取出事件
         update_source = inspect.getsource(self.window._update_simulation_v2)
-        self.assertIn('singleShot(100', update_source)
+        self.assertIn('drain(', update_source)
 
 if __name__ == '__main__':
     unittest.main()
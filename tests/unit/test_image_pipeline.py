@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+单元测试：内窥镜图像解码流水线
+Unit Tests: DecodedImageCache, ImagePipeline and EndoscopeView image switching
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage, QColor
+from PySide6.QtWidgets import QApplication
+
+from modules.image_pipeline import DecodedImageCache, ImagePipeline, decode_image, numpy_to_qimage
+from modules.endoscope_view import EndoscopeView
+
+
+def make_image(width, height, color="red"):
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color))
+    return image
+
+
+def wait_until(app, condition, timeout=5.0):
+    """处理事件直到条件满足或超时"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+class TestDecodedImageCache(unittest.TestCase):
+    """DecodedImageCache单元测试类"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """测试按字节数淘汰最久未使用的图像"""
+        image = make_image(100, 100)  # 40000字节
+        cache = DecodedImageCache(max_bytes=image.sizeInBytes() * 2)
+        cache.put(("a", 0, 0), image)
+        cache.put(("b", 0, 0), image)
+        self.assertIsNotNone(cache.get(("a", 0, 0)))  # a变为最近使用
+        cache.put(("c", 0, 0), image)
+
+        self.assertIn(("a", 0, 0), cache)
+        self.assertNotIn(("b", 0, 0), cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.current_bytes, image.sizeInBytes() * 2)
+
+    def test_oversized_image_not_cached(self):
+        """测试超过上限的单张图像不缓存"""
+        cache = DecodedImageCache(max_bytes=100)
+        cache.put(("a", 0, 0), make_image(100, 100))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.current_bytes, 0)
+
+    def test_replacing_key_updates_bytes(self):
+        """测试覆盖同一键时字节数正确"""
+        cache = DecodedImageCache()
+        cache.put(("a", 0, 0), make_image(100, 100))
+        cache.put(("a", 0, 0), make_image(10, 10))
+        self.assertEqual(cache.current_bytes, make_image(10, 10).sizeInBytes())
+
+
+class ImageFileTestCase(unittest.TestCase):
+    """在临时目录中生成测试图像文件"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i, color in enumerate(("red", "green", "blue")):
+            path = os.path.join(self.temp_dir.name, f"1-{i}.png")
+            make_image(800, 400, color).save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+class TestImagePipeline(ImageFileTestCase):
+    """ImagePipeline单元测试类"""
+
+    def test_decode_scales_to_target_keeping_aspect(self):
+        """测试解码结果按比例缩放到目标尺寸内"""
+        image = decode_image(self.paths[0], 200, 200)
+        self.assertEqual((image.width(), image.height()), (200, 100))
+        original = decode_image(self.paths[0], 0, 0)
+        self.assertEqual((original.width(), original.height()), (800, 400))
+        self.assertTrue(decode_image(os.path.join(self.temp_dir.name, "missing.png"), 200, 200).isNull())
+
+    def test_request_decodes_in_background_then_hits_cache(self):
+        """测试首次请求后台解码并发出信号，再次请求命中缓存"""
+        pipeline = ImagePipeline()
+        ready = []
+        pipeline.image_ready.connect(lambda path, image: ready.append((path, image.size())))
+        size = QSize(200, 200)
+
+        self.assertIsNone(pipeline.request(self.paths[0], size))
+        self.assertIsNone(pipeline.request(self.paths[0], size))  # 不重复提交
+        self.assertTrue(wait_until(self.app, lambda: ready))
+        pipeline.wait_for_done()
+        self.app.processEvents()
+
+        self.assertEqual(ready, [(self.paths[0], QSize(200, 100))])
+        self.assertEqual(pipeline.decoded_count, 1)
+        self.assertIsNotNone(pipeline.request(self.paths[0], size))
+        self.assertIsNone(pipeline.request(self.paths[0], QSize(100, 100)))  # 尺寸不同需重新解码
+        pipeline.wait_for_done()
+
+    def test_prefetch_fills_cache(self):
+        """测试预取后所有图像均已缓存"""
+        pipeline = ImagePipeline()
+        size = QSize(300, 300)
+        pipeline.prefetch(self.paths, size)
+        self.assertTrue(wait_until(self.app, lambda: pipeline.decoded_count == len(self.paths)))
+        for path in self.paths:
+            self.assertIsNotNone(pipeline.request(path, size))
+
+
+class TestEndoscopeViewImages(ImageFileTestCase):
+    """EndoscopeView图像切换测试类"""
+
+    def _scene_pixmaps(self, view):
+        return [item for item in view.graphics_scene.items()
+                if hasattr(item, 'pixmap') and not item.pixmap().isNull()]
+
+    def test_file_image_shown_when_decoded(self):
+        """测试文件图像解码完成后显示，缓存命中时立即显示"""
+        view = EndoscopeView()
+        view.update_image(self.paths[0])
+        self.assertEqual(self._scene_pixmaps(view), [])
+        self.assertTrue(wait_until(self.app, lambda: self._scene_pixmaps(view)))
+
+        view.prefetch_images(self.paths[1:])
+        self.assertTrue(wait_until(self.app, lambda: view.image_pipeline.decoded_count == 3))
+        view.update_image(self.paths[2])
+        pixmap = self._scene_pixmaps(view)[0].pixmap()
+        self.assertEqual(pixmap.toImage().pixelColor(0, 0), QColor("blue"))
+
+    def test_only_latest_request_is_shown(self):
+        """测试快速切换时只显示最后一次请求的图像"""
+        view = EndoscopeView()
+        view.update_image(self.paths[0])
+        view.update_image(self.paths[1])
+        self.assertTrue(wait_until(self.app, lambda: view.image_pipeline.decoded_count == 2))
+        pixmaps = self._scene_pixmaps(view)
+        self.assertEqual(len(pixmaps), 1)
+        self.assertEqual(pixmaps[0].pixmap().toImage().pixelColor(0, 0), QColor("green"))
+
+    def test_clear_cancels_pending_display(self):
+        """测试清除图像后不再显示尚未完成的请求"""
+        view = EndoscopeView()
+        view.update_image(self.paths[0])
+        view.clear_image()
+        self.assertTrue(wait_until(self.app, lambda: view.image_pipeline.decoded_count == 1))
+        self.app.processEvents()
+        self.assertEqual(self._scene_pixmaps(view), [])
+
+
+class TestNumpyToQImage(unittest.TestCase):
+    """numpy_to_qimage单元测试类"""
+
+    def test_wraps_contiguous_frame_without_copy(self):
+        """测试C连续帧零拷贝包装"""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+        image = numpy_to_qimage(frame)
+        self.assertIs(image.ndarray, frame)
+        frame[1, 2] = (0, 0, 255)
+        self.assertEqual(image.pixelColor(2, 1), QColor("blue"))
+
+    def test_formats(self):
+        """测试灰度、BGR和BGRA帧的像素格式"""
+        gray = numpy_to_qimage(np.full((2, 3), 128, dtype=np.uint8))
+        self.assertEqual(gray.format(), QImage.Format_Grayscale8)
+        self.assertEqual(numpy_to_qimage(np.zeros((2, 3), dtype=np.uint16)).format(), QImage.Format_Grayscale16)
+
+        bgr = np.zeros((2, 3, 3), dtype=np.uint8)
+        bgr[..., 0] = 255
+        self.assertEqual(numpy_to_qimage(bgr, bgr=True).pixelColor(0, 0), QColor("blue"))
+        bgra = np.zeros((2, 3, 4), dtype=np.uint8)
+        bgra[..., 2] = 255
+        bgra[..., 3] = 255
+        self.assertEqual(numpy_to_qimage(bgra, bgr=True).pixelColor(0, 0), QColor("red"))
+
+    def test_non_contiguous_frame_is_copied(self):
+        """测试非连续帧复制后包装，未支持的类型报错"""
+        frame = np.zeros((4, 8, 3), dtype=np.uint8)[:, :6]
+        image = numpy_to_qimage(frame)
+        self.assertTrue(image.ndarray.flags.c_contiguous)
+        self.assertEqual((image.width(), image.height()), (6, 4))
+        with self.assertRaises(ValueError):
+            numpy_to_qimage(np.zeros((2, 3), dtype=np.float32))
+
+
+class TestEndoscopeLiveFrames(unittest.TestCase):
+    """EndoscopeView实时帧测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _frame(self, value):
+        return np.full((120, 160), value, dtype=np.uint8)
+
+    def test_keeps_only_latest_frame(self):
+        """测试界面未处理时只显示最新帧，其余计为丢弃"""
+        view = EndoscopeView()
+        item = view.pixmap_item
+        for value in (10, 20, 30):
+            view.submit_frame(self._frame(value))
+        self.app.processEvents()
+
+        self.assertEqual(view.displayed_frames, 1)
+        self.assertEqual(view.dropped_frames, 2)
+        self.assertIs(view.pixmap_item, item)  # 图元复用
+        self.assertEqual(item.pixmap().toImage().pixelColor(0, 0).red(), 30)
+
+    def test_frames_from_camera_thread(self):
+        """测试从其他线程提交的帧在界面线程显示"""
+        view = EndoscopeView()
+        frames = 50
+
+        def camera():
+            for i in range(frames):
+                view.submit_frame(self._frame(i))
+                time.sleep(0.001)
+
+        thread = threading.Thread(target=camera)
+        thread.start()
+        while thread.is_alive():
+            self.app.processEvents()
+        thread.join()
+        self.app.processEvents()
+
+        self.assertEqual(view.displayed_frames + view.dropped_frames, frames)
+        self.assertEqual(view.pixmap_item.pixmap().toImage().pixelColor(0, 0).red(), frames - 1)
+
+    def test_frame_stats_and_clear(self):
+        """测试帧率统计窗口和清除图像"""
+        view = EndoscopeView()
+        reported = []
+        view.frame_stats_updated.connect(reported.append)
+        view._stats_window_start -= 1.0  # 模拟统计窗口已过去1秒
+        view.submit_frame(self._frame(1))
+        view.submit_frame(self._frame(2))
+        self.app.processEvents()
+
+        self.assertEqual(len(reported), 1)
+        self.assertEqual(reported[0]['displayed'], 1)
+        self.assertEqual(reported[0]['dropped'], 1)
+        self.assertGreater(reported[0]['displayed_fps'], 0)
+        self.assertEqual(view.get_frame_stats(), reported[0])
+
+        view.submit_frame(self._frame(3))
+        view.clear_image()
+        self.app.processEvents()
+        self.assertTrue(view.pixmap_item.pixmap().isNull())
+        self.assertEqual(view.displayed_frames, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+单元测试：测量数据CSV读取
+Unit Tests: shared measurement CSV reader
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from modules.measurement_csv import (
+    read_measurement_csv, read_probe_measurements, read_probe_columns, probe_records, PROBE_RECORD_FIELDS,
+    map_columns, detect_encoding,
+    measurement_cache_dir, measurement_cache_paths
+)
+
+CCIDM_HEADER = "测量序号,通道1值(μm),通道2值(μm),通道3值(μm),计算直径(mm)"
+
+
+class TestMeasurementCsv(unittest.TestCase):
+    """测量数据CSV读取单元测试类"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, text, encoding):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', encoding=encoding, newline='') as f:
+            f.write(text)
+        return path
+
+    def test_gbk_ccidm_file_fast_path(self):
+        """测试GBK编码的CCIDM文件按列头映射并整体解析"""
+        rows = "\r\n".join(f"{i},{1385 + i},{1390 + i},{1380 + i},{17.6 + i * 0.001:.3f}" for i in range(1, 101))
+        path = self._write("measurement_data.csv", CCIDM_HEADER + "\r\n" + rows + "\r\n", 'gbk')
+        table = read_measurement_csv(path)
+
+        self.assertEqual(table.encoding, 'gbk')
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table.column_map['diameter'], "计算直径(mm)")
+        np.testing.assert_array_equal(table.measurement, np.arange(1, 101))
+        np.testing.assert_array_equal(table.depth, np.arange(1, 101) * 1.0)
+        self.assertAlmostEqual(table.diameter[-1], 17.7)
+        self.assertEqual(table.channels.shape, (100, 3))
+        self.assertEqual(table.channels[0].tolist(), [1386.0, 1391.0, 1381.0])
+        self.assertAlmostEqual(table.mtime, os.path.getmtime(path))
+
+    def test_invalid_cells_and_short_rows(self):
+        """测试无效单元格记为NaN、短行补齐、空行跳过"""
+        text = CCIDM_HEADER + "\n1,1385,1390,1380,17.6\n2,abc,1390,1380,17.61\n\n3,1385,1390\n"
+        table = read_measurement_csv(self._write("bad.csv", text, 'utf-8'))
+
+        self.assertEqual(table.encoding, 'utf-8-sig')
+        self.assertEqual(len(table), 3)
+        self.assertTrue(np.isnan(table.column('channel1')[1]))
+        self.assertTrue(np.isnan(table.diameter[2]))
+        self.assertEqual(table.valid_rows('measurement', 'diameter').tolist(), [True, True, False])
+        self.assertEqual(len(table.take(table.valid_rows('channel1', 'diameter'))), 1)
+
+    def test_text_columns_and_records(self):
+        """测试文本列保留为字符串，records()返回类型化的行"""
+        text = "timestamp,depth,diameter\n2025-01-08T10:00:00,0.0,8.865\n2025-01-08T10:00:01,1.0,8.870\n"
+        table = read_measurement_csv(self._write("hole.csv", text, 'utf-8'))
+
+        records = table.records()
+        self.assertEqual(records[0], {'timestamp': "2025-01-08T10:00:00", 'depth': 0.0, 'diameter': 8.865})
+        self.assertEqual(table.depth.tolist(), [0.0, 1.0])
+        self.assertFalse(table.has_column('measurement'))
+
+    def test_column_mapping_fallback_and_encoding(self):
+        """测试无法识别列头时按CCIDM默认列位置映射，以及编码检测"""
+        self.assertEqual(map_columns(['a', 'b', 'c', 'd', 'e'])['diameter'], 'e')
+        self.assertEqual(map_columns(['Depth', 'Diameter'])['depth'], 'Depth')
+        self.assertEqual(detect_encoding("测量".encode('gbk')), 'gbk')
+        self.assertEqual(detect_encoding(b"\xff\xfe\xfa"), 'latin-1')
+
+        empty = read_measurement_csv(self._write("empty.csv", CCIDM_HEADER + "\n", 'gbk'))
+        self.assertEqual(len(empty), 0)
+        with self.assertRaises(ValueError):
+            read_measurement_csv(self._write("blank.csv", "", 'utf-8'))
+
+    def test_probe_measurements(self):
+        """测试历史数据记录：跳过无效行、合格判定和逐行时间戳"""
+        text = CCIDM_HEADER + "\n1,1385,1390,1380,17.6\n2,x,1390,1380,17.61\n3,1385,1390,1380,17.7\n"
+        path = self._write("probe.csv", text, 'gbk')
+        measurements = read_probe_measurements(path, (17.53, 17.65))
+
+        self.assertEqual([m['position'] for m in measurements], [1.0, 3.0])
+        self.assertEqual([m['is_qualified'] for m in measurements], [True, False])
+        self.assertEqual((measurements[1]['timestamp'] - measurements[0]['timestamp']).total_seconds(), 2)
+        self.assertEqual(measurements[0]['channel2'], 1390.0)
+
+        columns = read_probe_columns(path, (17.53, 17.65))
+        self.assertEqual(columns['position'].tolist(), [1.0, 3.0])
+        self.assertEqual(columns['is_qualified'].tolist(), [True, False])
+        self.assertEqual(columns['timestamp'][1] - columns['timestamp'][0], 2)
+        self.assertAlmostEqual(measurements[0]['timestamp'].timestamp(), columns['timestamp'][0], places=5)
+        self.assertEqual(probe_records(columns), measurements)
+
+        missing = read_probe_columns(self._write("missing.csv", "深度,直径\n1,17.6\n", 'utf-8'), (17.53, 17.65))
+        self.assertEqual(len(missing['diameter']), 0)
+        self.assertEqual(set(missing), set(PROBE_RECORD_FIELDS))
+
+
+
+class TestMeasurementCache(unittest.TestCase):
+    """测量数据解析缓存单元测试类"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.hole_dir = os.path.join(self.temp_dir.name, "Data", "H00001", "CCIDM")
+        os.makedirs(self.hole_dir)
+        self.path = os.path.join(self.hole_dir, "measurement_data_1.csv")
+        self._write_rows(3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_rows(self, count, mtime=None):
+        with open(self.path, 'w', encoding='gbk', newline='') as f:
+            f.write(CCIDM_HEADER + "\n")
+            for i in range(1, count + 1):
+                f.write(f"{i},1385,1390,1380,{17.6 + i * 0.01:.2f}\n")
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_cache_location(self):
+        """测试Data目录下的文件缓存到Data/cache，其他位置缓存到同目录隐藏子目录"""
+        data_dir = os.path.join(self.temp_dir.name, "Data")
+        self.assertEqual(measurement_cache_dir(self.path), os.path.join(data_dir, "cache"))
+        other = os.path.join(self.temp_dir.name, "export", "a.csv")
+        self.assertEqual(measurement_cache_dir(other),
+                         os.path.join(self.temp_dir.name, "export", ".measurement_cache"))
+
+    def test_cache_hit_is_memory_mapped(self):
+        """测试第二次读取命中缓存，数值列为内存映射且结果一致"""
+        parsed = read_measurement_csv(self.path)
+        array_path, meta_path = measurement_cache_paths(self.path)
+        self.assertTrue(os.path.exists(array_path))
+        self.assertTrue(os.path.exists(meta_path))
+
+        cached = read_measurement_csv(self.path)
+        self.assertIsInstance(cached.diameter.base, np.memmap)
+        self.assertEqual(cached.encoding, 'gbk')
+        self.assertEqual(cached.headers, parsed.headers)
+        self.assertEqual(cached.column_map, parsed.column_map)
+        np.testing.assert_array_equal(cached.channels, parsed.channels)
+        self.assertEqual(cached.records(), parsed.records())
+
+    def test_cache_rebuilt_when_csv_changes(self):
+        """测试CSV大小或修改时间变化后缓存自动重建"""
+        self._write_rows(3, mtime=1_700_000_000)
+        self.assertEqual(len(read_measurement_csv(self.path)), 3)
+
+        self._write_rows(5, mtime=1_700_000_100)
+        table = read_measurement_csv(self.path)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(len(read_measurement_csv(self.path)), 5)
+
+        # 大小不变、只有修改时间变化
+        with open(self.path, 'r+', encoding='gbk') as f:
+            text = f.read().replace("17.61", "17.71")
+            f.seek(0)
+            f.write(text)
+        os.utime(self.path, (1_700_000_200, 1_700_000_200))
+        self.assertAlmostEqual(read_measurement_csv(self.path).diameter[0], 17.71)
+
+    def test_text_columns_and_corrupt_cache(self):
+        """测试文本列经缓存保留，损坏的缓存被忽略并重建"""
+        path = os.path.join(self.hole_dir, "hole.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("timestamp,depth,diameter\n2025-01-08T10:00:00,0.0,8.865\n")
+        expected = read_measurement_csv(path).records()
+        self.assertEqual(read_measurement_csv(path).records(), expected)
+
+        _, meta_path = measurement_cache_paths(path)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            f.write("{")
+        self.assertEqual(read_measurement_csv(path).records(), expected)
+        self.assertEqual(read_measurement_csv(path).records(), expected)
+
+    def test_cache_disabled_or_unwritable(self):
+        """测试禁用缓存时不写缓存，缓存目录不可写时仍正常解析"""
+        read_measurement_csv(self.path, use_cache=False)
+        self.assertFalse(os.path.exists(measurement_cache_dir(self.path)))
+
+        blocker = os.path.join(self.temp_dir.name, "blocker")
+        with open(blocker, 'w') as f:
+            f.write("")
+        table = read_measurement_csv(self.path, cache_dir=os.path.join(blocker, "cache"))
+        self.assertEqual(len(table), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+单元测试：操作日志模型与面板
+Unit Tests: OperationLogModel / OperationLogPanel
+"""
+
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+from pathlib import Path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from PySide6.QtWidgets import QApplication
+
+from modules.operation_log import OperationLogModel, OperationLogPanel, infer_level, DEFAULT_LOG_DIR
+
+
+class TestOperationLogModel(unittest.TestCase):
+    """OperationLogModel单元测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp(prefix="test_operation_log_")
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_ring_buffer_is_bounded(self):
+        """测试内存记录数量有上限"""
+        model = OperationLogModel(max_lines=100, log_dir=None)
+        for i in range(10000):
+            model.append(f"消息 {i}")
+
+        self.assertEqual(len(model.records), 100)
+        self.assertEqual(model.records[-1].message, "消息 9999")
+        self.assertEqual(model.total_count, 10000)
+        self.assertLessEqual(len(model.take_pending()), 100)
+
+    def test_level_inference_and_filter(self):
+        """测试日志级别推断与过滤"""
+        self.assertEqual(infer_level("❌ 失败"), "ERROR")
+        self.assertEqual(infer_level("⚠️ 注意"), "WARNING")
+        self.assertEqual(infer_level("开始检测"), "INFO")
+
+        model = OperationLogModel(log_dir=None)
+        model.append("调试信息", "DEBUG")
+        model.append("开始检测")
+        model.append("❌ 失败")
+
+        self.assertEqual(len(model.filtered("DEBUG")), 3)
+        self.assertEqual(len(model.filtered("INFO")), 2)
+        self.assertEqual([r.message for r in model.filtered("ERROR")], ["❌ 失败"])
+
+    def test_spill_to_disk_keeps_full_history(self):
+        """测试历史日志完整写入磁盘"""
+        model = OperationLogModel(max_lines=10, log_dir=self.temp_dir)
+        for i in range(50):
+            model.append(f"消息 {i}")
+
+        self.assertEqual(model.spill_to_disk(), 50)
+        self.assertEqual(model.spill_to_disk(), 0)
+
+        history = Path(model.history_path()).read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(history), 50)
+        self.assertTrue(history[-1].endswith("消息 49"))
+        model.close()
+
+    def test_history_file_kept_open_until_clear(self):
+        """测试历史文件在多次刷新间保持打开，clear() 后关闭"""
+        model = OperationLogModel(log_dir=self.temp_dir)
+        model.append("第一条")
+        model.spill_to_disk()
+        handle = model._history_file
+        self.assertIsNotNone(handle)
+
+        model.append("第二条")
+        model.spill_to_disk()
+        self.assertIs(model._history_file, handle)
+        # 每次写入后刷新到磁盘
+        history = Path(model.history_path()).read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(history), 2)
+
+        model.clear()
+        self.assertTrue(handle.closed)
+        self.assertIsNone(model._history_file)
+        model.append("清空后")
+        self.assertEqual(model.spill_to_disk(), 1)
+        model.close()
+        self.assertEqual(len(Path(model.history_path()).read_text(encoding='utf-8').splitlines()), 3)
+
+    def test_write_error_logged(self):
+        """测试写入失败通过日志记录器报告"""
+        blocker = Path(self.temp_dir) / "not_a_dir"
+        blocker.write_text("", encoding='utf-8')
+        model = OperationLogModel(log_dir=blocker)
+        model.append("消息")
+        with self.assertLogs('modules.operation_log', level='ERROR') as captured:
+            self.assertEqual(model.spill_to_disk(), 0)
+        self.assertIn("写入历史日志失败", captured.output[0])
+
+    def test_default_log_dir_independent_of_cwd(self):
+        """测试默认历史目录不随工作目录变化"""
+        self.assertTrue(DEFAULT_LOG_DIR.is_absolute())
+        self.assertEqual(DEFAULT_LOG_DIR.parent, Path(__file__).resolve().parents[2])
+
+
+class TestOperationLogPanel(unittest.TestCase):
+    """OperationLogPanel单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        """设置测试类"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_batched_flush_and_line_cap(self):
+        """测试按帧批量刷新和行数上限"""
+        panel = OperationLogPanel(OperationLogModel(max_lines=50, log_dir=None))
+        for i in range(500):
+            panel.append(f"消息 {i}")
+
+        # 追加时不触碰文本视图
+        self.assertEqual(panel.text_view.toPlainText(), "")
+
+        panel.flush()
+        self.assertLessEqual(panel.text_view.document().blockCount(), 50)
+        self.assertIn("消息 499", panel.text_view.toPlainText())
+
+    def test_min_level_rebuilds_view(self):
+        """测试切换最低级别后重建视图"""
+        panel = OperationLogPanel(OperationLogModel(log_dir=None))
+        panel.append("调试信息", "DEBUG")
+        panel.append("❌ 失败")
+        panel.flush()
+        self.assertNotIn("调试信息", panel.text_view.toPlainText())
+
+        panel.set_min_level("DEBUG")
+        self.assertIn("调试信息", panel.text_view.toPlainText())
+
+        panel.set_min_level("ERROR")
+        self.assertEqual(panel.text_view.toPlainText().count("\n"), 0)
+
+    def test_shutdown_spills_last_frame(self):
+        """测试关闭时写出最后一帧尚未刷新的记录"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            panel = OperationLogPanel(OperationLogModel(log_dir=temp_dir))
+            panel.append("关闭前的消息")
+            panel.shutdown()
+            self.assertFalse(panel.flush_timer.isActive())
+            history = Path(panel.model.history_path()).read_text(encoding='utf-8')
+            self.assertIn("关闭前的消息", history)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+单元测试：探头拟合圆批量计算
+Unit Tests: vectorized ProbeCircleFitter and eccentricity plot
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.history_viewer import ProbeCircleFitter, EccentricityPlot
+
+
+def make_channels(count=500, seed=0):
+    """模拟μm格式的三通道扫描数据"""
+    rng = np.random.default_rng(seed)
+    return 1385.0 + rng.normal(0.0, 20.0, size=(count, 3))
+
+
+class TestProbeCircleFitterBatch(unittest.TestCase):
+    """ProbeCircleFitter批量接口单元测试类"""
+
+    def test_batch_matches_scalar_fit(self):
+        """测试批量结果与逐行标量拟合一致"""
+        channels = make_channels()
+        result = ProbeCircleFitter.fit_channels(channels)
+
+        for row in (0, 123, 499):
+            measure_list = ProbeCircleFitter.channels_to_parameters(channels[row])[0]
+            scalar = ProbeCircleFitter.process_channel_data(measure_list)
+            self.assertAlmostEqual(result['center_x'][row], scalar['center_x'], places=12)
+            self.assertAlmostEqual(result['center_y'][row], scalar['center_y'], places=12)
+            self.assertAlmostEqual(result['diameter'][row], scalar['diameter'], places=12)
+        self.assertFalse(result['collinear'].any())
+        np.testing.assert_allclose(result['eccentricity'], np.hypot(result['center_x'], result['center_y']))
+
+    def test_channel_conversion(self):
+        """测试μm通道值按 2.1 - 通道值*0.001 转换，已处理的参数保持不变"""
+        params = ProbeCircleFitter.channels_to_parameters([[1385.62, 1400.0, 1300.0],
+                                                           [0.7, 0.8, 0.9]])
+        np.testing.assert_allclose(params[0], [2.1 - 1.38562, 0.7, 0.8])
+        np.testing.assert_allclose(params[1], [0.7, 0.8, 0.9])
+
+    def test_equal_channels_give_centered_circle(self):
+        """测试三个通道相等时圆心位于探头中心"""
+        result = ProbeCircleFitter.fit_batch([[0.5, 0.5, 0.5]], probe_r=18.85)
+        self.assertAlmostEqual(result['eccentricity'][0], 0.0, places=12)
+        self.assertAlmostEqual(result['diameter'][0], 2 * 19.35, places=12)
+
+    def test_collinear_samples_flagged(self):
+        """测试共线和无效样本被标记，结果为NaN，其余样本不受影响"""
+        xc, yc, diameter, collinear = ProbeCircleFitter.circles_from_points(
+            [[0.0, 1.0, 2.0], [1.0, 0.0, -1.0]], [[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        self.assertEqual(collinear.tolist(), [True, False])
+        self.assertTrue(np.isnan(diameter[0]))
+        self.assertAlmostEqual(diameter[1], 2.0)
+
+        channels = make_channels(4)
+        channels[2] = np.nan
+        result = ProbeCircleFitter.fit_channels(channels)
+        self.assertEqual(result['collinear'].tolist(), [False, False, True, False])
+        self.assertTrue(np.isnan(result['eccentricity'][2]))
+
+        with self.assertRaises(ValueError):
+            ProbeCircleFitter.circle_from_polar([0.0, 0.0], [1.0, 0.0], [2.0, 0.0])
+
+
+class TestEccentricityPlot(unittest.TestCase):
+    """偏心度曲线绘制测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_plot_whole_hole(self):
+        """测试绘制整孔偏心度曲线并标出无法拟合的样本"""
+        channels = make_channels(200)
+        channels[10] = np.nan
+        result = ProbeCircleFitter.fit_channels(channels)
+        plot = EccentricityPlot()
+        plot.plot_eccentricity(np.arange(200) * 0.5, result)
+
+        lines = plot.ax.get_lines()
+        self.assertEqual(len(lines[0].get_xdata()), 200)
+        self.assertEqual(len(lines[1].get_xdata()), 1)  # 共线标记
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+单元测试：ProbeScheduler
+Unit Tests: ProbeScheduler
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from aidcis2.models.hole_data import HoleData
+from aidcis2.detection.probe_scheduler import ProbeScheduler
+
+
+class FakeClock:
+    """可控时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_grid(columns: int, rows: int, pitch: float = 10.0):
+    """创建网格排列的孔位"""
+    holes = []
+    for r in range(rows):
+        for c in range(columns):
+            holes.append(HoleData(f"H{r * columns + c + 1:05d}", c * pitch, r * pitch, 4.0))
+    return holes
+
+
+class TestProbeScheduler(unittest.TestCase):
+    """ProbeScheduler单元测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.clock = FakeClock()
+        self.holes = make_grid(30, 10)
+
+    def test_partition_is_balanced(self):
+        """测试孔位均衡划分到各探头"""
+        scheduler = ProbeScheduler(self.holes, probe_count=3, min_separation=0, clock=self.clock)
+        assigned = [p.assigned_count for p in scheduler.probes.values()]
+        self.assertEqual(sum(assigned), len(self.holes))
+        self.assertLessEqual(max(assigned) - min(assigned), 1)
+
+        # 区域在X方向上互不重叠
+        bounds = [p.region_bounds for p in scheduler.probes.values()]
+        for left, right in zip(bounds, bounds[1:]):
+            self.assertLess(left[2], right[0])
+
+    def test_all_holes_visited_once(self):
+        """测试所有孔位恰好被检测一次"""
+        scheduler = ProbeScheduler(self.holes, probe_count=3, min_separation=50, clock=self.clock)
+        visited = []
+        while not scheduler.is_finished():
+            for probe_id in scheduler.probes:
+                hole = scheduler.next_hole(probe_id)
+                if hole is not None:
+                    visited.append(hole.hole_id)
+            for probe_id in scheduler.probes:
+                scheduler.complete(probe_id)
+            self.clock.now += 1.0
+
+        self.assertEqual(sorted(visited), sorted(h.hole_id for h in self.holes))
+        self.assertEqual(scheduler.completed_count, len(self.holes))
+        self.assertEqual(scheduler.remaining_count, 0)
+
+    def test_min_separation_between_active_probes(self):
+        """测试同时工作的探头满足最小间距"""
+        scheduler = ProbeScheduler(self.holes, probe_count=3, min_separation=50, clock=self.clock)
+        while not scheduler.is_finished():
+            for probe_id in scheduler.probes:
+                scheduler.next_hole(probe_id)
+            self.assertGreaterEqual(scheduler.min_active_distance(), 50)
+            for probe_id in scheduler.probes:
+                scheduler.complete(probe_id)
+
+    def test_work_stealing_when_region_finishes_early(self):
+        """测试区域提前完成时窃取其他探头的工作"""
+        scheduler = ProbeScheduler(self.holes, probe_count=2, min_separation=0, clock=self.clock)
+        fast, slow = scheduler.probes[1], scheduler.probes[2]
+
+        # 探头1快速完成自身区域
+        while fast.queue:
+            scheduler.next_hole(1)
+            scheduler.complete(1)
+        slow_remaining = len(slow.queue)
+
+        stolen = scheduler.next_hole(1)
+        self.assertIsNotNone(stolen)
+        self.assertEqual(fast.stolen_count, 1)
+        self.assertEqual(len(slow.queue), slow_remaining - 1)
+
+    def test_separation_blocks_assignment(self):
+        """测试无法满足间距时探头等待"""
+        holes = [HoleData("H00001", 0, 0, 4.0), HoleData("H00002", 10, 0, 4.0)]
+        scheduler = ProbeScheduler(holes, probe_count=2, min_separation=100, clock=self.clock)
+        self.assertIsNotNone(scheduler.next_hole(1))
+        self.assertIsNone(scheduler.next_hole(2))
+
+        scheduler.complete(1)
+        self.assertIsNotNone(scheduler.next_hole(2))
+
+    def test_throughput_and_eta(self):
+        """测试探头吞吐量和剩余时间估算"""
+        scheduler = ProbeScheduler(self.holes, probe_count=2, min_separation=0, clock=self.clock)
+        self.assertIsNone(scheduler.estimate_remaining_seconds())
+
+        for _ in range(5):
+            self.clock.now += 2.0
+            for probe_id in scheduler.probes:
+                scheduler.next_hole(probe_id)
+                scheduler.complete(probe_id)
+
+        self.assertAlmostEqual(scheduler.get_probe_throughput(1), 0.5)
+        self.assertAlmostEqual(scheduler.get_total_throughput(), 1.0)
+        self.assertAlmostEqual(scheduler.estimate_remaining_seconds(), len(self.holes) - 10)
+
+        stats = scheduler.get_probe_statistics()
+        self.assertEqual([s['completed'] for s in stats], [5, 5])
+
+    def test_release_returns_hole_to_queue(self):
+        """测试释放当前孔位"""
+        scheduler = ProbeScheduler(self.holes, probe_count=1, clock=self.clock)
+        hole = scheduler.next_hole(1)
+        scheduler.release(1)
+        self.assertIs(scheduler.next_hole(1), hole)
+
+    def test_invalid_probe_count(self):
+        """测试无效的探头数量"""
+        with self.assertRaises(ValueError):
+            ProbeScheduler(self.holes, probe_count=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+单元测试：RealtimeChart 绘图后端
+Unit Tests: RealtimeChart plotting backends
+
+同一组功能测试分别在 matplotlib 和 pyqtgraph 后端上运行
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules import realtime_chart
+from modules.realtime_chart import RealtimeChart, CHART_BACKENDS, DEFAULT_X_LIMITS, HAS_PYQTGRAPH
+
+
+class RealtimeChartBackendTests:
+    """与后端无关的功能测试，子类指定 backend"""
+
+    backend = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """测试前准备"""
+        self.chart = RealtimeChart(backend=self.backend)
+        self.chart.update_timer.stop()
+
+    def tearDown(self):
+        """测试后清理"""
+        self.chart.cleanup()
+        self.chart.deleteLater()
+
+    def _plotted_data(self):
+        if self.chart.plot_panel:
+            return self.chart.plot_panel.data_curve.xData, self.chart.plot_panel.data_curve.yData
+        return self.chart.data_line.get_xdata(), self.chart.data_line.get_ydata()
+
+    def _anomaly_data(self):
+        if self.chart.plot_panel:
+            return self.chart.plot_panel.anomaly_markers.xData, self.chart.plot_panel.anomaly_markers.yData
+        return self.chart.anomaly_markers.get_xdata(), self.chart.anomaly_markers.get_ydata()
+
+    def _x_range(self):
+        return self.chart._get_x_range()
+
+    def test_backend_selected(self):
+        """测试使用请求的后端"""
+        self.assertEqual(self.chart.chart_backend, self.backend)
+        self.assertEqual(self.chart.plot_panel is not None, self.backend == "pyqtgraph")
+
+    def test_update_data_plots_samples(self):
+        """测试追加的样本被绘制"""
+        depths = np.arange(200) * 0.5
+        for depth in depths:
+            self.chart.update_data(depth, 17.6)
+        self.chart.update_plot()
+
+        x, y = self._plotted_data()
+        np.testing.assert_array_equal(np.asarray(x), depths)
+        np.testing.assert_array_equal(np.asarray(y), np.full(200, 17.6))
+
+    def test_update_data_chunk_matches_per_sample(self):
+        """测试批量更新与逐点更新结果一致"""
+        depths = np.arange(1.0, 101.0)
+        diameters = 17.6 + 0.1 * np.sin(depths)
+        for depth, diameter in zip(depths, diameters):
+            self.chart.update_data(depth, diameter)
+        per_sample = (self.chart.depth_data.view().copy(), self.chart.anomaly_tracker.anomaly_count,
+                      self.chart.max_diameter, self.chart.min_diameter)
+
+        self.chart.clear_data()
+        self.chart.max_diameter = self.chart.min_diameter = None
+        for chunk in np.array_split(np.arange(100), 7):
+            self.chart.update_data_chunk(depths[chunk], diameters[chunk])
+
+        np.testing.assert_array_equal(self.chart.depth_data.view(), per_sample[0])
+        self.assertEqual(self.chart.anomaly_tracker.anomaly_count, per_sample[1])
+        self.assertEqual(self.chart.max_diameter, per_sample[2])
+        self.assertEqual(self.chart.min_diameter, per_sample[3])
+
+    def test_live_statistics_match_buffer(self):
+        """测试流式统计与缓冲区数据一致，公差变化后重建"""
+        depths = np.arange(1.0, 301.0)
+        diameters = 17.6 + 0.1 * np.sin(depths)
+        for chunk in np.array_split(np.arange(300), 9):
+            self.chart.update_data_chunk(depths[chunk], diameters[chunk])
+
+        stats = self.chart.get_current_statistics()
+        self.assertEqual(stats['count'], 300)
+        self.assertAlmostEqual(stats['mean'], diameters.mean())
+        self.assertAlmostEqual(stats['std'], diameters.std())
+        self.assertEqual(stats['max'], diameters.max())
+
+        self.chart.set_tolerance_limits(17.6, 0.05)
+        stats = self.chart.get_current_statistics()
+        self.assertEqual(stats['in_tolerance'], int(np.count_nonzero(np.abs(diameters - 17.6) <= 0.05)))
+
+        self.chart.clear_data()
+        self.assertIsNone(self.chart.get_current_statistics())
+
+    def test_anomaly_markers_follow_tolerance(self):
+        """测试超出公差的点被标记"""
+        self.chart.set_standard_diameter(17.6)
+        for depth, diameter in [(1.0, 17.6), (2.0, 17.7), (3.0, 17.5), (4.0, 17.62)]:
+            self.chart.update_data(depth, diameter)
+        self.chart.update_plot()
+
+        x, y = self._anomaly_data()
+        np.testing.assert_array_equal(np.asarray(x), [2.0, 3.0])
+        np.testing.assert_allclose(np.asarray(y), [17.7, 17.5])
+
+    def test_anomaly_panel_synced_once_per_frame(self):
+        """测试超差样本合并为区间，异常面板在刷新帧同步"""
+        self.chart.set_standard_diameter(17.6)
+        depths = np.arange(0.0, 100.0, 0.1)
+        diameters = np.full(len(depths), 17.6)
+        diameters[200:700] = 17.7
+        self.chart.update_data_chunk(depths, diameters)
+        self.assertEqual(self.chart.anomaly_model.rowCount(), 0)
+
+        self.chart.update_plot()
+        self.assertEqual(self.chart.anomaly_model.rowCount(), 1)
+        self.assertEqual(self.chart.anomaly_count_number.text(), "500")
+
+    def test_x_range_expands_with_data(self):
+        """测试数据超出X轴范围时扩展"""
+        for depth in np.linspace(0, 1500, 50):
+            self.chart.update_data(depth, 17.6)
+        self.chart.update_plot()
+
+        x_min, x_max = self._x_range()
+        self.assertLessEqual(x_min, 0)
+        self.assertGreaterEqual(x_max, 1500)
+
+    def test_x_range_reset_for_next_hole(self):
+        """测试清除数据（切换孔位）后X轴恢复默认范围，不沿用上一个孔的范围"""
+        for depth in np.linspace(0, 3000, 50):
+            self.chart.update_data(depth, 17.6)
+        self.chart.update_plot()
+        self.assertGreaterEqual(self._x_range()[1], 3000)
+
+        self.chart.clear_data()
+        self.assertEqual(tuple(self._x_range()), DEFAULT_X_LIMITS)
+        for depth in np.linspace(0, 300, 20):
+            self.chart.update_data(depth, 17.6)
+        self.chart.update_plot()
+        self.assertEqual(tuple(self._x_range()), DEFAULT_X_LIMITS)
+
+    def test_reset_zoom_fits_data(self):
+        """测试重置缩放后X轴覆盖数据，Y轴聚焦标准直径"""
+        self.chart.set_standard_diameter(17.6)
+        for depth in np.linspace(100, 600, 50):
+            self.chart.update_data(depth, 17.6)
+        self.chart.reset_zoom()
+
+        x_min, x_max = self._x_range()
+        self.assertAlmostEqual(x_min, 50, places=3)
+        self.assertAlmostEqual(x_max, 650, places=3)
+        if self.chart.plot_panel:
+            y_min, y_max = self.chart.plot_panel.view_box.viewRange()[1]
+        else:
+            y_min, y_max = self.chart.ax.get_ylim()
+        self.assertAlmostEqual(y_min, 17.45, places=3)
+        self.assertAlmostEqual(y_max, 17.75, places=3)
+
+    def test_clear_data(self):
+        """测试清除数据后曲线为空"""
+        for depth in range(10):
+            self.chart.update_data(depth, 17.8)
+        self.chart.update_plot()
+        self.chart.clear_data()
+
+        x, _ = self._plotted_data()
+        self.assertEqual(len(x) if x is not None else 0, 0)
+        self.assertEqual(len(self.chart.depth_data), 0)
+
+
+class TestMatplotlibBackend(RealtimeChartBackendTests, unittest.TestCase):
+    """matplotlib后端"""
+
+    backend = "matplotlib"
+
+
+@unittest.skipUnless(HAS_PYQTGRAPH, "pyqtgraph不可用")
+class TestPyqtgraphBackend(RealtimeChartBackendTests, unittest.TestCase):
+    """pyqtgraph后端"""
+
+    backend = "pyqtgraph"
+
+    def test_tolerance_lines(self):
+        """测试设置标准直径后绘制上下公差线"""
+        self.chart.set_standard_diameter(17.6)
+        panel = self.chart.plot_panel
+        self.assertAlmostEqual(panel.max_error_line.value(), 17.65)
+        self.assertAlmostEqual(panel.min_error_line.value(), 17.53)
+
+        self.chart.remove_error_lines_and_reset_y_axis()
+        self.assertIsNone(panel.max_error_line)
+
+
+class TestBackendSelection(unittest.TestCase):
+    """后端选择"""
+
+    def test_unknown_backend_rejected(self):
+        """测试未知后端抛出ValueError"""
+        QApplication.instance() or QApplication([])
+        self.assertIn("pyqtgraph", CHART_BACKENDS)
+        with self.assertRaises(ValueError):
+            RealtimeChart(backend="vispy")
+
+    def test_falls_back_without_pyqtgraph(self):
+        """测试pyqtgraph不可用时回退到matplotlib"""
+        QApplication.instance() or QApplication([])
+        with patch.object(realtime_chart, 'HAS_PYQTGRAPH', False):
+            chart = RealtimeChart(backend="pyqtgraph")
+        self.assertEqual(chart.chart_backend, "matplotlib")
+        self.assertIsNone(chart.plot_panel)
+        chart.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
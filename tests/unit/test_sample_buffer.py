@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+单元测试：SampleRingBuffer
+Unit Tests: SampleRingBuffer
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from modules.sample_buffer import SampleRingBuffer
+
+
+class TestSampleRingBuffer(unittest.TestCase):
+    """SampleRingBuffer单元测试类"""
+
+    def test_keeps_most_recent_samples(self):
+        """测试只保留最近capacity个样本且视图连续"""
+        buffer = SampleRingBuffer(100)
+        for i in range(1050):
+            buffer.append(i)
+
+        view = buffer.view()
+        self.assertEqual(len(buffer), 100)
+        self.assertTrue(view.flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(view, np.arange(950, 1050))
+        self.assertEqual(list(buffer)[:2], [950.0, 951.0])
+        self.assertEqual(buffer[-1], 1049.0)
+
+    def test_running_statistics_follow_eviction(self):
+        """测试淘汰样本后最小/最大/均值正确"""
+        rng = np.random.default_rng(1)
+        values = rng.normal(17.6, 0.05, 5000)
+        buffer = SampleRingBuffer(300)
+        for value in values:
+            buffer.append(value)
+
+        tail = values[-300:]
+        self.assertAlmostEqual(buffer.min, tail.min())
+        self.assertAlmostEqual(buffer.max, tail.max())
+        self.assertAlmostEqual(buffer.mean, tail.mean(), places=9)
+
+    def test_extend_matches_append(self):
+        """测试批量追加与逐个追加结果一致"""
+        values = np.linspace(0, 900, 2500)
+        single = SampleRingBuffer(1000)
+        batched = SampleRingBuffer(1000)
+        for value in values:
+            single.append(value)
+        for chunk in np.array_split(values, 7):
+            batched.extend(chunk)
+
+        np.testing.assert_array_equal(single.view(), batched.view())
+        self.assertEqual(single.min, batched.min)
+        self.assertEqual(single.max, batched.max)
+
+        # 单次超过容量只保留最后部分
+        batched.extend(np.arange(5000.0))
+        np.testing.assert_array_equal(batched.view(), np.arange(4000.0, 5000.0))
+
+    def test_views_not_modified_by_later_appends(self):
+        """测试已返回的视图不会被后续追加或清空修改"""
+        buffer = SampleRingBuffer(10)
+        buffer.extend(np.arange(10.0))
+        view = buffer.view()
+        snapshot = view.copy()
+
+        for i in range(25):
+            buffer.append(100.0 + i)
+        buffer.clear()
+        buffer.extend(np.full(10, -1.0))
+        np.testing.assert_array_equal(view, snapshot)
+        self.assertFalse(view.flags.writeable)
+
+    def test_empty_buffer(self):
+        """测试空缓冲区"""
+        buffer = SampleRingBuffer(5)
+        self.assertFalse(buffer)
+        self.assertIsNone(buffer.min)
+        self.assertIsNone(buffer.mean)
+        self.assertEqual(len(buffer.view()), 0)
+        with self.assertRaises(ValueError):
+            SampleRingBuffer(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
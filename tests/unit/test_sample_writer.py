@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+单元测试：采集样本流式存储
+Unit Tests: StreamingSampleWriter and SampleTail
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from hardware.sample_writer import StreamingSampleWriter, SampleTail, read_sample_file
+from hardware.CR1500_controller import Acquisition, save_data_to_csv
+from hardware.simulated_sdk import SimulatedCR1500Protocol
+
+FIELDS = ["时间戳(s)", "控制器1通道1距离(mm)", "控制器1通道2距离(mm)", "控制器2通道1距离(mm)"]
+
+
+def make_rows(count):
+    rows = np.column_stack([np.arange(count) * 1e-4 + 1.7e9] +
+                           [np.linspace(900, 1100, count) + i for i in range(3)])
+    rows[::7, 3] = np.nan
+    return rows
+
+
+class TestStreamingSampleWriter(unittest.TestCase):
+    """StreamingSampleWriter单元测试类"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read_all(self, writer):
+        data = [read_sample_file(path) for path in writer.files]
+        for fields, _ in data:
+            self.assertEqual(fields, FIELDS)
+        return np.concatenate([rows for _, rows in data])
+
+    def test_binary_roundtrip_with_rotation(self):
+        """测试二进制格式按大小轮换文件且数据完整"""
+        rows = make_rows(10000)
+        with StreamingSampleWriter(self.directory, FIELDS, chunk_rows=1000,
+                                   max_file_bytes=100 * 1024) as writer:
+            for row in rows[:5000]:
+                writer.append(row)
+            writer.append_rows(rows[5000:])
+
+        self.assertEqual(writer.rows_written, 10000)
+        self.assertGreater(len(writer.files), 1)
+        for path in writer.files:
+            self.assertLessEqual(os.path.getsize(path), 100 * 1024)
+        np.testing.assert_array_equal(self._read_all(writer), rows)
+
+    def test_csv_roundtrip(self):
+        """测试CSV格式保留缺失值"""
+        rows = make_rows(500)
+        with StreamingSampleWriter(self.directory, FIELDS, file_format="csv", chunk_rows=64) as writer:
+            writer.append_rows(rows)
+        data = self._read_all(writer)
+        np.testing.assert_allclose(data, rows, atol=1e-6)
+        self.assertTrue(np.isnan(data[0, 3]))
+
+    def test_truncated_file_after_crash(self):
+        """测试崩溃导致末尾记录不完整时，丢弃不完整的记录，其余数据照常读取"""
+        rows = make_rows(100)
+        for file_format in ("binary", "csv"):
+            with StreamingSampleWriter(os.path.join(self.directory, file_format), FIELDS,
+                                       file_format=file_format) as writer:
+                writer.append_rows(rows)
+            path = writer.files[0]
+            for cut in (3, 20):
+                with open(path, "rb") as f:
+                    content = f.read()
+                with open(path, "wb") as f:
+                    f.write(content[:-cut])
+                fields, data = read_sample_file(path)
+                self.assertEqual(fields, FIELDS)
+                self.assertEqual(data.shape[1], len(FIELDS))
+                np.testing.assert_allclose(data, rows[:len(data)], atol=1e-6)
+                rows = rows[:len(data)]
+            self.assertGreaterEqual(len(rows), 97)
+            rows = make_rows(100)
+
+    def test_periodic_fsync(self):
+        """测试块未写满时也按fsync间隔写入磁盘"""
+        writer = StreamingSampleWriter(self.directory, FIELDS, chunk_rows=100000, fsync_interval=0.05)
+        writer.append(make_rows(1)[0])
+        time.sleep(0.06)
+        writer.append(make_rows(2)[1])
+        self.assertEqual(writer.rows_written, 2)
+        self.assertGreaterEqual(writer.fsync_count, 1)
+        self.assertEqual(len(read_sample_file(writer.files[0])[1]), 2)
+        writer.close()
+
+    def test_unknown_format(self):
+        """测试未知格式"""
+        with self.assertRaises(ValueError):
+            StreamingSampleWriter(self.directory, FIELDS, file_format="parquet")
+
+
+class TestSampleTail(unittest.TestCase):
+    """SampleTail单元测试类"""
+
+    def test_keeps_latest_rows(self):
+        """测试只保留最近的行并按时间顺序返回"""
+        tail = SampleTail(100, len(FIELDS))
+        rows = make_rows(250)
+        for row in rows:
+            tail.append(row)
+        self.assertEqual(len(tail), 100)
+        np.testing.assert_array_equal(tail.rows(), rows[150:])
+        tail.clear()
+        self.assertEqual(len(tail.rows()), 0)
+
+
+class TestAcquisitionPersistence(unittest.TestCase):
+    """Acquisition 流式存储集成测试类"""
+
+    def test_acquisition_streams_to_writer(self):
+        """测试采集数据写入文件，内存只保留最近数据"""
+        with tempfile.TemporaryDirectory() as directory:
+            protocol = SimulatedCR1500Protocol(sample_rate=2000, latency=(0.0, 0.0), seed=4)
+            acquisition = Acquisition(protocol, lambda *args: None, sampling_interval=0, output_dir=directory)
+            self.assertEqual(acquisition.writer.fields, acquisition.fields)
+            acquisition.data_tail = SampleTail(50, len(acquisition.fields))
+            acquisition.record_duration = 0.3
+
+            thread = threading.Thread(target=acquisition.start)
+            thread.start()
+            thread.join(5)
+            acquisition.stop()
+
+            rows = np.concatenate([read_sample_file(path)[1] for path in acquisition.writer.files])
+            self.assertGreater(len(rows), 200)
+            self.assertEqual(len(acquisition.data_tail), 50)
+            np.testing.assert_array_equal(acquisition.data_tail.rows(), rows[-50:])
+
+            data_list = acquisition.get_data_list()
+            self.assertEqual(len(data_list), 50)
+            self.assertEqual(set(data_list[0]), {'时间'} | set(acquisition.fields[1:]))
+            save_data_to_csv(data_list, os.path.join(directory, "tail.csv"))
+
+
+if __name__ == '__main__':
+    unittest.main()
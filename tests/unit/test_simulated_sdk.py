@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+单元测试：CR1500模拟SDK
+Unit Tests: SimulatedCR1500Protocol driving the acquisition code
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from hardware.CR1500_controller import (
+    CONTROLLERS, Acquisition, connect_to_controller, configure_data_output, read_data_nodes
+)
+from hardware.simulated_sdk import SimulatedCR1500Protocol
+
+
+def silent_callback(data_str, distance, controller_name, channel):
+    pass
+
+
+class TestSimulatedProtocol(unittest.TestCase):
+    """SimulatedCR1500Protocol单元测试类"""
+
+    def test_connect_configure_read(self):
+        """测试连接、配置输出通道后按采样率读到数据"""
+        protocol = SimulatedCR1500Protocol(sample_rate=2000, latency=(0.0, 0.0), seed=1)
+        config = CONTROLLERS[0]
+        instance = connect_to_controller(protocol, config, max_retries=1, retry_delay=0)
+        self.assertTrue(instance)
+        self.assertTrue(configure_data_output(protocol, instance, config))
+
+        start = time.monotonic()
+        reads = [read_data_nodes(protocol, instance, config["channels"]) for _ in range(200)]
+        elapsed = time.monotonic() - start
+        self.assertEqual(set(reads[0]), {1, 2})
+        # 没有新样本时阻塞：200次读取约需 200/2000 秒
+        self.assertGreater(elapsed, 0.08)
+
+    def test_unknown_controller_and_dropouts(self):
+        """测试未知IP无法连接，丢失率生效"""
+        protocol = SimulatedCR1500Protocol(sample_rate=10000, latency=(0.0, 0.0),
+                                           dropout_rate=0.5, controller_ips=["192.168.0.10"], seed=2)
+        self.assertIsNone(connect_to_controller(protocol, CONTROLLERS[1], max_retries=1, retry_delay=0))
+
+        config = CONTROLLERS[0]
+        instance = connect_to_controller(protocol, config, max_retries=1, retry_delay=0)
+        configure_data_output(protocol, instance, config)
+        reads = [read_data_nodes(protocol, instance, config["channels"]) for _ in range(400)]
+        self.assertAlmostEqual(reads.count(None) / len(reads), 0.5, delta=0.1)
+        self.assertEqual(protocol.dropouts, reads.count(None))
+
+    def test_outage_blocks_reconnect(self):
+        """测试断线期间无法重连，恢复后可以重连"""
+        protocol = SimulatedCR1500Protocol(latency=(0.0, 0.0))
+        config = CONTROLLERS[1]
+        instance = connect_to_controller(protocol, config, max_retries=1, retry_delay=0)
+        protocol.disconnect(config["ip"], outage_duration=0.1)
+        self.assertFalse(protocol.TSCMCAPI_isConnected(instance, 0))
+        self.assertIsNone(read_data_nodes(protocol, instance, config["channels"]))
+        self.assertIsNone(connect_to_controller(protocol, config, max_retries=1, retry_delay=0))
+        time.sleep(0.12)
+        self.assertTrue(connect_to_controller(protocol, config, max_retries=1, retry_delay=0))
+
+
+class TestAcquisitionWithSimulator(unittest.TestCase):
+    """Acquisition 与模拟SDK集成测试类"""
+
+    def test_acquisition_frames_and_reconnect(self):
+        """测试采集输出三通道帧，断线后自动重连并继续采集"""
+        protocol = SimulatedCR1500Protocol(sample_rate=500, latency=(0.0001, 0.00005), seed=3)
+        frames = []
+        acquisition = Acquisition(protocol, silent_callback, sampling_interval=0,
+                                  frame_callback=frames.append)
+        acquisition.record_duration = 0.8
+        acquisition.connection_check_interval = 0.05
+        acquisition.reconnect_delay = 0.05
+
+        thread = threading.Thread(target=acquisition.start)
+        thread.start()
+        time.sleep(0.3)
+        first_reader = acquisition.readers["控制器2"]
+        protocol.disconnect(CONTROLLERS[1]["ip"], outage_duration=0.05)
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertGreater(len(frames), 100)
+        self.assertEqual(len(frames[0]), 3)
+        self.assertIsNot(acquisition.readers["控制器2"], first_reader)
+        self.assertGreater(acquisition.readers["控制器2"].samples, 0)
+        stats = acquisition.get_acquisition_stats()
+        self.assertLess(stats['alignment']['skew_max_ms'], 50.0)
+        acquisition.stop()
+
+    def test_reconnect_does_not_block_alignment(self):
+        """测试重连在后台进行时对齐继续出帧，重连后参考控制器不变"""
+        protocol = SimulatedCR1500Protocol(sample_rate=500, latency=(0.0001, 0.00005), seed=4)
+        acquisition = Acquisition(protocol, silent_callback, sampling_interval=0)
+        acquisition.record_duration = 1.5
+        acquisition.connection_check_interval = 0.05
+        acquisition.reconnect_delay = 0.3
+
+        thread = threading.Thread(target=acquisition.start)
+        thread.start()
+        time.sleep(0.3)
+        protocol.disconnect(CONTROLLERS[0]["ip"], outage_duration=0.4)
+        time.sleep(0.2)
+        frames_during_reconnect = acquisition.aligner.frames
+        time.sleep(0.2)
+        self.assertNotIn("控制器1", acquisition.controller_instances)
+        self.assertGreater(acquisition.aligner.frames, frames_during_reconnect + 20)
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertIn("控制器1", acquisition.controller_instances)
+        self.assertEqual(list(acquisition.aligner.queues), ["控制器1", "控制器2"])
+        acquisition.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+单元测试：流式统计
+Unit Tests: StreamingStatistics and QuantileSketch
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from modules.streaming_stats import StreamingStatistics, QuantileSketch
+
+TOLERANCE = (17.53, 17.65)
+
+
+def make_diameters(count=50000, seed=7):
+    """生成模拟直径数据"""
+    rng = np.random.default_rng(seed)
+    return 17.6 + rng.normal(0, 0.03, count)
+
+
+class TestStreamingStatistics(unittest.TestCase):
+    """StreamingStatistics单元测试类"""
+
+    def test_matches_numpy(self):
+        """测试分块、逐点和一次性统计与NumPy一致"""
+        diameters = make_diameters()
+        chunked = StreamingStatistics(TOLERANCE)
+        for chunk in np.array_split(diameters, 113):
+            chunked.update(chunk)
+        single = StreamingStatistics(TOLERANCE)
+        for diameter in diameters[:5000].tolist():
+            single.add(diameter)
+
+        self.assertEqual(chunked.count, len(diameters))
+        self.assertAlmostEqual(chunked.mean, diameters.mean(), places=10)
+        self.assertAlmostEqual(chunked.std, diameters.std(), places=10)
+        self.assertEqual(chunked.min, diameters.min())
+        self.assertEqual(chunked.max, diameters.max())
+        self.assertAlmostEqual(single.mean, diameters[:5000].mean(), places=10)
+        self.assertAlmostEqual(single.variance, diameters[:5000].var(), places=10)
+
+        inside = np.count_nonzero((diameters >= TOLERANCE[0]) & (diameters <= TOLERANCE[1]))
+        self.assertEqual(chunked.in_tolerance_count, inside)
+        self.assertAlmostEqual(chunked.qualification_rate, inside / len(diameters) * 100)
+        reference = StreamingStatistics(TOLERANCE)
+        for diameter in diameters.tolist():
+            reference.add(diameter)
+        self.assertEqual(reference.out_of_tolerance_count, chunked.out_of_tolerance_count)
+
+    def test_merge_across_holes(self):
+        """测试多个孔位的统计合并结果与整体统计一致"""
+        holes = [make_diameters(count, seed) for count, seed in [(1000, 1), (30000, 2), (7, 3)]]
+        merged = StreamingStatistics.merged(
+            (StreamingStatistics.from_values(values, TOLERANCE) for values in holes), TOLERANCE)
+        whole = StreamingStatistics.from_values(np.concatenate(holes), TOLERANCE)
+
+        self.assertEqual(merged.count, whole.count)
+        self.assertAlmostEqual(merged.mean, whole.mean, places=10)
+        self.assertAlmostEqual(merged.std, whole.std, places=10)
+        self.assertEqual(merged.in_tolerance_count, whole.in_tolerance_count)
+        self.assertEqual(merged.quantile(0.5), whole.quantile(0.5))
+
+        with self.assertRaises(ValueError):
+            merged.merge(StreamingStatistics.from_values(holes[0], (17.5, 17.7)))
+
+    def test_quantiles_within_resolution(self):
+        """测试分位数误差不超过草图分辨率"""
+        diameters = make_diameters()
+        stats = StreamingStatistics.from_values(diameters)
+        for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+            self.assertAlmostEqual(stats.quantile(q), np.quantile(diameters, q),
+                                   delta=stats.sketch.resolution)
+        self.assertEqual(stats.quantile(0.0), diameters.min())
+        self.assertEqual(stats.quantile(1.0), diameters.max())
+
+    def test_empty(self):
+        """测试无样本时的结果"""
+        stats = StreamingStatistics(TOLERANCE)
+        self.assertIsNone(stats.min)
+        self.assertIsNone(stats.quantile(0.5))
+        self.assertEqual(stats.std, 0.0)
+        self.assertEqual(stats.qualification_rate, 0.0)
+        stats.update([17.6, 17.7])
+        stats.clear()
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.tolerance, TOLERANCE)
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """QuantileSketch单元测试类"""
+
+    def test_bounded_bins(self):
+        """测试取值跨度超过最大桶数时分辨率加倍"""
+        sketch = QuantileSketch(resolution=0.001, max_bins=1000)
+        sketch.add(np.linspace(0.0, 10.0, 10001))
+        self.assertLessEqual(len(sketch._counts), 1000)
+        self.assertEqual(sketch.count, 10001)
+        self.assertAlmostEqual(sketch.quantile(0.5), 5.0, delta=sketch.resolution)
+
+    def test_merge_different_resolution(self):
+        """测试合并分辨率不同（同一基准）的草图"""
+        coarse = QuantileSketch(resolution=0.001, max_bins=100)
+        coarse.add(np.linspace(0.0, 1.0, 1001))
+        fine = QuantileSketch(resolution=0.001)
+        fine.add(np.linspace(1.0, 1.05, 51))
+        fine.merge(coarse)
+        self.assertEqual(fine.count, 1052)
+        self.assertEqual(fine.resolution, coarse.resolution)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+单元测试：按列存储的表格模型
+Unit Tests: MeasurementTableModel and HoleQualityTableModel
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtCore import Qt, QPersistentModelIndex
+from PySide6.QtWidgets import QApplication
+
+from modules.table_models import (
+    MeasurementTableModel, HoleQualityTableModel, QUALIFIED_COLOR, UNQUALIFIED_COLOR
+)
+from modules.report_models import HoleQualityData
+
+
+def make_measurements():
+    """三条测量记录，第二条不合格且经过人工复查"""
+    return [
+        {'position': 1.0, 'diameter': 17.60, 'channel1': 1385.0, 'channel2': 1390.0, 'channel3': 1380.0,
+         'is_qualified': True, 'timestamp': datetime(2025, 1, 8, 10, 0, 2), 'operator': ''},
+        {'position': 2.0, 'diameter': 17.70, 'channel1': 1300.0, 'channel2': 1390.0, 'channel3': 1380.0,
+         'is_qualified': False, 'timestamp': datetime(2025, 1, 8, 10, 0, 0), 'operator': '',
+         'manual_review_value': 17.62, 'reviewer': '张三', 'review_time': '2025-01-09 09:00'},
+        {'depth': 3.0, 'diameter': 17.55, 'channel1': 1400.0, 'channel2': 1390.0, 'channel3': 1380.0,
+         'timestamp': None},
+    ]
+
+
+def make_hole(hole_id, x, rate, qualified, timestamp=None):
+    return HoleQualityData(
+        hole_id=hole_id, position_x=x, position_y=0.0, target_diameter=17.6,
+        tolerance_upper=0.05, tolerance_lower=0.07, measured_diameters=[17.6],
+        qualified_count=int(rate), total_count=100, qualification_rate=rate,
+        is_qualified=qualified, deviation_stats={}, measurement_timestamp=timestamp)
+
+
+class TestMeasurementTableModel(unittest.TestCase):
+    """MeasurementTableModel单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = MeasurementTableModel()
+        self.model.set_measurements(make_measurements())
+
+    def cell(self, row, column, role=Qt.ItemDataRole.DisplayRole):
+        return self.model.data(self.model.index(row, column), role)
+
+    def test_formatting(self):
+        """测试单元格按原表格格式显示"""
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 10)
+        self.assertEqual([self.cell(0, c) for c in range(9)],
+                         ["1", "1.0", "17.6000", "1385.00", "1390.00", "1380.00", "✓", "10:00:02", ""])
+        self.assertEqual(self.cell(2, 1), "3.0")
+        self.assertEqual(self.cell(2, 7), "--")
+        self.assertEqual(self.cell(2, 8), "--")
+        self.assertEqual(self.cell(0, 9), "")
+        self.assertEqual(self.cell(1, 9), "人工复查值: 17.6200mm, 复查员: 张三, 复查时间: 2025-01-09 09:00")
+        self.assertEqual(self.model.headerData(2, Qt.Orientation.Horizontal), "直径(mm)")
+
+    def test_qualified_background_from_mask(self):
+        """测试合格列背景色由合格掩码决定，其余列无背景色"""
+        self.assertEqual(self.cell(0, 6, Qt.ItemDataRole.BackgroundRole), QUALIFIED_COLOR)
+        self.assertEqual(self.cell(1, 6, Qt.ItemDataRole.BackgroundRole), UNQUALIFIED_COLOR)
+        self.assertIsNone(self.cell(1, 2, Qt.ItemDataRole.BackgroundRole))
+
+    def test_sort_maps_rows_and_keeps_selection(self):
+        """测试按数值排序、保持持久索引，恢复原始顺序"""
+        persistent = QPersistentModelIndex(self.model.index(1, 0))
+
+        self.model.sort(2, Qt.SortOrder.DescendingOrder)
+        self.assertEqual([self.cell(row, 2) for row in range(3)], ["17.7000", "17.6000", "17.5500"])
+        self.assertEqual([self.model.source_row(row) for row in range(3)], [1, 0, 2])
+        self.assertEqual(persistent.row(), 0)
+
+        self.model.sort(7)
+        self.assertEqual([self.cell(row, 0) for row in range(3)], ["3", "2", "1"])
+
+        # 新数据沿用当前排序
+        self.model.set_measurements(make_measurements()[:2])
+        self.assertEqual([self.model.source_row(row) for row in range(2)], [1, 0])
+
+        self.model.sort(-1)
+        self.assertEqual([self.model.source_row(row) for row in range(2)], [0, 1])
+
+    def test_set_columns_uses_arrays(self):
+        """测试直接使用按列数组，数值列不复制，与逐行字典显示一致"""
+        columns = {
+            'position': np.array([1.0, 2.0]), 'diameter': np.array([17.60, 17.70]),
+            'channel1': np.array([1385.0, 1300.0]), 'channel2': np.array([1390.0, 1390.0]),
+            'channel3': np.array([1380.0, 1380.0]), 'is_qualified': np.array([True, False]),
+            'timestamp': np.array([datetime(2025, 1, 8, 10, 0, 2).timestamp(), np.nan]),
+        }
+        self.model.set_columns(columns)
+
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertIs(self.model.diameters, columns['diameter'])
+        self.assertEqual([self.cell(0, c) for c in range(10)],
+                         ["1", "1.0", "17.6000", "1385.00", "1390.00", "1380.00", "✓", "10:00:02", "", ""])
+        self.assertEqual(self.cell(1, 7), "--")
+        self.assertEqual(self.cell(1, 6, Qt.ItemDataRole.BackgroundRole), UNQUALIFIED_COLOR)
+
+        self.model.sort(7, Qt.SortOrder.DescendingOrder)
+        self.assertEqual([self.model.source_row(row) for row in range(2)], [0, 1])
+
+    def test_clear(self):
+        """测试清空表格"""
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.model.sort(1)
+
+
+class TestHoleQualityTableModel(unittest.TestCase):
+    """HoleQualityTableModel单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_formatting_and_sort(self):
+        """测试孔位表格式化和按合格率、孔位ID排序"""
+        model = HoleQualityTableModel()
+        model.set_holes([
+            make_hole("H003", 3.0, 99.0, True, datetime(2025, 1, 8, 10, 30)),
+            make_hole("H001", 1.0, 80.0, False),
+            make_hole("H002", 2.0, 96.5, True),
+        ])
+
+        def row_text(row):
+            return [model.data(model.index(row, column)) for column in range(7)]
+
+        self.assertEqual(row_text(0), ["1", "H003", "(3.0, 0.0)", "99.0%", "99/100", "合格", "2025-01-08 10:30"])
+        self.assertEqual(row_text(1)[5:], ["不合格", "未知"])
+        self.assertNotEqual(model.data(model.index(0, 5), Qt.ItemDataRole.BackgroundRole),
+                            model.data(model.index(1, 5), Qt.ItemDataRole.BackgroundRole))
+
+        model.sort(1)
+        self.assertEqual([model.data(model.index(row, 1)) for row in range(3)], ["H001", "H002", "H003"])
+        model.sort(3, Qt.SortOrder.DescendingOrder)
+        self.assertEqual([model.data(model.index(row, 3)) for row in range(3)], ["99.0%", "96.5%", "80.0%"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,8 +36,10 @@ class TestUISyncFixes(unittest.TestCase):
         self.test_hole_h00002 = HoleData('H00002', 150.0, 250.0, 5.5, HoleStatus.QUALIFIED)
         self.test_hole_h00003 = HoleData('H00003', 200.0, 300.0, 4.8, HoleStatus.DEFECTIVE)
     
-    def test_simulation_frequency_1000ms(self):
-        """测试模拟频率调整为1000ms"""
+    def test_simulation_frame_interval(self):
+        """测试模拟事件按帧取出"""
+        from main_window import EVENT_DRAIN_INTERVAL_MS
+
         # 启动V2模拟
         self.window._start_simulation_progress_v2()
         
@@ -45,9 +47,10 @@ class TestUISyncFixes(unittest.TestCase):
         self.assertTrue(hasattr(self.window, 'simulation_timer_v2'))
         self.assertIsNotNone(self.window.simulation_timer_v2)
         
-        # 验证定时器间隔为1000ms
+        # 验证定时器间隔为一帧
         actual_interval = self.window.simulation_timer_v2.interval()
-        self.assertEqual(actual_interval, 1000)
+        self.assertEqual(actual_interval, EVENT_DRAIN_INTERVAL_MS)
+        self.window._stop_simulation_v2()
     
     def test_ui_component_validation(self):
         """测试UI组件验证机制"""
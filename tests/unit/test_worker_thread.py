@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+单元测试：WorkerThread 批量模式
+Unit Tests: WorkerThread batched mode
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from modules.worker_thread import WorkerThread
+
+
+class TestWorkerThreadBatched(unittest.TestCase):
+    """WorkerThread批量模式单元测试类"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_generate_chunk_continues_depth(self):
+        """测试连续生成的数据块深度首尾相接"""
+        worker = WorkerThread(batched=True)
+        worker.depth_step = 0.5
+        depths, diameters = worker.generate_chunk(4)
+        np.testing.assert_allclose(depths, [0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(diameters.shape, (4,))
+
+        worker.samples_emitted = 4
+        depths, _ = worker.generate_chunk(2)
+        np.testing.assert_allclose(depths, [2.5, 3.0])
+
+    def test_batched_run_emits_all_samples_in_chunks(self):
+        """测试批量模式按块发射全部样本，状态只发射一次"""
+        worker = WorkerThread(batched=True)
+        worker.measurement_frequency = 20000
+        worker.depth_step = 0.1
+        worker.max_depth = 300.0
+
+        chunks = []
+        statuses = []
+        worker.data_chunk_updated.connect(lambda d, v: chunks.append((d, v)))
+        worker.status_updated.connect(lambda *args: statuses.append(args))
+        worker.start_measurement("H042")
+        # 信号排队到主线程，需处理事件才能送达
+        while not worker.wait(10):
+            self.app.processEvents()
+        self.app.processEvents()
+
+        depths = np.concatenate([chunk[0] for chunk in chunks])
+        self.assertEqual(len(depths), 3000)
+        self.assertTrue(np.all(np.diff(depths) > 0))
+        self.assertAlmostEqual(depths[-1], 300.0)
+        self.assertLess(len(chunks), 100)
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0][0], "H042")
+
+
+if __name__ == '__main__':
+    unittest.main()